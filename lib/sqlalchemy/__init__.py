@@ -44,8 +44,11 @@ from .engine import TwoPhaseTransaction as TwoPhaseTransaction
 from .engine import TypeCompiler as TypeCompiler
 from .engine import URL as URL
 from .inspection import inspect as inspect
+from .pool import AdaptiveQueuePool as AdaptiveQueuePool
+from .pool import AffinityQueuePool as AffinityQueuePool
 from .pool import AssertionPool as AssertionPool
 from .pool import AsyncAdaptedQueuePool as AsyncAdaptedQueuePool
+from .pool import AsyncQueuePool as AsyncQueuePool
 from .pool import (
     FallbackAsyncAdaptedQueuePool as FallbackAsyncAdaptedQueuePool,
 )
@@ -2396,6 +2396,10 @@ class MySQLDialect(default.DefaultDialect):
     supports_multivalues_insert = True
     insert_null_pk_still_autoincrements = True
 
+    # "insertmanyvalues" is only used for INSERT..RETURNING on MariaDB;
+    # plain executemany() INSERTs are batched by the MySQL drivers themselves
+    use_insertmanyvalues = True
+
     supports_comments = True
     inline_comments = True
     default_paramstyle = "format"
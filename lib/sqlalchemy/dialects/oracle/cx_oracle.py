@@ -881,6 +881,7 @@ class OracleDialect_cx_oracle(OracleDialect):
 
     supports_sane_rowcount = True
     supports_sane_multi_rowcount = True
+    supports_threaded_fetch = True
 
     bind_typing = interfaces.BindTyping.SETINPUTSIZES
 
@@ -433,6 +433,36 @@ class AsyncAdapt_asyncpg_cursor:
             self._executemany(operation, seq_of_parameters)
         )
 
+    async def _copy_records(self, table_name, schema_name, columns, records):
+        adapt_connection = self._adapt_connection
+
+        async with adapt_connection._execute_mutex:
+            await adapt_connection._check_type_cache_invalidation(
+                self._invalidate_schema_cache_asof
+            )
+
+            if not adapt_connection._started:
+                await adapt_connection._start_transaction()
+
+            try:
+                return await self._connection.copy_records_to_table(
+                    table_name,
+                    records=records,
+                    columns=columns,
+                    schema_name=schema_name,
+                )
+            except Exception as error:
+                self._handle_exception(error)
+
+    def copy_records(self, table_name, schema_name, columns, records):
+        """Load records using asyncpg's ``copy_records_to_table()``, which
+        makes use of the binary format of COPY.
+
+        """
+        return self._adapt_connection.await_(
+            self._copy_records(table_name, schema_name, columns, records)
+        )
+
     def setinputsizes(self, *inputsizes):
         raise NotImplementedError()
 
@@ -796,6 +826,8 @@ class PGDialect_asyncpg(PGDialect):
 
     supports_server_side_cursors = True
 
+    supports_bulk_copy = True
+
     render_bind_cast = True
 
     default_paramstyle = "format"
@@ -985,6 +1017,16 @@ class PGDialect_asyncpg(PGDialect):
 
         return connect
 
+    def do_bulk_copy(
+        self, cursor, statement, table, schema, columns, rows, binary
+    ):
+        # asyncpg always uses the binary format when copying records
+        status = cursor.copy_records(
+            table.name, schema, [col.name for col in columns], rows
+        )
+        # status is a string such as "COPY 10"
+        return int(status.split()[-1])
+
     def get_driver_connection(self, connection):
         return connection._connection
 
@@ -435,6 +435,40 @@ use the :meth:`._UpdateBase.returning` method on a per-statement basis::
         where(table.c.name=='foo')
     print(result.fetchall())
 
+.. _postgresql_bulk_copy:
+
+Bulk Loading with COPY
+----------------------
+
+The :meth:`_engine.Connection.bulk_copy` method loads rows into a table
+using PostgreSQL's ``COPY ... FROM STDIN`` command, which for large numbers
+of rows is considerably faster than INSERT, including when INSERT is used
+with :ref:`engine_insertmanyvalues`.   Rows are given as dictionaries, or
+as tuples along with a list of columns, and may be supplied by a generator
+so that they are streamed to the database as they're produced::
+
+    with engine.begin() as conn:
+        conn.bulk_copy(
+            some_table,
+            ({"id": i, "data": f"row {i}"} for i in range(1000000)),
+        )
+
+The bind processors for each column's datatype are applied to each value,
+so that values are passed in the same form as for an INSERT.  ``COPY``
+does not support RETURNING, and server-generated values such as SERIAL
+primary keys are not returned.
+
+Bulk loading is supported by the psycopg, psycopg2 and asyncpg dialects.
+The text format of ``COPY`` is used by default; the binary format may be
+used with psycopg by passing ``binary=True``.   psycopg2 supports only the
+text format, and asyncpg always makes use of the binary format.
+
+The ORM :meth:`_orm.Session.bulk_insert_mappings` method may also make use of
+``COPY`` by passing the
+:paramref:`_orm.Session.bulk_insert_mappings.use_copy` parameter.
+
+.. versionadded:: 2.0
+
 .. _postgresql_insert_on_conflict:
 
 INSERT...ON CONFLICT (Upsert)
@@ -2866,6 +2900,7 @@ class PGDialect(default.DefaultDialect):
     supports_native_boolean = True
     supports_native_uuid = True
     supports_smallserial = True
+    supports_array_parameters = True
 
     supports_sequences = True
     sequences_optional = True
@@ -2896,6 +2931,8 @@ class PGDialect(default.DefaultDialect):
     delete_returning = True
     insert_returning = True
 
+    use_insertmanyvalues = True
+
     connection_characteristics = (
         default.DefaultDialect.connection_characteristics
     )
@@ -3005,6 +3042,17 @@ class PGDialect(default.DefaultDialect):
     def get_readonly(self, connection):
         raise NotImplementedError()
 
+    def _bulk_copy_statement(self, table, schema, columns, binary):
+        preparer = self.identifier_preparer
+        table_name = preparer.quote(table.name)
+        if schema:
+            table_name = preparer.quote_schema(schema) + "." + table_name
+        return "COPY %s (%s) FROM STDIN%s" % (
+            table_name,
+            ", ".join(preparer.format_column(col) for col in columns),
+            " (FORMAT BINARY)" if binary else "",
+        )
+
     def set_deferrable(self, connection, value):
         raise NotImplementedError()
 
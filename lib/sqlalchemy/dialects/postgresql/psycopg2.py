@@ -446,6 +446,7 @@ which may be more performant.
 
 """  # noqa
 import collections.abc as collections_abc
+import datetime
 import logging
 import re
 
@@ -455,6 +456,7 @@ from .base import PGCompiler
 from .base import PGIdentifierPreparer
 from .json import JSON
 from .json import JSONB
+from ... import exc
 from ... import types as sqltypes
 from ... import util
 from ...engine import cursor as _cursor
@@ -519,6 +521,82 @@ class PGCompiler_psycopg2(PGCompiler):
     pass
 
 
+_copy_text_escapes = str.maketrans(
+    {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"}
+)
+
+
+def _copy_array_element(value):
+    if value is None:
+        return "NULL"
+    elif isinstance(value, (list, tuple)):
+        return _copy_text_value(value)
+    else:
+        value = _copy_text_value(value)
+        return '"%s"' % value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def _copy_text_value(value):
+    """Render a value for the text format of COPY, prior to escaping."""
+
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    elif isinstance(value, str):
+        return value
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        return "\\x" + bytes(value).hex()
+    elif isinstance(value, (list, tuple)):
+        return "{%s}" % ",".join(_copy_array_element(elem) for elem in value)
+    elif isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    elif isinstance(value, datetime.timedelta):
+        return "%d days %d seconds %d microseconds" % (
+            value.days,
+            value.seconds,
+            value.microseconds,
+        )
+    else:
+        return str(value)
+
+
+class _CopyTextStream:
+    """A file-like object which renders rows in the text format of COPY
+    as they're read by psycopg2's ``copy_expert()``.
+
+    """
+
+    def __init__(self, rows):
+        self._rows = iter(rows)
+        self._buffer = ""
+
+    def _line(self, row):
+        return (
+            "\t".join(
+                "\\N"
+                if value is None
+                else _copy_text_value(value).translate(_copy_text_escapes)
+                for value in row
+            )
+            + "\n"
+        )
+
+    def read(self, size=-1):
+        chunks = [self._buffer]
+        length = len(self._buffer)
+        for row in self._rows:
+            line = self._line(row)
+            chunks.append(line)
+            length += len(line)
+            if size >= 0 and length >= size:
+                break
+        data = "".join(chunks)
+        if size >= 0:
+            data, self._buffer = data[:size], data[size:]
+        else:
+            self._buffer = ""
+        return data
+
+
 class PGIdentifierPreparer_psycopg2(PGIdentifierPreparer):
     pass
 
@@ -543,6 +621,8 @@ class PGDialect_psycopg2(_PGDialect_common_psycopg):
 
     supports_statement_cache = True
     supports_server_side_cursors = True
+    supports_bulk_copy = True
+    supports_threaded_fetch = True
 
     default_paramstyle = "pyformat"
     # set to true based on psycopg2 version
@@ -552,6 +632,10 @@ class PGDialect_psycopg2(_PGDialect_common_psycopg):
     preparer = PGIdentifierPreparer_psycopg2
     psycopg2_version = (0, 0)
 
+    # psycopg2 batches INSERT statements using its own execute_values()
+    # extension, configured using executemany_mode
+    use_insertmanyvalues = False
+
     _has_native_hstore = True
 
     colspecs = util.update_copy(
@@ -585,9 +669,6 @@ class PGDialect_psycopg2(_PGDialect_common_psycopg):
             "executemany_mode",
         )
 
-        if self.executemany_mode & EXECUTEMANY_VALUES:
-            self.insert_executemany_returning = True
-
         self.executemany_batch_page_size = executemany_batch_page_size
         self.executemany_values_page_size = executemany_values_page_size
 
@@ -603,6 +684,12 @@ class PGDialect_psycopg2(_PGDialect_common_psycopg):
                     "psycopg2 version 2.7 or higher is required."
                 )
 
+    @property
+    def insert_executemany_returning(self):
+        return self.insert_returning and bool(
+            self.executemany_mode & EXECUTEMANY_VALUES
+        )
+
     def initialize(self, connection):
         super(PGDialect_psycopg2, self).initialize(connection)
         self._has_native_hstore = (
@@ -614,7 +701,6 @@ class PGDialect_psycopg2(_PGDialect_common_psycopg):
         # PGDialect.initialize() checks server version for <= 8.2 and sets
         # this flag to False if so
         if not self.insert_returning:
-            self.insert_executemany_returning = False
             self.executemany_mode = EXECUTEMANY_PLAIN
 
         self.supports_sane_multi_rowcount = not (
@@ -761,6 +847,17 @@ class PGDialect_psycopg2(_PGDialect_common_psycopg):
         else:
             cursor.executemany(statement, parameters)
 
+    def do_bulk_copy(
+        self, cursor, statement, table, schema, columns, rows, binary
+    ):
+        if binary:
+            raise exc.ArgumentError(
+                "The psycopg2 dialect supports only the text format "
+                "for bulk_copy()"
+            )
+        cursor.copy_expert(statement, _CopyTextStream(rows))
+        return cursor.rowcount
+
     def do_begin_twophase(self, connection, xid):
         connection.connection.tpc_begin(xid)
 
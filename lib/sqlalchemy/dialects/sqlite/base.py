@@ -1896,10 +1896,15 @@ class SQLiteDialect(default.DefaultDialect):
     supports_empty_insert = False
     supports_cast = True
     supports_multivalues_insert = True
+    use_insertmanyvalues = True
     tuple_in_values = True
     supports_statement_cache = True
     insert_null_pk_still_autoincrements = True
 
+    # SQLITE_MAX_VARIABLE_NUMBER defaults to 32766 as of SQLite 3.32;
+    # older versions are adjusted down in __init__()
+    insertmanyvalues_max_parameters = 32766
+
     default_paramstyle = "qmark"
     execution_ctx_cls = SQLiteExecutionContext
     statement_compiler = SQLiteCompiler
@@ -1998,6 +2003,9 @@ class SQLiteDialect(default.DefaultDialect):
                 self.dbapi.sqlite_version_info
                 >= (3, 7, 11)
             )
+            if self.dbapi.sqlite_version_info < (3, 32, 0):
+                # https://www.sqlite.org/limits.html
+                self.insertmanyvalues_max_parameters = 999
             # see https://www.sqlalchemy.org/trac/ticket/2568
             # as well as https://www.sqlite.org/src/info/600482d161
             self._broken_fk_pragma_quotes = self.dbapi.sqlite_version_info < (
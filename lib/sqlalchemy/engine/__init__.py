@@ -17,6 +17,7 @@ constructor ``create_engine()``.
 
 from . import events as events
 from . import util as util
+from .base import CompiledCacheStats as CompiledCacheStats
 from .base import Connection as Connection
 from .base import Engine as Engine
 from .base import NestedTransaction as NestedTransaction
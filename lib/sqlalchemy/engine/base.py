@@ -6,19 +6,26 @@
 # the MIT License: https://www.opensource.org/licenses/mit-license.php
 from __future__ import annotations
 
+import collections.abc as collections_abc
 import contextlib
+import itertools
 import sys
+from time import perf_counter
 import typing
 from typing import Any
 from typing import Callable
 from typing import cast
+from typing import Dict
+from typing import Iterable
 from typing import Iterator
 from typing import List
 from typing import Mapping
 from typing import MutableMapping
+from typing import NamedTuple
 from typing import NoReturn
 from typing import Optional
 from typing import overload
+from typing import Sequence
 from typing import Tuple
 from typing import Type
 from typing import TypeVar
@@ -26,9 +33,11 @@ from typing import Union
 
 from .interfaces import _IsolationLevel
 from .interfaces import BindTyping
+from .interfaces import CacheStats
 from .interfaces import ConnectionEventsTarget
 from .interfaces import DBAPICursor
 from .interfaces import ExceptionContext
+from .interfaces import ExecuteStyle
 from .interfaces import ExecutionContext
 from .util import _distill_params_20
 from .util import _distill_raw_params
@@ -70,9 +79,11 @@ if typing.TYPE_CHECKING:
     from ..sql.ddl import SchemaDropper
     from ..sql.ddl import SchemaGenerator
     from ..sql.functions import FunctionElement
+    from ..sql.schema import Column
     from ..sql.schema import DefaultGenerator
     from ..sql.schema import HasSchemaAttr
     from ..sql.schema import SchemaItem
+    from ..sql.schema import Table
     from ..sql.selectable import TypedReturnsRows
 
 """Defines :class:`_engine.Connection` and :class:`_engine.Engine`.
@@ -128,6 +139,10 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
     _transaction: Optional[RootTransaction]
     _nested_transaction: Optional[NestedTransaction]
 
+    # DBAPI-level pipeline in progress, established by pipeline()
+    _pipeline: Optional[Any] = None
+    _pipeline_results: List[CursorResult[Any]]
+
     def __init__(
         self,
         engine: Engine,
@@ -154,6 +169,7 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
         self._transaction = self._nested_transaction = None
         self.__savepoint_seq = 0
         self.__in_begin = False
+        self.__transaction_was_reset = False
 
         self.__can_reconnect = _allow_revalidate
         self._allow_autobegin = _allow_autobegin
@@ -297,6 +313,20 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             :paramref:`_sa.create_engine.logging_name` - adds a name to the
             name used by the Python logger object itself.
 
+        :param insertmanyvalues_page_size: Available on:
+          :class:`_engine.Connection`, :class:`_engine.Engine`,
+          :class:`_sql.Executable`.
+
+          Number of rows to format into an INSERT statement when the
+          statement uses "insertmanyvalues" mode.   Defaults to the value
+          of :paramref:`_sa.create_engine.insertmanyvalues_page_size`.
+
+          .. versionadded:: 2.0
+
+          .. seealso::
+
+            :ref:`engine_insertmanyvalues`
+
         :param isolation_level: Available on: :class:`_engine.Connection`,
           :class:`_engine.Engine`.
 
@@ -354,6 +384,28 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
           or piped into a script that's later invoked by
           command line tools.
 
+        :param pad_expanding_parameters: Available on:
+          :class:`_engine.Connection`, :class:`_engine.Engine`,
+          :class:`_sql.Executable`.
+
+          When ``True``, the list of values given to an "expanding" IN
+          parameter is padded out to the next power of two by repeating its
+          last value, before the parameter is rendered into individual bound
+          parameters.   An IN list of 5, 6, 7 or 8 values then renders the
+          same SQL string in all cases, which bounds the number of distinct
+          statements a varying IN list produces, allowing the database's
+          prepared statement and plan caches as well as SQLAlchemy's own
+          rendering of the statement to be reused.  Repeated values don't
+          change the result of an IN or NOT IN comparison.  Lists close to
+          the database's limit on the number of bound parameters in a
+          single statement may exceed that limit once padded.
+
+          .. versionadded:: 2.0
+
+          .. seealso::
+
+            :ref:`engine_expanding_padding`
+
         :param stream_results: Available on: :class:`_engine.Connection`,
           :class:`_sql.Executable`.
 
@@ -367,6 +419,27 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
 
             :ref:`engine_stream_results`
 
+        :param prefetch_batches: Available on: :class:`_engine.Connection`,
+          :class:`_sql.Executable`.
+
+          When set to an integer, rows are fetched from the DBAPI cursor in
+          a background thread, in batches of ``max_row_buffer`` rows, into a
+          queue holding up to the given number of batches.  This allows
+          rows to be received from the database while previously received
+          rows are processed, and is typically used in conjunction with
+          ``stream_results``.  The connection should not be used for other
+          operations while such a result is being consumed.  Supported by
+          the psycopg2, psycopg and cx_Oracle dialects; for other dialects,
+          a warning is emitted and rows are fetched in batches within the
+          current thread.  Not supported for asyncio dialects, where the
+          option has no effect.
+
+          .. versionadded:: 2.0
+
+          .. seealso::
+
+            :ref:`engine_stream_results_prefetch`
+
         :param schema_translate_map: Available on: :class:`_engine.Connection`,
           :class:`_engine.Engine`, :class:`_sql.Executable`.
 
@@ -471,6 +544,9 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             except BaseException as e:
                 self._handle_dbapi_exception(e, None, None, None, None)
         else:
+            # the DBAPI connection may be used directly from this point,
+            # so the pool should reset it when it's returned
+            self.__transaction_was_reset = False
             return self._dbapi_connection
 
     def get_isolation_level(self) -> _IsolationLevel:
@@ -979,6 +1055,7 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
                 self._log_info("BEGIN (implicit)")
 
         self.__in_begin = True
+        self.__transaction_was_reset = False
 
         if self._has_events or self.engine._has_events:
             self.dispatch.begin(self)
@@ -1007,6 +1084,8 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
                 self.engine.dialect.do_rollback(self.connection)
             except BaseException as e:
                 self._handle_dbapi_exception(e, None, None, None, None)
+            else:
+                self.__transaction_was_reset = True
 
     def _commit_impl(self) -> None:
 
@@ -1025,6 +1104,8 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             self.engine.dialect.do_commit(self.connection)
         except BaseException as e:
             self._handle_dbapi_exception(e, None, None, None, None)
+        else:
+            self.__transaction_was_reset = True
 
     def _savepoint_impl(self, name: Optional[str] = None) -> str:
         if self._has_events or self.engine._has_events:
@@ -1056,6 +1137,7 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             self.dispatch.begin_twophase(self, transaction.xid)
 
         self.__in_begin = True
+        self.__transaction_was_reset = False
         try:
             self.engine.dialect.do_begin_twophase(self, transaction.xid)
         except BaseException as e:
@@ -1128,7 +1210,17 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
         if self._dbapi_connection is not None:
             conn = self._dbapi_connection
 
-            # as we just closed the transaction, close the connection
+            if not skip_reset and self.__transaction_was_reset:
+                # the most recent operation on the DBAPI connection was a
+                # commit() or rollback(), so there's no transaction to
+                # reset; the reset still takes place if "reset" event
+                # listeners are present, as these may perform other
+                # cleanup on the connection
+                skip_reset = not cast(
+                    "_ConnectionFairy", conn
+                )._pool.dispatch.reset
+
+            # as the transaction is closed, close the connection
             # pool connection without doing an additional reset
             if skip_reset:
                 cast("_ConnectionFairy", conn)._close_no_reset()
@@ -1516,6 +1608,10 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             "compiled_cache", self.engine._compiled_cache
         )
 
+        cache_stats = self.engine._compiled_cache_stats
+        if cache_stats is not None:
+            start = perf_counter()
+
         compiled_sql, extracted_params, cache_hit = elem._compile_w_cache(
             dialect=dialect,
             compiled_cache=compiled_cache,
@@ -1524,6 +1620,9 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             schema_translate_map=schema_translate_map,
             linting=self.dialect.compiler_linting | compiler.WARN_LINTING,
         )
+
+        if cache_stats is not None:
+            cache_stats.record(compiled_sql, cache_hit, perf_counter() - start)
         ret = self._execute_context(
             dialect,
             dialect.execution_ctx_cls._init_compiled,
@@ -1670,6 +1769,350 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
 
         return ret
 
+    def bulk_copy(
+        self,
+        table: Table,
+        rows: Iterable[Union[Mapping[str, Any], Sequence[Any]]],
+        columns: Optional[Sequence[Union[str, Column[Any]]]] = None,
+        binary: bool = False,
+    ) -> int:
+        r"""Load rows into a table using the database's bulk load facility,
+        returning the number of rows loaded.
+
+        For PostgreSQL, rows are streamed to the database using
+        ``COPY ... FROM STDIN``, which is significantly faster than
+        INSERT for large numbers of rows.   This is supported by the
+        psycopg, psycopg2 and asyncpg dialects, as indicated by the
+        :attr:`.Dialect.supports_bulk_copy` attribute; for other dialects,
+        :class:`.InvalidRequestError` is raised.
+
+        E.g.::
+
+            with engine.begin() as conn:
+                conn.bulk_copy(
+                    some_table,
+                    ({"id": i, "data": "row %d" % i} for i in range(1000000)),
+                )
+
+        Rows are consumed from the given iterable as they are sent to the
+        database, so that a generator may be used to load rows without
+        materializing them all in memory.   The bind processors for each
+        column's datatype are applied to each value, in the same way as
+        for an INSERT.   There is no RETURNING, and no INSERT events are
+        emitted; the :meth:`_events.ConnectionEvents.before_cursor_execute`
+        and :meth:`_events.ConnectionEvents.after_cursor_execute` events are
+        emitted for the COPY statement, with an empty parameter collection.
+
+        :param table: the :class:`_schema.Table` into which rows are loaded.
+
+        :param rows: an iterable of rows.   Each row is a dictionary keyed on
+         column key, or a tuple of values in the order given by the
+         :paramref:`_engine.Connection.bulk_copy.columns` parameter.
+
+        :param columns: a sequence of :class:`_schema.Column` objects or
+         column keys indicating the columns to be loaded.   If omitted, the
+         columns loaded are those present in the first row, which must be a
+         dictionary, along with those columns that have a Python-side scalar
+         or callable default.   A dictionary row that's missing a loaded
+         column will use that column's Python-side default, invoked with
+         an execution context of ``None`` if callable, else NULL.   Columns
+         that aren't loaded will receive their server-side default, if any;
+         a column that isn't loaded which has a client-side default, such
+         as a Python value, SQL expression or :class:`.Sequence`, raises
+         :class:`.InvalidRequestError`.
+
+        :param binary: when True, rows are sent using the database's binary
+         format, rather than text, if supported by the driver.   For
+         PostgreSQL, psycopg2 supports only the text format, and asyncpg
+         always uses the binary format.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`postgresql_bulk_copy`
+
+        """
+        dialect = self.dialect
+        if not dialect.supports_bulk_copy:
+            raise exc.InvalidRequestError(
+                "The %s dialect does not support bulk_copy()"
+                % (dialect.name + "+" + dialect.driver,)
+            )
+
+        rows = iter(rows)
+        for first_row in rows:
+            rows = itertools.chain([first_row], rows)
+            break
+        else:
+            return 0
+
+        if columns is None:
+            if not isinstance(first_row, collections_abc.Mapping):
+                raise exc.ArgumentError(
+                    "The columns parameter is required when rows are "
+                    "not dictionaries"
+                )
+            unconsumed = set(first_row).difference(table.c.keys())
+            if unconsumed:
+                raise exc.ArgumentError(
+                    "Unconsumed column names: %s"
+                    % (", ".join(sorted(unconsumed)),)
+                )
+            copy_columns = [
+                col
+                for col in table.c
+                if col.key in first_row
+                or (
+                    col.default is not None
+                    and (col.default.is_scalar or col.default.is_callable)
+                )
+            ]
+        else:
+            copy_columns = [
+                table.c[col] if isinstance(col, str) else col
+                for col in columns
+            ]
+
+        for col in table.c:
+            if col.default is not None and col not in copy_columns:
+                raise exc.InvalidRequestError(
+                    "Column %s has a client-side default, which can't be "
+                    "applied by bulk_copy() unless the column is loaded"
+                    % (col,)
+                )
+
+        def _default(col: Column[Any]) -> Callable[[], Any]:
+            default = col.default
+            if default is None:
+                return lambda: None
+            elif default.is_scalar:
+                return lambda: default.arg  # type: ignore
+            elif default.is_callable:
+                return lambda: default.arg(None)  # type: ignore
+            else:
+                raise exc.InvalidRequestError(
+                    "Column %s has a SQL expression default or Sequence, "
+                    "which can't be applied by bulk_copy(); a value "
+                    "must be present in each row" % (col,)
+                )
+
+        keys = [col.key for col in copy_columns]
+        processors = [
+            col.type._cached_bind_processor(dialect) for col in copy_columns
+        ]
+        defaults: Dict[str, Callable[[], Any]] = {}
+
+        def process_rows() -> Iterator[Sequence[Any]]:
+            for row in rows:
+                if isinstance(row, collections_abc.Mapping):
+                    values = []
+                    for col, key in zip(copy_columns, keys):
+                        if key in row:
+                            values.append(row[key])
+                        else:
+                            if key not in defaults:
+                                defaults[key] = _default(col)
+                            values.append(defaults[key]())
+                else:
+                    values = row  # type: ignore
+                    if len(values) != len(copy_columns):
+                        raise exc.ArgumentError(
+                            "Row %r has %d values; bulk_copy() expects %d "
+                            "values per row, for columns %s"
+                            % (
+                                row,
+                                len(values),
+                                len(copy_columns),
+                                ", ".join(keys),
+                            )
+                        )
+                yield tuple(
+                    [
+                        proc(value) if proc is not None else value
+                        for proc, value in zip(processors, values)
+                    ]
+                )
+
+        schema = table.schema
+        schema_translate_map = self._execution_options.get(
+            "schema_translate_map", None
+        )
+        if (
+            schema_translate_map
+            and table._use_schema_map
+            and schema in schema_translate_map
+        ):
+            schema = schema_translate_map[schema]
+
+        statement = dialect._bulk_copy_statement(
+            table, schema, copy_columns, binary
+        )
+        parameters: _DBAPISingleExecuteParams = ()
+
+        if (
+            self._transaction
+            and not self._transaction.is_active
+            or (
+                self._nested_transaction
+                and not self._nested_transaction.is_active
+            )
+        ):
+            self._invalid_transaction()
+
+        elif self._trans_context_manager:
+            TransactionalContext._trans_ctx_check(self)
+
+        if self._transaction is None:
+            self._autobegin()
+
+        dbapi_connection = self._dbapi_connection
+        if dbapi_connection is None:
+            dbapi_connection = self._revalidate_connection()
+        self.__transaction_was_reset = False
+        cursor = dbapi_connection.cursor()
+        try:
+            if self._has_events or self.engine._has_events:
+                for fn in self.dispatch.before_cursor_execute:
+                    statement, parameters = fn(
+                        self, cursor, statement, parameters, None, False
+                    )
+
+            if self._echo:
+                self._log_info(statement)
+            try:
+                rowcount = dialect.do_bulk_copy(
+                    cursor,
+                    statement,
+                    table,
+                    schema,
+                    copy_columns,
+                    process_rows(),
+                    binary,
+                )
+            except exc.ArgumentError:
+                # a malformed row, raised by process_rows()
+                raise
+            except BaseException as e:
+                self._handle_dbapi_exception(
+                    e, statement, parameters, cursor, None
+                )
+
+            if self._has_events or self.engine._has_events:
+                self.dispatch.after_cursor_execute(
+                    self, cursor, statement, parameters, None, False
+                )
+        finally:
+            self._safe_close_cursor(cursor)
+
+        return rowcount
+
+    @contextlib.contextmanager
+    def pipeline(self) -> Iterator[None]:
+        """Return a context manager within which statements are sent to
+        the database in a single pipeline, without waiting for the result
+        of each statement before sending the next one.
+
+        E.g.::
+
+            with engine.begin() as conn:
+                with conn.pipeline():
+                    r1 = conn.execute(
+                        update(table).where(table.c.id == 1).values(x=5)
+                    )
+                    r2 = conn.execute(delete(table).where(table.c.id == 2))
+
+                print(r1.rowcount, r2.rowcount)
+
+        Pipelining is supported by the psycopg (i.e. psycopg 3) dialect when
+        used with libpq 14 or greater, as indicated by the
+        :attr:`.Dialect.supports_pipeline` attribute.  For other dialects,
+        the context manager has no effect and statements are executed
+        normally.
+
+        INSERT, UPDATE and DELETE statements which don't make use of
+        RETURNING return their :class:`_engine.CursorResult` immediately;
+        the :attr:`_engine.CursorResult.rowcount` attribute of such a result
+        is delivered once the pipeline is synchronized.   The pipeline is
+        synchronized when the block ends, when the ``rowcount`` of a pending
+        result is accessed, and when a statement which returns rows is
+        executed, as that statement's rows must be received before its
+        result can be returned.
+
+        As statements are sent ahead of their results being received, an
+        error raised by one statement may be reported at the point the
+        pipeline is next synchronized, rather than by the call which
+        executed that statement.  Statements that follow the failed
+        statement are not executed.
+
+        Calls to :meth:`_engine.Connection.pipeline` may be nested, in which
+        case the inner block has no additional effect.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`postgresql_psycopg_pipeline`
+
+        """
+        if self._pipeline is not None or not self.dialect.supports_pipeline:
+            yield
+            return
+
+        dbapi_connection = self.connection.dbapi_connection
+        assert dbapi_connection is not None
+        try:
+            pipeline_ctx = self.dialect.do_pipeline(dbapi_connection)
+            pipeline = pipeline_ctx.__enter__()
+        except BaseException as e:
+            self._handle_dbapi_exception(e, None, None, None, None)
+
+        self._pipeline = pipeline
+        self._pipeline_results = []
+        try:
+            yield
+        except BaseException:
+            self._pipeline = None
+            try:
+                pipeline_ctx.__exit__(*sys.exc_info())
+            finally:
+                self._finish_pipelined_results()
+            raise
+        else:
+            self._pipeline = None
+            try:
+                pipeline_ctx.__exit__(None, None, None)
+            except BaseException as e:
+                self._finish_pipelined_results()
+                self._handle_dbapi_exception(e, None, None, None, None)
+            else:
+                self._finish_pipelined_results()
+
+    def _sync_pipeline(self) -> None:
+        try:
+            self._sync_pipeline_impl()
+        except BaseException as e:
+            self._handle_dbapi_exception(e, None, None, None, None)
+
+    def _sync_pipeline_impl(self) -> None:
+        assert self._pipeline is not None
+        try:
+            self.dialect.do_pipeline_sync(self._pipeline)
+        finally:
+            self._finish_pipelined_results()
+
+    def _finish_pipelined_results(self) -> None:
+        """Deliver the rowcount for results that were returned while the
+        pipeline was in progress, and release their cursors.
+
+        """
+        results, self._pipeline_results = self._pipeline_results, []
+        for result in results:
+            context = result.context
+            context._pipeline_pending = False
+            context._rowcount = context.cursor.rowcount
+            result._soft_close()
+
     def _execute_context(
         self,
         dialect: Dialect,
@@ -1687,6 +2130,7 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
             conn = self._dbapi_connection
             if conn is None:
                 conn = self._revalidate_connection()
+            self.__transaction_was_reset = False
 
             context = constructor(
                 dialect, self, conn, execution_options, *args, **kw
@@ -1716,6 +2160,9 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
 
         context.pre_exec()
 
+        if context.execute_style is ExecuteStyle.INSERTMANYVALUES:
+            return self._exec_insertmany_context(dialect, context)
+
         if dialect.bind_typing is BindTyping.SETINPUTSIZES:
             context._set_input_sizes()
 
@@ -1835,6 +2282,162 @@ class Connection(ConnectionEventsTarget, inspection.Inspectable["Inspector"]):
 
         return result
 
+    def _exec_insertmany_context(
+        self,
+        dialect: Dialect,
+        context: ExecutionContext,
+    ) -> CursorResult[Any]:
+        """continue the _execute_context() method for an "insertmanyvalues"
+        operation, which will invoke DBAPI
+        cursor.execute() one or more times with individual log and
+        event hook calls.
+
+        """
+        cursor, str_statement, parameters = (
+            context.cursor,
+            context.statement,
+            context.parameters,
+        )
+        compiled = cast("compiler.SQLCompiler", context.compiled)
+        imv = compiled._insertmanyvalues
+        assert imv is not None
+
+        batch_size = context.execution_options.get(
+            "insertmanyvalues_page_size", dialect.insertmanyvalues_page_size
+        )
+        if dialect.insertmanyvalues_max_parameters:
+            batch_size = max(
+                1,
+                min(
+                    batch_size,
+                    dialect.insertmanyvalues_max_parameters
+                    // max(imv.num_params_per_row, 1),
+                ),
+            )
+
+        engine_events = self._has_events or self.engine._has_events
+        if dialect._has_events:
+            do_execute_dispatch: Iterable[Any] = dialect.dispatch.do_execute
+        else:
+            do_execute_dispatch = ()
+
+        fetch_rows = bool(compiled.effective_returning)
+        rows: List[Any] = []
+        rowcount: Optional[int] = 0
+
+        for imv_batch in compiled._deliver_insertmanyvalues_batches(
+            str_statement, parameters, batch_size
+        ):
+            sub_stmt = imv_batch.replaced_statement
+            sub_params = imv_batch.replaced_parameters
+
+            if engine_events:
+                for fn in self.dispatch.before_cursor_execute:
+                    sub_stmt, sub_params = fn(
+                        self,
+                        cursor,
+                        sub_stmt,
+                        sub_params,
+                        context,
+                        True,
+                    )
+
+            if self._echo:
+                self._log_info(sub_stmt)
+
+                imv_stats = "%s/%s (%d rows)" % (
+                    imv_batch.batchnum,
+                    imv_batch.total_batches,
+                    imv_batch.batch_size,
+                )
+
+                if imv_batch.batchnum == 1:
+                    stats = "%s (insertmanyvalues) %s" % (
+                        context._get_cache_stats(),
+                        imv_stats,
+                    )
+                else:
+                    stats = "insertmanyvalues %s" % (imv_stats,)
+
+                if not self.engine.hide_parameters:
+                    self._log_info(
+                        "[%s] %r",
+                        stats,
+                        sql_util._repr_params(
+                            sub_params,
+                            batches=10,
+                            ismulti=False,
+                        ),
+                    )
+                else:
+                    self._log_info(
+                        "[%s] [SQL parameters hidden due to "
+                        "hide_parameters=True]" % (stats,)
+                    )
+
+            try:
+                for fn in do_execute_dispatch:
+                    if fn(
+                        cursor,
+                        sub_stmt,
+                        sub_params,
+                        context,
+                    ):
+                        break
+                else:
+                    dialect.do_execute(cursor, sub_stmt, sub_params, context)
+
+                if self._pipeline is not None:
+                    # rows and rowcount for the batch are present on the
+                    # cursor only once the pipeline is synchronized
+                    self._sync_pipeline_impl()
+
+                if fetch_rows:
+                    rows.extend(cursor.fetchall())
+
+                if rowcount is not None:
+                    batch_rowcount = cursor.rowcount
+                    rowcount = (
+                        rowcount + batch_rowcount
+                        if batch_rowcount >= 0
+                        else None
+                    )
+
+            except BaseException as e:
+                self._handle_dbapi_exception(
+                    e,
+                    sub_stmt,
+                    sub_params,
+                    cursor,
+                    context,
+                )
+
+            if engine_events:
+                self.dispatch.after_cursor_execute(
+                    self,
+                    cursor,
+                    sub_stmt,
+                    sub_params,
+                    context,
+                    True,
+                )
+
+        if fetch_rows:
+            context._insertmanyvalues_rows = rows
+        context._rowcount = rowcount
+
+        try:
+            context.post_exec()
+
+            result = context._setup_result_proxy()
+
+        except BaseException as e:
+            self._handle_dbapi_exception(
+                e, str_statement, parameters, cursor, context
+            )
+
+        return result
+
     def _cursor_execute(
         self,
         cursor: DBAPICursor,
@@ -2577,6 +3180,123 @@ class TwoPhaseTransaction(RootTransaction):
         self.connection._commit_twophase_impl(self.xid, self._is_prepared)
 
 
+class CompiledCacheStats(NamedTuple):
+    """Statistics for the compiled cache of an :class:`_engine.Engine`.
+
+    Returned by the :meth:`_engine.Engine.compiled_cache_stats` method.
+
+    Times are in seconds, as measured by ``time.perf_counter()``.
+
+    .. versionadded:: 2.0
+
+    .. seealso::
+
+        :ref:`sql_caching_stats`
+
+    """
+
+    hits: int
+    """Number of statement executions where the compiled form of the
+    statement was found in the cache."""
+
+    misses: int
+    """Number of statement executions where the statement was compiled
+    and placed in the cache."""
+
+    no_cache_key: int
+    """Number of statement executions where the statement could not produce
+    a cache key, and was therefore compiled without being cached."""
+
+    caching_disabled: int
+    """Number of statement executions where caching was disabled, either
+    via the :paramref:`.Connection.execution_options.compiled_cache`
+    option or because the dialect does not support caching."""
+
+    evictions: int
+    """Number of compiled statements pruned from the cache of the
+    :class:`_engine.Engine` due to its size limit."""
+
+    size: int
+    """Current number of compiled statements in the cache of the
+    :class:`_engine.Engine`."""
+
+    capacity: int
+    """The :paramref:`_sa.create_engine.query_cache_size` of the
+    :class:`_engine.Engine`."""
+
+    cache_key_time: float
+    """Total time spent generating cache keys and looking them up in the
+    cache."""
+
+    compile_time: float
+    """Total time spent compiling statements into SQL strings."""
+
+    slowest_statements: List[Tuple[str, float]]
+    """The SQL strings and compile times of the statements currently in
+    the cache of the :class:`_engine.Engine` that took the longest to
+    compile, slowest first."""
+
+    uncacheable_statements: List[Tuple[str, int]]
+    """The SQL strings of statements that could not produce a cache key,
+    along with the number of times each was executed, most frequent
+    first."""
+
+
+class _CompiledCacheStatsCollector:
+    """Accumulates the counters returned by
+    :meth:`_engine.Engine.compiled_cache_stats`."""
+
+    __slots__ = (
+        "hits",
+        "misses",
+        "no_cache_key",
+        "caching_disabled",
+        "evictions",
+        "cache_key_time",
+        "compile_time",
+        "uncacheable",
+    )
+
+    # maximum number of distinct uncacheable SQL strings that are tracked
+    max_uncacheable = 100
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.hits = self.misses = self.no_cache_key = 0
+        self.caching_disabled = self.evictions = 0
+        self.cache_key_time = self.compile_time = 0.0
+        self.uncacheable: Dict[str, int] = {}
+
+    def record(
+        self, compiled: Compiled, cache_hit: CacheStats, elapsed: float
+    ) -> None:
+        if cache_hit is CacheStats.CACHE_HIT:
+            self.hits += 1
+            self.cache_key_time += elapsed
+            return
+
+        compile_time = compiled._gen_duration
+        self.compile_time += compile_time
+
+        if cache_hit is CacheStats.CACHE_MISS:
+            self.misses += 1
+            self.cache_key_time += elapsed - compile_time
+        elif cache_hit is CacheStats.NO_CACHE_KEY:
+            self.no_cache_key += 1
+            self.cache_key_time += elapsed - compile_time
+
+            sql = compiled.string
+            uncacheable = self.uncacheable
+            if sql in uncacheable:
+                uncacheable[sql] += 1
+            elif len(uncacheable) < self.max_uncacheable:
+                uncacheable[sql] = 1
+        else:
+            self.caching_disabled += 1
+
+
 class Engine(
     ConnectionEventsTarget, log.Identified, inspection.Inspectable["Inspector"]
 ):
@@ -2603,6 +3323,7 @@ class Engine(
     dispatch: dispatcher[ConnectionEventsTarget]
 
     _compiled_cache: Optional[_CompiledCacheType]
+    _compiled_cache_stats: Optional[_CompiledCacheStatsCollector]
 
     _execution_options: _ExecuteOptions = _EMPTY_EXECUTION_OPTS
     _has_events: bool = False
@@ -2628,6 +3349,7 @@ class Engine(
         query_cache_size: int = 500,
         execution_options: Optional[Mapping[str, Any]] = None,
         hide_parameters: bool = False,
+        query_cache_stats: bool = False,
     ):
         self.pool = pool
         self.url = url
@@ -2642,11 +3364,17 @@ class Engine(
             )
         else:
             self._compiled_cache = None
+        if query_cache_stats:
+            self._compiled_cache_stats = _CompiledCacheStatsCollector()
+        else:
+            self._compiled_cache_stats = None
         log.instance_logger(self, echoflag=echo)
         if execution_options:
             self.update_execution_options(**execution_options)
 
     def _lru_size_alert(self, cache: util.LRUCache[Any, Any]) -> None:
+        if self._compiled_cache_stats is not None:
+            self._compiled_cache_stats.evictions += len(cache) - cache.capacity
         if self._should_log_info:
             self.logger.info(
                 "Compiled cache size pruning from %d items to %d.  "
@@ -2679,6 +3407,77 @@ class Engine(
         if self._compiled_cache:
             self._compiled_cache.clear()
 
+    def compiled_cache_stats(
+        self, top: int = 10, reset: bool = False
+    ) -> CompiledCacheStats:
+        """Return statistics for the compiled cache of this
+        :class:`_engine.Engine`.
+
+        Statistics are collected only if the
+        :paramref:`_sa.create_engine.query_cache_stats` parameter is set.
+        Hits and misses are counted for all statements executed via this
+        :class:`_engine.Engine`, including those which make use of a
+        separate cache via the
+        :paramref:`.Connection.execution_options.compiled_cache` option.
+
+        :param top: maximum number of entries to return for the
+         :attr:`.CompiledCacheStats.slowest_statements` and
+         :attr:`.CompiledCacheStats.uncacheable_statements` lists.
+
+        :param reset: if True, reset the counters to zero after collecting
+         them, so that the next call returns statistics for the interval
+         in between.   The contents of the cache itself are not affected.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`sql_caching_stats`
+
+        """
+        stats = self._compiled_cache_stats
+        if stats is None:
+            raise exc.InvalidRequestError(
+                "Compiled cache statistics are not enabled for this "
+                "Engine; pass query_cache_stats=True to create_engine()"
+            )
+
+        cache = self._compiled_cache
+        if cache is not None:
+            compiled = list(cache.values())
+            slowest = [
+                (c.string, c._gen_duration)
+                for c in sorted(
+                    compiled, key=lambda c: c._gen_duration, reverse=True
+                )[:top]
+            ]
+            size = len(compiled)
+            capacity = cache.capacity  # type: ignore[attr-defined]
+        else:
+            slowest = []
+            size = capacity = 0
+
+        result = CompiledCacheStats(
+            stats.hits,
+            stats.misses,
+            stats.no_cache_key,
+            stats.caching_disabled,
+            stats.evictions,
+            size,
+            capacity,
+            stats.cache_key_time,
+            stats.compile_time,
+            slowest,
+            sorted(
+                stats.uncacheable.items(),
+                key=lambda item: item[1],
+                reverse=True,
+            )[:top],
+        )
+        if reset:
+            stats.reset()
+        return result
+
     def update_execution_options(self, **opt: Any) -> None:
         r"""Update the default execution_options dictionary
         of this :class:`_engine.Engine`.
@@ -2961,6 +3760,7 @@ class OptionEngineMixin(log.Identified):
 
     dispatch: dispatcher[ConnectionEventsTarget]
     _compiled_cache: Optional[_CompiledCacheType]
+    _compiled_cache_stats: Optional[_CompiledCacheStatsCollector]
     dialect: Dialect
     pool: Pool
     url: URL
@@ -2976,6 +3776,7 @@ class OptionEngineMixin(log.Identified):
         self.logging_name = proxied.logging_name
         self.echo = proxied.echo
         self._compiled_cache = proxied._compiled_cache
+        self._compiled_cache_stats = proxied._compiled_cache_stats
         self.hide_parameters = proxied.hide_parameters
         log.instance_logger(self, echoflag=self.echo)
 
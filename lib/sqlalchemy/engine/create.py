@@ -58,6 +58,7 @@ def create_engine(
     future: Literal[True],
     hide_parameters: bool = ...,
     implicit_returning: Literal[True] = ...,
+    insertmanyvalues_page_size: int = ...,
     isolation_level: _IsolationLevel = ...,
     json_deserializer: Callable[..., Any] = ...,
     json_serializer: Callable[..., Any] = ...,
@@ -72,13 +73,20 @@ def create_engine(
     poolclass: Optional[Type[Pool]] = ...,
     pool_logging_name: str = ...,
     pool_pre_ping: bool = ...,
+    pool_pre_ping_interval: Optional[float] = ...,
+    pool_idle_ping_interval: Optional[float] = ...,
+    pool_idle_timeout: float = ...,
+    pool_min_size: int = ...,
+    pool_metrics: bool = ...,
     pool_size: int = ...,
     pool_recycle: int = ...,
     pool_reset_on_return: Optional[_ResetStyleArgType] = ...,
     pool_timeout: float = ...,
     pool_use_lifo: bool = ...,
+    pool_wait_threshold: float = ...,
     plugins: List[str] = ...,
     query_cache_size: int = ...,
+    query_cache_stats: bool = ...,
     **kwargs: Any,
 ) -> Engine:
     ...
@@ -273,6 +281,21 @@ def create_engine(url: Union[str, "_url.URL"], **kwargs: Any) -> Engine:
         :paramref:`.Table.implicit_returning` parameter.
 
 
+    :param insertmanyvalues_page_size: number of rows to format into an
+     INSERT statement when the statement uses "insertmanyvalues" mode, which is
+     a paged form of bulk insert that is used for many backends when using
+     :term:`executemany` execution typically in conjunction with RETURNING.
+     Defaults to 1000, but may also be subject to dialect-specific limiting
+     factors which may override this value on a per-statement basis.
+
+     .. versionadded:: 2.0
+
+     .. seealso::
+
+        :ref:`engine_insertmanyvalues`
+
+        :paramref:`_engine.Connection.execution_options.insertmanyvalues_page_size`
+
     :param isolation_level: optional string name of an isolation level
         which will be set on all new connections unconditionally.
         Isolation levels are typically some subset of the string names
@@ -422,6 +445,63 @@ def create_engine(url: Union[str, "_url.URL"], **kwargs: Any) -> Engine:
 
             :ref:`pool_disconnects_pessimistic`
 
+    :param pool_pre_ping_interval: a number of seconds; when used with
+        ``pool_pre_ping``, only connections that have been idle in the pool
+        for longer than this interval are tested upon checkout.  Sets the
+        :paramref:`_pool.Pool.pre_ping_interval` parameter.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`pool_disconnects_pessimistic_interval`
+
+    :param pool_idle_ping_interval: a number of seconds; when set, a
+        background thread tests connections that have been idle in the
+        pool for at least this interval, reconnecting those which fail.
+        Sets the :paramref:`_pool.QueuePool.idle_ping_interval`
+        parameter.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`pool_disconnects_pessimistic_interval`
+
+    :param pool_idle_timeout=60: used with
+        :class:`~sqlalchemy.pool.AdaptiveQueuePool`, the number of seconds
+        a connection may remain unused in the pool before it's closed.
+        Sets the :paramref:`_pool.AdaptiveQueuePool.idle_timeout`
+        parameter.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`pool_adaptive`
+
+    :param pool_metrics=False: if True, the connection pool collects
+        counts and timings of checkouts, checkins and connects, available
+        from :meth:`_pool.Pool.get_metrics`.  Sets the
+        :paramref:`_pool.Pool.metrics` parameter.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`pool_metrics`
+
+    :param pool_min_size=0: the number of connections that
+        :class:`~sqlalchemy.pool.QueuePool` keeps open at all times, which
+        are established in the background upon first use of the engine.
+        Sets the :paramref:`_pool.QueuePool.min_size` parameter.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`pool_min_size`
+
     :param pool_size=5: the number of connections to keep open
         inside the connection pool. This used with
         :class:`~sqlalchemy.pool.QueuePool` as
@@ -475,6 +555,19 @@ def create_engine(url: Union[str, "_url.URL"], **kwargs: Any) -> Engine:
 
             :ref:`pool_disconnects`
 
+    :param pool_wait_threshold=0.01: used with
+        :class:`~sqlalchemy.pool.AdaptiveQueuePool`, the number of seconds
+        after which a checkout is considered to have waited for a
+        connection, causing the pool to open additional connections.
+        Sets the :paramref:`_pool.AdaptiveQueuePool.wait_threshold`
+        parameter.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`pool_adaptive`
+
     :param plugins: string list of plugin names to load.  See
         :class:`.CreateEnginePlugin` for background.
 
@@ -508,6 +601,18 @@ def create_engine(url: Union[str, "_url.URL"], **kwargs: Any) -> Engine:
 
      .. versionadded:: 1.4
 
+    :param query_cache_stats: when True, the :class:`_engine.Engine` collects
+     statistics on the use of its compiled cache, including cache hits and
+     misses as well as the time spent generating cache keys and compiling
+     statements, which are returned by the
+     :meth:`_engine.Engine.compiled_cache_stats` method.  Defaults to False.
+
+     .. versionadded:: 2.0
+
+     .. seealso::
+
+        :ref:`sql_caching_stats`
+
     """  # noqa
 
     if "strategy" in kwargs:
@@ -628,6 +733,12 @@ def create_engine(url: Union[str, "_url.URL"], **kwargs: Any) -> Engine:
             "events": "pool_events",
             "reset_on_return": "pool_reset_on_return",
             "pre_ping": "pool_pre_ping",
+            "pre_ping_interval": "pool_pre_ping_interval",
+            "idle_ping_interval": "pool_idle_ping_interval",
+            "min_size": "pool_min_size",
+            "idle_timeout": "pool_idle_timeout",
+            "wait_threshold": "pool_wait_threshold",
+            "metrics": "pool_metrics",
             "use_lifo": "pool_use_lifo",
         }
         for k in util.get_cls_kwargs(poolclass):
@@ -14,6 +14,8 @@ from __future__ import annotations
 
 import collections
 import functools
+import queue
+import threading
 import typing
 from typing import Any
 from typing import cast
@@ -28,6 +30,7 @@ from typing import Tuple
 from typing import TYPE_CHECKING
 from typing import TypeVar
 from typing import Union
+import weakref
 
 from .result import MergedResult
 from .result import Result
@@ -1133,6 +1136,174 @@ class BufferedRowCursorFetchStrategy(CursorFetchStrategy):
             self.handle_exception(result, dbapi_cursor, e)
 
 
+class _RowPrefetcher:
+    """Fetch batches of rows from a DBAPI cursor into a bounded queue,
+    using a background thread.
+
+    """
+
+    __slots__ = ("dbapi_cursor", "batch_size", "queue", "stopped", "thread")
+
+    def __init__(self, dbapi_cursor, batch_size, num_batches):
+        self.dbapi_cursor = dbapi_cursor
+        self.batch_size = batch_size
+        self.queue = queue.Queue(maxsize=num_batches)
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(
+            target=self._run, name="sqlalchemy-row-prefetch", daemon=True
+        )
+        self.thread.start()
+
+    def _put(self, item):
+        # poll so that the thread exits once stopped, even when the queue
+        # is full because rows are no longer being consumed
+        while not self.stopped.is_set():
+            try:
+                self.queue.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+            else:
+                return True
+        return False
+
+    def _run(self):
+        try:
+            while True:
+                rows = self.dbapi_cursor.fetchmany(self.batch_size)
+                if not self._put((rows, None)) or not rows:
+                    return
+        except BaseException as err:
+            self._put((None, err))
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+
+
+class PrefetchingCursorFetchStrategy(CursorFetchStrategy):
+    """A cursor fetch strategy which fetches rows from the DBAPI cursor
+    in a background thread.
+
+    This strategy is used when the ``prefetch_batches`` execution option is
+    present.  Batches of ``max_row_buffer`` rows, defaulting to 1000, are
+    fetched ahead of time into a queue holding up to ``prefetch_batches``
+    batches, so that rows are received from the database while the rows of
+    the current batch are being processed::
+
+        with psycopg2_engine.connect() as conn:
+
+            result = conn.execution_options(
+                stream_results=True, prefetch_batches=4
+                ).execute(text("select * from table"))
+
+    The connection must not be used for other operations while the result
+    is being consumed.  The strategy is used only for dialects which
+    indicate that the DBAPI allows a connection to be used by more than one
+    thread, via the :attr:`.Dialect.supports_threaded_fetch` attribute;
+    other dialects emit a warning and buffer rows as with
+    :class:`.BufferedRowCursorFetchStrategy`.  The option has no effect for
+    asyncio dialects.
+
+    .. versionadded:: 2.0
+
+    """
+
+    __slots__ = ("_rowbuffer", "_prefetcher", "__weakref__")
+
+    def __init__(self, dbapi_cursor, execution_options):
+        batch_size = execution_options.get("max_row_buffer", 1000)
+
+        # the first batch is fetched up front, as cursor.description is
+        # available only once rows are fetched for some DBAPIs, currently
+        # psycopg2 when used with server-side cursors
+        self._rowbuffer = collections.deque(dbapi_cursor.fetchmany(batch_size))
+
+        if self._rowbuffer:
+            self._prefetcher = prefetcher = _RowPrefetcher(
+                dbapi_cursor,
+                batch_size,
+                execution_options["prefetch_batches"],
+            )
+            # don't leave the thread running if the result is discarded
+            # without being closed
+            weakref.finalize(self, prefetcher.stopped.set)
+        else:
+            self._prefetcher = None
+
+    def _buffer_rows(self, result, dbapi_cursor):
+        prefetcher = self._prefetcher
+        if prefetcher is None:
+            return False
+
+        rows, err = prefetcher.queue.get()
+        if err is not None:
+            self._prefetcher = None
+            try:
+                raise err
+            except BaseException as e:
+                self.handle_exception(result, dbapi_cursor, e)
+        elif not rows:
+            self._prefetcher = None
+            return False
+
+        self._rowbuffer.extend(rows)
+        return True
+
+    def _stop(self):
+        if self._prefetcher is not None:
+            self._prefetcher.stop()
+            self._prefetcher = None
+        self._rowbuffer.clear()
+
+    def yield_per(self, result, dbapi_cursor, num):
+        if self._prefetcher is not None:
+            self._prefetcher.batch_size = num
+
+    def soft_close(self, result, dbapi_cursor):
+        self._stop()
+        super().soft_close(result, dbapi_cursor)
+
+    def hard_close(self, result, dbapi_cursor):
+        self._stop()
+        super().hard_close(result, dbapi_cursor)
+
+    def fetchone(self, result, dbapi_cursor, hard_close=False):
+        if not self._rowbuffer and not self._buffer_rows(
+            result, dbapi_cursor
+        ):
+            result._soft_close(hard=hard_close)
+            return None
+        return self._rowbuffer.popleft()
+
+    def fetchmany(self, result, dbapi_cursor, size=None):
+        if size is None:
+            return self.fetchall(result, dbapi_cursor)
+
+        rowbuffer = self._rowbuffer
+        while len(rowbuffer) < size and self._buffer_rows(
+            result, dbapi_cursor
+        ):
+            pass
+
+        if not rowbuffer:
+            result._soft_close()
+            return []
+        elif size >= len(rowbuffer):
+            rows = list(rowbuffer)
+            rowbuffer.clear()
+            return rows
+        else:
+            return [rowbuffer.popleft() for _ in range(size)]
+
+    def fetchall(self, result, dbapi_cursor):
+        while self._buffer_rows(result, dbapi_cursor):
+            pass
+        rows = list(self._rowbuffer)
+        self._rowbuffer.clear()
+        result._soft_close()
+        return rows
+
+
 class FullyBufferedCursorFetchStrategy(CursorFetchStrategy):
     """A cursor strategy that buffers rows fully upon creation.
 
@@ -1418,20 +1589,15 @@ class CursorResult(Result[_T]):
         as a row contained within a list; some dialects may support a
         multiple row form as well.
 
-        .. note:: As indicated below, in current SQLAlchemy versions this
-           accessor is only useful beyond what's already supplied by
-           :attr:`_engine.CursorResult.inserted_primary_key` when using the
-           :ref:`postgresql_psycopg2` dialect.   Future versions hope to
-           generalize this feature to more dialects.
-
         This accessor is added to support dialects that offer the feature
-        that is currently implemented by the :ref:`psycopg2_executemany_mode`
-        feature, currently **only the psycopg2 dialect**, which provides
-        for many rows to be INSERTed at once while still retaining the
-        behavior of being able to return server-generated primary key values.
-
-        * **When using the psycopg2 dialect, or other dialects that may support
-          "fast executemany" style inserts in upcoming releases** : When
+        of INSERTing many rows at once while still retaining the
+        behavior of being able to return server-generated primary key values,
+        which includes all dialects that make use of the
+        :ref:`engine_insertmanyvalues` feature as well as the
+        :ref:`psycopg2_executemany_mode` feature of psycopg2.
+
+        * **When using a dialect that supports
+          "insert executemany returning"**: When
           invoking an INSERT statement while passing a list of rows as the
           second argument to :meth:`_engine.Connection.execute`, this accessor
           will then provide a list of rows, where each row contains the primary
@@ -1446,12 +1612,11 @@ class CursorResult(Result[_T]):
           one row per row inserted in the statement, however it will contain
           ``None`` for any server-generated values.
 
-        Future releases of SQLAlchemy will further generalize the
-        "fast execution helper" feature of psycopg2 to suit other dialects,
-        thus allowing this accessor to be of more general use.
-
         .. versionadded:: 1.4
 
+        .. versionchanged:: 2.0 Generalized to all dialects that make use
+           of :ref:`engine_insertmanyvalues`.
+
         .. seealso::
 
             :attr:`_engine.CursorResult.inserted_primary_key`
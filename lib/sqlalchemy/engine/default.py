@@ -44,6 +44,7 @@ from .base import Connection
 from .interfaces import CacheStats
 from .interfaces import DBAPICursor
 from .interfaces import Dialect
+from .interfaces import ExecuteStyle
 from .interfaces import ExecutionContext
 from .reflection import ObjectKind
 from .reflection import ObjectScope
@@ -143,7 +144,13 @@ class DefaultDialect(Dialect):
     update_returning = False
     delete_returning = False
     insert_returning = False
-    insert_executemany_returning = False
+
+    use_insertmanyvalues = False
+
+    use_insertmanyvalues_wo_returning = False
+
+    insertmanyvalues_page_size = 1000
+    insertmanyvalues_max_parameters = 32700
 
     cte_follows_insert = False
 
@@ -169,6 +176,8 @@ class DefaultDialect(Dialect):
             "pool_size": util.asint,
             "max_overflow": util.asint,
             "future": util.asbool,
+            "insertmanyvalues_page_size": util.asint,
+            "query_cache_stats": util.asbool,
         }
     )
 
@@ -212,6 +221,15 @@ class DefaultDialect(Dialect):
 
     supports_multivalues_insert = False
 
+    supports_bulk_copy = False
+
+    supports_array_parameters = False
+
+    supports_threaded_fetch = False
+
+    supports_pipeline = False
+    use_pipeline_for_flush = False
+
     supports_is_distinct_from = True
 
     supports_server_side_cursors = False
@@ -271,6 +289,7 @@ class DefaultDialect(Dialect):
         # Linting.NO_LINTING constant
         compiler_linting: Linting = int(compiler.NO_LINTING),  # type: ignore
         server_side_cursors: bool = False,
+        insertmanyvalues_page_size: Optional[int] = None,
         **kwargs: Any,
     ):
         if server_side_cursors:
@@ -327,6 +346,9 @@ class DefaultDialect(Dialect):
         self.label_length = label_length
         self.compiler_linting = compiler_linting
 
+        if insertmanyvalues_page_size is not None:
+            self.insertmanyvalues_page_size = insertmanyvalues_page_size
+
     @util.deprecated_property(
         "2.0",
         "full_returning is deprecated, please use insert_returning, "
@@ -339,6 +361,24 @@ class DefaultDialect(Dialect):
             and self.delete_returning
         )
 
+    @property
+    def insert_executemany_returning(self):
+        """Default implementation for insert_executemany_returning, if not
+        otherwise overridden by the specific dialect.
+
+        The default dialect determines "insert_executemany_returning" is
+        available if the dialect in use has opted into using the
+        "use_insertmanyvalues" feature. If they haven't opted into that, then
+        this attribute is False, unless the dialect in question overrides this
+        and provides some other implementation (such as the psycopg2 dialect).
+
+        """
+        return (
+            self.insert_returning
+            and self.supports_multivalues_insert
+            and self.use_insertmanyvalues
+        )
+
     @util.memoized_property
     def loaded_dbapi(self) -> ModuleType:
         if self.dbapi is None:
@@ -683,6 +723,12 @@ class DefaultDialect(Dialect):
     def do_execute_no_params(self, cursor, statement, context=None):
         cursor.execute(statement)
 
+    def do_pipeline(self, dbapi_connection):
+        return dbapi_connection.pipeline()
+
+    def do_pipeline_sync(self, pipeline):
+        pipeline.sync()
+
     def is_disconnect(self, e, connection, cursor):
         return False
 
@@ -924,6 +970,8 @@ class DefaultExecutionContext(ExecutionContext):
     is_text = False
     isddl = False
 
+    execute_style: ExecuteStyle = ExecuteStyle.EXECUTE
+
     executemany = False
     compiled: Optional[Compiled] = None
     result_column_struct: Optional[
@@ -945,6 +993,12 @@ class DefaultExecutionContext(ExecutionContext):
 
     _has_rowcount = False
 
+    _rowcount: Optional[int] = None
+
+    _pipeline_pending = False
+
+    _insertmanyvalues_rows: Optional[List[Any]] = None
+
     # a hook for SQLite's translation of
     # result column names
     # NOTE: pyhive is using this hook, can't remove it :(
@@ -1085,6 +1139,12 @@ class DefaultExecutionContext(ExecutionContext):
 
             self.executemany = len(parameters) > 1
 
+        if self.executemany:
+            if compiled._insertmanyvalues is not None:
+                self.execute_style = ExecuteStyle.INSERTMANYVALUES
+            else:
+                self.execute_style = ExecuteStyle.EXECUTEMANY
+
         self.unicode_statement = compiled.string
 
         self.cursor = self.create_cursor()
@@ -1109,7 +1169,10 @@ class DefaultExecutionContext(ExecutionContext):
                 )
 
             expanded_state = compiled._process_parameters_for_postcompile(
-                self.compiled_parameters[0]
+                self.compiled_parameters[0],
+                _pad_expanding=self.execution_options.get(
+                    "pad_expanding_parameters", False
+                ),
             )
 
             # re-assign self.unicode_statement
@@ -1226,6 +1289,8 @@ class DefaultExecutionContext(ExecutionContext):
             ]
 
         self.executemany = len(parameters) > 1
+        if self.executemany:
+            self.execute_style = ExecuteStyle.EXECUTEMANY
 
         self.statement = self.unicode_statement = statement
 
@@ -1343,6 +1408,8 @@ class DefaultExecutionContext(ExecutionContext):
                 parameters = {}
 
         conn._cursor_execute(self.cursor, stmt, parameters, context=self)
+        if conn._pipeline is not None:
+            conn._sync_pipeline()
         row = self.cursor.fetchone()
         if row is not None:
             r = row[0]
@@ -1463,6 +1530,13 @@ class DefaultExecutionContext(ExecutionContext):
 
     @util.non_memoized_property
     def rowcount(self) -> int:
+        if self._rowcount is not None:
+            return self._rowcount
+        if self._pipeline_pending:
+            # rowcount for a statement in a pipeline is delivered once
+            # the pipeline is synchronized
+            self.root_connection._sync_pipeline()
+            return cast(int, self._rowcount)
         return self.cursor.rowcount
 
     def supports_sane_rowcount(self):
@@ -1472,11 +1546,24 @@ class DefaultExecutionContext(ExecutionContext):
         return self.dialect.supports_sane_multi_rowcount
 
     def _setup_result_proxy(self):
+        if self.root_connection._pipeline is not None:
+            if self._can_defer_in_pipeline():
+                return self._setup_pipelined_result()
+
+            # statement returns rows, or might; its result won't be
+            # present on the cursor until the pipeline is synchronized
+            self.root_connection._sync_pipeline_impl()
+
         if self.is_crud or self.is_text:
             result = self._setup_dml_or_text_result()
         else:
             strategy = self.cursor_fetch_strategy
-            if self._is_server_side and strategy is _cursor._DEFAULT_FETCH:
+            if (
+                strategy is _cursor._DEFAULT_FETCH
+                and self._use_prefetch_batches()
+            ):
+                strategy = self._prefetch_batches_strategy()
+            elif self._is_server_side and strategy is _cursor._DEFAULT_FETCH:
                 strategy = _cursor.BufferedRowCursorFetchStrategy(
                     self.cursor, self.execution_options
                 )
@@ -1502,6 +1589,63 @@ class DefaultExecutionContext(ExecutionContext):
 
         return result
 
+    def _can_defer_in_pipeline(self) -> bool:
+        """Return True if the result of this statement, which has been
+        sent within a pipeline, can be established without waiting for
+        the pipeline to be synchronized.
+
+        This is the case for INSERT, UPDATE and DELETE statements that
+        don't return rows, where only the rowcount is delivered later.
+
+        """
+        if (
+            not self.is_crud
+            or self.execute_style is ExecuteStyle.INSERTMANYVALUES
+            or self._is_implicit_returning
+            or self._is_explicit_returning
+        ):
+            return False
+        compiled = cast(SQLCompiler, self.compiled)
+        return not (self.isinsert and compiled.postfetch_lastrowid)
+
+    def _setup_pipelined_result(self):
+        result: _cursor.CursorResult[Any] = _cursor.CursorResult(
+            self, _cursor._NO_CURSOR_DML, None
+        )
+        self._has_rowcount = True
+        self._pipeline_pending = True
+
+        # the cursor is released once the pipeline is synchronized
+        self.root_connection._pipeline_results.append(result)
+        return result
+
+    def _use_prefetch_batches(self) -> bool:
+        # rows are fetched in a thread, which can't be used with asyncio
+        # dialects; for a cursor that's not server side, only consider
+        # statements that have actually returned rows
+        return (
+            bool(self.execution_options.get("prefetch_batches"))
+            and not self.dialect.is_async
+            and (self._is_server_side or self.cursor.description is not None)
+        )
+
+    def _prefetch_batches_strategy(self) -> _cursor.CursorFetchStrategy:
+        if self.dialect.supports_threaded_fetch:
+            return _cursor.PrefetchingCursorFetchStrategy(
+                self.cursor, self.execution_options
+            )
+
+        # the DBAPI connection may not be used from another thread;
+        # buffer rows in this thread instead
+        util.warn(
+            "The %s dialect does not support fetching rows in a background "
+            "thread; the prefetch_batches execution option will fetch rows "
+            "in batches without prefetching them." % self.dialect.name
+        )
+        return _cursor.BufferedRowCursorFetchStrategy(
+            self.cursor, self.execution_options
+        )
+
     def _setup_out_parameters(self, result):
         compiled = cast(SQLCompiler, self.compiled)
 
@@ -1544,7 +1688,19 @@ class DefaultExecutionContext(ExecutionContext):
             # return an "empty" primary key collection when accessed.
 
         strategy = self.cursor_fetch_strategy
-        if self._is_server_side and strategy is _cursor._DEFAULT_FETCH:
+        if self._insertmanyvalues_rows is not None:
+            # rows were fetched from each "insertmanyvalues" batch as it
+            # was executed; deliver them as a single buffered result
+            strategy = _cursor.FullyBufferedCursorFetchStrategy(
+                self.cursor, initial_buffer=self._insertmanyvalues_rows
+            )
+        elif (
+            strategy is _cursor._DEFAULT_FETCH
+            and self.is_text
+            and self._use_prefetch_batches()
+        ):
+            strategy = self._prefetch_batches_strategy()
+        elif self._is_server_side and strategy is _cursor._DEFAULT_FETCH:
             strategy = _cursor.BufferedRowCursorFetchStrategy(
                 self.cursor, self.execution_options
             )
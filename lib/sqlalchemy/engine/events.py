@@ -517,7 +517,11 @@ class ConnectionEvents(event.Events[ConnectionEventsTarget]):
         a DBAPI connection upon checkin, if the ``reset_on_return``
         flag is set to its default value of ``'rollback'``.
         To intercept this
-        rollback, use the :meth:`_events.PoolEvents.reset` hook.
+        rollback, use the :meth:`_events.PoolEvents.reset` hook.  When the
+        :class:`_engine.Connection` has already committed or rolled back
+        its transaction, this rollback is skipped unless listeners for
+        the :meth:`_events.PoolEvents.reset` hook are present; see
+        :meth:`_events.PoolEvents.reset_skipped`.
 
         :param conn: :class:`_engine.Connection` object
 
@@ -534,7 +538,11 @@ class ConnectionEvents(event.Events[ConnectionEventsTarget]):
         Note that the :class:`_pool.Pool` may also "auto-commit"
         a DBAPI connection upon checkin, if the ``reset_on_return``
         flag is set to the value ``'commit'``.  To intercept this
-        commit, use the :meth:`_events.PoolEvents.reset` hook.
+        commit, use the :meth:`_events.PoolEvents.reset` hook.  When the
+        :class:`_engine.Connection` has already committed or rolled back
+        its transaction, this commit is skipped unless listeners for the
+        :meth:`_events.PoolEvents.reset` hook are present; see
+        :meth:`_events.PoolEvents.reset_skipped`.
 
         :param conn: :class:`_engine.Connection` object
         """
@@ -63,6 +63,7 @@ if TYPE_CHECKING:
     from ..sql.schema import Column
     from ..sql.schema import DefaultGenerator
     from ..sql.schema import Sequence as Sequence_SchemaItem
+    from ..sql.schema import Table
     from ..sql.sqltypes import Integer
     from ..sql.type_api import _TypeMemoDict
     from ..sql.type_api import TypeEngine
@@ -550,6 +551,32 @@ class BindTyping(Enum):
     """
 
 
+class ExecuteStyle(Enum):
+    """indicates the :term:`DBAPI` cursor method that will be used to invoke
+    a statement.
+
+    .. versionadded:: 2.0
+
+    """
+
+    EXECUTE = 0
+    """indicates cursor.execute() will be used"""
+
+    EXECUTEMANY = 1
+    """indicates cursor.executemany() will be used."""
+
+    INSERTMANYVALUES = 2
+    """indicates cursor.execute() will be used with an INSERT where the
+    VALUES expression will be expanded to accommodate for multiple
+    parameter sets
+
+    .. seealso::
+
+        :ref:`engine_insertmanyvalues`
+
+    """
+
+
 VersionInfoType = Tuple[Union[int, str], ...]
 TableKey = Tuple[Optional[str], str]
 
@@ -974,6 +1001,111 @@ class Dialect(EventTarget):
 
     """
 
+    use_insertmanyvalues: bool
+    """if True, indicates "insertmanyvalues" functionality should be used
+    to allow for ``insert_executemany_returning`` behavior, if possible.
+
+    In practice, setting this to True means:
+
+    if ``supports_multivalues_insert``, ``insert_returning`` and
+    ``use_insertmanyvalues`` are all True, the SQL compiler will produce
+    an INSERT that will be interpreted by the :class:`.DefaultDialect`
+    as an :attr:`.ExecuteStyle.INSERTMANYVALUES` execution that allows
+    for INSERT of many rows with RETURNING by rewriting a single-row
+    INSERT statement to have multiple VALUES clauses, also executing
+    the statement multiple times for a series of batches when large numbers
+    of rows are given.
+
+    The parameter is False for the default dialect, and is set to
+    True for SQLAlchemy internal dialects SQLite, MySQL/MariaDB, and
+    PostgreSQL other than psycopg2, which makes use of its own
+    ``execute_values()`` based batching.
+
+    .. versionadded:: 2.0
+
+    .. seealso::
+
+        :ref:`engine_insertmanyvalues`
+
+    """
+
+    use_insertmanyvalues_wo_returning: bool
+    """if True, and use_insertmanyvalues is also True, INSERT statements
+    that don't include RETURNING will also use "insertmanyvalues".
+
+    .. versionadded:: 2.0
+
+    """
+
+    insertmanyvalues_page_size: int
+    """Number of rows to render into an individual INSERT..VALUES() statement
+    for :attr:`.ExecuteStyle.INSERTMANYVALUES` executions.
+
+    The default dialect defaults this to 1000.
+
+    .. versionadded:: 2.0
+
+    .. seealso::
+
+        :paramref:`_engine.Connection.execution_options.insertmanyvalues_page_size` -
+        execution option available on :class:`_engine.Connection`, statements
+
+    """  # noqa: E501
+
+    insertmanyvalues_max_parameters: int
+    """Alternate to insertmanyvalues_page_size, will additionally limit
+    page size based on number of parameters total in the statement.
+
+    .. versionadded:: 2.0
+
+    """
+
+    supports_bulk_copy: bool
+    """dialect supports the :meth:`_engine.Connection.bulk_copy` method,
+    which loads rows into a table using the database's bulk load facility,
+    such as PostgreSQL's ``COPY ... FROM STDIN``.
+
+    .. versionadded:: 2.0
+
+    """
+
+    supports_array_parameters: bool
+    """indicates the driver accepts a Python list as the value of a single
+    bound parameter of an ARRAY datatype, so that an expression such as
+    ``column = ANY (:param)`` may be used in place of an IN expression
+    with one bound parameter per value.
+
+    .. versionadded:: 2.0
+
+    """
+
+    supports_threaded_fetch: bool
+    """indicates the DBAPI cursor may be fetched from a thread other than
+    the one which executed the statement, so that the ``prefetch_batches``
+    execution option can fetch rows in a background thread.
+
+    .. versionadded:: 2.0
+
+    """
+
+    supports_pipeline: bool
+    """dialect supports the :meth:`_engine.Connection.pipeline` method,
+    which sends statements to the database without waiting for the
+    result of each one, such as psycopg 3's pipeline mode.
+
+    .. versionadded:: 2.0
+
+    """
+
+    use_pipeline_for_flush: bool
+    """the ORM unit of work emits the UPDATE and DELETE statements of a
+    flush using :meth:`_engine.Connection.pipeline`, for dialects which
+    set :attr:`.Dialect.supports_pipeline`.
+
+    .. versionadded:: 2.0
+
+    """
+
     _type_memos: MutableMapping[TypeEngine[Any], "_TypeMemoDict"]
 
     def _builtin_onconnect(self) -> Optional[_ListenerFnType]:
@@ -1936,6 +2068,92 @@ class Dialect(EventTarget):
 
         raise NotImplementedError()
 
+    def do_bulk_copy(
+        self,
+        cursor: DBAPICursor,
+        statement: str,
+        table: Table,
+        schema: Optional[str],
+        columns: Sequence[Column[Any]],
+        rows: Iterable[Sequence[Any]],
+        binary: bool,
+    ) -> int:
+        """Load the given rows into a table using the database's bulk load
+        facility, returning the number of rows loaded.
+
+        This method is invoked by :meth:`_engine.Connection.bulk_copy` for
+        dialects that set :attr:`.Dialect.supports_bulk_copy`.
+
+        :param cursor: a DBAPI cursor procured from the connection.
+
+        :param statement: the statement which loads the rows, as produced
+         by the dialect's ``_bulk_copy_statement()`` method and passed
+         through the :meth:`_events.ConnectionEvents.before_cursor_execute`
+         event.
+
+        :param table: the target :class:`_schema.Table`.
+
+        :param schema: the effective schema name of the table, which takes
+         into account the ``schema_translate_map`` execution option.
+
+        :param columns: the target :class:`_schema.Column` objects, in the
+         order that values are present in each row.
+
+        :param rows: an iterable of tuples, each one representing a row,
+         where bind processors for each column's datatype have been applied.
+
+        :param binary: if True, the rows should be transferred using the
+         database's binary format, if applicable.
+
+        .. versionadded:: 2.0
+
+        """
+
+        raise NotImplementedError()
+
+    def _bulk_copy_statement(
+        self,
+        table: Table,
+        schema: Optional[str],
+        columns: Sequence[Column[Any]],
+        binary: bool,
+    ) -> str:
+        raise NotImplementedError()
+
+    def do_pipeline(self, dbapi_connection: DBAPIConnection) -> Any:
+        """Return a context manager which places the given DBAPI connection
+        into pipeline mode for the duration of the block.
+
+        This method is invoked by :meth:`_engine.Connection.pipeline` for
+        dialects that set :attr:`.Dialect.supports_pipeline`.   The object
+        returned by the context manager's ``__enter__()`` method is passed
+        to :meth:`.Dialect.do_pipeline_sync`.   The ``__exit__()`` method
+        is expected to synchronize the pipeline, raising the first error
+        encountered by any statement that was sent.
+
+        :param dbapi_connection: a DBAPI connection, typically
+         proxied within a :class:`.ConnectionFairy`.
+
+        .. versionadded:: 2.0
+
+        """
+
+        raise NotImplementedError()
+
+    def do_pipeline_sync(self, pipeline: Any) -> None:
+        """Synchronize a pipeline established by :meth:`.Dialect.do_pipeline`,
+        waiting for the results of all statements sent so far to be
+        received.
+
+        :param pipeline: the object returned by the context manager
+         produced by :meth:`.Dialect.do_pipeline`.
+
+        .. versionadded:: 2.0
+
+        """
+
+        raise NotImplementedError()
+
     def is_disconnect(
         self,
         e: Exception,
@@ -2696,6 +2914,20 @@ class ExecutionContext:
     executemany: bool
     """True if the parameters have determined this to be an executemany"""
 
+    execute_style: ExecuteStyle
+    """the style of DBAPI cursor method that will be used to execute
+    a statement.
+
+    .. versionadded:: 2.0
+
+    """
+
+    _rowcount: Optional[int]
+
+    _pipeline_pending: bool
+
+    _insertmanyvalues_rows: Optional[List[Any]]
+
     prefetch_cols: util.generic_fn_descriptor[Optional[Sequence[Column[Any]]]]
     """a list of Column objects for which a client-side default
       was fired off.  Applies to inserts and updates."""
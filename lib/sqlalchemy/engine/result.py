@@ -9,6 +9,7 @@
 
 from __future__ import annotations
 
+import array
 from enum import Enum
 import functools
 import itertools
@@ -353,6 +354,41 @@ class _NoRow(Enum):
 
 _NO_ROW = _NoRow._NO_ROW
 
+
+def _column_buffer(values: Sequence[Any]) -> Sequence[Any]:
+    """Return a buffer for a sequence of column values.
+
+    Columns that contain only ``int`` or only ``float`` values are returned
+    as an ``array.array``; other columns, including those which contain
+    ``None``, are returned as a list.
+
+    """
+    first_type = type(values[0])
+    if first_type is int:
+        typecode = "q"
+    elif first_type is float:
+        typecode = "d"
+    else:
+        return list(values)
+
+    try:
+        return array.array(typecode, values)
+    except (TypeError, OverflowError):
+        return list(values)
+
+
+def _extend_column_buffer(
+    buffer: Sequence[Any], values: Sequence[Any]
+) -> Sequence[Any]:
+    if isinstance(buffer, array.array) and (
+        not isinstance(values, array.array)
+        or values.typecode != buffer.typecode
+    ):
+        buffer = list(buffer)
+    buffer.extend(values)  # type: ignore
+    return buffer
+
+
 SelfResultInternal = TypeVar("SelfResultInternal", bound="ResultInternal[Any]")
 
 
@@ -686,6 +722,67 @@ class ResultInternal(InPlaceGenerative, Generic[_R]):
 
         return manyrows
 
+    @HasMemoized_ro_memoized_attribute
+    def _columnar_getter(
+        self,
+    ) -> Callable[..., Optional[List[Sequence[Any]]]]:
+        real_result: Result[Any] = (
+            self._real_result
+            if self._real_result
+            else cast("Result[Any]", self)
+        )
+
+        if (
+            self._unique_filter_state
+            or self._post_creational_filter
+            or real_result._row_logging_fn
+            or real_result._source_supports_scalars
+        ):
+            # rows have to be constructed in order to be filtered or
+            # logged; transpose the rows that are produced
+            _manyrows = self._manyrow_getter
+
+            def columns(
+                self: ResultInternal[_R], num: Optional[int]
+            ) -> Optional[List[Sequence[Any]]]:
+                rows = _manyrows(self, num)
+                if not rows:
+                    return None
+                return [_column_buffer(col) for col in zip(*rows)]
+
+            return columns
+
+        metadata = self._metadata
+        tf = metadata._tuplefilter
+        processors: Optional[_ProcessorsType] = metadata._processors
+
+        if processors and tf:
+            processors = tf(processors)
+        if processors and not any(processors):
+            processors = None
+
+        def columns(
+            self: ResultInternal[_R], num: Optional[int]
+        ) -> Optional[List[Sequence[Any]]]:
+            if num is None:
+                num = real_result._yield_per
+
+            rows = self._fetchmany_impl(num)
+            if not rows:
+                return None
+
+            cols: Sequence[Sequence[Any]] = list(zip(*rows))
+            if tf:
+                cols = tf(cols)
+            if processors:
+                cols = [
+                    [proc(value) for value in col] if proc else col
+                    for col, proc in zip(cols, processors)
+                ]
+            return [_column_buffer(col) for col in cols]
+
+        return columns
+
     @overload
     def _only_one_row(
         self,
@@ -1232,6 +1329,122 @@ class Result(_WithKeys, ResultInternal[Row[_TP]]):
             else:
                 break
 
+    def partitions_columnar(
+        self, size: Optional[int] = None, as_numpy: bool = False
+    ) -> Iterator[List[Sequence[Any]]]:
+        """Iterate through groups of rows of the size given, with each
+        group delivered as a list of per-column sequences.
+
+        This method works like :meth:`_engine.Result.partitions`, however
+        instead of a list of :class:`_engine.Row` objects, each group of rows
+        is delivered as a list containing one sequence per column, in the
+        same order as :meth:`_engine.Result.keys`.   Result processors are
+        applied to each column as a whole, without building up
+        intermediary :class:`_engine.Row` objects.
+
+        Columns that contain only Python ``int`` or only Python ``float``
+        values are delivered as ``array.array`` objects of typecode ``"q"``
+        or ``"d"`` respectively; all other columns, including those which
+        contain ``None`` values, are delivered as lists.
+
+        .. versionadded:: 2.0
+
+        :param size: indicate the maximum number of rows to be present
+         in each group yielded.  If None, makes use of the value set by
+         :meth:`_engine.Result.yield_per`, if present, otherwise uses the
+         :meth:`_engine.Result.fetchmany` default which may be backend
+         specific.
+
+        :param as_numpy: if True, each column is delivered as a NumPy
+         array instead, where numeric columns are converted from their
+         ``array.array`` buffers and all others use the ``object`` dtype.
+         Requires that NumPy is installed.
+
+        :return: iterator of lists of column sequences
+
+        .. seealso::
+
+            :meth:`_engine.Result.columns_as_arrays`
+
+        """
+
+        if as_numpy:
+            to_numpy = self._numpy_converter()
+
+        getter = self._columnar_getter
+
+        while True:
+            partition = getter(self, size)
+            if partition is None:
+                break
+            if as_numpy:
+                partition = [to_numpy(col) for col in partition]
+            yield partition
+
+    def columns_as_arrays(
+        self, as_numpy: bool = False, size: Optional[int] = None
+    ) -> List[Sequence[Any]]:
+        """Return all remaining rows as a list of per-column sequences.
+
+        The rows are fetched in groups, as with
+        :meth:`_engine.Result.partitions_columnar`, with each group appended
+        to a buffer per column, so that the rows themselves are not retained.
+        Closes the result set after invocation.
+
+        If no rows remain, a list of empty lists is returned, one for
+        each column.
+
+        .. versionadded:: 2.0
+
+        :param as_numpy: if True, each column is returned as a NumPy array.
+         See :meth:`_engine.Result.partitions_columnar`.
+
+        :param size: the number of rows to fetch in each group.  If None,
+         makes use of the value set by :meth:`_engine.Result.yield_per`, if
+         present, otherwise 1000.
+
+        :return: a list of column sequences
+
+        """
+
+        buffers: Optional[List[Sequence[Any]]] = None
+
+        if size is None:
+            size = self._yield_per or 1000
+
+        for partition in self.partitions_columnar(size):
+            if buffers is None:
+                buffers = partition
+            else:
+                buffers = [
+                    _extend_column_buffer(buffer, values)
+                    for buffer, values in zip(buffers, partition)
+                ]
+
+        if buffers is None:
+            buffers = [[] for key in self.keys()]
+
+        if as_numpy:
+            to_numpy = self._numpy_converter()
+            buffers = [to_numpy(buffer) for buffer in buffers]
+        return buffers
+
+    def _numpy_converter(self) -> Callable[[Sequence[Any]], Any]:
+        import numpy
+
+        def to_numpy(buffer: Sequence[Any]) -> Any:
+            if isinstance(buffer, array.array):
+                return numpy.array(buffer)
+
+            # assign elements individually so that tuples or other
+            # sequences are not interpreted as additional dimensions
+            arr = numpy.empty(len(buffer), dtype=object)
+            for idx, value in enumerate(buffer):
+                arr[idx] = value
+            return arr
+
+        return to_numpy
+
     def fetchall(self) -> Sequence[Row[_TP]]:
         """A synonym for the :meth:`_engine.Result.all` method."""
 
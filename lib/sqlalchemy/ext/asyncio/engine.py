@@ -32,6 +32,7 @@ from ...engine import create_engine as _create_engine
 from ...engine import Engine
 from ...engine.base import NestedTransaction
 from ...engine.base import Transaction
+from ...pool import AsyncQueuePool
 from ...util.concurrency import greenlet_spawn
 from ...util.typing import Protocol
 
@@ -214,7 +215,7 @@ class AsyncConnection(
         if self.sync_connection:
             raise exc.InvalidRequestError("connection is already started")
         self.sync_connection = self._assign_proxied(
-            await (greenlet_spawn(self.sync_engine.connect))
+            await self.engine._sync_connect()
         )
         return self
 
@@ -910,6 +911,29 @@ class AsyncEngine(ProxyComparable[Engine], AsyncConnectable):
 
         return self._connection_cls(self)
 
+    async def _sync_connect(self) -> Connection:
+        sync_engine = self.sync_engine
+        pool = sync_engine.pool
+
+        # engine-level event handlers such as engine_connect may use the
+        # connection, so they are run within a greenlet along with the
+        # checkout
+        if not isinstance(pool, AsyncQueuePool) or sync_engine._has_events:
+            return await greenlet_spawn(sync_engine.connect)
+
+        dialect = sync_engine.dialect
+        try:
+            dbapi_connection = await pool.connect_async()
+        except dialect.loaded_dbapi.Error as err:
+            await greenlet_spawn(
+                Connection._handle_dbapi_exception_noconnection,
+                err,
+                dialect,
+                sync_engine,
+            )
+            raise
+        return sync_engine._connection_cls(sync_engine, dbapi_connection)
+
     async def raw_connection(self) -> PoolProxiedConnection:
         """Return a "raw" DBAPI connection from the connection pool.
 
@@ -918,6 +942,9 @@ class AsyncEngine(ProxyComparable[Engine], AsyncConnectable):
             :ref:`dbapi_connections`
 
         """
+        pool = self.sync_engine.pool
+        if isinstance(pool, AsyncQueuePool):
+            return await pool.connect_async()
         return await greenlet_spawn(self.sync_engine.raw_connection)
 
     def execution_options(self, **opt: Any) -> AsyncEngine:
@@ -12,6 +12,7 @@ from typing import Callable
 from typing import Generic
 from typing import Iterable
 from typing import Iterator
+from typing import List
 from typing import Optional
 from typing import overload
 from typing import Sequence
@@ -87,6 +88,7 @@ _T = TypeVar("_T", bound=Any)
         "is_modified",
         "invalidate",
         "merge",
+        "merge_all",
         "refresh",
         "rollback",
         "scalar",
@@ -104,6 +106,7 @@ _T = TypeVar("_T", bound=Any)
         "autoflush",
         "no_autoflush",
         "info",
+        "lazy_load_tracker",
     ],
 )
 class async_scoped_session(Generic[_AS]):
@@ -253,6 +256,47 @@ class async_scoped_session(Generic[_AS]):
         )
         return return_value
 
+    async def get_many(
+        self,
+        entity: _EntityBindKey[_O],
+        idents: Iterable[_PKIdentityArgument],
+        *,
+        options: Optional[Sequence[ORMOption]] = None,
+        populate_existing: bool = False,
+        with_for_update: Optional[ForUpdateArg] = None,
+        identity_token: Optional[Any] = None,
+        execution_options: _ExecuteOptionsParameter = util.EMPTY_DICT,
+        chunksize: int = 500,
+    ) -> List[Optional[_O]]:
+        r"""Return a list of instances based on the given primary key
+        identifiers, with ``None`` for each identifier not found.
+
+        .. container:: class_bases
+
+            Proxied for the :class:`_asyncio.AsyncSession` class on
+            behalf of the :class:`_asyncio.scoping.async_scoped_session` class.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :meth:`_orm.Session.get_many` - main documentation for get_many
+
+
+
+        """  # noqa: E501
+
+        return await self._proxied.get_many(
+            entity,
+            idents,
+            options=options,
+            populate_existing=populate_existing,
+            with_for_update=with_for_update,
+            identity_token=identity_token,
+            execution_options=execution_options,
+            chunksize=chunksize,
+        )
+
     # START PROXY METHODS async_scoped_session
 
     # code within this block is **programmatically,
@@ -905,6 +949,34 @@ class async_scoped_session(Generic[_AS]):
 
         return await self._proxied.merge(instance, load=load, options=options)
 
+    async def merge_all(
+        self,
+        instances: Iterable[_O],
+        *,
+        load: bool = True,
+        options: Optional[Sequence[ORMOption]] = None,
+    ) -> List[_O]:
+        r"""Copy the state of each of the given instances into a
+        corresponding instance within this :class:`_asyncio.AsyncSession`.
+
+        .. container:: class_bases
+
+            Proxied for the :class:`_asyncio.AsyncSession` class on
+            behalf of the :class:`_asyncio.scoping.async_scoped_session` class.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :meth:`_orm.Session.merge_all` - main documentation for merge_all
+
+
+        """  # noqa: E501
+
+        return await self._proxied.merge_all(
+            instances, load=load, options=options
+        )
+
     async def refresh(
         self,
         instance: object,
@@ -1410,6 +1482,25 @@ class async_scoped_session(Generic[_AS]):
 
         return self._proxied.info
 
+    @property
+    def lazy_load_tracker(self) -> Any:
+        r"""Proxy for the :attr:`_orm.Session.lazy_load_tracker` attribute
+        on behalf of the :class:`_asyncio.AsyncSession` class.
+
+        .. container:: class_bases
+
+            Proxied for the :class:`_asyncio.AsyncSession` class
+            on behalf of the :class:`_asyncio.scoping.async_scoped_session` class.
+
+
+        """  # noqa: E501
+
+        return self._proxied.lazy_load_tracker
+
+    @lazy_load_tracker.setter
+    def lazy_load_tracker(self, attr: Any) -> None:
+        self._proxied.lazy_load_tracker = attr
+
     @classmethod
     async def close_all(self) -> None:
         r"""Close all :class:`_asyncio.AsyncSession` sessions.
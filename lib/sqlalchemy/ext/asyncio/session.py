@@ -11,6 +11,7 @@ from typing import Dict
 from typing import Generic
 from typing import Iterable
 from typing import Iterator
+from typing import List
 from typing import NoReturn
 from typing import Optional
 from typing import overload
@@ -57,6 +58,7 @@ if TYPE_CHECKING:
     from ...orm.session import _PKIdentityArgument
     from ...orm.session import _SessionBind
     from ...orm.session import _SessionBindKey
+    from ...orm.session import LazyLoadTracker
     from ...sql._typing import _InfoType
     from ...sql.base import Executable
     from ...sql.elements import ClauseElement
@@ -104,6 +106,7 @@ _STREAM_OPTIONS = util.immutabledict({"stream_results": True})
         "autoflush",
         "no_autoflush",
         "info",
+        "lazy_load_tracker",
     ],
 )
 class AsyncSession(ReversibleProxy[Session]):
@@ -470,6 +473,41 @@ class AsyncSession(ReversibleProxy[Session]):
         )
         return result_obj
 
+    async def get_many(
+        self,
+        entity: _EntityBindKey[_O],
+        idents: Iterable[_PKIdentityArgument],
+        *,
+        options: Optional[Sequence[ORMOption]] = None,
+        populate_existing: bool = False,
+        with_for_update: Optional[ForUpdateArg] = None,
+        identity_token: Optional[Any] = None,
+        execution_options: _ExecuteOptionsParameter = util.EMPTY_DICT,
+        chunksize: int = 500,
+    ) -> List[Optional[_O]]:
+        """Return a list of instances based on the given primary key
+        identifiers, with ``None`` for each identifier not found.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :meth:`_orm.Session.get_many` - main documentation for get_many
+
+        """
+
+        return await greenlet_spawn(
+            self.sync_session.get_many,
+            entity,
+            idents,
+            options=options,
+            populate_existing=populate_existing,
+            with_for_update=with_for_update,
+            identity_token=identity_token,
+            execution_options=execution_options,
+            chunksize=chunksize,
+        )
+
     @overload
     async def stream(
         self,
@@ -616,6 +654,27 @@ class AsyncSession(ReversibleProxy[Session]):
             self.sync_session.merge, instance, load=load, options=options
         )
 
+    async def merge_all(
+        self,
+        instances: Iterable[_O],
+        *,
+        load: bool = True,
+        options: Optional[Sequence[ORMOption]] = None,
+    ) -> List[_O]:
+        """Copy the state of each of the given instances into a
+        corresponding instance within this :class:`_asyncio.AsyncSession`.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :meth:`_orm.Session.merge_all` - main documentation for merge_all
+
+        """
+        return await greenlet_spawn(
+            self.sync_session.merge_all, instances, load=load, options=options
+        )
+
     async def flush(self, objects: Optional[Sequence[Any]] = None) -> None:
         """Flush all the object changes to the database.
 
@@ -1318,6 +1377,19 @@ class AsyncSession(ReversibleProxy[Session]):
 
         return self._proxied.info
 
+    @property
+    def lazy_load_tracker(self) -> Optional[LazyLoadTracker]:
+        r"""Proxy for the :attr:`_orm.Session.lazy_load_tracker` attribute
+        on behalf of the :class:`_asyncio.AsyncSession` class.
+
+        """  # noqa: E501
+
+        return self._proxied.lazy_load_tracker
+
+    @lazy_load_tracker.setter
+    def lazy_load_tracker(self, attr: Optional[LazyLoadTracker]) -> None:
+        self._proxied.lazy_load_tracker = attr
+
     @classmethod
     def object_session(cls, instance: object) -> Optional[Session]:
         r"""Return the :class:`.Session` to which an object belongs.
@@ -16,12 +16,26 @@ the source distribution.
 
 """
 
+import asyncio
+from concurrent import futures
+import heapq
+import itertools
+import threading
+import time
+
 from .. import event
 from .. import exc
 from .. import inspect
 from .. import util
+from ..engine.result import MergedResult
+from ..orm import exc as orm_exc
 from ..orm.query import Query
 from ..orm.session import Session
+from ..sql import elements
+from ..sql import operators
+from ..sql.selectable import Select
+from ..util.concurrency import await_only
+from ..util.concurrency import greenlet_spawn
 
 __all__ = ["ShardedSession", "ShardedQuery"]
 
@@ -60,6 +74,9 @@ class ShardedSession(Session):
         execute_chooser=None,
         shards=None,
         query_cls=ShardedQuery,
+        max_concurrent_shards=None,
+        shard_timeout=None,
+        merge_ordered_results=False,
         **kwargs,
     ):
         """Construct a ShardedSession.
@@ -86,6 +103,52 @@ class ShardedSession(Session):
         :param shards: A dictionary of string shard names
           to :class:`~sqlalchemy.engine.Engine` objects.
 
+        :param max_concurrent_shards: when set to an integer greater than
+          one, a SELECT statement that is to be invoked against multiple
+          shards is invoked against up to this many shards concurrently,
+          rather than one shard at a time.  For a :class:`.ShardedSession`
+          used with :class:`_asyncio.AsyncSession`, the statements are
+          invoked as concurrent asyncio tasks; otherwise, a pool of worker
+          threads is used.   In both cases, a connection for each shard is
+          first procured by the calling thread, and the results are
+          combined in the order of the shard ids returned by the
+          ``execute_chooser``.  Shards which make use of the same
+          database connection, such as those that differ only in
+          ``schema_translate_map``, are invoked one at a time.
+
+          .. versionadded:: 2.0
+
+        :param shard_timeout: number of seconds to wait for the statement
+          invoked against each shard when ``max_concurrent_shards`` is in
+          use, counted from the time the statement is invoked.  If a shard
+          doesn't return a result within this time,
+          :class:`.exc.TimeoutError` is raised.   When using asyncio, the
+          pending statements are cancelled; when using threads, statements
+          which have not yet started are cancelled, and those which are in
+          progress are allowed to complete before the error is raised, as the
+          connections they're using belong to the :class:`.ShardedSession`.
+
+          .. versionadded:: 2.0
+
+        :param merge_ordered_results: when True, the results of a SELECT
+          statement that is invoked against multiple shards are combined
+          in terms of the statement's ORDER BY, LIMIT and OFFSET, rather than
+          being concatenated together.  Rows from each shard are merged as
+          they're fetched, so that when the ``yield_per`` execution option
+          is used, only as many rows are fetched from each shard as are
+          needed to produce the merged result.   LIMIT and OFFSET are
+          applied to the merged rows, with each shard being given a
+          LIMIT of the combined limit and offset.
+
+          Each ORDER BY expression must be either a column that's also
+          selected by the statement, or a mapped column of an entity
+          selected by the statement, so that its value can be retrieved from
+          each row.  NULL values are assumed to sort in the same way as the
+          database of the first shard, unless :meth:`_sql.nulls_first` or
+          :meth:`_sql.nulls_last` is used.
+
+          .. versionadded:: 2.0
+
         """
         query_chooser = kwargs.pop("query_chooser", None)
         super(ShardedSession, self).__init__(query_cls=query_cls, **kwargs)
@@ -115,6 +178,9 @@ class ShardedSession(Session):
         else:
             self.execute_chooser = execute_chooser
         self.query_chooser = query_chooser
+        self.max_concurrent_shards = max_concurrent_shards
+        self.shard_timeout = shard_timeout
+        self.merge_ordered_results = merge_ordered_results
         self.__binds = {}
         if shards is not None:
             for k in shards:
@@ -220,7 +286,9 @@ def execute_and_instances(orm_context):
 
     session = orm_context.session
 
-    def iter_for_shard(shard_id, load_options, update_options):
+    def iter_for_shard(
+        shard_id, load_options, update_options, statement=None
+    ):
         execution_options = dict(orm_context.local_execution_options)
 
         bind_arguments = dict(orm_context.bind_arguments)
@@ -234,7 +302,9 @@ def execute_and_instances(orm_context):
             execution_options["_sa_orm_update_options"] = update_options
 
         return orm_context.invoke_statement(
-            bind_arguments=bind_arguments, execution_options=execution_options
+            statement=statement,
+            bind_arguments=bind_arguments,
+            execution_options=execution_options,
         )
 
     if active_options and active_options._refresh_identity_token is not None:
@@ -249,8 +319,360 @@ def execute_and_instances(orm_context):
     if shard_id is not None:
         return iter_for_shard(shard_id, load_options, update_options)
     else:
-        partial = []
-        for shard_id in session.execute_chooser(orm_context):
-            result_ = iter_for_shard(shard_id, load_options, update_options)
-            partial.append(result_)
-        return partial[0].merge(*partial[1:])
+        shard_ids = list(session.execute_chooser(orm_context))
+
+        merge_ordered = (
+            orm_context.is_select
+            and isinstance(orm_context.statement, Select)
+            and session.merge_ordered_results
+            and len(shard_ids) > 1
+            and _supports_ordered_merge(orm_context.statement)
+        )
+        if merge_ordered:
+            statement, offset, limit = _shard_statement_for_merge(
+                orm_context.statement
+            )
+        else:
+            statement = None
+
+        if (
+            orm_context.is_select
+            and session.max_concurrent_shards
+            and session.max_concurrent_shards > 1
+            and len(shard_ids) > 1
+        ):
+            # UPDATE and DELETE are excluded as their "synchronize_session"
+            # step modifies objects in the Session as part of invocation
+            partial = _iter_for_shards_concurrently(
+                session,
+                shard_ids,
+                lambda shard_id: iter_for_shard(
+                    shard_id, load_options, update_options, statement
+                ),
+            )
+        else:
+            partial = [
+                iter_for_shard(
+                    shard_id, load_options, update_options, statement
+                )
+                for shard_id in shard_ids
+            ]
+
+        if merge_ordered:
+            dialect = session.get_bind(shard_id=shard_ids[0]).dialect
+            sort_key = _sort_key_for_statement(
+                orm_context.statement,
+                dialect,
+                partial[0]._source_supports_scalars,
+            )
+            return _OrderedMergedResult(partial, sort_key, offset, limit)
+        else:
+            return partial[0].merge(*partial[1:])
+
+
+def _supports_ordered_merge(statement):
+    """Return True if the LIMIT / OFFSET of the given SELECT can be applied
+    to the merged rows.
+
+    FETCH, as well as LIMIT / OFFSET given as SQL expressions, can't be
+    applied by the merge; statements that use them are invoked against
+    each shard as is, and the results are concatenated.
+
+    """
+    return statement._fetch_clause is None and all(
+        clause is None or statement._simple_int_clause(clause)
+        for clause in (statement._limit_clause, statement._offset_clause)
+    )
+
+
+def _shard_statement_for_merge(statement):
+    """Return the statement to be invoked against each shard for an
+    ordered merge, along with the offset and limit to be applied to the
+    merged rows.
+
+    """
+    offset, limit = statement._offset, statement._limit
+
+    if offset:
+        statement = statement.offset(None)
+        if limit is not None:
+            statement = statement.limit(offset + limit)
+    return statement, offset or 0, limit
+
+
+# databases which sort NULL as though it's greater than all other values,
+# when NULLS FIRST / NULLS LAST isn't given
+_nulls_sort_high = frozenset(["postgresql", "oracle"])
+
+
+class _Descending:
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+
+def _sort_key_for_statement(statement, dialect, scalars):
+    """Return a function that produces a sort key for a raw row of the
+    given ORM-enabled SELECT, in terms of its ORDER BY clause, or None
+    if the statement has no ORDER BY.
+
+    """
+
+    if not statement._order_by_clauses:
+        return None
+
+    descriptions = statement.column_descriptions
+
+    getters = []
+    for order_by in statement._order_by_clauses:
+        element = order_by
+        if isinstance(element, elements._label_reference):
+            element = element.element
+
+        descending = False
+        nulls_high = dialect.name in _nulls_sort_high
+        explicit_nulls = None
+        while isinstance(element, elements.UnaryExpression):
+            if element.modifier is operators.desc_op:
+                descending = True
+            elif element.modifier in (
+                operators.nulls_first_op,
+                operators.nulls_last_op,
+            ):
+                explicit_nulls = element.modifier
+            elif element.modifier is not operators.asc_op:
+                break
+            element = element.element
+
+        if explicit_nulls is not None:
+            # NULLS FIRST on a descending sort means NULL sorts high
+            nulls_high = descending is (
+                explicit_nulls is operators.nulls_first_op
+            )
+
+        getters.append(
+            (
+                _value_getter(element, descriptions, scalars),
+                descending,
+                nulls_high,
+            )
+        )
+
+    def sort_key(row):
+        key = []
+        for getter, descending, nulls_high in getters:
+            value = getter(row)
+            if value is None:
+                item = (1 if nulls_high else -1, None)
+            else:
+                item = (0, value)
+            key.append(_Descending(item) if descending else item)
+        return key
+
+    return sort_key
+
+
+def _value_getter(element, descriptions, scalars):
+    if isinstance(element, elements._textual_label_reference):
+        name = element.element
+    elif isinstance(element, elements.Label):
+        name = element.name
+    else:
+        name = None
+
+    parententity = element._annotations.get("parententity")
+    proxy_key = element._annotations.get("proxy_key")
+
+    for index, description in enumerate(descriptions):
+        entity = description["entity"]
+        expr = description["expr"]
+
+        if entity is not None and expr is entity:
+            # an entity; look for a mapped attribute of that entity
+            insp = inspect(entity)
+            if parententity is not None and proxy_key is not None:
+                if parententity is not insp:
+                    continue
+                key = proxy_key
+            elif insp.is_aliased_class or name is not None:
+                continue
+            else:
+                try:
+                    key = insp.mapper.get_property_by_column(element).key
+                except orm_exc.UnmappedColumnError:
+                    continue
+            return _entity_attribute_getter(index, key, scalars)
+        elif name is not None:
+            if description["name"] == name:
+                return _row_value_getter(index, scalars)
+        else:
+            if hasattr(expr, "__clause_element__"):
+                expr = expr.__clause_element__()
+            if isinstance(expr, elements.ColumnElement) and element.compare(
+                expr
+            ):
+                return _row_value_getter(index, scalars)
+
+    raise exc.InvalidRequestError(
+        "Can't merge the results of multiple shards in terms of ORDER BY "
+        "expression %s; ORDER BY expressions must be columns or labels "
+        "that are also in the columns clause of the SELECT, or columns of "
+        "an entity that's in the columns clause of the SELECT" % (element,)
+    )
+
+
+def _row_value_getter(index, scalars):
+    if scalars:
+        return lambda row: row
+    else:
+        return lambda row: row[index]
+
+
+def _entity_attribute_getter(index, key, scalars):
+    def get(row):
+        obj = row if scalars else row[index]
+        return getattr(obj, key) if obj is not None else None
+
+    return get
+
+
+class _OrderedMergedResult(MergedResult):
+    """A :class:`.MergedResult` that merges already-sorted results in terms
+    of a sort key, if any, applying an offset and limit to the merged rows.
+
+    """
+
+    def __init__(self, results, sort_key, offset, limit):
+        super(_OrderedMergedResult, self).__init__(
+            results[0]._metadata, results
+        )
+        if sort_key is not None:
+            iterator = heapq.merge(
+                *[r._raw_row_iterator() for r in results], key=sort_key
+            )
+        else:
+            iterator = self.iterator
+        if offset or limit is not None:
+            iterator = itertools.islice(
+                iterator,
+                offset,
+                offset + limit if limit is not None else None,
+            )
+        self.iterator = iterator
+
+
+def _iter_for_shards_concurrently(session, shard_ids, iter_for_shard):
+    """Invoke ``iter_for_shard`` for each of the given shard ids concurrently,
+    returning the results in the order of ``shard_ids``.
+
+    The :class:`.Session` is not thread safe; by procuring the connection
+    for each shard up front, the concurrent invocations only look up those
+    connections within the current transaction, and then make use of each
+    one exclusively.  ORM row processing, which interacts with the
+    identity map, occurs only once the merged result is consumed by the
+    calling thread.
+
+    """
+    connections = [
+        session.connection(bind_arguments={"shard_id": shard_id})
+        for shard_id in shard_ids
+    ]
+
+    # shards which share a single database connection, such as those
+    # that use schema_translate_map against one SQLite database, can't
+    # be invoked concurrently
+    if len(
+        {id(conn.connection.dbapi_connection) for conn in connections}
+    ) < len(connections):
+        return [iter_for_shard(shard_id) for shard_id in shard_ids]
+
+    max_concurrent = min(session.max_concurrent_shards, len(shard_ids))
+    timeout = session.shard_timeout
+
+    if connections[0].dialect.is_async:
+        return await_only(
+            _run_shard_tasks(
+                shard_ids, iter_for_shard, max_concurrent, timeout
+            )
+        )
+    else:
+        return _run_shard_threads(
+            shard_ids, iter_for_shard, max_concurrent, timeout
+        )
+
+
+def _shard_timeout_error(shard_id, timeout):
+    return exc.TimeoutError(
+        "Statement for shard %r did not complete within %s seconds"
+        % (shard_id, timeout)
+    )
+
+
+def _run_shard_threads(shard_ids, iter_for_shard, max_concurrent, timeout):
+    start_times = {}
+    started = {shard_id: threading.Event() for shard_id in shard_ids}
+
+    def run(shard_id):
+        start_times[shard_id] = time.perf_counter()
+        started[shard_id].set()
+        return iter_for_shard(shard_id)
+
+    executor = futures.ThreadPoolExecutor(
+        max_workers=max_concurrent, thread_name_prefix="sqla_shard"
+    )
+    tasks = []
+    try:
+        for shard_id in shard_ids:
+            tasks.append((shard_id, executor.submit(run, shard_id)))
+        results = []
+        for shard_id, task in tasks:
+            if timeout is None:
+                results.append(task.result())
+                continue
+
+            # tasks start in the order submitted, and the tasks preceding
+            # this one have completed, so it will have been started or be
+            # about to start
+            started[shard_id].wait()
+            remaining = start_times[shard_id] + timeout - time.perf_counter()
+            try:
+                results.append(task.result(timeout=max(remaining, 0)))
+            except futures.TimeoutError as err:
+                raise _shard_timeout_error(shard_id, timeout) from err
+        return results
+    finally:
+        # cancel tasks that haven't started, e.g. if an error was raised;
+        # tasks in progress are waited upon, as they are using connections
+        # that belong to the Session
+        for shard_id, task in tasks:
+            task.cancel()
+        executor.shutdown(wait=True)
+
+
+async def _run_shard_tasks(shard_ids, iter_for_shard, max_concurrent, timeout):
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def run(shard_id):
+        async with semaphore:
+            try:
+                return await asyncio.wait_for(
+                    greenlet_spawn(iter_for_shard, shard_id), timeout
+                )
+            except asyncio.TimeoutError as err:
+                raise _shard_timeout_error(shard_id, timeout) from err
+
+    tasks = [asyncio.ensure_future(run(shard_id)) for shard_id in shard_ids]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
@@ -52,24 +52,71 @@ needed for:
   point in time.  The serializer module is specifically for the opposite case,
   where the Table metadata is already present in memory.
 
+Persisting the compiled cache
+-----------------------------
+
+The same "contextual" approach is used by :func:`.dump_compiled_cache` and
+:func:`.load_compiled_cache`, which write the contents of an
+:class:`_engine.Engine` object's compiled statement cache (see
+:ref:`sql_caching`) to a file and pre-populate the cache of a new
+:class:`_engine.Engine` from it.   This allows a newly started process to skip
+the compilation step for statements that were already compiled by a previous
+process::
+
+    from sqlalchemy.ext.serializer import dump_compiled_cache
+    from sqlalchemy.ext.serializer import load_compiled_cache
+
+    # in a warmed-up process
+    with open("compiled_cache.pickle", "wb") as file_:
+        dump_compiled_cache(engine, file_)
+
+    # in a new process, before serving requests
+    with open("compiled_cache.pickle", "rb") as file_:
+        load_compiled_cache(engine, file_, metadata)
+
+The file records the SQLAlchemy version, the dialect in use and the server
+version information of the database; if any of these don't match those of the
+target :class:`_engine.Engine`, the file is ignored in its entirety.
+This feature is oriented towards Core statements against :class:`_schema.Table`
+objects.   Individual statements that can't be serialized, such as those that
+refer to Python functions or code objects (e.g. :func:`_sql.lambda_stmt`, as
+well as ORM-enabled statements), or that refer to :class:`_schema.Table`
+objects not present in the target :class:`_schema.MetaData`, are skipped.
+
+.. versionadded:: 2.0
+
 """
 
+from inspect import isfunction
 from io import BytesIO
 import pickle
 import re
+import time
 
+from .. import __version__
 from .. import Column
 from .. import Table
+from .. import util
+from ..engine import Dialect
 from ..engine import Engine
 from ..orm import class_mapper
 from ..orm.interfaces import MapperProperty
 from ..orm.mapper import Mapper
 from ..orm.session import Session
+from ..sql.compiler import Compiled
+from ..sql.compiler import IdentifierPreparer
 from ..util import b64decode
 from ..util import b64encode
 
 
-__all__ = ["Serializer", "Deserializer", "dumps", "loads"]
+__all__ = [
+    "Serializer",
+    "Deserializer",
+    "dumps",
+    "loads",
+    "dump_compiled_cache",
+    "load_compiled_cache",
+]
 
 
 def Serializer(*args, **kw):
@@ -99,6 +146,10 @@ def Serializer(*args, **kw):
             id_ = "session:"
         elif isinstance(obj, Engine):
             id_ = "engine:"
+        elif isinstance(obj, Dialect):
+            id_ = "dialect:"
+        elif isinstance(obj, IdentifierPreparer):
+            id_ = "preparer:"
         else:
             return None
         return id_
@@ -109,7 +160,7 @@ def Serializer(*args, **kw):
 
 our_ids = re.compile(
     r"(mapperprop|mapper|mapper_selectable|table|column|"
-    r"session|attribute|engine):(.*)"
+    r"session|attribute|engine|dialect|preparer):(.*)"
 )
 
 
@@ -155,6 +206,10 @@ def Deserializer(file, metadata=None, scoped_session=None, engine=None):
                 return scoped_session()
             elif type_ == "engine":
                 return get_engine()
+            elif type_ == "dialect":
+                return get_engine().dialect
+            elif type_ == "preparer":
+                return get_engine().dialect.identifier_preparer
             else:
                 raise Exception("Unknown token: %s" % type_)
 
@@ -173,3 +228,142 @@ def loads(data, metadata=None, scoped_session=None, engine=None):
     buf = BytesIO(data)
     unpickler = Deserializer(buf, metadata, scoped_session, engine)
     return unpickler.load()
+
+
+# version of the layout used by dump_compiled_cache(); bump when the
+# structure of the file changes
+_COMPILED_CACHE_FORMAT = 1
+
+
+def _compiled_cache_header(engine):
+    dialect = engine.dialect
+    return {
+        "format": _COMPILED_CACHE_FORMAT,
+        "sqlalchemy": __version__,
+        "dialect": "%s.%s"
+        % (type(dialect).__module__, type(dialect).__name__),
+        "paramstyle": dialect.paramstyle,
+        "server_version_info": dialect.server_version_info,
+    }
+
+
+def _memoized_attribute_names(cls):
+    """Return names of instance attributes of the given :class:`.Compiled`
+    subclass that hold memoized values.
+
+    These refer to processing functions and result metadata that are
+    dialect / DBAPI specific and are regenerated on demand after loading.
+
+    """
+    names = {"_cached_metadata"}
+    for supercls in cls.__mro__:
+        for name, value in vars(supercls).items():
+            # memoized_instancemethod() places a function in the
+            # instance dictionary under the name of the method
+            if isinstance(value, util.memoized_property) or isfunction(value):
+                names.add(name)
+    return names
+
+
+def _dump_compiled(key, compiled):
+    state = dict(compiled.__dict__)
+    for name in _memoized_attribute_names(type(compiled)).intersection(
+        state
+    ):
+        del state[name]
+    return dumps((key, type(compiled), state))
+
+
+def _load_compiled(data, metadata, engine):
+    key, cls, state = loads(data, metadata, engine=engine)
+    compiled = cls.__new__(cls)
+    compiled.__dict__.update(state)
+
+    # the compile time is relative to the process that compiled it
+    compiled._gen_time = time.perf_counter()
+    return key, compiled
+
+
+def dump_compiled_cache(engine, file):
+    """Write the contents of the compiled statement cache of the given
+    :class:`_engine.Engine` to the given file object.
+
+    The file object must be opened in binary mode.   Statements which
+    can't be serialized are skipped.
+
+    Returns the number of statements written.
+
+    .. versionadded:: 2.0
+
+    .. seealso::
+
+        :func:`.load_compiled_cache`
+
+    """
+    entries = []
+    if engine._compiled_cache is not None:
+        for key, compiled in list(engine._compiled_cache.items()):
+            if not isinstance(compiled, Compiled):
+                continue
+            try:
+                entries.append(_dump_compiled(key, compiled))
+            except (pickle.PicklingError, TypeError, AttributeError):
+                continue
+
+    pickle.dump(
+        {"header": _compiled_cache_header(engine), "entries": entries},
+        file,
+        pickle.HIGHEST_PROTOCOL,
+    )
+    return len(entries)
+
+
+def load_compiled_cache(engine, file, metadata=None):
+    """Populate the compiled statement cache of the given
+    :class:`_engine.Engine` from a file written by
+    :func:`.dump_compiled_cache`.
+
+    :param engine: the target :class:`_engine.Engine`.  A connection is
+     procured in order to ensure the dialect is initialized, so that the
+     server version information may be compared to that of the file.
+
+    :param file: file object opened in binary mode.
+
+    :param metadata: :class:`_schema.MetaData` which contains the
+     :class:`_schema.Table` objects referred to by the cached statements.
+
+    If the SQLAlchemy version, dialect or server version information recorded
+    in the file don't match those of the given :class:`_engine.Engine`, no
+    statements are loaded.   Statements which can't be restored, such as
+    those which refer to tables not present in the given
+    :class:`_schema.MetaData`, are skipped.
+
+    Returns the number of statements loaded.
+
+    .. versionadded:: 2.0
+
+    .. seealso::
+
+        :func:`.dump_compiled_cache`
+
+    """
+    cache = engine._compiled_cache
+    if cache is None:
+        return 0
+
+    with engine.connect():
+        pass
+
+    snapshot = pickle.load(file)
+    if snapshot["header"] != _compiled_cache_header(engine):
+        return 0
+
+    count = 0
+    for data in snapshot["entries"]:
+        try:
+            key, compiled = _load_compiled(data, metadata, engine)
+        except (pickle.UnpicklingError, KeyError, AttributeError):
+            continue
+        cache[key] = compiled
+        count += 1
+    return count
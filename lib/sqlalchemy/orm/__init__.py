@@ -100,6 +100,7 @@ from .relationships import Relationship as Relationship
 from .relationships import remote as remote
 from .scoping import scoped_session as scoped_session
 from .session import close_all_sessions as close_all_sessions
+from .session import LazyLoadTracker as LazyLoadTracker
 from .session import make_transient as make_transient
 from .session import make_transient_to_detached as make_transient_to_detached
 from .session import object_session as object_session
@@ -109,6 +110,7 @@ from .session import sessionmaker as sessionmaker
 from .session import SessionTransaction as SessionTransaction
 from .state import AttributeState as AttributeState
 from .state import InstanceState as InstanceState
+from .strategy_options import batchload as batchload
 from .strategy_options import contains_eager as contains_eager
 from .strategy_options import defaultload as defaultload
 from .strategy_options import defer as defer
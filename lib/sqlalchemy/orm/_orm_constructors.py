@@ -1231,6 +1231,17 @@ def relationship(
 
         .. versionadded:: 1.2
 
+      * ``batch`` - items should be loaded lazily when the property is
+        first accessed, as with ``select``; the first such load also
+        loads the property for all other objects which were loaded by the
+        same statement, using the same SQL as ``selectin`` loading.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`batch_lazy_loading`
+
       * ``noload`` - no loading should occur at any time.  This is to
         support "write-only" attributes, or attributes which are
         populated in some manner specific to the application.
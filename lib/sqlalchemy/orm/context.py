@@ -120,6 +120,8 @@ class QueryContext:
         "yield_per",
         "loaders_require_buffering",
         "loaders_require_uniquing",
+        "readonly_entities",
+        "readonly_identity_map",
     )
 
     runid: int
@@ -138,6 +140,7 @@ class QueryContext:
         _lazy_loaded_from = None
         _legacy_uniquing = False
         _sa_top_level_orm_context = None
+        _readonly_entities = False
 
     def __init__(
         self,
@@ -197,6 +200,18 @@ class QueryContext:
         self.yield_per = load_options._yield_per
         self.identity_token = load_options._refresh_identity_token
 
+        top_level_context = self.top_level_context
+        if top_level_context is not None:
+            # loads run on behalf of a top level load, e.g. selectinload,
+            # share its read-only mode and uniquing
+            self.readonly_entities = top_level_context.readonly_entities
+            self.readonly_identity_map = (
+                top_level_context.readonly_identity_map
+            )
+        else:
+            self.readonly_entities = load_options._readonly_entities
+            self.readonly_identity_map = {} if self.readonly_entities else None
+
     def _get_top_level_context(self) -> QueryContext:
         return self.top_level_context or self
 
@@ -338,6 +353,7 @@ class ORMCompileState(CompileState):
                 "autoflush",
                 "yield_per",
                 "sa_top_level_orm_context",
+                "readonly_entities",
             },
             execution_options,
             statement._execution_options,
@@ -389,6 +389,29 @@ class MapperProperty(
 
         """
 
+    def create_readonly_row_processor(
+        self,
+        context: ORMCompileState,
+        query_entity: _MapperEntity,
+        path: AbstractEntityRegistry,
+        mapper: Mapper[Any],
+        result: Result[Any],
+        adapter: Optional[ORMAdapter],
+        populators: _PopulatorDict,
+    ) -> None:
+        """Produce row processing functions for a load using the
+        ``readonly_entities`` execution option, and append to the given
+        set of populators lists.
+
+        ``"quick"`` populators are ``(key, getter)`` pairs as for
+        :meth:`.MapperProperty.create_row_processor`; ``"new"`` and
+        ``"existing"`` populators are called as ``fn(obj, dict_, row)``
+        where ``obj`` is a :class:`.ReadOnlyEntity` and ``dict_`` is its
+        ``__dict__``.  By default, nothing is produced and the attribute is
+        not populated.
+
+        """
+
     def cascade_iterator(
         self,
         type_: str,
@@ -970,6 +993,32 @@ class StrategizedProperty(MapperProperty[_T]):
             populators,
         )
 
+    def create_readonly_row_processor(
+        self,
+        context: ORMCompileState,
+        query_entity: _MapperEntity,
+        path: AbstractEntityRegistry,
+        mapper: Mapper[Any],
+        result: Result[Any],
+        adapter: Optional[ORMAdapter],
+        populators: _PopulatorDict,
+    ) -> None:
+        loader = self._get_context_loader(context, path)
+        if loader and loader.strategy:
+            strat = self._get_strategy(loader.strategy)
+        else:
+            strat = self.strategy
+        strat.create_readonly_row_processor(
+            context,
+            query_entity,
+            path,
+            loader,
+            mapper,
+            result,
+            adapter,
+            populators,
+        )
+
     def do_init(self) -> None:
         self._strategies = {}
         self.strategy = self._get_strategy(self.strategy_key)
@@ -1311,5 +1360,25 @@ class LoaderStrategy:
 
         """
 
+    def create_readonly_row_processor(
+        self,
+        context: ORMCompileState,
+        query_entity: _MapperEntity,
+        path: AbstractEntityRegistry,
+        loadopt: Optional[_LoadElement],
+        mapper: Mapper[Any],
+        result: Result[Any],
+        adapter: Optional[ORMAdapter],
+        populators: _PopulatorDict,
+    ) -> None:
+        """Establish row processing functions for a load using the
+        ``readonly_entities`` execution option.
+
+        This method fulfills the contract specified by
+        MapperProperty.create_readonly_row_processor(); strategies which
+        don't implement it leave their attribute unpopulated.
+
+        """
+
     def __str__(self) -> str:
         return str(self.parent_property)
@@ -36,6 +36,7 @@ from . import path_registry
 from .base import _DEFER_FOR_STATE
 from .base import _RAISE_FOR_STATE
 from .base import _SET_DEFERRED_EXPIRED
+from .base import class_mapper
 from .base import PassiveFlag
 from .util import _none_set
 from .util import state_str
@@ -180,6 +181,11 @@ def instances(cursor: CursorResult[Any], context: QueryContext) -> Result[Any]:
 
             context.partials = {}
 
+            if yield_per and context.readonly_entities:
+                # read-only entities are uniqued within each batch only,
+                # so that memory use stays bounded
+                context.readonly_identity_map.clear()
+
             if yield_per:
                 fetch = cursor.fetchmany(yield_per)
 
@@ -860,6 +866,19 @@ def _instance_processor(
 
         path.set(compile_state.attributes, getter_key, getters)
 
+    if context.readonly_entities:
+        return _readonly_instance_processor(
+            query_entity,
+            mapper,
+            context,
+            result,
+            path,
+            adapter,
+            getters,
+            polymorphic_discriminator,
+            _polymorphic_from,
+        )
+
     cached_populators = getters["cached_populators"]
 
     populators = {key: list(value) for key, value in cached_populators.items()}
@@ -1141,6 +1160,176 @@ def _instance_processor(
     return _instance
 
 
+class ReadOnlyEntity:
+    """Base class for objects loaded with the ``readonly_entities``
+    execution option.
+
+    A subclass is generated for each mapper; instances hold the loaded
+    attribute values in a plain ``__dict__``, have no
+    :class:`.InstanceState` and are not associated with any
+    :class:`.Session`.  Attributes can't be set or deleted.
+
+    Instances may be pickled, provided the mapped class can be; they're
+    unpickled as instances of the read-only class of the mapped class'
+    mapper.
+
+    """
+
+    __slots__ = ("__dict__", "_sa_identity_key")
+
+    _sa_mapper = None
+
+    def __setattr__(self, key, value):
+        raise AttributeError(
+            "Can't set attribute %r on read-only %s object"
+            % (key, type(self).__name__)
+        )
+
+    def __delattr__(self, key):
+        raise AttributeError(
+            "Can't delete attribute %r on read-only %s object"
+            % (key, type(self).__name__)
+        )
+
+    def __repr__(self):
+        return "<%s %r (read-only)>" % (
+            type(self).__name__,
+            self._sa_identity_key[1],
+        )
+
+    def __reduce__(self):
+        # the generated class can't be located by name, so pickle
+        # in terms of the mapped class instead.  the attributes are
+        # given as the state, which is applied after the object is
+        # memoized, so that cycles among objects are supported
+        return (
+            _unpickle_readonly_entity,
+            (self._sa_mapper.class_, self._sa_identity_key),
+            self.__dict__,
+        )
+
+
+_set_identity_key = ReadOnlyEntity._sa_identity_key.__set__
+
+
+def _unpickle_readonly_entity(class_, identity_key):
+    entity_class = class_mapper(class_)._readonly_entity_class
+    instance = entity_class.__new__(entity_class)
+    _set_identity_key(instance, identity_key)
+    return instance
+
+
+def _readonly_instance_processor(
+    query_entity,
+    mapper,
+    context,
+    result,
+    path,
+    adapter,
+    getters,
+    polymorphic_discriminator,
+    _polymorphic_from,
+):
+    """Produce a row processor callable which processes rows into
+    :class:`.ReadOnlyEntity` objects, for the ``readonly_entities``
+    execution option.
+
+    Only column attributes that are present in the row, and relationships
+    whose loader strategy supports it via
+    :meth:`.MapperProperty.create_readonly_row_processor`, are populated.
+    No :class:`.InstanceState`, identity map entry or load events are
+    produced; objects are uniqued per load on their identity key.
+
+    """
+    identity_class = mapper._identity_class
+    entity_class = mapper._readonly_entity_class
+    new_entity = entity_class.__new__
+
+    populators = {
+        "quick": list(getters["cached_populators"]["quick"]),
+        "expire": [],
+        "new": [],
+        "existing": [],
+    }
+    for prop in getters["todo"]:
+        prop.create_readonly_row_processor(
+            context, query_entity, path, mapper, result, adapter, populators
+        )
+    quick_populators = populators["quick"]
+    new_populators = populators["new"]
+    existing_populators = populators["existing"]
+
+    load_path = (
+        context.compile_state.current_path + path
+        if context.compile_state.current_path.path
+        else path
+    )
+    post_load = PostLoad.for_context(context, load_path, None)
+
+    readonly_identity_map = context.readonly_identity_map
+    identity_token = context.identity_token
+    primary_key_getter = getters["primary_key_getter"]
+
+    if mapper.allow_partial_pks:
+        is_not_primary_key = _none_set.issuperset
+    else:
+        is_not_primary_key = _none_set.intersection
+
+    def _instance(row):
+        identitykey = (identity_class, primary_key_getter(row), identity_token)
+
+        instance = readonly_identity_map.get(identitykey)
+        if instance is None:
+            if is_not_primary_key(identitykey[1]):
+                return None
+
+            instance = new_entity(entity_class)
+            _set_identity_key(instance, identitykey)
+            readonly_identity_map[identitykey] = instance
+
+            dict_ = instance.__dict__
+            for key, getter in quick_populators:
+                dict_[key] = getter(row)
+            for key, populator in new_populators:
+                populator(instance, dict_, row)
+
+            if post_load:
+                post_load.add_state(instance, True)
+        elif existing_populators:
+            dict_ = instance.__dict__
+            for key, populator in existing_populators:
+                populator(instance, dict_, row)
+
+        return instance
+
+    if mapper.polymorphic_map and not _polymorphic_from:
+
+        def ensure_no_pk(row):
+            identitykey = (
+                identity_class,
+                primary_key_getter(row),
+                identity_token,
+            )
+            if not is_not_primary_key(identitykey[1]):
+                return identitykey
+            else:
+                return None
+
+        _instance = _decorate_polymorphic_switch(
+            _instance,
+            context,
+            query_entity,
+            mapper,
+            result,
+            path,
+            polymorphic_discriminator,
+            adapter,
+            ensure_no_pk,
+        )
+
+    return _instance
+
+
 def _load_subclass_via_in(context, path, entity):
     mapper = entity.mapper
 
@@ -1401,11 +1590,19 @@ class PostLoad:
             arg,
             kw,
         ) in self.loaders.values():
-            states = [
-                (state, overwrite)
-                for state, overwrite in self.states.items()
-                if state.manager.mapper.isa(limit_to_mapper)
-            ]
+            if effective_context.readonly_entities:
+                entity_class = limit_to_mapper._readonly_entity_class
+                states = [
+                    (state, overwrite)
+                    for state, overwrite in self.states.items()
+                    if isinstance(state, entity_class)
+                ]
+            else:
+                states = [
+                    (state, overwrite)
+                    for state, overwrite in self.states.items()
+                    if state.manager.mapper.isa(limit_to_mapper)
+                ]
             if states:
                 loader(
                     effective_context, path, states, self.load_keys, *arg, **kw
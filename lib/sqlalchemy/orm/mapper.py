@@ -3119,6 +3119,32 @@ class Mapper(
     def _identity_key_props(self):
         return [self._columntoproperty[col] for col in self.primary_key]
 
+    @HasMemoized.memoized_attribute
+    def _readonly_entity_class(self):
+        """The class of objects produced for this mapper when the
+        ``readonly_entities`` execution option is used.
+
+        The class mirrors the inheritance hierarchy of the mapped classes,
+        so that ``isinstance()`` checks against a superclass' read-only
+        entity class work as expected.
+
+        """
+        if self.inherits is not None:
+            base = self.inherits._readonly_entity_class
+        else:
+            base = loading.ReadOnlyEntity
+
+        return type(
+            self.class_.__name__,
+            (base,),
+            {
+                "__slots__": (),
+                "__module__": self.class_.__module__,
+                "__qualname__": self.class_.__qualname__,
+                "_sa_mapper": self,
+            },
+        )
+
     @HasMemoized.memoized_attribute
     def _all_pk_cols(self):
         collection: Set[ColumnClause[Any]] = set()
@@ -17,6 +17,7 @@ in unitofwork.py.
 """
 from __future__ import annotations
 
+import contextlib
 from itertools import chain
 from itertools import groupby
 from itertools import zip_longest
@@ -72,6 +73,7 @@ def _bulk_insert(
     isstates: bool,
     return_defaults: bool,
     render_nulls: bool,
+    use_copy: bool = False,
 ) -> None:
     base_mapper = mapper.base_mapper
 
@@ -81,6 +83,12 @@ def _bulk_insert(
             "not supported in bulk_insert()"
         )
 
+    if use_copy and return_defaults:
+        raise sa_exc.ArgumentError(
+            "The use_copy and return_defaults parameters of "
+            "bulk_insert_mappings() can't be used together"
+        )
+
     if isstates:
         if return_defaults:
             states = [(state, state.dict) for state in mappings]
@@ -123,6 +131,10 @@ def _bulk_insert(
                 render_nulls=render_nulls,
             )
         )
+        if use_copy:
+            _emit_copy_statements(connection, table, records)
+            continue
+
         _emit_insert_statements(
             base_mapper,
             None,
@@ -142,6 +154,27 @@ def _bulk_insert(
             )
 
 
+def _emit_copy_statements(connection, table, records):
+    """Load a series of bulk insert records using
+    :meth:`_engine.Connection.bulk_copy`."""
+
+    rows = [params for (_, _, params, *_) in records]
+    if not rows:
+        return
+
+    keys = set().union(*rows)
+    columns = [
+        col
+        for col in table.c
+        if col.key in keys
+        or (
+            col.default is not None
+            and (col.default.is_scalar or col.default.is_callable)
+        )
+    ]
+    connection.bulk_copy(table, rows, columns)
+
+
 def _bulk_update(
     mapper: Mapper[Any],
     mappings: Union[Iterable[InstanceState[_O]], Iterable[Dict[str, Any]]],
@@ -919,7 +952,6 @@ def _emit_update_statements(
             rec[7],  # has all pks
         ),
     ):
-        rows = 0
         records = list(records)
 
         statement = cached_stmt
@@ -951,40 +983,11 @@ def _emit_update_statements(
         )
         allow_multirow = has_all_defaults and not needs_version_id
 
-        if hasvalue:
-            for (
-                state,
-                state_dict,
-                params,
-                mapper,
-                connection,
-                value_params,
-                has_all_defaults,
-                has_all_pks,
-            ) in records:
-                c = connection.execute(
-                    statement.values(value_params),
-                    params,
-                    execution_options=execution_options,
-                )
-                if bookkeeping:
-                    _postfetch(
-                        mapper,
-                        uowtransaction,
-                        table,
-                        state,
-                        state_dict,
-                        c,
-                        c.context.compiled_parameters[0],
-                        value_params,
-                        True,
-                        c.returned_defaults,
-                    )
-                rows += c.rowcount
-                check_rowcount = assert_singlerow
-        else:
-            if not allow_multirow:
-                check_rowcount = assert_singlerow
+        # rowcounts are summed once all statements are emitted, so that
+        # statements may be pipelined for those dialects that support it
+        results = []
+        with _flush_pipeline(connection):
+            if hasvalue:
                 for (
                     state,
                     state_dict,
@@ -996,10 +999,10 @@ def _emit_update_statements(
                     has_all_pks,
                 ) in records:
                     c = connection.execute(
-                        statement, params, execution_options=execution_options
+                        statement.values(value_params),
+                        params,
+                        execution_options=execution_options,
                     )
-
-                    # TODO: why with bookkeeping=False?
                     if bookkeeping:
                         _postfetch(
                             mapper,
@@ -1013,45 +1016,84 @@ def _emit_update_statements(
                             True,
                             c.returned_defaults,
                         )
-                    rows += c.rowcount
+                    results.append(c)
+                    check_rowcount = assert_singlerow
             else:
-                multiparams = [rec[2] for rec in records]
+                if not allow_multirow:
+                    check_rowcount = assert_singlerow
+                    for (
+                        state,
+                        state_dict,
+                        params,
+                        mapper,
+                        connection,
+                        value_params,
+                        has_all_defaults,
+                        has_all_pks,
+                    ) in records:
+                        c = connection.execute(
+                            statement,
+                            params,
+                            execution_options=execution_options,
+                        )
 
-                check_rowcount = assert_multirow or (
-                    assert_singlerow and len(multiparams) == 1
-                )
+                        # TODO: why with bookkeeping=False?
+                        if bookkeeping:
+                            _postfetch(
+                                mapper,
+                                uowtransaction,
+                                table,
+                                state,
+                                state_dict,
+                                c,
+                                c.context.compiled_parameters[0],
+                                value_params,
+                                True,
+                                c.returned_defaults,
+                            )
+                        results.append(c)
+                else:
+                    multiparams = [rec[2] for rec in records]
 
-                c = connection.execute(
-                    statement, multiparams, execution_options=execution_options
-                )
+                    check_rowcount = assert_multirow or (
+                        assert_singlerow and len(multiparams) == 1
+                    )
 
-                rows += c.rowcount
+                    c = connection.execute(
+                        statement,
+                        multiparams,
+                        execution_options=execution_options,
+                    )
 
-                for (
-                    state,
-                    state_dict,
-                    params,
-                    mapper,
-                    connection,
-                    value_params,
-                    has_all_defaults,
-                    has_all_pks,
-                ) in records:
-                    if bookkeeping:
-                        _postfetch(
-                            mapper,
-                            uowtransaction,
-                            table,
-                            state,
-                            state_dict,
-                            c,
-                            c.context.compiled_parameters[0],
-                            value_params,
-                            True,
-                            c.returned_defaults
-                            if not c.context.executemany
-                            else None,
-                        )
+                    results.append(c)
+
+                    for (
+                        state,
+                        state_dict,
+                        params,
+                        mapper,
+                        connection,
+                        value_params,
+                        has_all_defaults,
+                        has_all_pks,
+                    ) in records:
+                        if bookkeeping:
+                            _postfetch(
+                                mapper,
+                                uowtransaction,
+                                table,
+                                state,
+                                state_dict,
+                                c,
+                                c.context.compiled_parameters[0],
+                                value_params,
+                                True,
+                                c.returned_defaults
+                                if not c.context.executemany
+                                else None,
+                            )
+
+        rows = sum(c.rowcount for c in results)
 
         if check_rowcount:
             if rows != len(records):
@@ -1469,15 +1511,18 @@ def _emit_delete_statements(
             and not connection.dialect.supports_sane_multi_rowcount
         ):
             if connection.dialect.supports_sane_rowcount:
-                rows_matched = 0
                 # execute deletes individually so that versioned
                 # rows can be verified
-                for params in del_objects:
-
-                    c = connection.execute(
-                        statement, params, execution_options=execution_options
-                    )
-                    rows_matched += c.rowcount
+                with _flush_pipeline(connection):
+                    results = [
+                        connection.execute(
+                            statement,
+                            params,
+                            execution_options=execution_options,
+                        )
+                        for params in del_objects
+                    ]
+                rows_matched = sum(c.rowcount for c in results)
             else:
                 util.warn(
                     "Dialect %s does not support deleted rowcount "
@@ -1526,6 +1571,18 @@ def _emit_delete_statements(
                 )
 
 
+def _flush_pipeline(connection):
+    """Return a context manager which emits the statements within it in a
+    pipeline, if enabled for the dialect by the ``use_pipeline_for_flush``
+    parameter.
+
+    """
+    if connection.dialect.use_pipeline_for_flush:
+        return connection.pipeline()
+    else:
+        return contextlib.nullcontext()
+
+
 def _finalize_insert_update_commands(base_mapper, uowtransaction, states):
     """finalize state on states that have been inserted or updated,
     including calling after_insert/after_update events.
@@ -136,6 +136,7 @@ _RelationshipArgumentType = Union[
 
 _LazyLoadArgumentType = Literal[
     "select",
+    "batch",
     "joined",
     "selectin",
     "subquery",
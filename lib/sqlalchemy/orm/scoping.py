@@ -13,6 +13,7 @@ from typing import Dict
 from typing import Generic
 from typing import Iterable
 from typing import Iterator
+from typing import List
 from typing import Optional
 from typing import overload
 from typing import Sequence
@@ -45,6 +46,7 @@ if TYPE_CHECKING:
     from .session import _EntityBindKey
     from .session import _PKIdentityArgument
     from .session import _SessionBind
+    from .session import LazyLoadTracker
     from .session import sessionmaker
     from .session import SessionTransaction
     from ..engine import Connection
@@ -109,12 +111,14 @@ __all__ = ["scoped_session"]
         "expunge_all",
         "flush",
         "get",
+        "get_many",
         "get_bind",
         "is_modified",
         "bulk_save_objects",
         "bulk_insert_mappings",
         "bulk_update_mappings",
         "merge",
+        "merge_all",
         "query",
         "refresh",
         "rollback",
@@ -131,6 +135,7 @@ __all__ = ["scoped_session"]
         "autoflush",
         "no_autoflush",
         "info",
+        "lazy_load_tracker",
     ],
 )
 class scoped_session(Generic[_S]):
@@ -952,6 +957,110 @@ class scoped_session(Generic[_S]):
             execution_options=execution_options,
         )
 
+    def get_many(
+        self,
+        entity: _EntityBindKey[_O],
+        idents: Iterable[_PKIdentityArgument],
+        *,
+        options: Optional[Sequence[ORMOption]] = None,
+        populate_existing: bool = False,
+        with_for_update: Optional[ForUpdateArg] = None,
+        identity_token: Optional[Any] = None,
+        execution_options: _ExecuteOptionsParameter = util.EMPTY_DICT,
+        chunksize: int = 500,
+    ) -> List[Optional[_O]]:
+        r"""Return a list of instances based on the given primary key
+        identifiers, in the same order as the identifiers given, with
+        ``None`` for each identifier that was not found.
+
+        .. container:: class_bases
+
+            Proxied for the :class:`_orm.Session` class on
+            behalf of the :class:`_orm.scoping.scoped_session` class.
+
+        E.g.::
+
+            users = session.get_many(User, [5, 7, 12])
+
+            some_objects = session.get_many(VersionedFoo, [(5, 10), (6, 10)])
+
+        :meth:`_orm.Session.get_many` works like :meth:`_orm.Session.get`
+        for a series of identities at once.   Objects which are present in
+        the identity map and not expired are returned directly; the
+        remaining identities are loaded using a SELECT with an IN criteria
+        against the primary key, emitting one statement for every
+        :paramref:`_orm.Session.get_many.chunksize` identities, rather than
+        one statement per identity.  For a composite primary key, a tuple
+        IN is used.
+
+        Loaded rows are matched to the identities given by their identity
+        key.   Primary key values given as strings for a column whose Python
+        type is numeric or ``uuid.UUID``, such as ``"5"`` for an
+        :class:`.Integer` column or a UUID string for a :class:`.Uuid`
+        column, are first converted to that type; a string which isn't
+        valid for the type raises the error of the conversion.  If
+        a SELECT returns rows which don't match any of the identities it
+        was emitted for, such as when the database compares strings
+        without regard to case or trailing spaces, the identities which
+        remain unmatched are loaded individually as with
+        :meth:`_orm.Session.get`.
+
+        .. versionadded:: 2.0
+
+        :param entity: a mapped class or :class:`.Mapper` indicating the
+         type of entity to be loaded.
+
+        :param idents: a sequence of primary key identifiers, each of which
+         is a scalar, tuple, or dictionary as accepted by the
+         :paramref:`_orm.Session.get.ident` parameter.
+
+        :param options: optional sequence of loader options which will be
+         applied to the query, if one is emitted.
+
+        :param populate_existing: causes the method to unconditionally emit
+         SQL for all identities and refresh the objects with the newly loaded
+         data, regardless of whether or not they are already present.
+
+        :param with_for_update: optional boolean ``True`` indicating FOR
+         UPDATE should be used, or may be a dictionary containing flags
+         to indicate a more specific set of FOR UPDATE flags for the SELECT;
+         as with :paramref:`_orm.Session.get.with_for_update`, this
+         bypasses the identity map.
+
+        :param identity_token: optional identity token which will be used
+         as part of the identity key of each object, as with
+         :paramref:`_orm.Session.get.identity_token`.  The token is used
+         for the identity map lookups as well as for the objects loaded,
+         including to select the shard in use with the
+         :ref:`horizontal_sharding_toplevel` extension.
+
+        :param execution_options: optional dictionary of execution options,
+         which will be associated with each query execution emitted.
+
+        :param chunksize: maximum number of identities to be included in a
+         single SELECT; defaults to 500.
+
+        :return: a list of object instances or ``None``, corresponding to
+         each element of ``idents``.
+
+        .. seealso::
+
+            :meth:`_orm.Session.get`
+
+
+        """  # noqa: E501
+
+        return self._proxied.get_many(
+            entity,
+            idents,
+            options=options,
+            populate_existing=populate_existing,
+            with_for_update=with_for_update,
+            identity_token=identity_token,
+            execution_options=execution_options,
+            chunksize=chunksize,
+        )
+
     def get_bind(
         self,
         mapper: Optional[_EntityBindKey[_O]] = None,
@@ -1229,6 +1338,7 @@ class scoped_session(Generic[_S]):
         mappings: Iterable[Dict[str, Any]],
         return_defaults: bool = False,
         render_nulls: bool = False,
+        use_copy: bool = False,
     ) -> None:
         r"""Perform a bulk insert of the given list of mapping dictionaries.
 
@@ -1322,6 +1432,23 @@ class scoped_session(Generic[_S]):
 
          .. versionadded:: 1.1
 
+        :param use_copy: When True, rows are loaded into each table using
+         :meth:`_engine.Connection.bulk_copy`, which for PostgreSQL makes use
+         of ``COPY ... FROM STDIN``, rather than INSERT statements.  This
+         can't be combined with
+         :paramref:`.Session.bulk_insert_mappings.return_defaults`, as
+         server-generated values aren't returned.   The columns loaded for
+         each table are those that have a value in any of the given
+         dictionaries; a dictionary that's missing a value for one of these
+         columns loads NULL, or the column's Python-side default, rather
+         than invoking a server-side default for that row.
+
+         .. versionadded:: 2.0
+
+         .. seealso::
+
+            :ref:`postgresql_bulk_copy`
+
         .. seealso::
 
             :ref:`bulk_operations`
@@ -1338,6 +1465,7 @@ class scoped_session(Generic[_S]):
             mappings,
             return_defaults=return_defaults,
             render_nulls=render_nulls,
+            use_copy=use_copy,
         )
 
     def bulk_update_mappings(
@@ -1482,6 +1610,61 @@ class scoped_session(Generic[_S]):
 
         return self._proxied.merge(instance, load=load, options=options)
 
+    def merge_all(
+        self,
+        instances: Iterable[_O],
+        *,
+        load: bool = True,
+        options: Optional[Sequence[ORMOption]] = None,
+    ) -> List[_O]:
+        r"""Copy the state of each of the given instances into a
+        corresponding instance within this :class:`.Session`.
+
+        .. container:: class_bases
+
+            Proxied for the :class:`_orm.Session` class on
+            behalf of the :class:`_orm.scoping.scoped_session` class.
+
+        :meth:`.Session.merge_all` produces the same result as calling
+        :meth:`.Session.merge` for each instance in turn, returning the list
+        of merged instances in the same order as given.  When
+        :paramref:`.Session.merge_all.load` is ``True``, rather than emitting
+        a SELECT for each instance not present in the identity map, the
+        primary key identities of the given instances, as well as of those
+        instances reachable from them along relationships that are mapped
+        with ``cascade="merge"``, are first located up front, and those not
+        already present are loaded for each mapper using
+        :meth:`.Session.get_many`, which emits a SELECT with an IN criteria
+        for each group of up to 500 identities.   Collections which are
+        lazy loaded and cascaded by the merge are loaded along with these
+        objects using :func:`_orm.selectinload`.  The merge of each object
+        then proceeds against the identity map.
+
+        .. versionadded:: 2.0
+
+        :param instances: a sequence of instances to be merged.
+
+        :param load: Boolean, when False, the merge proceeds in the "high
+         performance" mode which foregoes all database access; see
+         :paramref:`.Session.merge.load`.
+
+        :param options: optional sequence of loader options which will be
+         applied to the SELECT statements emitted in order to load the
+         existing versions of the objects from the database.
+
+        :return: a list of the merged instances, corresponding to each
+         element of ``instances``.
+
+        .. seealso::
+
+            :meth:`.Session.merge`
+
+
+
+        """  # noqa: E501
+
+        return self._proxied.merge_all(instances, load=load, options=options)
+
     @overload
     def query(self, _entity: _EntityType[_O]) -> Query[_O]:
         ...
@@ -2005,6 +2188,19 @@ class scoped_session(Generic[_S]):
 
         return self._proxied.info
 
+    @property
+    def lazy_load_tracker(self) -> Optional[LazyLoadTracker]:
+        r"""Proxy for the :attr:`_orm.Session.lazy_load_tracker` attribute
+        on behalf of the :class:`_orm.scoping.scoped_session` class.
+
+        """  # noqa: E501
+
+        return self._proxied.lazy_load_tracker
+
+    @lazy_load_tracker.setter
+    def lazy_load_tracker(self, attr: Optional[LazyLoadTracker]) -> None:
+        self._proxied.lazy_load_tracker = attr
+
     @classmethod
     def close_all(cls) -> None:
         r"""Close *all* sessions in memory.
@@ -10,6 +10,7 @@
 from __future__ import annotations
 
 import contextlib
+import decimal
 import itertools
 import sys
 import typing
@@ -31,6 +32,7 @@ from typing import Type
 from typing import TYPE_CHECKING
 from typing import TypeVar
 from typing import Union
+import uuid
 import weakref
 
 from . import attributes
@@ -44,6 +46,7 @@ from . import query
 from . import state as statelib
 from ._typing import _O
 from ._typing import insp_is_mapper
+from ._typing import is_has_collection_adapter
 from ._typing import is_composite_class
 from ._typing import is_user_defined_option
 from .base import _class_to_mapper
@@ -132,6 +135,7 @@ __all__ = [
     "SessionTransaction",
     "sessionmaker",
     "ORMExecuteState",
+    "LazyLoadTracker",
     "close_all_sessions",
     "make_transient",
     "make_transient_to_detached",
@@ -154,6 +158,10 @@ _EntityBindKey = Union[Type[_O], "Mapper[_O]"]
 _SessionBindKey = Union[Type[Any], "Mapper[Any]", "Table"]
 _SessionBind = Union["Engine", "Connection"]
 
+# Python types of primary key columns to which Session.get_many() converts
+# primary key values given as strings
+_pk_string_types = frozenset([int, float, decimal.Decimal, uuid.UUID])
+
 
 class _ConnectionCallableProto(Protocol):
     """a callable that returns a :class:`.Connection` given an instance.
@@ -1207,6 +1215,157 @@ class SessionTransaction(_StateChange, TransactionalContext):
         return self._state not in (COMMITTED, CLOSED)
 
 
+class LazyLoadTracker:
+    """Counts lazy loads emitted within a :class:`.Session`, for the
+    purpose of detecting "N plus one" loading patterns.
+
+    An instance of :class:`.LazyLoadTracker` is associated with a
+    :class:`.Session` using the :paramref:`.Session.lazy_load_tracker`
+    parameter, or by assigning to the :attr:`.Session.lazy_load_tracker`
+    attribute.  Each time a relationship lazy load or a deferred column
+    load emits SQL on behalf of an object in that :class:`.Session`, the
+    load is counted against the mapper, the attribute name, and the
+    location in application code which triggered it::
+
+        tracker = LazyLoadTracker(threshold=10)
+        session = Session(engine, lazy_load_tracker=tracker)
+
+        for user in session.scalars(select(User)):
+            print(user.addresses)
+
+        for mapper, key, origin, count in tracker.report():
+            print(f"{mapper.class_.__name__}.{key} at {origin}: {count}")
+
+    When no tracker is present, the only overhead is a single attribute
+    check per lazy load.
+
+    .. versionadded:: 2.0
+
+    .. seealso::
+
+        :ref:`lazy_load_tracking`
+
+    """
+
+    __slots__ = (
+        "threshold",
+        "raise_on_threshold",
+        "track_origin",
+        "_counts",
+        "_totals",
+        "_warned",
+    )
+
+    threshold: Optional[int]
+    raise_on_threshold: bool
+    track_origin: bool
+    _counts: Dict[Tuple[Mapper[Any], str, Optional[str]], int]
+    _totals: Dict[Tuple[Mapper[Any], str], int]
+    _warned: Set[Tuple[Mapper[Any], str]]
+
+    def __init__(
+        self,
+        threshold: Optional[int] = None,
+        raise_on_threshold: bool = False,
+        track_origin: bool = True,
+    ):
+        """Construct a new :class:`.LazyLoadTracker`.
+
+        :param threshold: optional integer number of lazy loads for a single
+         mapped attribute, beyond which a warning is emitted, or an error
+         raised if :paramref:`.LazyLoadTracker.raise_on_threshold` is set.
+         The warning is emitted only once per attribute until
+         :meth:`.LazyLoadTracker.reset` is called.
+
+        :param raise_on_threshold: when ``True``, exceeding the threshold
+         raises :class:`.InvalidRequestError` rather than emitting a
+         warning.
+
+        :param track_origin: when ``True``, the default, each load is
+         attributed to the filename and line number of the innermost
+         calling frame outside of SQLAlchemy itself.  Set to ``False`` to
+         skip the stack inspection and count per attribute only.
+
+        """
+        self.threshold = threshold
+        self.raise_on_threshold = raise_on_threshold
+        self.track_origin = track_origin
+        self._counts = {}
+        self._totals = {}
+        self._warned = set()
+
+    def record(self, state: InstanceState[Any], key: str) -> None:
+        """Record a single lazy load of attribute ``key`` for the given
+        :class:`.InstanceState`.
+
+        This method is called by the ORM loader strategies and is not
+        normally called by application code.
+
+        """
+        mapper = state.mapper
+        origin = self._origin() if self.track_origin else None
+
+        self._counts[(mapper, key, origin)] = (
+            self._counts.get((mapper, key, origin), 0) + 1
+        )
+        total = self._totals[(mapper, key)] = (
+            self._totals.get((mapper, key), 0) + 1
+        )
+
+        if self.threshold is not None and total > self.threshold:
+            message = (
+                "Attribute %s.%s has been lazy loaded %d times, exceeding "
+                "the threshold of %d; consider using an eager loading "
+                "strategy such as selectinload()"
+                % (mapper.class_.__name__, key, total, self.threshold)
+            )
+            if self.raise_on_threshold:
+                raise sa_exc.InvalidRequestError(message)
+            elif (mapper, key) not in self._warned:
+                self._warned.add((mapper, key))
+                util.warn(message)
+
+    def _origin(self) -> Optional[str]:
+        frame: Any = sys._getframe(2)
+        while frame is not None:
+            if not frame.f_globals.get("__name__", "").startswith(
+                "sqlalchemy."
+            ):
+                return "%s:%d" % (frame.f_code.co_filename, frame.f_lineno)
+            frame = frame.f_back
+        return None
+
+    def report(
+        self,
+    ) -> List[Tuple[Mapper[Any], str, Optional[str], int]]:
+        """Return a list of ``(mapper, key, origin, count)`` tuples
+        describing the lazy loads recorded so far, most frequent first.
+
+        ``origin`` is a string ``"filename:lineno"`` indicating where in
+        application code the loads were triggered, or ``None`` if
+        :paramref:`.LazyLoadTracker.track_origin` is ``False``.
+
+        """
+        return sorted(
+            (
+                (mapper, key, origin, count)
+                for (mapper, key, origin), count in self._counts.items()
+            ),
+            key=lambda rec: -rec[3],
+        )
+
+    def totals(self) -> Dict[Tuple[Mapper[Any], str], int]:
+        """Return a dictionary of ``(mapper, key)`` to the total number
+        of lazy loads recorded for that attribute."""
+        return dict(self._totals)
+
+    def reset(self) -> None:
+        """Discard all counts recorded so far."""
+        self._counts.clear()
+        self._totals.clear()
+        self._warned.clear()
+
+
 class Session(_SessionClassMethods, EventTarget):
     """Manages persistence operations for ORM-mapped objects.
 
@@ -1246,6 +1405,7 @@ class Session(_SessionClassMethods, EventTarget):
     expire_on_commit: bool
     enable_baked_queries: bool
     twophase: bool
+    lazy_load_tracker: Optional[LazyLoadTracker]
     _query_cls: Type[Query[Any]]
 
     def __init__(
@@ -1260,6 +1420,7 @@ class Session(_SessionClassMethods, EventTarget):
         info: Optional[_InfoType] = None,
         query_cls: Optional[Type[Query[Any]]] = None,
         autocommit: Literal[False] = False,
+        lazy_load_tracker: Optional[LazyLoadTracker] = None,
     ):
         r"""Construct a new Session.
 
@@ -1359,6 +1520,19 @@ class Session(_SessionClassMethods, EventTarget):
            :class:`.Session` dictionary will be local to that
            :class:`.Session`.
 
+        :param lazy_load_tracker: optional :class:`.LazyLoadTracker` which
+           will be notified of each lazy load and deferred column load
+           emitted on behalf of objects in this :class:`.Session`, for the
+           purpose of detecting "N plus one" loading patterns.  The tracker
+           is also available as the :attr:`.Session.lazy_load_tracker`
+           attribute, which may be assigned at any time.
+
+           .. versionadded:: 2.0
+
+           .. seealso::
+
+                :ref:`lazy_load_tracking`
+
         :param query_cls:  Class which should be used to create new Query
           objects, as returned by the :meth:`~.Session.query` method.
           Defaults to :class:`_query.Query`.
@@ -1405,6 +1579,7 @@ class Session(_SessionClassMethods, EventTarget):
         self.autoflush = autoflush
         self.expire_on_commit = expire_on_commit
         self.enable_baked_queries = enable_baked_queries
+        self.lazy_load_tracker = lazy_load_tracker
 
         self.twophase = twophase
         self._query_cls = query_cls if query_cls else query.Query
@@ -3180,30 +3355,92 @@ class Session(_SessionClassMethods, EventTarget):
             execution_options=execution_options,
         )
 
-    def _get_impl(
+    def get_many(
         self,
         entity: _EntityBindKey[_O],
-        primary_key_identity: _PKIdentityArgument,
-        db_load_fn: Callable[..., _O],
+        idents: Iterable[_PKIdentityArgument],
         *,
-        options: Optional[Sequence[ExecutableOption]] = None,
+        options: Optional[Sequence[ORMOption]] = None,
         populate_existing: bool = False,
         with_for_update: Optional[ForUpdateArg] = None,
         identity_token: Optional[Any] = None,
-        execution_options: Optional[_ExecuteOptionsParameter] = None,
-    ) -> Optional[_O]:
+        execution_options: _ExecuteOptionsParameter = util.EMPTY_DICT,
+        chunksize: int = 500,
+    ) -> List[Optional[_O]]:
+        """Return a list of instances based on the given primary key
+        identifiers, in the same order as the identifiers given, with
+        ``None`` for each identifier that was not found.
 
-        # convert composite types to individual args
-        if (
-            is_composite_class(primary_key_identity)
-            and type(primary_key_identity)
-            in descriptor_props._composite_getters
-        ):
-            getter = descriptor_props._composite_getters[
-                type(primary_key_identity)
-            ]
-            primary_key_identity = getter(primary_key_identity)
+        E.g.::
 
+            users = session.get_many(User, [5, 7, 12])
+
+            some_objects = session.get_many(VersionedFoo, [(5, 10), (6, 10)])
+
+        :meth:`_orm.Session.get_many` works like :meth:`_orm.Session.get`
+        for a series of identities at once.   Objects which are present in
+        the identity map and not expired are returned directly; the
+        remaining identities are loaded using a SELECT with an IN criteria
+        against the primary key, emitting one statement for every
+        :paramref:`_orm.Session.get_many.chunksize` identities, rather than
+        one statement per identity.  For a composite primary key, a tuple
+        IN is used.
+
+        Loaded rows are matched to the identities given by their identity
+        key.   Primary key values given as strings for a column whose Python
+        type is numeric or ``uuid.UUID``, such as ``"5"`` for an
+        :class:`.Integer` column or a UUID string for a :class:`.Uuid`
+        column, are first converted to that type; a string which isn't
+        valid for the type raises the error of the conversion.  If
+        a SELECT returns rows which don't match any of the identities it
+        was emitted for, such as when the database compares strings
+        without regard to case or trailing spaces, the identities which
+        remain unmatched are loaded individually as with
+        :meth:`_orm.Session.get`.
+
+        .. versionadded:: 2.0
+
+        :param entity: a mapped class or :class:`.Mapper` indicating the
+         type of entity to be loaded.
+
+        :param idents: a sequence of primary key identifiers, each of which
+         is a scalar, tuple, or dictionary as accepted by the
+         :paramref:`_orm.Session.get.ident` parameter.
+
+        :param options: optional sequence of loader options which will be
+         applied to the query, if one is emitted.
+
+        :param populate_existing: causes the method to unconditionally emit
+         SQL for all identities and refresh the objects with the newly loaded
+         data, regardless of whether or not they are already present.
+
+        :param with_for_update: optional boolean ``True`` indicating FOR
+         UPDATE should be used, or may be a dictionary containing flags
+         to indicate a more specific set of FOR UPDATE flags for the SELECT;
+         as with :paramref:`_orm.Session.get.with_for_update`, this
+         bypasses the identity map.
+
+        :param identity_token: optional identity token which will be used
+         as part of the identity key of each object, as with
+         :paramref:`_orm.Session.get.identity_token`.  The token is used
+         for the identity map lookups as well as for the objects loaded,
+         including to select the shard in use with the
+         :ref:`horizontal_sharding_toplevel` extension.
+
+        :param execution_options: optional dictionary of execution options,
+         which will be associated with each query execution emitted.
+
+        :param chunksize: maximum number of identities to be included in a
+         single SELECT; defaults to 500.
+
+        :return: a list of object instances or ``None``, corresponding to
+         each element of ``idents``.
+
+        .. seealso::
+
+            :meth:`_orm.Session.get`
+
+        """
         mapper: Optional[Mapper[_O]] = inspect(entity)
 
         if mapper is None or not mapper.is_mapper:
@@ -3211,36 +3448,210 @@ class Session(_SessionClassMethods, EventTarget):
                 "Expected mapped class or mapper, got: %r" % entity
             )
 
-        is_dict = isinstance(primary_key_identity, dict)
-        if not is_dict:
-            primary_key_identity = util.to_list(
-                primary_key_identity, default=[None]
-            )
+        primary_key_identities = [
+            tuple(self._pk_identity_for_get(mapper, ident))
+            for ident in idents
+        ]
 
-        if len(primary_key_identity) != len(mapper.primary_key):
-            raise sa_exc.InvalidRequestError(
-                "Incorrect number of values in identifier to formulate "
-                "primary key for session.get(); primary key columns "
-                "are %s" % ",".join("'%s'" % c for c in mapper.primary_key)
+        primary_key_identities = self._coerce_pk_strings(
+            mapper, primary_key_identities
+        )
+
+        use_identity_map = (
+            not populate_existing
+            and not mapper.always_refresh
+            and with_for_update is None
+        )
+
+        found: Dict[Tuple[Any, ...], Optional[_O]] = {}
+        to_load: List[Tuple[Any, ...]] = []
+
+        for primary_key_identity in primary_key_identities:
+            if primary_key_identity in found:
+                continue
+            found[primary_key_identity] = None
+
+            if use_identity_map:
+                instance = self._identity_lookup(
+                    mapper,
+                    primary_key_identity,
+                    identity_token=identity_token,
+                    passive=PassiveFlag.PASSIVE_NO_FETCH,
+                )
+                if instance is LoaderCallableStatus.PASSIVE_CLASS_MISMATCH:
+                    continue
+                elif (
+                    instance is not None
+                    and instance is not LoaderCallableStatus.PASSIVE_NO_RESULT
+                ):
+                    # reject calls for id in identity map but class
+                    # mismatch.
+                    if isinstance(instance, mapper.class_):
+                        found[primary_key_identity] = instance
+                    continue
+
+            if None in primary_key_identity:
+                # identities that include NULL can't be compared using IN;
+                # load these individually
+                found[primary_key_identity] = self._get_impl(
+                    mapper,
+                    primary_key_identity,
+                    loading.load_on_pk_identity,
+                    options=options,
+                    populate_existing=populate_existing,
+                    with_for_update=with_for_update,
+                    identity_token=identity_token,
+                    execution_options=execution_options,
+                )
+            else:
+                to_load.append(primary_key_identity)
+
+        if to_load:
+            single_pk = len(mapper.primary_key) == 1
+            if single_pk:
+                pk_criteria = mapper.primary_key[0].in_(
+                    sql.bindparam("primary_keys", expanding=True)
+                )
+            else:
+                pk_criteria = sql.tuple_(*mapper.primary_key).in_(
+                    sql.bindparam("primary_keys", expanding=True)
+                )
+
+            statement = (
+                sql.select(mapper)
+                .set_label_style(LABEL_STYLE_TABLENAME_PLUS_COL)
+                .where(pk_criteria)
             )
+            if with_for_update is not None:
+                statement._for_update_arg = ForUpdateArg._from_argument(
+                    with_for_update
+                )
+            if options:
+                statement = statement.options(*options)
+            load_execution_options = execution_options
+            if populate_existing:
+                load_execution_options = util.EMPTY_DICT.merge_with(
+                    load_execution_options, {"populate_existing": True}
+                )
+            if identity_token is not None:
+                # as with Session.get(), apply the identity token to the
+                # objects loaded
+                load_execution_options = util.EMPTY_DICT.merge_with(
+                    load_execution_options,
+                    {
+                        "_sa_orm_load_options": (
+                            context.QueryContext.default_load_options
+                            + {"_refresh_identity_token": identity_token}
+                        )
+                    },
+                )
 
-        if is_dict:
+            while to_load:
+                chunk = to_load[0:chunksize]
+                to_load = to_load[chunksize:]
+
+                unmatched = {
+                    mapper.identity_key_from_primary_key(
+                        primary_key_identity, identity_token
+                    ): primary_key_identity
+                    for primary_key_identity in chunk
+                }
+                unmatched_rows = False
+                for instance in self.execute(
+                    statement,
+                    {
+                        "primary_keys": [pk[0] for pk in chunk]
+                        if single_pk
+                        else chunk
+                    },
+                    execution_options=load_execution_options,
+                ).scalars():
+                    key = object_state(instance).key
+                    assert key is not None
+                    if key in unmatched:
+                        found[unmatched.pop(key)] = instance
+                    else:
+                        unmatched_rows = True
+
+                if unmatched and unmatched_rows:
+                    # the database matched a row to an identity that isn't
+                    # equal to the row's primary key in Python, so there's
+                    # no telling which identities were found; load those
+                    # individually
+                    for primary_key_identity in unmatched.values():
+                        found[primary_key_identity] = self._get_impl(
+                            mapper,
+                            primary_key_identity,
+                            loading.load_on_pk_identity,
+                            options=options,
+                            populate_existing=populate_existing,
+                            with_for_update=with_for_update,
+                            identity_token=identity_token,
+                            execution_options=execution_options,
+                        )
+
+        return [
+            found[primary_key_identity]
+            for primary_key_identity in primary_key_identities
+        ]
+
+    def _coerce_pk_strings(
+        self,
+        mapper: Mapper[Any],
+        primary_key_identities: List[Tuple[Any, ...]],
+    ) -> List[Tuple[Any, ...]]:
+        """Convert string values within the given primary key identities
+        to the Python types of numeric and UUID primary key columns.
+
+        """
+        python_types: List[Optional[Type[Any]]] = []
+        for col in mapper.primary_key:
             try:
-                primary_key_identity = list(
-                    primary_key_identity[prop.key]
-                    for prop in mapper._identity_key_props
+                python_type = col.type.python_type
+            except NotImplementedError:
+                python_type = None
+            if python_type not in _pk_string_types:
+                python_type = None
+            python_types.append(python_type)
+
+        if not any(python_types):
+            return primary_key_identities
+
+        return [
+            tuple(
+                python_type(value)
+                if python_type is not None and isinstance(value, str)
+                else value
+                for value, python_type in zip(
+                    primary_key_identity, python_types
                 )
+            )
+            for primary_key_identity in primary_key_identities
+        ]
 
-            except KeyError as err:
-                raise sa_exc.InvalidRequestError(
-                    "Incorrect names of values in identifier to formulate "
-                    "primary key for session.get(); primary key attribute "
-                    "names are %s"
-                    % ",".join(
-                        "'%s'" % prop.key
-                        for prop in mapper._identity_key_props
-                    )
-                ) from err
+    def _get_impl(
+        self,
+        entity: _EntityBindKey[_O],
+        primary_key_identity: _PKIdentityArgument,
+        db_load_fn: Callable[..., _O],
+        *,
+        options: Optional[Sequence[ExecutableOption]] = None,
+        populate_existing: bool = False,
+        with_for_update: Optional[ForUpdateArg] = None,
+        identity_token: Optional[Any] = None,
+        execution_options: Optional[_ExecuteOptionsParameter] = None,
+    ) -> Optional[_O]:
+
+        mapper: Optional[Mapper[_O]] = inspect(entity)
+
+        if mapper is None or not mapper.is_mapper:
+            raise sa_exc.ArgumentError(
+                "Expected mapped class or mapper, got: %r" % entity
+            )
+
+        primary_key_identity = self._pk_identity_for_get(
+            mapper, primary_key_identity
+        )
 
         if (
             not populate_existing
@@ -3289,6 +3700,56 @@ class Session(_SessionClassMethods, EventTarget):
             load_options=load_options,
         )
 
+    def _pk_identity_for_get(
+        self, mapper: Mapper[Any], primary_key_identity: _PKIdentityArgument
+    ) -> List[Any]:
+        """Convert a primary key argument as accepted by
+        :meth:`.Session.get` into a list of column values."""
+
+        # convert composite types to individual args
+        if (
+            is_composite_class(primary_key_identity)
+            and type(primary_key_identity)
+            in descriptor_props._composite_getters
+        ):
+            getter = descriptor_props._composite_getters[
+                type(primary_key_identity)
+            ]
+            primary_key_identity = getter(primary_key_identity)
+
+        is_dict = isinstance(primary_key_identity, dict)
+        if not is_dict:
+            primary_key_identity = util.to_list(
+                primary_key_identity, default=[None]
+            )
+
+        if len(primary_key_identity) != len(mapper.primary_key):
+            raise sa_exc.InvalidRequestError(
+                "Incorrect number of values in identifier to formulate "
+                "primary key for session.get(); primary key columns "
+                "are %s" % ",".join("'%s'" % c for c in mapper.primary_key)
+            )
+
+        if is_dict:
+            try:
+                primary_key_identity = list(
+                    primary_key_identity[prop.key]
+                    for prop in mapper._identity_key_props
+                )
+
+            except KeyError as err:
+                raise sa_exc.InvalidRequestError(
+                    "Incorrect names of values in identifier to formulate "
+                    "primary key for session.get(); primary key attribute "
+                    "names are %s"
+                    % ",".join(
+                        "'%s'" % prop.key
+                        for prop in mapper._identity_key_props
+                    )
+                ) from err
+
+        return primary_key_identity  # type: ignore
+
     def merge(
         self,
         instance: _O,
@@ -3380,6 +3841,181 @@ class Session(_SessionClassMethods, EventTarget):
         finally:
             self.autoflush = autoflush
 
+    def merge_all(
+        self,
+        instances: Iterable[_O],
+        *,
+        load: bool = True,
+        options: Optional[Sequence[ORMOption]] = None,
+    ) -> List[_O]:
+        """Copy the state of each of the given instances into a
+        corresponding instance within this :class:`.Session`.
+
+        :meth:`.Session.merge_all` produces the same result as calling
+        :meth:`.Session.merge` for each instance in turn, returning the list
+        of merged instances in the same order as given.  When
+        :paramref:`.Session.merge_all.load` is ``True``, rather than emitting
+        a SELECT for each instance not present in the identity map, the
+        primary key identities of the given instances, as well as of those
+        instances reachable from them along relationships that are mapped
+        with ``cascade="merge"``, are first located up front, and those not
+        already present are loaded for each mapper using
+        :meth:`.Session.get_many`, which emits a SELECT with an IN criteria
+        for each group of up to 500 identities.   Collections which are
+        lazy loaded and cascaded by the merge are loaded along with these
+        objects using :func:`_orm.selectinload`.  The merge of each object
+        then proceeds against the identity map.
+
+        .. versionadded:: 2.0
+
+        :param instances: a sequence of instances to be merged.
+
+        :param load: Boolean, when False, the merge proceeds in the "high
+         performance" mode which foregoes all database access; see
+         :paramref:`.Session.merge.load`.
+
+        :param options: optional sequence of loader options which will be
+         applied to the SELECT statements emitted in order to load the
+         existing versions of the objects from the database.
+
+        :return: a list of the merged instances, corresponding to each
+         element of ``instances``.
+
+        .. seealso::
+
+            :meth:`.Session.merge`
+
+        """
+
+        if self._warn_on_events:
+            self._flush_warning("Session.merge_all()")
+
+        _recursive: Dict[InstanceState[Any], object] = {}
+        _resolve_conflict_map: Dict[_IdentityKeyType[Any], object] = {}
+
+        # verify mapped
+        states = [object_state(instance) for instance in instances]
+
+        if load:
+            # flush current contents if we expect to load data
+            self._autoflush()
+
+        autoflush = self.autoflush
+        try:
+            self.autoflush = False
+            if load:
+                self._load_for_merge(states, options, _resolve_conflict_map)
+
+            return [
+                self._merge(
+                    state,
+                    state.dict,
+                    load=load,
+                    options=options,
+                    _recursive=_recursive,
+                    _resolve_conflict_map=_resolve_conflict_map,
+                )
+                for state in states
+            ]
+        finally:
+            self.autoflush = autoflush
+
+    @util.preload_module("sqlalchemy.orm.strategy_options")
+    def _load_for_merge(
+        self,
+        states: Iterable[InstanceState[Any]],
+        options: Optional[Sequence[ORMOption]],
+        _resolve_conflict_map: Dict[_IdentityKeyType[Any], object],
+    ) -> None:
+        """Load the persistent objects which a subsequent merge of the
+        given states will look for, grouped by mapper and loaded using
+        :meth:`.Session.get_many`.
+
+        Each object is recorded in the conflict map by identity key, which
+        also keeps it strongly referenced until the merge is complete.
+        Identities which aren't found are recorded as ``None`` so that the
+        merge doesn't look for them again, creating a new object instead;
+        this applies only to identities given in terms of the Python types
+        of the primary key columns, while for others, such as ``"5"`` for an
+        integer column, the merge loads the object individually.
+
+        """
+        strategy_options = util.preloaded.orm_strategy_options
+
+        seen: Set[InstanceState[Any]] = set()
+        to_visit = list(states)
+        to_load: Dict[
+            Tuple[Mapper[Any], Any],
+            Dict[Tuple[Any, ...], _IdentityKeyType[Any]],
+        ] = {}
+        collections: Dict[Mapper[Any], Set[str]] = {}
+
+        while to_visit:
+            state = to_visit.pop()
+            if state in seen:
+                continue
+            seen.add(state)
+
+            mapper = state.mapper
+            key = state.key
+            if key is None:
+                key = mapper._identity_key_from_state(state)
+                key_is_persistent = LoaderCallableStatus.NEVER_SET not in key[
+                    1
+                ] and (
+                    not _none_set.intersection(key[1])
+                    or (
+                        mapper.allow_partial_pks
+                        and not _none_set.issuperset(key[1])
+                    )
+                )
+            else:
+                key_is_persistent = True
+
+            if key_is_persistent and key not in self.identity_map:
+                to_load.setdefault((mapper, key[2]), {})[key[1]] = key
+
+            state_dict = state.dict
+            for prop in mapper.relationships:
+                if "merge" not in prop._cascade or prop.key not in state_dict:
+                    continue
+
+                if prop.uselist:
+                    impl = state.get_impl(prop.key)
+                    assert is_has_collection_adapter(impl)
+                    to_visit.extend(
+                        attributes.instance_state(obj)
+                        for obj in impl.get_collection(state, state_dict)
+                    )
+                    if prop.lazy in ("select", "batch", True):
+                        collections.setdefault(mapper, set()).add(prop.key)
+                elif state_dict[prop.key] is not None:
+                    to_visit.append(
+                        attributes.instance_state(state_dict[prop.key])
+                    )
+
+        for (mapper, identity_token), identities in to_load.items():
+            load_options: List[ORMOption] = [
+                strategy_options.selectinload(getattr(mapper.class_, key))
+                for key in sorted(collections.get(mapper, ()))
+            ]
+            if options:
+                load_options.extend(options)
+
+            primary_key_identities = list(identities)
+            for key, canonical_identity, obj in zip(
+                identities.values(),
+                self._coerce_pk_strings(mapper, primary_key_identities),
+                self.get_many(
+                    mapper,
+                    primary_key_identities,
+                    options=load_options,
+                    identity_token=identity_token,
+                ),
+            ):
+                if obj is not None or canonical_identity == key[1]:
+                    _resolve_conflict_map[key] = obj
+
     def _merge(
         self,
         state: InstanceState[_O],
@@ -4036,6 +4672,7 @@ class Session(_SessionClassMethods, EventTarget):
         mappings: Iterable[Dict[str, Any]],
         return_defaults: bool = False,
         render_nulls: bool = False,
+        use_copy: bool = False,
     ) -> None:
         """Perform a bulk insert of the given list of mapping dictionaries.
 
@@ -4124,6 +4761,23 @@ class Session(_SessionClassMethods, EventTarget):
 
          .. versionadded:: 1.1
 
+        :param use_copy: When True, rows are loaded into each table using
+         :meth:`_engine.Connection.bulk_copy`, which for PostgreSQL makes use
+         of ``COPY ... FROM STDIN``, rather than INSERT statements.  This
+         can't be combined with
+         :paramref:`.Session.bulk_insert_mappings.return_defaults`, as
+         server-generated values aren't returned.   The columns loaded for
+         each table are those that have a value in any of the given
+         dictionaries; a dictionary that's missing a value for one of these
+         columns loads NULL, or the column's Python-side default, rather
+         than invoking a server-side default for that row.
+
+         .. versionadded:: 2.0
+
+         .. seealso::
+
+            :ref:`postgresql_bulk_copy`
+
         .. seealso::
 
             :ref:`bulk_operations`
@@ -4141,6 +4795,7 @@ class Session(_SessionClassMethods, EventTarget):
             return_defaults,
             False,
             render_nulls,
+            use_copy=use_copy,
         )
 
     def bulk_update_mappings(
@@ -4215,6 +4870,7 @@ class Session(_SessionClassMethods, EventTarget):
         return_defaults: bool,
         update_changed_only: bool,
         render_nulls: bool,
+        use_copy: bool = False,
     ) -> None:
         mapper = _class_to_mapper(mapper)
         self._flushing = True
@@ -4237,6 +4893,7 @@ class Session(_SessionClassMethods, EventTarget):
                     isstates,
                     return_defaults,
                     render_nulls,
+                    use_copy=use_copy,
                 )
             transaction.commit()
 
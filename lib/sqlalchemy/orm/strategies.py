@@ -18,6 +18,7 @@ from typing import Any
 from typing import Dict
 from typing import Tuple
 from typing import TYPE_CHECKING
+import weakref
 
 from . import attributes
 from . import exc as orm_exc
@@ -52,6 +53,7 @@ from .. import inspect
 from .. import log
 from .. import sql
 from .. import util
+from ..sql import sqltypes
 from ..sql import util as sql_util
 from ..sql import visitors
 from ..sql.selectable import LABEL_STYLE_TABLENAME_PLUS_COL
@@ -274,6 +276,30 @@ class ColumnLoader(LoaderStrategy):
         else:
             populators["expire"].append((self.key, True))
 
+    def create_readonly_row_processor(
+        self,
+        context,
+        query_entity,
+        path,
+        loadopt,
+        mapper,
+        result,
+        adapter,
+        populators,
+    ):
+        # "quick" populators apply to read-only entities unchanged;
+        # "expire" entries are ignored
+        self.create_row_processor(
+            context,
+            query_entity,
+            path,
+            loadopt,
+            mapper,
+            result,
+            adapter,
+            populators,
+        )
+
 
 @log.class_logger
 @properties.ColumnProperty.strategy_for(query_expression=True)
@@ -528,6 +554,10 @@ class DeferredColumnLoader(LoaderStrategy):
         if self.raiseload:
             self._invoke_raise_load(state, passive, "raise")
 
+        tracker = session.lazy_load_tracker
+        if tracker is not None:
+            tracker.record(state, self.key)
+
         loading.load_scalar_attributes(
             state.mapper, state, set(group), PASSIVE_OFF
         )
@@ -1033,6 +1063,10 @@ class LazyLoader(
             if self._raise_on_sql and not passive & PassiveFlag.NO_RAISE:
                 self._invoke_raise_load(state, passive, "raise_on_sql")
 
+            tracker = session.lazy_load_tracker
+            if tracker is not None:
+                tracker.record(state, self.key)
+
             return loading.load_on_pk_identity(
                 session,
                 stmt,
@@ -1096,6 +1130,10 @@ class LazyLoader(
 
         stmt._where_criteria = (lazy_clause,)
 
+        tracker = session.lazy_load_tracker
+        if tracker is not None:
+            tracker.record(state, self.key)
+
         result = session.execute(
             stmt, params, execution_options=execution_options
         )
@@ -1224,6 +1262,209 @@ class LoadLazyAttribute:
         )
 
 
+@log.class_logger
+@relationships.Relationship.strategy_for(lazy="batch")
+class BatchLazyLoader(LazyLoader):
+    """Provide loading behavior for a :class:`.Relationship`
+    with "lazy='batch'", that is loads when first accessed, for the
+    accessed object as well as for the other objects loaded along with it.
+
+    """
+
+    __slots__ = ()
+
+    _batch_excluded_passive = (
+        PassiveFlag.LOAD_AGAINST_COMMITTED
+        | PassiveFlag.NO_AUTOFLUSH
+        | PassiveFlag.DEFERRED_HISTORY_LOAD
+    )
+
+    def create_row_processor(
+        self,
+        context,
+        query_entity,
+        path,
+        loadopt,
+        mapper,
+        result,
+        adapter,
+        populators,
+    ):
+        key = self.key
+
+        # states loaded by this result for this path; the first lazy
+        # load among them loads the attribute for all of them.  the
+        # batch is referenced by each state's loader callable, so it
+        # refers to the states weakly, so that objects that are no
+        # longer used aren't kept alive by their siblings
+        batch = []
+
+        load_lazy_attribute = BatchLoadLazyAttribute(
+            key,
+            self,
+            loadopt,
+            loadopt._generate_extra_criteria(context)
+            if loadopt and loadopt._extra_criteria
+            else None,
+            batch,
+        )
+
+        reset = context.populate_existing or mapper.always_refresh
+
+        def set_batch_lazy_callable(state, dict_, row):
+            if reset:
+                state._reset(dict_, key)
+            if "callables" not in state.__dict__:
+                state.callables = {}
+            state.callables[key] = load_lazy_attribute
+            batch.append(weakref.ref(state))
+
+        populators["new"].append((key, set_batch_lazy_callable))
+
+    def _load_for_state(
+        self,
+        state,
+        passive,
+        loadopt=None,
+        extra_criteria=(),
+        extra_options=(),
+        alternate_effective_path=None,
+        execution_options=util.EMPTY_DICT,
+        batch=None,
+    ):
+        if (
+            batch
+            and state.key
+            and state.session_id
+            and passive & PassiveFlag.SQL_OK
+            and passive & PassiveFlag.RELATED_OBJECT_OK
+            and not passive & self._batch_excluded_passive
+        ):
+            if self.use_get and not (loadopt and loadopt._extra_criteria):
+                # a many-to-one that's present in the identity map
+                # doesn't need SQL at all
+                value = super()._load_for_state(
+                    state,
+                    passive ^ PassiveFlag.SQL_OK,
+                    loadopt=loadopt,
+                    extra_criteria=extra_criteria,
+                )
+                if value is not LoaderCallableStatus.PASSIVE_NO_RESULT:
+                    return value
+
+            if self._load_batch(state, loadopt, extra_criteria, batch):
+                return LoaderCallableStatus.ATTR_WAS_SET
+
+        return super()._load_for_state(
+            state,
+            passive,
+            loadopt=loadopt,
+            extra_criteria=extra_criteria,
+            extra_options=extra_options,
+            alternate_effective_path=alternate_effective_path,
+            execution_options=execution_options,
+        )
+
+    def _load_batch(self, state, loadopt, extra_criteria, batch):
+        """Load the attribute for the given state and for the other states
+        in its batch using a SELECT IN, as the "selectin" loader would have.
+
+        Returns True if the given state was populated; otherwise the
+        caller proceeds with a plain lazy load.
+
+        """
+        session_id = state.session_id
+        key = self.key
+
+        # a batch is used only once; states which didn't qualify will
+        # lazy load individually
+        states = [
+            (sibling, False)
+            for sibling in (ref() for ref in batch)
+            if sibling is not None
+            and sibling.session_id == session_id
+            and sibling.key is not None
+            and not sibling._deleted
+            and sibling.obj() is not None
+            and key not in sibling.dict
+        ]
+        del batch[:]
+
+        if not states:
+            return False
+
+        if state.load_options or (loadopt and loadopt._extra_criteria):
+            effective_path = state.load_path[self.parent_property]
+            options = state.load_options
+            if loadopt and loadopt._extra_criteria:
+                options += (
+                    orm_util.LoaderCriteriaOption(self.entity, extra_criteria),
+                )
+        else:
+            effective_path = state.mapper._path_registry[self.parent_property]
+            options = ()
+
+        self.logger.debug("%s batch loading %d instances", self, len(states))
+
+        session = _state_session(state)
+        if session is None:
+            return False
+
+        # the batch is a single SELECT, so it counts as a single load
+        tracker = session.lazy_load_tracker
+        if tracker is not None:
+            tracker.record(state, key)
+
+        selectin_loader = self.parent_property._get_strategy(
+            (("lazy", "selectin"),)
+        )
+        selectin_loader._load_for_states(
+            session,
+            states,
+            self.entity,
+            effective_path,
+            options,
+            util.EMPTY_DICT,
+            False,
+        )
+
+        return key in state.dict
+
+
+class BatchLoadLazyAttribute(LoadLazyAttribute):
+    """semi-serializable loader object used by BatchLazyLoader.
+
+    Carries the list of weak references to the states the parent was
+    loaded with, which is not serialized.
+
+    """
+
+    def __init__(
+        self, key, initiating_strategy, loadopt, extra_criteria, batch
+    ):
+        super().__init__(key, initiating_strategy, loadopt, extra_criteria)
+        self.batch = batch
+
+    def __getstate__(self):
+        d = super().__getstate__()
+        d["batch"] = []
+        return d
+
+    def __call__(self, state, passive=attributes.PASSIVE_OFF):
+        key = self.key
+        instance_mapper = state.manager.mapper
+        prop = instance_mapper._props[key]
+        strategy = prop._strategies[self.strategy_key]
+
+        return strategy._load_for_state(
+            state,
+            passive,
+            loadopt=self.loadopt,
+            extra_criteria=self.extra_criteria,
+            batch=self.batch,
+        )
+
+
 class PostLoader(AbstractRelationshipLoader):
     """A relationship loader that emits a second SELECT statement."""
 
@@ -2693,6 +2934,84 @@ class JoinedLoader(AbstractRelationshipLoader):
                 populators,
             )
 
+    def create_readonly_row_processor(
+        self,
+        context,
+        query_entity,
+        path,
+        loadopt,
+        mapper,
+        result,
+        adapter,
+        populators,
+    ):
+        if self.uselist:
+            context.loaders_require_uniquing = True
+
+        our_path = path[self.parent_property]
+
+        eager_adapter = self._create_eager_adapter(
+            context, result, adapter, our_path, loadopt
+        )
+
+        if eager_adapter is False:
+            # there's no lazy loading for read-only entities; the
+            # attribute is left unpopulated
+            return
+
+        key = self.key
+
+        _instance = loading._instance_processor(
+            query_entity,
+            self.mapper,
+            context,
+            result,
+            our_path[self.entity],
+            eager_adapter,
+        )
+
+        if self.uselist:
+
+            def load_collection_from_joined_new_row(obj, dict_, row):
+                collection = dict_[key] = []
+                result_list = util.UniqueAppender(collection)
+                context.attributes[(obj, key)] = result_list
+                inst = _instance(row)
+                if inst is not None:
+                    result_list.append(inst)
+
+            def load_collection_from_joined_existing_row(obj, dict_, row):
+                if (obj, key) in context.attributes:
+                    result_list = context.attributes[(obj, key)]
+                else:
+                    collection = dict_[key] = []
+                    result_list = util.UniqueAppender(collection)
+                    context.attributes[(obj, key)] = result_list
+                inst = _instance(row)
+                if inst is not None:
+                    result_list.append(inst)
+
+            populators["new"].append(
+                (key, load_collection_from_joined_new_row)
+            )
+            populators["existing"].append(
+                (key, load_collection_from_joined_existing_row)
+            )
+        else:
+
+            def load_scalar_from_joined_new_row(obj, dict_, row):
+                dict_[key] = _instance(row)
+
+            def load_scalar_from_joined_existing_row(obj, dict_, row):
+                existing = _instance(row)
+                if key not in dict_:
+                    dict_[key] = existing
+
+            populators["new"].append((key, load_scalar_from_joined_new_row))
+            populators["existing"].append(
+                (key, load_scalar_from_joined_existing_row)
+            )
+
     def _create_collection_loader(self, context, key, _instance, populators):
         def load_collection_from_joined_new_row(state, dict_, row):
             # note this must unconditionally clear out any existing collection.
@@ -2803,6 +3122,8 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
 
     _chunksize = 500
 
+    _array_chunksize = 10000
+
     def __init__(self, parent, strategy_key):
         super(SelectInLoader, self).__init__(parent, strategy_key)
         self.join_depth = self.parent_property.join_depth
@@ -2965,6 +3286,49 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
             loadopt,
             recursion_depth,
             execution_options,
+            self._use_array_keys(result),
+        )
+
+    def create_readonly_row_processor(
+        self,
+        context,
+        query_entity,
+        path,
+        loadopt,
+        mapper,
+        result,
+        adapter,
+        populators,
+    ):
+        # the SELECT is emitted by a post load callable, which populates
+        # read-only entities as well; see _load_for_path()
+        self.create_row_processor(
+            context,
+            query_entity,
+            path,
+            loadopt,
+            mapper,
+            result,
+            adapter,
+            populators,
+        )
+
+    def _use_array_keys(self, result):
+        """return True if primary keys should be sent as a single array
+        parameter, as requested by the ``selectinload_array_keys`` execution
+        option, for a backend that supports it.
+
+        """
+        # the dialect is taken from the result being loaded; the SELECT
+        # emitted for the related objects will use the same bind in all
+        # but the most unusual cases
+        cursor_context = getattr(result, "context", None)
+        return (
+            cursor_context is not None
+            and cursor_context.dialect.supports_array_parameters
+            and cursor_context.execution_options.get(
+                "selectinload_array_keys", False
+            )
         )
 
     def _load_for_path(
@@ -2977,10 +3341,117 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
         loadopt,
         recursion_depth,
         execution_options,
+        array_keys,
     ):
         if load_only and self.key not in load_only:
             return
 
+        # a test which exercises what these comments talk about is
+        # test_selectin_relations.py -> test_twolevel_selectin_w_polymorphic
+        #
+        # effective_entity above is given to us in terms of the cached
+        # statement, namely this one:
+        orig_query = context.compile_state.select_statement
+
+        # the actual statement that was requested is this one:
+        #  context_query = context.query
+        #
+        # that's not the cached one, however.  So while it is of the identical
+        # structure, if it has entities like AliasedInsp, which we get from
+        # aliased() or with_polymorphic(), the AliasedInsp will likely be a
+        # different object identity each time, and will not match up
+        # hashing-wise to the corresponding AliasedInsp that's in the
+        # cached query, meaning it won't match on paths and loader lookups
+        # and loaders like this one will be skipped if it is used in options.
+        #
+        # Now we want to transfer loader options from the parent query to the
+        # "selectinload" query we're about to run.   Which query do we transfer
+        # the options from?  We use the cached query, because the options in
+        # that query will be in terms of the effective entity we were just
+        # handed.
+        #
+        # But now the selectinload query we are running is *also*
+        # cached.  What if it's cached and running from some previous iteration
+        # of that AliasedInsp?  Well in that case it will also use the previous
+        # iteration of the loader options.   If the query expires and
+        # gets generated again, it will be handed the current effective_entity
+        # and the current _with_options, again in terms of whatever
+        # compile_state.select_statement happens to be right now, so the
+        # query will still be internally consistent and loader callables
+        # will be correctly invoked.
+
+        effective_path = path[self.parent_property]
+
+        if orig_query is context.query:
+            options = new_options = orig_query._with_options
+            user_defined_options = []
+        else:
+            options = orig_query._with_options
+
+            # propagate compile state options from the original query,
+            # updating their "extra_criteria" as necessary.
+            # note this will create a different cache key than
+            # "orig" options if extra_criteria is present, because the copy
+            # of extra_criteria will have different boundparam than that of
+            # the QueryableAttribute in the path
+
+            new_options = [
+                orig_opt._adjust_for_extra_criteria(context)
+                if orig_opt._is_strategy_option
+                else orig_opt
+                for orig_opt in options
+                if orig_opt._is_compile_state or orig_opt._is_legacy_option
+            ]
+
+            # propagate user defined options from the current query
+            user_defined_options = [
+                opt
+                for opt in context.query._with_options
+                if not opt._is_compile_state and not opt._is_legacy_option
+            ]
+
+        if loadopt and loadopt._extra_criteria:
+            new_options += (
+                orm_util.LoaderCriteriaOption(
+                    effective_entity,
+                    loadopt._generate_extra_criteria(context),
+                ),
+            )
+
+        if recursion_depth is not None:
+            effective_path = effective_path._truncate_recursive()
+
+        self._load_for_states(
+            context.session,
+            states,
+            effective_entity,
+            effective_path,
+            tuple(new_options) + tuple(user_defined_options),
+            execution_options,
+            array_keys,
+            populate_existing=context.populate_existing,
+            readonly=context.readonly_entities,
+        )
+
+    def _load_for_states(
+        self,
+        session,
+        states,
+        effective_entity,
+        effective_path,
+        options,
+        execution_options,
+        array_keys,
+        populate_existing=False,
+        readonly=False,
+    ):
+        """Emit the SELECT IN for the given list of (state, overwrite)
+        tuples and populate the attribute on each.
+
+        Used by :meth:`._load_for_path`, as well as by
+        :class:`.BatchLazyLoader` for states outside of a load.
+
+        """
         query_info = self._query_info
 
         if query_info.load_only_child:
@@ -2990,16 +3461,26 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
             mapper = self.parent
 
             for state, overwrite in states:
-                state_dict = state.dict
-                related_ident = tuple(
-                    mapper._get_state_attr_by_column(
-                        state,
-                        state_dict,
-                        lk,
-                        passive=attributes.PASSIVE_NO_FETCH,
+                if readonly:
+                    state_dict = state.__dict__
+                    related_ident = tuple(
+                        state_dict.get(
+                            mapper._columntoproperty[lk].key,
+                            LoaderCallableStatus.PASSIVE_NO_RESULT,
+                        )
+                        for lk in query_info.child_lookup_cols
+                    )
+                else:
+                    state_dict = state.dict
+                    related_ident = tuple(
+                        mapper._get_state_attr_by_column(
+                            state,
+                            state_dict,
+                            lk,
+                            passive=attributes.PASSIVE_NO_FETCH,
+                        )
+                        for lk in query_info.child_lookup_cols
                     )
-                    for lk in query_info.child_lookup_cols
-                )
                 # if the loaded parent objects do not have the foreign key
                 # to the related item loaded, then degrade into the joined
                 # version of selectinload
@@ -3020,10 +3501,16 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
 
         # note the above conditional may have changed query_info
         if not query_info.load_only_child:
-            our_states = [
-                (state.key[1], state, state.dict, overwrite)
-                for state, overwrite in states
-            ]
+            if readonly:
+                our_states = [
+                    (state._sa_identity_key[1], state, state.__dict__, True)
+                    for state, overwrite in states
+                ]
+            else:
+                our_states = [
+                    (state.key[1], state, state.dict, overwrite)
+                    for state, overwrite in states
+                ]
 
         pk_cols = query_info.pk_cols
         in_expr = query_info.in_expr
@@ -3072,91 +3559,32 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
                 )
             )
 
-        q = q.filter(in_expr.in_(sql.bindparam("primary_keys")))
-
-        # a test which exercises what these comments talk about is
-        # test_selectin_relations.py -> test_twolevel_selectin_w_polymorphic
-        #
-        # effective_entity above is given to us in terms of the cached
-        # statement, namely this one:
-        orig_query = context.compile_state.select_statement
-
-        # the actual statement that was requested is this one:
-        #  context_query = context.query
-        #
-        # that's not the cached one, however.  So while it is of the identical
-        # structure, if it has entities like AliasedInsp, which we get from
-        # aliased() or with_polymorphic(), the AliasedInsp will likely be a
-        # different object identity each time, and will not match up
-        # hashing-wise to the corresponding AliasedInsp that's in the
-        # cached query, meaning it won't match on paths and loader lookups
-        # and loaders like this one will be skipped if it is used in options.
-        #
-        # Now we want to transfer loader options from the parent query to the
-        # "selectinload" query we're about to run.   Which query do we transfer
-        # the options from?  We use the cached query, because the options in
-        # that query will be in terms of the effective entity we were just
-        # handed.
-        #
-        # But now the selectinload query we are running is *also*
-        # cached.  What if it's cached and running from some previous iteration
-        # of that AliasedInsp?  Well in that case it will also use the previous
-        # iteration of the loader options.   If the query expires and
-        # gets generated again, it will be handed the current effective_entity
-        # and the current _with_options, again in terms of whatever
-        # compile_state.select_statement happens to be right now, so the
-        # query will still be internally consistent and loader callables
-        # will be correctly invoked.
-
-        effective_path = path[self.parent_property]
-
-        if orig_query is context.query:
-            options = new_options = orig_query._with_options
-            user_defined_options = []
-        else:
-            options = orig_query._with_options
-
-            # propagate compile state options from the original query,
-            # updating their "extra_criteria" as necessary.
-            # note this will create a different cache key than
-            # "orig" options if extra_criteria is present, because the copy
-            # of extra_criteria will have different boundparam than that of
-            # the QueryableAttribute in the path
-
-            new_options = [
-                orig_opt._adjust_for_extra_criteria(context)
-                if orig_opt._is_strategy_option
-                else orig_opt
-                for orig_opt in options
-                if orig_opt._is_compile_state or orig_opt._is_legacy_option
-            ]
-
-            # propagate user defined options from the current query
-            user_defined_options = [
-                opt
-                for opt in context.query._with_options
-                if not opt._is_compile_state and not opt._is_legacy_option
-            ]
-
-        if loadopt and loadopt._extra_criteria:
-            new_options += (
-                orm_util.LoaderCriteriaOption(
-                    effective_entity,
-                    loadopt._generate_extra_criteria(context),
-                ),
+        if array_keys and query_info.zero_idx:
+            # send the primary keys as a single array, giving one
+            # statement for any number of keys
+            q = q.filter(
+                in_expr
+                == sql.any_(
+                    sql.bindparam(
+                        "primary_keys", type_=sqltypes.ARRAY(in_expr.type)
+                    )
+                )
             )
+            chunksize = self._array_chunksize
 
-        if recursion_depth is not None:
-            effective_path = effective_path._truncate_recursive()
+            # propagate to loaders that run within this load
+            execution_options = execution_options.union(
+                {"selectinload_array_keys": True}
+            )
+        else:
+            q = q.filter(in_expr.in_(sql.bindparam("primary_keys")))
+            chunksize = self._chunksize
 
-        q = q.options(*new_options)._update_compile_options(
+        q = q.options(*options)._update_compile_options(
             {"_current_path": effective_path}
         )
 
-        if user_defined_options:
-            q = q.options(*user_defined_options)
-
-        if context.populate_existing:
+        if populate_existing:
             q = q.execution_options(populate_existing=True)
 
         if self.parent_property.order_by:
@@ -3179,18 +3607,28 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
                     _setup_outermost_orderby, self.parent_property
                 )
 
+        set_value = self._value_setter(readonly)
+
         if query_info.load_only_child:
             self._load_via_child(
                 our_states,
                 none_states,
                 query_info,
                 q,
-                context,
+                session,
+                set_value,
                 execution_options,
+                chunksize,
             )
         else:
             self._load_via_parent(
-                our_states, query_info, q, context, execution_options
+                our_states,
+                query_info,
+                q,
+                session,
+                set_value,
+                execution_options,
+                chunksize,
             )
 
     def _load_via_child(
@@ -3199,19 +3637,21 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
         none_states,
         query_info,
         q,
-        context,
+        session,
+        set_value,
         execution_options,
+        chunksize,
     ):
         uselist = self.uselist
 
         # this sort is really for the benefit of the unit tests
         our_keys = sorted(our_states)
         while our_keys:
-            chunk = our_keys[0 : self._chunksize]
-            our_keys = our_keys[self._chunksize :]
+            chunk = our_keys[0:chunksize]
+            our_keys = our_keys[chunksize:]
             data = {
                 k: v
-                for k, v in context.session.execute(
+                for k, v in session.execute(
                     q,
                     params={
                         "primary_keys": [
@@ -3234,7 +3674,7 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
                     if not overwrite and self.key in dict_:
                         continue
 
-                    state.get_impl(self.key).set_committed_value(
+                    set_value(
                         state,
                         dict_,
                         related_obj if not uselist else [related_obj],
@@ -3246,17 +3686,24 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
 
             # note it's OK if this is a uselist=True attribute, the empty
             # collection will be populated
-            state.get_impl(self.key).set_committed_value(state, dict_, None)
+            set_value(state, dict_, None)
 
     def _load_via_parent(
-        self, our_states, query_info, q, context, execution_options
+        self,
+        our_states,
+        query_info,
+        q,
+        session,
+        set_value,
+        execution_options,
+        chunksize,
     ):
         uselist = self.uselist
         _empty_result = () if uselist else None
 
         while our_states:
-            chunk = our_states[0 : self._chunksize]
-            our_states = our_states[self._chunksize :]
+            chunk = our_states[0:chunksize]
+            our_states = our_states[chunksize:]
 
             primary_keys = [
                 key[0] if query_info.zero_idx else key
@@ -3265,7 +3712,7 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
 
             data = collections.defaultdict(list)
             for k, v in itertools.groupby(
-                context.session.execute(
+                session.execute(
                     q,
                     params={"primary_keys": primary_keys},
                     execution_options=execution_options,
@@ -3288,15 +3735,36 @@ class SelectInLoader(PostLoader, util.MemoizedSlots):
                             "uselist=False for eagerly-loaded "
                             "attribute '%s' " % self
                         )
-                    state.get_impl(self.key).set_committed_value(
-                        state, state_dict, collection[0]
-                    )
+                    set_value(state, state_dict, collection[0])
                 else:
                     # note that empty tuple set on uselist=False sets the
                     # value to None
-                    state.get_impl(self.key).set_committed_value(
-                        state, state_dict, collection
-                    )
+                    set_value(state, state_dict, collection)
+
+    def _value_setter(self, readonly):
+        """Return a function which sets a loaded value on either an
+        InstanceState or a read-only entity."""
+
+        key = self.key
+
+        if not readonly:
+
+            def set_committed_value(state, dict_, value):
+                state.get_impl(key).set_committed_value(state, dict_, value)
+
+            return set_committed_value
+        elif self.uselist:
+
+            def set_readonly_collection(obj, dict_, value):
+                dict_[key] = list(value) if value is not None else []
+
+            return set_readonly_collection
+        else:
+
+            def set_readonly_scalar(obj, dict_, value):
+                dict_[key] = value
+
+            return set_readonly_scalar
 
 
 def single_parent_validator(desc, prop):
@@ -415,6 +415,32 @@ class _AbstractLoad(traversals.GenerativeOnTraversal, LoaderOption):
         """
         return self._set_relationship_strategy(attr, {"lazy": "select"})
 
+    def batchload(
+        self: Self_AbstractLoad, attr: _AttrType
+    ) -> Self_AbstractLoad:
+        """Indicate that the given attribute should be loaded using "batch"
+        lazy loading.
+
+        The attribute is loaded when first accessed, as with
+        :func:`.lazyload`; however the first such access loads the attribute
+        for all of the objects that were loaded along with the parent
+        object, using the same SELECT IN statement as that of
+        :func:`.selectinload`.
+
+        This function is part of the :class:`_orm.Load` interface and supports
+        both method-chained and standalone operation.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :ref:`loading_toplevel`
+
+            :ref:`batch_lazy_loading`
+
+        """
+        return self._set_relationship_strategy(attr, {"lazy": "batch"})
+
     def immediateload(
         self: Self_AbstractLoad,
         attr: _AttrType,
@@ -2416,6 +2442,11 @@ def lazyload(*keys: _AttrType) -> _AbstractLoad:
     return _generate_from_keys(Load.lazyload, keys, False, {})
 
 
+@loader_unbound_fn
+def batchload(*keys: _AttrType) -> _AbstractLoad:
+    return _generate_from_keys(Load.batchload, keys, False, {})
+
+
 @loader_unbound_fn
 def immediateload(
     *keys: _AttrType, recursion_depth: Optional[int] = None
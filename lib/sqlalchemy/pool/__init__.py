@@ -32,8 +32,11 @@ from .base import PoolProxiedConnection as PoolProxiedConnection
 from .base import reset_commit as reset_commit
 from .base import reset_none as reset_none
 from .base import reset_rollback as reset_rollback
+from .impl import AdaptiveQueuePool as AdaptiveQueuePool
+from .impl import AffinityQueuePool as AffinityQueuePool
 from .impl import AssertionPool as AssertionPool
 from .impl import AsyncAdaptedQueuePool as AsyncAdaptedQueuePool
+from .impl import AsyncQueuePool as AsyncQueuePool
 from .impl import (
     FallbackAsyncAdaptedQueuePool as FallbackAsyncAdaptedQueuePool,
 )
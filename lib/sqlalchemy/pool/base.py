@@ -12,6 +12,7 @@
 
 from __future__ import annotations
 
+import bisect
 from collections import deque
 from enum import Enum
 import threading
@@ -106,6 +107,99 @@ class _CreatorWRecFnType(Protocol):
         ...
 
 
+class _Histogram:
+    """Count of durations, in seconds, within fixed buckets."""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    # upper bounds of each bucket; a final bucket holds all larger values
+    bounds = (
+        0.0001,
+        0.0005,
+        0.001,
+        0.005,
+        0.01,
+        0.05,
+        0.1,
+        0.5,
+        1.0,
+        5.0,
+        10.0,
+        30.0,
+    )
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "max": self.max,
+            "buckets": list(
+                zip(self.bounds + (float("inf"),), list(self.counts))
+            ),
+        }
+
+
+class _PoolMetrics:
+    """Counters and timings collected by a :class:`_pool.Pool` when the
+    :paramref:`_pool.Pool.metrics` parameter is set.
+
+    Values are updated without locking, so counts may be very slightly
+    off under concurrent use.
+
+    """
+
+    __slots__ = (
+        "checkout_wait",
+        "hold_time",
+        "connect_time",
+        "connect_errors",
+        "overflow_created",
+        "timeouts",
+        "invalidations",
+        "resets",
+        "resets_skipped",
+    )
+
+    def __init__(self) -> None:
+        self.checkout_wait = _Histogram()
+        self.hold_time = _Histogram()
+        self.connect_time = _Histogram()
+        self.connect_errors = 0
+        self.overflow_created = 0
+        self.timeouts = 0
+        self.invalidations = 0
+        self.resets = 0
+        self.resets_skipped = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "checkouts": self.checkout_wait.count,
+            "checkout_wait": self.checkout_wait.as_dict(),
+            "hold_time": self.hold_time.as_dict(),
+            "connects": self.connect_time.count,
+            "connect_time": self.connect_time.as_dict(),
+            "connect_errors": self.connect_errors,
+            "overflow_created": self.overflow_created,
+            "timeouts": self.timeouts,
+            "invalidations": self.invalidations,
+            "resets": self.resets,
+            "resets_skipped": self.resets_skipped,
+        }
+
+
 class Pool(log.Identified, event.EventTarget):
 
     """Abstract base class for connection pools."""
@@ -118,6 +212,7 @@ class Pool(log.Identified, event.EventTarget):
     _creator_arg: Union[_CreatorFnType, _CreatorWRecFnType]
     _invoke_creator: _CreatorWRecFnType
     _invalidate_time: float
+    _metrics: Optional[_PoolMetrics]
 
     def __init__(
         self,
@@ -129,6 +224,8 @@ class Pool(log.Identified, event.EventTarget):
         events: Optional[List[Tuple[_ListenerFnType, str]]] = None,
         dialect: Optional[Union[_ConnDialect, Dialect]] = None,
         pre_ping: bool = False,
+        pre_ping_interval: Optional[float] = None,
+        metrics: bool = False,
         _dispatch: Optional[_DispatchCommon[Pool]] = None,
     ):
         """
@@ -222,6 +319,34 @@ class Pool(log.Identified, event.EventTarget):
 
          .. versionadded:: 1.2
 
+        :param pre_ping_interval: when used with
+         :paramref:`_pool.Pool.pre_ping`, a number of seconds; a connection
+         which was returned to the pool or otherwise tested for liveness
+         more recently than this interval is not pinged upon checkout.
+         Only connections that have been idle for longer than the interval
+         are pinged.   Defaults to None, meaning that every checkout is
+         pinged.
+
+         .. versionadded:: 2.0
+
+         .. seealso::
+
+            :ref:`pool_disconnects_pessimistic_interval`
+
+        :param metrics: if True, the pool collects counts and timings of
+         its activity, including how long checkouts wait for a connection,
+         how long connections are held before being returned, and how long
+         new connections take to establish, which are available from the
+         :meth:`_pool.Pool.get_metrics` method.   The collection is
+         performed inline without the use of events, and adds only a few
+         timer calls to each checkout and checkin.
+
+         .. versionadded:: 2.0
+
+         .. seealso::
+
+            :ref:`pool_metrics`
+
         """
         if logging_name:
             self.logging_name = self._orig_logging_name = logging_name
@@ -233,6 +358,8 @@ class Pool(log.Identified, event.EventTarget):
         self._recycle = recycle
         self._invalidate_time = 0
         self._pre_ping = pre_ping
+        self._pre_ping_interval = pre_ping_interval
+        self._metrics = _PoolMetrics() if metrics else None
         self._reset_on_return = util.parse_user_argument_for_enum(
             reset_on_return,
             {
@@ -405,6 +532,42 @@ class Pool(log.Identified, event.EventTarget):
     def status(self) -> str:
         raise NotImplementedError()
 
+    def get_metrics(self, reset: bool = False) -> Optional[Dict[str, Any]]:
+        """Return the metrics collected by this pool as a dictionary.
+
+        Returns None unless the pool was created with the
+        :paramref:`_pool.Pool.metrics` parameter.   The dictionary includes
+        counters such as ``"checkouts"``, ``"connects"``, ``"timeouts"``,
+        ``"overflow_created"`` and ``"invalidations"``, as well as
+        histograms of durations in seconds under the keys
+        ``"checkout_wait"``, ``"hold_time"`` and ``"connect_time"``.   Pool
+        implementations may add the current state of the pool as well,
+        such as the ``"checkedout"`` count and ``"saturation"`` ratio of
+        :class:`.QueuePool`.
+
+        .. versionadded:: 2.0
+
+        :param reset: if True, the collected counts and timings are reset
+         after being returned.
+
+        .. seealso::
+
+            :ref:`pool_metrics`
+
+        """
+        metrics = self._metrics
+        if metrics is None:
+            return None
+
+        result = metrics.as_dict()
+        result.update(self._metrics_state())
+        if reset:
+            self._metrics = _PoolMetrics()
+        return result
+
+    def _metrics_state(self) -> Dict[str, Any]:
+        return {}
+
 
 class ManagesConnection:
     """Common base for the two connection-management interfaces
@@ -589,6 +752,8 @@ class _ConnectionRecord(ConnectionPoolEntry):
         "finalize_callback",
         "fresh",
         "starttime",
+        "last_used",
+        "_checkout_time",
         "dbapi_connection",
         "__weakref__",
         "__dict__",
@@ -598,11 +763,14 @@ class _ConnectionRecord(ConnectionPoolEntry):
     fresh: bool
     fairy_ref: Optional[weakref.ref[_ConnectionFairy]]
     starttime: float
+    last_used: float
 
     def __init__(self, pool: Pool, connect: bool = True):
         self.fresh = False
         self.fairy_ref = None
         self.starttime = 0
+        self.last_used = 0
+        self._checkout_time: Optional[float] = None
         self.dbapi_connection = None
 
         self.__pool = pool
@@ -640,11 +808,21 @@ class _ConnectionRecord(ConnectionPoolEntry):
         return {}
 
     @classmethod
-    def checkout(cls, pool: Pool) -> _ConnectionFairy:
-        if TYPE_CHECKING:
-            rec = cast(_ConnectionRecord, pool._do_get())
-        else:
-            rec = pool._do_get()
+    def checkout(
+        cls,
+        pool: Pool,
+        rec: Optional[_ConnectionRecord] = None,
+        start: Optional[float] = None,
+    ) -> _ConnectionFairy:
+        metrics = pool._metrics
+        if metrics is not None and start is None:
+            start = time.perf_counter()
+
+        if rec is None:
+            if TYPE_CHECKING:
+                rec = cast(_ConnectionRecord, pool._do_get())
+            else:
+                rec = pool._do_get()
 
         try:
             dbapi_connection = rec.get_connection()
@@ -653,6 +831,11 @@ class _ConnectionRecord(ConnectionPoolEntry):
                 rec._checkin_failed(err, _fairy_was_created=False)
             raise
 
+        if metrics is not None:
+            rec._checkout_time = now = time.perf_counter()
+            assert start is not None
+            metrics.checkout_wait.observe(now - start)
+
         echo = pool._should_log_debug()
         fairy = _ConnectionFairy(pool, dbapi_connection, rec, echo)
 
@@ -698,6 +881,13 @@ class _ConnectionRecord(ConnectionPoolEntry):
         if pool.dispatch.checkin:
             pool.dispatch.checkin(connection, self)
 
+        self.last_used = time.time()
+        if self._checkout_time is not None:
+            if pool._metrics is not None:
+                pool._metrics.hold_time.observe(
+                    time.perf_counter() - self._checkout_time
+                )
+            self._checkout_time = None
         pool._return_conn(self)
 
     @property
@@ -718,6 +908,8 @@ class _ConnectionRecord(ConnectionPoolEntry):
         # already invalidated
         if self.dbapi_connection is None:
             return
+        if self.__pool._metrics is not None:
+            self.__pool._metrics.invalidations += 1
         if soft:
             self.__pool.dispatch.soft_invalidate(
                 self.dbapi_connection, self, e
@@ -789,14 +981,57 @@ class _ConnectionRecord(ConnectionPoolEntry):
             recycle = True
 
         if recycle:
-            self.__close()
-            self.info.clear()  # type: ignore  # our info is always present
-
-            self.__connect()
+            self._reconnect()
 
         assert self.dbapi_connection is not None
         return self.dbapi_connection
 
+    def _needs_reconnect(self, recycle_before: float) -> bool:
+        """Return True if this connection was invalidated, or would be
+        recycled if checked out at the given time.
+
+        """
+        return self._is_hard_or_soft_invalidated() or (
+            self.__pool._recycle > -1
+            and recycle_before - self.starttime > self.__pool._recycle
+        )
+
+    def _reconnect(self) -> None:
+        if self.dbapi_connection is not None:
+            self.__close()
+        self.info.clear()  # type: ignore  # our info is always present
+
+        self.__connect()
+
+    def _idle_ping(self) -> None:
+        """Test an idle connection for liveness, reconnecting if the ping
+        fails or the connection is otherwise due to be recycled.
+
+        Called by the idle pinger of a :class:`.QueuePool` for a record
+        that it has removed from the pool.
+
+        """
+        pool = self.__pool
+        try:
+            if (
+                self.dbapi_connection is not None
+                and not self._is_hard_or_soft_invalidated()
+                and not pool._dialect.do_ping(self.dbapi_connection)
+            ):
+                pool.logger.info(
+                    "Idle ping on connection %r failed; reconnecting",
+                    self.dbapi_connection,
+                )
+                self.invalidate()
+            self.get_connection()
+        except Exception as err:
+            pool.logger.info(
+                "Error on idle ping of connection %r", self, exc_info=True
+            )
+            self.invalidate(e=err)
+        finally:
+            self.last_used = time.time()
+
     def _is_hard_or_soft_invalidated(self) -> bool:
         return (
             self.dbapi_connection is None
@@ -818,6 +1053,9 @@ class _ConnectionRecord(ConnectionPoolEntry):
         # ensure any existing connection is removed, so that if
         # creator fails, this attribute stays None
         self.dbapi_connection = None
+        metrics = pool._metrics
+        if metrics is not None:
+            start = time.perf_counter()
         try:
             self.starttime = time.time()
             self.dbapi_connection = connection = pool._invoke_creator(self)
@@ -825,8 +1063,13 @@ class _ConnectionRecord(ConnectionPoolEntry):
             self.fresh = True
         except Exception as e:
             with util.safe_reraise():
+                if metrics is not None:
+                    metrics.connect_errors += 1
                 pool.logger.debug("Error on connect(): %s", e)
         else:
+            if metrics is not None:
+                metrics.connect_time.observe(time.perf_counter() - start)
+
             # in SQLAlchemy 1.4 the first_connect event is not used by
             # the engine, so this will usually not be set
             if pool.dispatch.first_connect:
@@ -906,8 +1149,11 @@ def _finalize_fairy(
                     echo,
                 )
             assert fairy.dbapi_connection is dbapi_connection
-            if reset and can_manipulate_connection:
-                fairy._reset(pool)
+            if can_manipulate_connection:
+                if reset:
+                    fairy._reset(pool)
+                else:
+                    fairy._reset_skipped(pool)
 
             if detach:
                 if connection_record:
@@ -1170,9 +1416,11 @@ class _ConnectionFairy(PoolProxiedConnection):
         pool: Pool,
         threadconns: Optional[threading.local] = None,
         fairy: Optional[_ConnectionFairy] = None,
+        rec: Optional[_ConnectionRecord] = None,
+        start: Optional[float] = None,
     ) -> _ConnectionFairy:
         if not fairy:
-            fairy = _ConnectionRecord.checkout(pool)
+            fairy = _ConnectionRecord.checkout(pool, rec, start)
 
             if threadconns is not None:
                 threadconns.current = weakref.ref(fairy)
@@ -1202,7 +1450,19 @@ class _ConnectionFairy(PoolProxiedConnection):
             fairy._connection_record.fresh = False
             try:
                 if pool._pre_ping:
-                    if not connection_is_fresh:
+                    if (
+                        pool._pre_ping_interval is not None
+                        and not connection_is_fresh
+                        and time.time() - fairy._connection_record.last_used
+                        < pool._pre_ping_interval
+                    ):
+                        if fairy._echo:
+                            pool.logger.debug(
+                                "Connection %s was used recently, "
+                                "skipping pre-ping",
+                                fairy.dbapi_connection,
+                            )
+                    elif not connection_is_fresh:
                         if fairy._echo:
                             pool.logger.debug(
                                 "Pool pre-ping on connection %s",
@@ -1305,6 +1565,23 @@ class _ConnectionFairy(PoolProxiedConnection):
                     self.dbapi_connection,
                 )
             pool._dialect.do_commit(self)
+        else:
+            return
+
+        if pool._metrics is not None:
+            pool._metrics.resets += 1
+
+    def _reset_skipped(self, pool: Pool) -> None:
+        if pool._reset_on_return is reset_none:
+            # no reset would have taken place
+            return
+
+        if pool.dispatch.reset_skipped:
+            pool.dispatch.reset_skipped(
+                self.dbapi_connection, self._connection_record
+            )
+        if pool._metrics is not None:
+            pool._metrics.resets_skipped += 1
 
     @property
     def _logger(self) -> log._IdentifiedLoggerType:
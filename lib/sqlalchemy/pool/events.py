@@ -202,6 +202,16 @@ class PoolEvents(event.Events[Pool]):
         be controlled, including disabled, using the ``reset_on_return``
         pool argument.
 
+        When the :class:`_engine.Connection` which used the DBAPI connection
+        has already ended its transaction with ``commit()`` or
+        ``rollback()``, the "reset" action is normally skipped, emitting
+        the :meth:`_events.PoolEvents.reset_skipped` event instead.  When
+        listeners for the :meth:`_events.PoolEvents.reset` event are
+        present, the "reset" action still takes place in this case so that
+        the listeners continue to be invoked for each connection returned
+        by an :class:`_engine.Engine`.  The action is still skipped when the
+        :class:`_engine.Connection` rolls back a transaction that is in
+        progress as it is closed, as in previous versions.
 
         The :meth:`_events.PoolEvents.reset` event is usually followed by the
         :meth:`_events.PoolEvents.checkin` event is called, except in those
@@ -215,12 +225,52 @@ class PoolEvents(event.Events[Pool]):
 
         .. seealso::
 
+            :meth:`_events.PoolEvents.reset_skipped`
+
             :meth:`_events.ConnectionEvents.rollback`
 
             :meth:`_events.ConnectionEvents.commit`
 
         """
 
+    def reset_skipped(
+        self,
+        dbapi_connection: DBAPIConnection,
+        connection_record: ConnectionPoolEntry,
+    ) -> None:
+        """Called when a pooled connection is returned to the pool without
+        the "reset" action, as the :class:`_engine.Connection` which used
+        it has indicated that its transactional state was already reset.
+
+        This occurs when the :class:`_engine.Connection` rolled back a
+        transaction that was still in progress as it was closed, as well as
+        when the most recent operation on the DBAPI connection was a
+        ``commit()`` or ``rollback()`` emitted by the
+        :class:`_engine.Connection`, so that no transaction is in progress,
+        unless listeners for the :meth:`_events.PoolEvents.reset` event are
+        present.
+        Together with the :meth:`_events.PoolEvents.reset` event, this
+        event can be used to observe how often the "reset" action is
+        performed versus skipped.   The event is not emitted for a pool
+        configured with ``reset_on_return=None``, as no reset would have
+        taken place.
+
+        :param dbapi_connection: a DBAPI connection.
+         The :attr:`.ConnectionPoolEntry.dbapi_connection` attribute.
+
+        :param connection_record: the :class:`.ConnectionPoolEntry` managing
+         the DBAPI connection.
+
+        .. versionadded:: 2.0
+
+        .. seealso::
+
+            :meth:`_events.PoolEvents.reset`
+
+            :ref:`pool_reset_on_return`
+
+        """
+
     def invalidate(
         self,
         dbapi_connection: DBAPIConnection,
@@ -11,14 +11,20 @@
 """
 from __future__ import annotations
 
+import asyncio
 import threading
+import time
 import traceback
 import typing
 from typing import Any
+from typing import Callable
 from typing import cast
+from typing import Dict
 from typing import List
+from typing import NoReturn
 from typing import Optional
 from typing import Set
+from typing import Tuple
 from typing import Type
 from typing import TYPE_CHECKING
 from typing import Union
@@ -36,6 +42,7 @@ from .. import exc
 from .. import util
 from ..util import chop_traceback
 from ..util import queue as sqla_queue
+from ..util.concurrency import greenlet_spawn
 from ..util.typing import Literal
 
 if typing.TYPE_CHECKING:
@@ -60,6 +67,8 @@ class QueuePool(Pool):
 
     _pool: sqla_queue.QueueCommon[ConnectionPoolEntry]
 
+    _filler_interval = 1.0
+
     def __init__(
         self,
         creator: Union[_CreatorFnType, _CreatorWRecFnType],
@@ -67,6 +76,8 @@ class QueuePool(Pool):
         max_overflow: int = 10,
         timeout: float = 30.0,
         use_lifo: bool = False,
+        idle_ping_interval: Optional[float] = None,
+        min_size: int = 0,
         **kw: Any,
     ):
         r"""
@@ -117,6 +128,39 @@ class QueuePool(Pool):
 
             :ref:`pool_disconnects`
 
+        :param idle_ping_interval: a number of seconds; if set, a
+          background thread is started which, at this interval, tests each
+          connection that has been idle in the pool for at least this long
+          for liveness, reconnecting those that fail the test or are
+          due to be recycled.   Used in conjunction with
+          :paramref:`_pool.Pool.pre_ping_interval`, checkouts will then
+          not usually need to test connections themselves.   The thread
+          is stopped when the pool is disposed.  Not supported for
+          asyncio pools.
+
+          .. versionadded:: 2.0
+
+          .. seealso::
+
+            :ref:`pool_disconnects_pessimistic_interval`
+
+        :param min_size: the number of connections to keep open in the
+          pool at all times, which may not exceed ``pool_size``.   Upon first
+          checkout, a background thread is started which opens connections
+          until this number is reached, and which subsequently reconnects
+          idle connections that were invalidated or are about to reach the
+          :paramref:`_pool.Pool.recycle` time, so that checkouts don't
+          have to wait on new connections being established.   The thread
+          is stopped when the pool is disposed.   Defaults to zero,
+          meaning connections are only opened as they are requested.   Not
+          supported for asyncio pools.
+
+          .. versionadded:: 2.0
+
+          .. seealso::
+
+            :ref:`pool_min_size`
+
         :param \**kw: Other keyword arguments including
           :paramref:`_pool.Pool.recycle`, :paramref:`_pool.Pool.echo`,
           :paramref:`_pool.Pool.reset_on_return` and others are passed to the
@@ -129,6 +173,56 @@ class QueuePool(Pool):
         self._max_overflow = max_overflow
         self._timeout = timeout
         self._overflow_lock = threading.Lock()
+        self._idle_ping_interval = idle_ping_interval
+        self._min_size = min_size
+        self._filler_started = False
+        self._background_stop: Optional[threading.Event] = None
+
+        for name, value in [
+            ("idle_ping_interval", idle_ping_interval),
+            ("min_size", min_size),
+        ]:
+            if value and self._is_asyncio:
+                raise exc.ArgumentError(
+                    "The %s parameter is not supported "
+                    "for asyncio connection pools" % name
+                )
+
+        if pool_size > 0 and min_size > pool_size:
+            raise exc.ArgumentError(
+                "min_size of %d may not exceed pool_size of %d"
+                % (min_size, pool_size)
+            )
+
+        if idle_ping_interval is not None:
+            self._start_background(
+                "sqlalchemy-idle-pinger",
+                idle_ping_interval,
+                QueuePool._ping_idle_connections,
+            )
+
+    def _start_background(
+        self,
+        name: str,
+        interval: float,
+        fn: Callable[[QueuePool], None],
+        run_first: bool = False,
+    ) -> None:
+        if self._background_stop is None:
+            self._background_stop = threading.Event()
+
+        threading.Thread(
+            target=_run_in_background,
+            args=(
+                weakref.ref(self),
+                self._background_stop,
+                interval,
+                fn,
+                run_first,
+            ),
+            name=name,
+            daemon=True,
+        ).start()
 
     def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
         try:
@@ -140,6 +234,9 @@ class QueuePool(Pool):
                 self._dec_overflow()
 
     def _do_get(self) -> ConnectionPoolEntry:
+        if self._min_size and not self._filler_started:
+            self._start_filler()
+
         use_overflow = self._max_overflow > -1
 
         wait = use_overflow and self._overflow >= self._max_overflow
@@ -154,22 +251,50 @@ class QueuePool(Pool):
             if not wait:
                 return self._do_get()
             else:
-                raise exc.TimeoutError(
-                    "QueuePool limit of size %d overflow %d reached, "
-                    "connection timed out, timeout %0.2f"
-                    % (self.size(), self.overflow(), self._timeout),
-                    code="3o7r",
-                )
+                self._raise_timeout()
 
-        if self._inc_overflow():
-            try:
-                return self._create_connection()
-            except:
-                with util.safe_reraise():
-                    self._dec_overflow()
-                raise
-        else:
+        rec = self._create_overflow_connection()
+        if rec is None:
             return self._do_get()
+        return rec
+
+    def _start_filler(self) -> None:
+        self._filler_started = True
+        self._start_background(
+            "sqlalchemy-pool-filler",
+            self._filler_interval,
+            QueuePool._fill_to_min_size,
+            run_first=True,
+        )
+
+    def _raise_timeout(self) -> NoReturn:
+        if self._metrics is not None:
+            self._metrics.timeouts += 1
+        raise exc.TimeoutError(
+            "QueuePool limit of size %d overflow %d reached, "
+            "connection timed out, timeout %0.2f"
+            % (self.size(), self.overflow(), self._timeout),
+            code="3o7r",
+        )
+
+    def _create_overflow_connection(self) -> Optional[ConnectionPoolEntry]:
+        """Create a new connection if the overflow limit allows, else
+        return None.
+
+        """
+        if not self._inc_overflow():
+            return None
+
+        try:
+            rec = self._create_connection()
+        except:
+            with util.safe_reraise():
+                self._dec_overflow()
+            raise
+        else:
+            if self._metrics is not None and self._overflow > 0:
+                self._metrics.overflow_created += 1
+            return rec
 
     def _inc_overflow(self) -> bool:
         if self._max_overflow == -1:
@@ -190,6 +315,74 @@ class QueuePool(Pool):
             self._overflow -= 1
             return True
 
+    def _ping_idle_connections(self) -> None:
+        assert self._idle_ping_interval is not None
+        idle_since = time.time() - self._idle_ping_interval
+
+        while True:
+            rec = cast(
+                Optional[_ConnectionRecord],
+                self._pool.get_where(
+                    lambda rec: rec.last_used <= idle_since  # type: ignore
+                ),
+            )
+            if rec is None:
+                break
+            try:
+                rec._idle_ping()
+            finally:
+                QueuePool._do_return_conn(self, rec)
+
+    def _fill_to_min_size(self) -> None:
+        started = time.time()
+        recycle_before = started + self._filler_interval
+
+        # reconnect idle connections that were invalidated or which
+        # would reach the recycle time before the next run.  a connection
+        # is reconnected at most once per run, as with a recycle time
+        # shorter than the filler interval, a new connection would again
+        # reach it before the next run
+        while True:
+            rec = cast(
+                Optional[_ConnectionRecord],
+                self._pool.get_where(
+                    lambda rec: rec.starttime < started  # type: ignore
+                    and rec._needs_reconnect(recycle_before)  # type: ignore
+                ),
+            )
+            if rec is None:
+                break
+            try:
+                rec._reconnect()
+            except Exception:
+                self.logger.error(
+                    "Error reconnecting idle connection", exc_info=True
+                )
+                break
+            finally:
+                QueuePool._do_return_conn(self, rec)
+
+        self._open_connections(self._min_size)
+
+    def _open_connections(self, size: int) -> None:
+        """Open new connections into the pool until ``size`` connections
+        are open, counting those which are checked out.
+
+        """
+        while self._overflow + self.size() < size and self._inc_overflow():
+            try:
+                rec = self._create_connection()
+            except Exception:
+                self._dec_overflow()
+                self.logger.error(
+                    "Error opening connection to maintain pool size",
+                    exc_info=True,
+                )
+                break
+            else:
+                rec.last_used = time.time()  # type: ignore[attr-defined]
+                QueuePool._do_return_conn(self, rec)
+
     def recreate(self) -> QueuePool:
         self.logger.info("Pool recreating")
         return self.__class__(
@@ -197,6 +390,10 @@ class QueuePool(Pool):
             pool_size=self._pool.maxsize,
             max_overflow=self._max_overflow,
             pre_ping=self._pre_ping,
+            pre_ping_interval=self._pre_ping_interval,
+            metrics=self._metrics is not None,
+            idle_ping_interval=self._idle_ping_interval,
+            min_size=self._min_size,
             use_lifo=self._pool.use_lifo,
             timeout=self._timeout,
             recycle=self._recycle,
@@ -208,6 +405,9 @@ class QueuePool(Pool):
         )
 
     def dispose(self) -> None:
+        if self._background_stop is not None:
+            self._background_stop.set()
+
         while True:
             try:
                 conn = self._pool.get(False)
@@ -231,6 +431,23 @@ class QueuePool(Pool):
             )
         )
 
+    def _metrics_state(self) -> Dict[str, Any]:
+        checkedout = self.checkedout()
+        if self._max_overflow > -1 and self.size() > 0:
+            saturation: Optional[float] = checkedout / (
+                self.size() + self._max_overflow
+            )
+        else:
+            saturation = None
+        return {
+            "size": self.size(),
+            "max_overflow": self._max_overflow,
+            "checkedin": self.checkedin(),
+            "checkedout": checkedout,
+            "overflow": self.overflow(),
+            "saturation": saturation,
+        }
+
     def size(self) -> int:
         return self._pool.maxsize
 
@@ -247,6 +464,360 @@ class QueuePool(Pool):
         return self._pool.maxsize - self._pool.qsize() + self._overflow
 
 
+def _run_in_background(
+    pool_ref: weakref.ref[QueuePool],
+    stop: threading.Event,
+    interval: float,
+    fn: Callable[[QueuePool], None],
+    run_first: bool,
+) -> None:
+    """Run a maintenance function for a :class:`.QueuePool` at the given
+    interval, until the pool is disposed or garbage collected.
+
+    """
+    wait = 0 if run_first else interval
+
+    while not stop.wait(wait):
+        wait = interval
+        pool = pool_ref()
+        if pool is None:
+            break
+        try:
+            fn(pool)
+        except Exception:
+            pool.logger.error(
+                "Exception in background pool maintenance", exc_info=True
+            )
+        del pool
+
+
+class AffinityQueuePool(QueuePool):
+    """A :class:`.QueuePool` which keeps the connection returned by a
+    thread aside for that thread's next checkout.
+
+    When a thread returns a connection to the pool, the connection is
+    placed in a slot reserved for that thread rather than in the shared
+    queue, and the thread's next checkout takes it from that slot.   This
+    allows threads which repeatedly check out and return a single
+    connection to do so without acquiring the locks used by the shared
+    queue and for overflow accounting.   A connection is returned to the
+    shared queue instead when the thread's slot is already occupied, or
+    when the pool has reached its ``max_overflow`` limit so that other
+    threads may be waiting on it.   Threads that find the shared queue
+    empty take connections from the slots of other threads before opening
+    new connections.   Connections held in thread slots are pinged by the
+    ``idle_ping_interval`` pinger and reconnected by the ``min_size``
+    filler in the same way as those in the shared queue.
+
+    The shared queue is used in LIFO mode by default.   Arguments are the
+    same as those of :class:`.QueuePool`.
+
+    .. versionadded:: 2.0
+
+    """
+
+    # how often a checkout which is waiting on the shared queue checks
+    # the slots of other threads
+    _parked_poll_interval = 0.05
+
+    _parked: Dict[int, ConnectionPoolEntry]
+
+    def __init__(
+        self,
+        creator: Union[_CreatorFnType, _CreatorWRecFnType],
+        use_lifo: bool = True,
+        **kw: Any,
+    ):
+        QueuePool.__init__(self, creator, use_lifo=use_lifo, **kw)
+        self._parked = {}
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        overflow = self._overflow
+
+        # park the connection only if it's within pool_size, so that
+        # overflow connections are still discarded by the shared queue,
+        # and if a checkout would not need to wait for it
+        if (
+            overflow <= 0
+            and (overflow < self._max_overflow or self._max_overflow == -1)
+            and self._parked.setdefault(threading.get_ident(), record)
+            is record
+        ):
+            return
+
+        QueuePool._do_return_conn(self, record)
+
+    def _take_parked(self) -> Optional[ConnectionPoolEntry]:
+        parked = self._parked
+        for ident in list(parked):
+            rec = parked.pop(ident, None)
+            if rec is not None:
+                return rec
+        return None
+
+    def _take_parked_where(
+        self, fn: Callable[[_ConnectionRecord], bool]
+    ) -> Optional[Tuple[int, _ConnectionRecord]]:
+        """Remove and return the first parked connection for which the
+        given function returns True, along with the thread it was parked
+        for.
+
+        """
+        parked = cast(Dict[int, _ConnectionRecord], self._parked)
+        for ident, rec in list(parked.items()):
+            if not fn(rec):
+                continue
+            taken = parked.pop(ident, None)
+            if taken is None:
+                continue
+            elif fn(taken):
+                return ident, taken
+            else:
+                # the thread swapped in a different connection while
+                # we were looking
+                self._repark(ident, taken)
+        return None
+
+    def _repark(self, ident: int, rec: ConnectionPoolEntry) -> None:
+        """Return a connection taken by :meth:`._take_parked_where` to the
+        slot of its thread, or to the shared queue if the slot has been
+        filled in the meantime.
+
+        """
+        if self._parked.setdefault(ident, rec) is not rec:
+            QueuePool._do_return_conn(self, rec)
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        rec = self._parked.pop(threading.get_ident(), None)
+        if rec is not None:
+            return rec
+
+        if self._min_size and not self._filler_started:
+            self._start_filler()
+
+        endtime: Optional[float] = None
+        while True:
+            try:
+                return self._pool.get(False)
+            except sqla_queue.Empty:
+                pass
+
+            rec = self._take_parked()
+            if rec is not None:
+                return rec
+
+            if self._max_overflow == -1 or self._overflow < self._max_overflow:
+                rec = self._create_overflow_connection()
+                if rec is not None:
+                    return rec
+                continue
+
+            if endtime is None:
+                endtime = time.time() + self._timeout
+            remaining = endtime - time.time()
+            if remaining <= 0:
+                self._raise_timeout()
+
+            try:
+                return self._pool.get(
+                    True, min(remaining, self._parked_poll_interval)
+                )
+            except sqla_queue.Empty:
+                pass
+
+    def _ping_idle_connections(self) -> None:
+        QueuePool._ping_idle_connections(self)
+
+        assert self._idle_ping_interval is not None
+        idle_since = time.time() - self._idle_ping_interval
+
+        while True:
+            taken = self._take_parked_where(
+                lambda rec: rec.last_used <= idle_since
+            )
+            if taken is None:
+                break
+            ident, rec = taken
+            try:
+                rec._idle_ping()
+            finally:
+                self._repark(ident, rec)
+
+    def _fill_to_min_size(self) -> None:
+        started = time.time()
+        recycle_before = started + self._filler_interval
+
+        # parked connections aren't in the shared queue, so reconnect
+        # those first; the shared queue and the count of open connections
+        # are handled by QueuePool
+        while True:
+            taken = self._take_parked_where(
+                lambda rec: rec.starttime < started
+                and rec._needs_reconnect(recycle_before)
+            )
+            if taken is None:
+                break
+            ident, rec = taken
+            try:
+                rec._reconnect()
+            except Exception:
+                self.logger.error(
+                    "Error reconnecting idle connection", exc_info=True
+                )
+                break
+            finally:
+                self._repark(ident, rec)
+
+        QueuePool._fill_to_min_size(self)
+
+    def dispose(self) -> None:
+        while True:
+            rec = self._take_parked()
+            if rec is None:
+                break
+            QueuePool._do_return_conn(self, rec)
+
+        QueuePool.dispose(self)
+
+    def checkedin(self) -> int:
+        return self._pool.qsize() + len(self._parked)
+
+    def checkedout(self) -> int:
+        return self._pool.maxsize - self.checkedin() + self._overflow
+
+
+class AdaptiveQueuePool(QueuePool):
+    """A :class:`.QueuePool` which adjusts the number of connections it
+    keeps open according to recent demand.
+
+    :class:`.AdaptiveQueuePool` keeps between
+    :paramref:`_pool.QueuePool.min_size` and
+    :paramref:`_pool.QueuePool.pool_size` connections open.   Upon first
+    checkout, a background thread is started which, once per second,
+    checks how the pool has been used since its previous run:
+
+    * If any checkouts took longer than ``wait_threshold`` seconds, due to
+      waiting for a connection to be returned or for a new connection to be
+      established, the pool opens one additional connection for each of
+      them, so that subsequent checkouts can proceed immediately.
+
+    * Otherwise, if a connection in the pool has not been used for
+      ``idle_timeout`` seconds, and more than ``min_size`` connections are
+      open, the connection is closed.   Only one connection is closed on
+      each run, so that the pool shrinks gradually as demand decreases.
+
+    This allows ``pool_size`` to be set to what's needed under peak load
+    without keeping that many connections open when the load is lower.
+    Overflow connections beyond ``pool_size`` are handled in the same way
+    as for :class:`.QueuePool`.
+
+    The thread is stopped when the pool is disposed.   The pool uses its
+    connections in LIFO order by default, so that surplus connections
+    become idle rather than all connections being used in turn.
+
+    .. versionadded:: 2.0
+
+    .. seealso::
+
+        :ref:`pool_adaptive`
+
+    """
+
+    def __init__(
+        self,
+        creator: Union[_CreatorFnType, _CreatorWRecFnType],
+        use_lifo: bool = True,
+        idle_timeout: float = 60.0,
+        wait_threshold: float = 0.01,
+        **kw: Any,
+    ):
+        r"""
+        Construct an AdaptiveQueuePool.
+
+        :param creator: a callable function that returns a DB-API
+          connection object, same as that of :paramref:`_pool.Pool.creator`.
+
+        :param use_lifo: use LIFO (last-in-first-out) when retrieving
+          connections, which is the default for this pool.
+
+        :param idle_timeout: number of seconds a connection may remain
+          unused in the pool before it's eligible to be closed, when more
+          than :paramref:`_pool.QueuePool.min_size` connections are open.
+          Defaults to 60.
+
+        :param wait_threshold: a checkout which takes at least this many
+          seconds is counted as having waited for a connection, causing the
+          pool to open an additional connection.   Defaults to 0.01.
+
+        :param \**kw: Other keyword arguments including
+          :paramref:`_pool.QueuePool.pool_size`,
+          :paramref:`_pool.QueuePool.max_overflow` and
+          :paramref:`_pool.QueuePool.min_size` are passed to the
+          :class:`.QueuePool` constructor.
+
+        """
+        QueuePool.__init__(self, creator, use_lifo=use_lifo, **kw)
+        self._idle_timeout = idle_timeout
+        self._wait_threshold = wait_threshold
+        self._slow_checkouts = 0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        if not self._filler_started:
+            self._start_filler()
+
+        start = time.perf_counter()
+        try:
+            return QueuePool._do_get(self)
+        finally:
+            if time.perf_counter() - start >= self._wait_threshold:
+                self._slow_checkouts += 1
+
+    def _start_filler(self) -> None:
+        self._filler_started = True
+        self._start_background(
+            "sqlalchemy-pool-adapter",
+            self._filler_interval,
+            AdaptiveQueuePool._adjust_size,  # type: ignore[arg-type]
+            run_first=True,
+        )
+
+    def _adjust_size(self) -> None:
+        slow_checkouts, self._slow_checkouts = self._slow_checkouts, 0
+
+        self._fill_to_min_size()
+
+        if slow_checkouts:
+            size = self._overflow + self.size() + slow_checkouts
+            if self.size() > 0:
+                size = min(size, self.size())
+            self._open_connections(size)
+        elif self._overflow + self.size() > self._min_size:
+            self._close_idle_connection()
+
+    def _close_idle_connection(self) -> None:
+        idle_since = time.time() - self._idle_timeout
+        rec = cast(
+            Optional[_ConnectionRecord],
+            self._pool.get_where(
+                lambda rec: rec.last_used <= idle_since  # type: ignore
+            ),
+        )
+        if rec is None:
+            return
+
+        self.logger.debug("Closing idle connection %r", rec)
+        try:
+            rec.close()
+        finally:
+            self._dec_overflow()
+
+    def recreate(self) -> AdaptiveQueuePool:
+        pool = cast(AdaptiveQueuePool, QueuePool.recreate(self))
+        pool._idle_timeout = self._idle_timeout
+        pool._wait_threshold = self._wait_threshold
+        return pool
+
+
 class AsyncAdaptedQueuePool(QueuePool):
     _is_asyncio = True  # type: ignore[assignment]
     _queue_class: Type[
@@ -260,6 +831,161 @@ class FallbackAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
     _queue_class = sqla_queue.FallbackAsyncAdaptedQueue
 
 
+class AsyncQueuePool(AsyncAdaptedQueuePool):
+    """An asyncio connection pool which checks out connections using
+    coroutines, rather than by running the checkout within a greenlet.
+
+    :class:`.AsyncQueuePool` provides the same behavior as
+    :class:`.AsyncAdaptedQueuePool` and is used in the same way, including
+    by the ORM, which checks out connections synchronously.   In addition,
+    the :meth:`.AsyncQueuePool.connect_async` coroutine, which is used by
+    :class:`_asyncio.AsyncEngine` to begin a new
+    :class:`_asyncio.AsyncConnection`, waits for connections to become
+    available by awaiting the asyncio queue directly.   A greenlet is used
+    only for those parts of a checkout which must interact with the
+    database driver, which are establishing a new connection, recycling a
+    connection, and the "pre ping"; when
+    :paramref:`_pool.Pool.pre_ping_interval` is used, most checkouts don't
+    need to ping the connection.   Pools with ``checkout`` event listeners
+    perform the checkout within a greenlet, as these may also use the
+    connection.
+
+    Unlike :class:`.AsyncAdaptedQueuePool`, the
+    :paramref:`.QueuePool.min_size` parameter is supported; when set, the
+    pool opens connections concurrently within an asyncio task upon first
+    use, until the given number of connections are open.   The
+    :meth:`.AsyncQueuePool.warm_up` coroutine may also be used to open
+    connections ahead of time.
+
+    .. versionadded:: 2.0
+
+    .. seealso::
+
+        :ref:`asyncio_pool`
+
+    """
+
+    _queue_class = sqla_queue.AsyncAdaptedQueue
+
+    _pool: sqla_queue.AsyncAdaptedQueue[ConnectionPoolEntry]
+
+    _warm_up_task: Optional[asyncio.Task[None]]
+
+    def __init__(
+        self,
+        creator: Union[_CreatorFnType, _CreatorWRecFnType],
+        min_size: int = 0,
+        **kw: Any,
+    ):
+        AsyncAdaptedQueuePool.__init__(self, creator, **kw)
+        if self.size() > 0 and min_size > self.size():
+            raise exc.ArgumentError(
+                "min_size of %d may not exceed pool_size of %d"
+                % (min_size, self.size())
+            )
+        self._min_size = min_size
+        self._warm_up_task = None
+
+    async def connect_async(self) -> PoolProxiedConnection:
+        """Return a DBAPI connection from the pool, awaiting a connection
+        to become available if needed.
+
+        This is the asyncio equivalent of :meth:`_pool.Pool.connect`.
+
+        """
+        start = time.perf_counter()
+        rec = cast(_ConnectionRecord, await self._do_get_async())
+
+        if self._checkout_needs_driver(rec):
+            fairy = await greenlet_spawn(
+                _ConnectionFairy._checkout, self, None, None, rec, start
+            )
+        else:
+            fairy = _ConnectionFairy._checkout(self, rec=rec, start=start)
+
+        if self._min_size and not self._filler_started:
+            self._start_filler()
+        return fairy
+
+    async def _do_get_async(self) -> ConnectionPoolEntry:
+        while True:
+            try:
+                return self._pool.get_nowait()
+            except sqla_queue.Empty:
+                pass
+
+            if -1 < self._max_overflow <= self._overflow:
+                break
+
+            rec = await greenlet_spawn(self._create_overflow_connection)
+            if rec is not None:
+                return rec
+
+        try:
+            return await self._pool.get_async(self._timeout)
+        except sqla_queue.Empty:
+            pass
+        self._raise_timeout()
+
+    def _checkout_needs_driver(self, rec: _ConnectionRecord) -> bool:
+        """Return True if checking out the given record may need to use
+        the database driver.
+
+        """
+        now = time.time()
+        return (
+            rec._needs_reconnect(now)
+            or bool(self.dispatch.checkout)
+            or (
+                self._pre_ping
+                and not rec.fresh
+                and (
+                    self._pre_ping_interval is None
+                    or now - rec.last_used >= self._pre_ping_interval
+                )
+            )
+        )
+
+    def _start_filler(self) -> None:
+        self._filler_started = True
+        self._warm_up_task = asyncio.get_running_loop().create_task(
+            self.warm_up(self._min_size)
+        )
+
+    async def warm_up(self, size: int) -> None:
+        """Open new connections concurrently until the given number of
+        connections are open, counting those which are checked out.
+
+        The number of connections opened is limited by the
+        ``pool_size`` and ``max_overflow`` of the pool.   Errors
+        establishing connections are logged and otherwise ignored.
+
+        """
+        count = 0
+        while self._overflow + self.size() < size and self._inc_overflow():
+            count += 1
+
+        results = await asyncio.gather(
+            *[greenlet_spawn(self._create_connection) for i in range(count)],
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                self._dec_overflow()
+                self.logger.error(
+                    "Error opening connection to warm up pool",
+                    exc_info=result,
+                )
+            else:
+                result.last_used = time.time()  # type: ignore[attr-defined]
+                self._do_return_conn(result)
+
+    def dispose(self) -> None:
+        if self._warm_up_task is not None:
+            self._warm_up_task.cancel()
+        AsyncAdaptedQueuePool.dispose(self)
+
+
 class NullPool(Pool):
 
     """A Pool which does not pool connections.
@@ -292,6 +1018,8 @@ class NullPool(Pool):
             logging_name=self._orig_logging_name,
             reset_on_return=self._reset_on_return,
             pre_ping=self._pre_ping,
+            pre_ping_interval=self._pre_ping_interval,
+            metrics=self._metrics is not None,
             _dispatch=self.dispatch,
             dialect=self._dialect,
         )
@@ -353,6 +1081,8 @@ class SingletonThreadPool(Pool):
             recycle=self._recycle,
             echo=self.echo,
             pre_ping=self._pre_ping,
+            pre_ping_interval=self._pre_ping_interval,
+            metrics=self._metrics is not None,
             logging_name=self._orig_logging_name,
             reset_on_return=self._reset_on_return,
             _dispatch=self.dispatch,
@@ -453,6 +1183,8 @@ class StaticPool(Pool):
             recycle=self._recycle,
             reset_on_return=self._reset_on_return,
             pre_ping=self._pre_ping,
+            pre_ping_interval=self._pre_ping_interval,
+            metrics=self._metrics is not None,
             echo=self.echo,
             logging_name=self._orig_logging_name,
             _dispatch=self.dispatch,
@@ -525,6 +1257,8 @@ class AssertionPool(Pool):
             self._creator,
             echo=self.echo,
             pre_ping=self._pre_ping,
+            pre_ping_interval=self._pre_ping_interval,
+            metrics=self._metrics is not None,
             recycle=self._recycle,
             reset_on_return=self._reset_on_return,
             logging_name=self._orig_logging_name,
@@ -106,6 +106,9 @@ if typing.TYPE_CHECKING:
     from .type_api import _BindProcessorType
     from ..engine.cursor import CursorResultMetaData
     from ..engine.interfaces import _CoreSingleExecuteParams
+    from ..engine.interfaces import _DBAPIAnyExecuteParams
+    from ..engine.interfaces import _DBAPIMultiExecuteParams
+    from ..engine.interfaces import _DBAPISingleExecuteParams
     from ..engine.interfaces import _ExecuteOptions
     from ..engine.interfaces import _MutableCoreSingleExecuteParams
     from ..engine.interfaces import _SchemaTranslateMapType
@@ -396,6 +399,63 @@ class ExpandedState(NamedTuple):
     parameter_expansion: Mapping[str, List[str]]
 
 
+class _InsertManyValues(NamedTuple):
+    """represents state to use for executing an "insertmanyvalues" statement
+
+    .. versionadded:: 2.0
+
+    """
+
+    single_row_only: bool
+    """if True, the statement can't be rewritten to use a multiple-row
+    VALUES clause, such as for an INSERT that uses DEFAULT VALUES or that
+    renders bound parameters outside of the VALUES clause.  Each parameter
+    set is then invoked as an individual ``cursor.execute()`` call within
+    the same execution, so that RETURNING rows can still be delivered.
+
+    """
+
+    single_values_expr: str
+    """The rendered "values" clause of the INSERT statement.
+
+    This is typically the parenthesized section e.g. "(?, ?, ?)" or similar.
+    The insertmanyvalues logic uses this string as a search and replace
+    target.
+
+    """
+
+    num_params_per_row: int
+    """the number of bound parameters in a single-row statement.
+
+    This count may be larger or smaller than the actual number of columns
+    targeted in the INSERT, as it accommodates for SQL expressions
+    in the values list that may have zero or more parameters embedded
+    within them.   It's used to limit the size of each batch against
+    :attr:`.Dialect.insertmanyvalues_max_parameters`.
+
+    """
+
+
+class _InsertManyValuesBatch(NamedTuple):
+    """represents an individual batch SQL statement for insertmanyvalues.
+
+    This is produced by the
+    :meth:`.SQLCompiler._deliver_insertmanyvalues_batches` method and
+    consumed by the :class:`.Connection` within the
+    :meth:`.Connection._exec_insertmany_context` method.
+
+    .. versionadded:: 2.0
+
+    """
+
+    replaced_statement: str
+    replaced_parameters: _DBAPIAnyExecuteParams
+    batch: Sequence[_DBAPISingleExecuteParams]
+    batch_size: int
+    batchnum: int
+    total_batches: int
+
+
 class Linting(IntEnum):
     NO_LINTING = 0
     "Disable all linting."
@@ -545,6 +605,10 @@ class Compiled:
     """Generation time of this :class:`.Compiled`, used for reporting
     cache stats."""
 
+    _gen_duration: float
+    """Time taken to generate this :class:`.Compiled`, used for reporting
+    cache stats."""
+
     def __init__(
         self,
         dialect: Dialect,
@@ -574,6 +638,8 @@ class Compiled:
 
         """
 
+        gen_start = perf_counter()
+
         self.dialect = dialect
         self.preparer = self.dialect.identifier_preparer
         if schema_translate_map:
@@ -597,6 +663,7 @@ class Compiled:
                     self.string, schema_translate_map
                 )
         self._gen_time = perf_counter()
+        self._gen_duration = self._gen_time - gen_start
 
     def _execute_on_connection(
         self, connection, distilled_params, execution_options
@@ -823,6 +890,16 @@ class SQLCompiler(Compiled):
 
     """
 
+    _insertmanyvalues: Optional[_InsertManyValues] = None
+    """When an INSERT is compiled for executemany style execution against
+    a dialect that supports "insertmanyvalues", this is assigned a structure
+    that's used to rewrite the single-row VALUES clause into batches of
+    many rows, each of which is sent as a single cursor.execute() call.
+
+    .. versionadded:: 2.0
+
+    """
+
     literal_execute_params: FrozenSet[BindParameter[Any]] = frozenset()
     """bindparameter objects that are rendered as literal values at statement
     execution time.
@@ -835,6 +912,19 @@ class SQLCompiler(Compiled):
 
     """
 
+    _post_compile_cache_size = 100
+    """number of rendered statements kept per compiled object by
+    :meth:`.SQLCompiler._process_parameters_for_postcompile`, with the
+    least recently used pruned beyond that.
+
+    """
+
+    _post_compile_cache_max_length = 4000
+    """rendered statements longer than this, typically due to IN
+    expressions with many values, aren't kept in the post compile cache.
+
+    """
+
     escaped_bind_names: util.immutabledict[str, str] = util.EMPTY_DICT
     """Late escaping of bound parameter names that has to be converted
     to the original name when looking in the parameter dictionary.
@@ -1343,6 +1433,7 @@ class SQLCompiler(Compiled):
         self,
         parameters: Optional[_MutableCoreSingleExecuteParams] = None,
         _populate_self: bool = False,
+        _pad_expanding: bool = False,
     ) -> ExpandedState:
         """handle special post compile parameters.
 
@@ -1355,11 +1446,35 @@ class SQLCompiler(Compiled):
           things like SQL Server "TOP N" where the driver does not accommodate
           N as a bound parameter.
 
+        When ``_pad_expanding`` is set, the values of "expanding" parameters
+        are first padded out to the next power of two, see
+        :meth:`.SQLCompiler._pad_expanding_parameters`.
+
+        The rendered statement is cached per compiled object, keyed on the
+        "shape" of the given parameters, i.e. the number of values given
+        to each expanding parameter and the literal strings rendered for
+        literal_execute parameters, so that repeated executions with the
+        same shape don't need to render the statement again.   Statements
+        longer than
+        :attr:`.SQLCompiler._post_compile_cache_max_length` aren't cached.
+
         """
 
         if parameters is None:
             parameters = self.construct_params(escape_names=False)
 
+        shape: Optional[Tuple[Any, ...]] = None
+        if not _populate_self:
+            if _pad_expanding:
+                self._pad_expanding_parameters(parameters)
+
+            shape = self._post_compile_shape(parameters)
+            cached = self._post_compile_cache.get(shape)
+            if cached is not None:
+                return self._expanded_state_from_cache(
+                    cached, shape, parameters
+                )
+
         expanded_parameters = {}
         positiontup: Optional[List[str]]
 
@@ -1392,6 +1507,18 @@ class SQLCompiler(Compiled):
         replacement_expressions: Dict[str, Any] = {}
         to_update_sets: Dict[str, Any] = {}
 
+        if shape is not None:
+            # literal_execute values were already rendered for the shape
+            rendered_literals = {
+                escaped_name: rendered
+                for (_, escaped_name, literal, _), rendered in zip(
+                    self._post_compile_binds, shape
+                )
+                if literal
+            }
+        else:
+            rendered_literals = {}
+
         # notes:
         # *unescaped* parameter names in:
         # self.bind_names, self.binds, self._bind_processors
@@ -1414,12 +1541,16 @@ class SQLCompiler(Compiled):
             if parameter in self.literal_execute_params:
                 if escaped_name not in replacement_expressions:
                     value = parameters.pop(escaped_name)
-
-                replacement_expressions[
-                    escaped_name
-                ] = self.render_literal_bindparam(
-                    parameter, render_literal_value=value
-                )
+                    if escaped_name in rendered_literals:
+                        replacement_expressions[
+                            escaped_name
+                        ] = rendered_literals[escaped_name]
+                    else:
+                        replacement_expressions[
+                            escaped_name
+                        ] = self.render_literal_bindparam(
+                            parameter, render_literal_value=value
+                        )
                 continue
 
             if parameter in self.post_compile_params:
@@ -1505,6 +1636,14 @@ class SQLCompiler(Compiled):
             expanded_parameters,
         )
 
+        if (
+            shape is not None
+            and len(statement) <= self._post_compile_cache_max_length
+        ):
+            self._post_compile_cache[shape] = expanded_state._replace(
+                additional_parameters=util.EMPTY_DICT
+            )
+
         if _populate_self:
             # this is for the "render_postcompile" flag, which is not
             # otherwise used internally and is for end-user debugging and
@@ -1530,6 +1669,129 @@ class SQLCompiler(Compiled):
 
         return expanded_state
 
+    @util.memoized_property
+    def _post_compile_cache(
+        self,
+    ) -> util.LRUCache[Tuple[Any, ...], ExpandedState]:
+        return util.LRUCache(self._post_compile_cache_size)
+
+    @util.memoized_property
+    def _post_compile_binds(
+        self,
+    ) -> List[Tuple[str, str, bool, TypeEngine[Any]]]:
+        """name, escaped name, "literal_execute" flag and dialect type of each
+        post compile parameter.
+
+        """
+        escaped_bind_names = self.escaped_bind_names
+        binds = [
+            (name, self.binds[name])
+            for name in dict.fromkeys(self.bind_names.values())
+        ]
+        return [
+            (
+                name,
+                escaped_bind_names.get(name, name),
+                parameter in self.literal_execute_params,
+                parameter.type._unwrapped_dialect_impl(self.dialect),
+            )
+            for name, parameter in binds
+            if parameter in self.post_compile_params
+            or parameter in self.literal_execute_params
+        ]
+
+    def _pad_expanding_parameters(
+        self, parameters: _MutableCoreSingleExecuteParams
+    ) -> None:
+        """pad the values of "expanding" parameters in the given dictionary
+        out to the next power of two, by repeating the last value.
+
+        Repeating a value already present doesn't change the result of an
+        IN or NOT IN comparison, while limiting the number of distinct
+        statements sent to the database to one per size bucket, which
+        in turn keeps server side statement caches and the
+        :attr:`.SQLCompiler._post_compile_cache` effective.
+
+        """
+        for name, _, literal, _ in self._post_compile_binds:
+            if literal:
+                continue
+
+            values = parameters[name]
+            if not values:
+                continue
+
+            size = len(values)
+            bucket = 1 << (size - 1).bit_length()
+            if bucket > size:
+                values = list(values)
+                values.extend([values[-1]] * (bucket - size))
+                parameters[name] = values
+
+    def _post_compile_shape(
+        self, parameters: _MutableCoreSingleExecuteParams
+    ) -> Tuple[Any, ...]:
+        """return a key that determines the statement rendered for the given
+        post compile parameters.
+
+        The key includes the number of values given to each expanding
+        parameter, as well as the length of each tuple for a tuple IN.
+        literal_execute values are part of the key as the literal string
+        rendered for them, as values which compare as equal, such as ``1``
+        and ``True`` or ``Decimal("1.0")`` and ``Decimal("1.00")``, may
+        render differently.
+
+        """
+        shape: List[Any] = []
+        for name, escaped_name, literal, typ in self._post_compile_binds:
+            if literal:
+                shape.append(
+                    self.render_literal_bindparam(
+                        self.binds[name],
+                        render_literal_value=parameters[escaped_name],
+                    )
+                )
+                continue
+
+            values = parameters[name]
+            if not values:
+                shape.append(0)
+            elif typ._is_tuple_type or (
+                typ._isnull
+                and isinstance(values[0], collections_abc.Sequence)
+                and not isinstance(values[0], (str, bytes))
+            ):
+                shape.append(tuple(len(element) for element in values))
+            else:
+                shape.append(len(values))
+        return tuple(shape)
+
+    def _expanded_state_from_cache(
+        self,
+        cached: ExpandedState,
+        shape: Tuple[Any, ...],
+        parameters: _MutableCoreSingleExecuteParams,
+    ) -> ExpandedState:
+        """apply the given parameters to an :class:`.ExpandedState`
+        rendered by a previous call for parameters of the same shape.
+
+        """
+        for (name, escaped_name, literal, _), size in zip(
+            self._post_compile_binds, shape
+        ):
+            if literal:
+                parameters.pop(escaped_name)
+                continue
+
+            values = parameters.pop(name)
+            if not size:
+                continue
+            if isinstance(size, tuple):
+                values = [value for element in values for value in element]
+            parameters.update(zip(cached.parameter_expansion[name], values))
+
+        return cached._replace(additional_parameters=parameters)
+
     @util.preload_module("sqlalchemy.engine.cursor")
     def _create_result_map(self):
         """utility method used for unit tests only."""
@@ -4387,6 +4649,11 @@ class SQLCompiler(Compiled):
         )
         crud_params_single = crud_params_struct.single_params
 
+        # note the number of distinct bound parameters present once the
+        # VALUES clause has been processed; "insertmanyvalues" can only
+        # rewrite statements where every parameter is part of VALUES
+        num_values_binds = len(self.bind_names)
+
         if (
             not crud_params_single
             and not self.dialect.supports_default_values
@@ -4507,10 +4774,167 @@ class SQLCompiler(Compiled):
                 + text
             )
 
+        if toplevel and self.for_executemany:
+            self._insertmanyvalues = self._get_insertmanyvalues(
+                self.insert_single_values_expr,
+                bool(returning_clause),
+                num_values_binds,
+            )
+
         self.stack.pop(-1)
 
         return text
 
+    def _get_insertmanyvalues(
+        self,
+        single_values_expr: Optional[str],
+        has_returning: bool,
+        num_values_binds: int,
+    ) -> Optional[_InsertManyValues]:
+        """Determine if an INSERT compiled for executemany should be
+        executed using "insertmanyvalues", returning the state to use
+        for the execution if so.
+
+        .. versionadded:: 2.0
+
+        """
+        dialect = self.dialect
+        if not dialect.use_insertmanyvalues or (
+            not has_returning
+            and not dialect.use_insertmanyvalues_wo_returning
+        ):
+            return None
+
+        if (
+            single_values_expr is not None
+            and dialect.supports_multivalues_insert
+            and not self._numeric_binds
+            # parameters rendered outside of the VALUES clause, e.g.
+            # within an ON CONFLICT clause or RETURNING, can't be batched
+            and len(self.bind_names) == num_values_binds
+        ):
+            return _InsertManyValues(
+                False,
+                "(%s)" % single_values_expr,
+                len(self.positiontup)
+                if self.positional
+                else num_values_binds,
+            )
+        elif has_returning and dialect.insert_executemany_returning:
+            # the statement can't be rewritten to INSERT many rows at once,
+            # however we still need to deliver RETURNING for each row, so
+            # invoke it once per parameter set
+            return _InsertManyValues(
+                True, single_values_expr or "", num_values_binds
+            )
+        else:
+            return None
+
+    def _deliver_insertmanyvalues_batches(
+        self,
+        statement: str,
+        parameters: _DBAPIMultiExecuteParams,
+        batch_size: int,
+    ) -> Iterable[_InsertManyValuesBatch]:
+        """Given a rendered single-row INSERT statement and a list of
+        parameter sets, yield a series of statements that each INSERT
+        up to ``batch_size`` rows using a multiple-row VALUES clause.
+
+        .. versionadded:: 2.0
+
+        """
+        imv = self._insertmanyvalues
+        assert imv is not None
+
+        lenparams = len(parameters)
+
+        if imv.single_row_only:
+            head = values_token = tail = ""
+        else:
+            head, values_token, tail = statement.partition(
+                "VALUES %s" % imv.single_values_expr
+            )
+
+        if not values_token:
+            # no multiple-row VALUES clause is possible, or the statement
+            # was altered such that the VALUES clause can't be located;
+            # yield the original statement once for each parameter set
+            for batchnum, param in enumerate(parameters, 1):
+                yield _InsertManyValuesBatch(
+                    statement, param, [param], 1, batchnum, lenparams
+                )
+            return
+
+        total_batches = -(-lenparams // batch_size)
+
+        if self.positional:
+            sequence_format = self.dialect.execute_sequence_format
+            values_expr = imv.single_values_expr
+
+            for batchnum, start in enumerate(
+                range(0, lenparams, batch_size), 1
+            ):
+                batch = parameters[start : start + batch_size]
+                yield _InsertManyValuesBatch(
+                    "%sVALUES %s%s"
+                    % (head, ", ".join([values_expr] * len(batch)), tail),
+                    sequence_format(
+                        list(itertools.chain.from_iterable(batch))
+                    ),
+                    batch,
+                    len(batch),
+                    batchnum,
+                    total_batches,
+                )
+        else:
+            # break the VALUES expression into literal segments and
+            # bound parameter names, so that each row's expression can
+            # be produced with per-row parameter names "<name>__<index>"
+            if self.dialect.paramstyle == "pyformat":
+                tokens = re.split(r"%\(([^)]+)\)s", imv.single_values_expr)
+            else:
+                tokens = BIND_PARAMS.split(imv.single_values_expr)
+
+            keys = set(parameters[0])
+            bindtemplate = self.bindtemplate
+            row_exprs: List[str] = []
+
+            def row_expr(index: int) -> str:
+                return "".join(
+                    (
+                        bindtemplate % {"name": "%s__%d" % (token, index)}
+                        if token in keys
+                        else bindtemplate % {"name": token}
+                    )
+                    if idx % 2
+                    else token
+                    for idx, token in enumerate(tokens)
+                )
+
+            for batchnum, start in enumerate(
+                range(0, lenparams, batch_size), 1
+            ):
+                batch = parameters[start : start + batch_size]
+                while len(row_exprs) < len(batch):
+                    row_exprs.append(row_expr(len(row_exprs)))
+
+                replaced_parameters: Dict[str, Any] = {}
+                for index, param in enumerate(batch):
+                    replaced_parameters.update(
+                        ("%s__%d" % (key, index), value)
+                        for key, value in param.items()
+                    )
+
+                yield _InsertManyValuesBatch(
+                    "%sVALUES %s%s"
+                    % (head, ", ".join(row_exprs[0 : len(batch)]), tail),
+                    replaced_parameters,
+                    batch,
+                    len(batch),
+                    batchnum,
+                    total_batches,
+                )
+
     def update_limit_clause(self, update_stmt):
         """Provide a hook for MySQL to add LIMIT to the UPDATE"""
         return None
@@ -950,7 +950,8 @@ class ValuesBase(UpdateBase):
         4. An INSERT statement invoked with executemany() is supported if the
            backend database driver supports the
            ``insert_executemany_returning`` feature, currently this includes
-           PostgreSQL with psycopg2.  When executemany is used, the
+           all dialects that make use of :ref:`engine_insertmanyvalues`
+           as well as PostgreSQL with psycopg2.  When executemany is used, the
            :attr:`_engine.CursorResult.returned_defaults_rows` and
            :attr:`_engine.CursorResult.inserted_primary_key_rows` accessors
            will return the inserted defaults and primary keys.
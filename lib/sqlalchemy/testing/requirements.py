@@ -1474,6 +1474,18 @@ class SuiteRequirements(Requirements):
 
         return exclusions.only_if(go)
 
+    @property
+    def numpy(self):
+        def go(config):
+            try:
+                import numpy  # noqa: F401
+            except ImportError:
+                return False
+            else:
+                return True
+
+        return exclusions.only_if(go)
+
     @property
     def computed_columns(self):
         "Supports computed columns"
@@ -9,8 +9,8 @@
 """Collection classes and helpers."""
 from __future__ import annotations
 
+import collections
 import collections.abc as collections_abc
-import operator
 import threading
 import types
 import typing
@@ -21,6 +21,7 @@ from typing import Dict
 from typing import FrozenSet
 from typing import Generic
 from typing import Iterable
+from typing import ItemsView
 from typing import Iterator
 from typing import List
 from typing import Mapping
@@ -487,6 +488,11 @@ class LRUCache(typing.MutableMapping[_KT, _VT]):
     """Dictionary with 'squishy' removal of least
     recently used items.
 
+    Items are kept in order of use within an ``OrderedDict``, so that
+    accessing an item as well as pruning the least recently used items are
+    constant time operations per item, rather than requiring the whole
+    collection to be sorted.
+
     Note that either get() or [] should be used here, but
     generally its not safe to do an "in" check first as the dictionary
     can change subsequent to that call.
@@ -498,7 +504,6 @@ class LRUCache(typing.MutableMapping[_KT, _VT]):
         "threshold",
         "size_alert",
         "_data",
-        "_counter",
         "_mutex",
     )
 
@@ -515,13 +520,8 @@ class LRUCache(typing.MutableMapping[_KT, _VT]):
         self.capacity = capacity
         self.threshold = threshold
         self.size_alert = size_alert
-        self._counter = 0
         self._mutex = threading.Lock()
-        self._data: Dict[_KT, Tuple[_KT, _VT, List[int]]] = {}
-
-    def _inc_counter(self):
-        self._counter += 1
-        return self._counter
+        self._data: typing.OrderedDict[_KT, _VT] = collections.OrderedDict()
 
     @overload
     def get(self, key: _KT) -> Optional[_VT]:
@@ -534,17 +534,25 @@ class LRUCache(typing.MutableMapping[_KT, _VT]):
     def get(
         self, key: _KT, default: Optional[Union[_VT, _T]] = None
     ) -> Optional[Union[_VT, _T]]:
-        item = self._data.get(key, default)
-        if item is not default and item is not None:
-            item[2][0] = self._inc_counter()
-            return item[1]
-        else:
+        data = self._data
+        try:
+            value = data[key]
+            data.move_to_end(key)
+        except KeyError:
+            # not present, or removed by another thread in between
             return default
+        else:
+            return value
 
     def __getitem__(self, key: _KT) -> _VT:
-        item = self._data[key]
-        item[2][0] = self._inc_counter()
-        return item[1]
+        data = self._data
+        value = data[key]
+        try:
+            data.move_to_end(key)
+        except KeyError:
+            # removed by another thread; skip
+            pass
+        return value
 
     def __iter__(self) -> Iterator[_KT]:
         return iter(self._data)
@@ -553,10 +561,31 @@ class LRUCache(typing.MutableMapping[_KT, _VT]):
         return len(self._data)
 
     def values(self) -> ValuesView[_VT]:
-        return typing.ValuesView({k: i[1] for k, i in self._data.items()})
+        return typing.ValuesView(self._copy())
+
+    def items(self) -> ItemsView[_KT, _VT]:
+        # iterate a copy, as accessing items via __getitem__ would
+        # otherwise reorder the OrderedDict while it's being iterated
+        return typing.ItemsView(self._copy())
+
+    def _copy(self) -> Dict[_KT, _VT]:
+        # get() and __getitem__ reorder the OrderedDict without the mutex,
+        # so the copy fails if another thread reads from the cache while
+        # it's in progress; retry until a consistent copy is made
+        while True:
+            try:
+                return dict(self._data)
+            except RuntimeError:
+                pass
 
     def __setitem__(self, key: _KT, value: _VT) -> None:
-        self._data[key] = (key, value, [self._inc_counter()])
+        data = self._data
+        data[key] = value
+        try:
+            data.move_to_end(key)
+        except KeyError:
+            # removed by another thread; skip
+            pass
         self._manage_size()
 
     def __delitem__(self, __v: _KT) -> None:
@@ -575,17 +604,13 @@ class LRUCache(typing.MutableMapping[_KT, _VT]):
                 if size_alert:
                     size_alert = False
                     self.size_alert(self)  # type: ignore
-                by_counter = sorted(
-                    self._data.values(),
-                    key=operator.itemgetter(2),
-                    reverse=True,
-                )
-                for item in by_counter[self.capacity :]:
+                popitem = self._data.popitem
+                for _ in range(len(self) - self.capacity):
                     try:
-                        del self._data[item[0]]
+                        popitem(last=False)
                     except KeyError:
-                        # deleted elsewhere; skip
-                        continue
+                        # emptied elsewhere; skip
+                        break
         finally:
             self._mutex.release()
 
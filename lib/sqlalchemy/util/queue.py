@@ -27,6 +27,7 @@ from time import time as _time
 import typing
 from typing import Any
 from typing import Awaitable
+from typing import Callable
 from typing import Deque
 from typing import Generic
 from typing import Optional
@@ -83,6 +84,9 @@ class QueueCommon(Generic[_T]):
     def get(self, block: bool = True, timeout: Optional[float] = None) -> _T:
         raise NotImplementedError()
 
+    def get_where(self, fn: Callable[[_T], bool]) -> Optional[_T]:
+        raise NotImplementedError()
+
 
 class Queue(QueueCommon[_T]):
     queue: Deque[_T]
@@ -213,6 +217,22 @@ class Queue(QueueCommon[_T]):
 
         return self.get(False)
 
+    def get_where(self, fn: Callable[[_T], bool]) -> Optional[_T]:
+        """Remove and return the first item in the queue for which the
+        given function returns True, without blocking.
+
+        Items are tested in the order in which they were put into the
+        queue.  Returns None if no item matches.
+
+        """
+        with self.not_empty:
+            for item in self.queue:
+                if fn(item):
+                    self.queue.remove(item)
+                    self.not_full.notify()
+                    return item
+            return None
+
     def _init(self, maxsize: int) -> None:
         self.maxsize = maxsize
         self.queue = deque()
@@ -318,6 +338,20 @@ class AsyncAdaptedQueue(QueueCommon[_T]):
         except (asyncio.QueueEmpty, asyncio.TimeoutError) as err:
             raise Empty() from err
 
+    async def get_async(self, timeout: Optional[float] = None) -> _T:
+        """Wait for an item to be available and return it, awaiting the
+        underlying asyncio queue directly rather than from within a
+        greenlet.
+
+        """
+        try:
+            if timeout is not None:
+                return await asyncio.wait_for(self._queue.get(), timeout)
+            else:
+                return await self._queue.get()
+        except (asyncio.QueueEmpty, asyncio.TimeoutError) as err:
+            raise Empty() from err
+
 
 class FallbackAsyncAdaptedQueue(AsyncAdaptedQueue[_T]):
     if not typing.TYPE_CHECKING:
@@ -1,3 +1,4 @@
+from sqlalchemy import bindparam
 from sqlalchemy import Column
 from sqlalchemy import Integer
 from sqlalchemy import MetaData
@@ -105,3 +106,43 @@ class CompileTest(fixtures.TestBase, AssertsExecutionResults):
             s.compile(dialect=self.dialect)
 
         go()
+
+    def test_postcompile_expanding(self):
+        s = (
+            select(t1)
+            .where(t1.c.c1.in_(bindparam("ids", expanding=True)))
+            .where(t1.c.c2.in_(bindparam("names", expanding=True)))
+        )
+        compiled = s.compile(dialect=self.dialect)
+        compiled._process_parameters_for_postcompile(
+            {"ids": list(range(20)), "names": ["a", "b", "c"]}
+        )
+
+        @profiling.function_call_count(variance=0.15, warmup=1)
+        def go():
+            for i in range(10):
+                compiled._process_parameters_for_postcompile(
+                    {"ids": list(range(i, i + 20)), "names": ["d", "e", "f"]}
+                )
+
+        go()
+
+    def test_postcompile_literal_execute(self):
+        s = (
+            select(t1)
+            .where(t1.c.c1.in_(bindparam("ids", expanding=True)))
+            .limit(bindparam("limit", type_=Integer, literal_execute=True))
+        )
+        compiled = s.compile(dialect=self.dialect)
+        compiled._process_parameters_for_postcompile(
+            {"ids": list(range(20)), "limit": 10}
+        )
+
+        @profiling.function_call_count(variance=0.15, warmup=1)
+        def go():
+            for i in range(10):
+                compiled._process_parameters_for_postcompile(
+                    {"ids": list(range(i, i + 20)), "limit": 10}
+                )
+
+        go()
@@ -8,6 +8,7 @@ from sqlalchemy import select
 from sqlalchemy import String
 from sqlalchemy import Table
 from sqlalchemy import testing
+from sqlalchemy import util
 from sqlalchemy.orm import join as ormjoin
 from sqlalchemy.orm import relationship
 from sqlalchemy.testing import eq_
@@ -146,3 +147,30 @@ class CacheKeyTest(fixtures.TestBase):
                     current_key = key
 
         go()
+
+
+class LRUCacheTest(fixtures.TestBase):
+    __requires__ = ("cpython", "python_profiling_backend")
+
+    @testing.fixture
+    def cache_fixture(self):
+        cache = util.LRUCache(500)
+        for i in range(750):
+            cache[("warmup", i)] = i
+        return cache
+
+    @profiling.function_call_count(variance=0.10)
+    def test_churn_under_eviction_pressure(self, cache_fixture):
+        # keys cycle through twice the capacity of the cache, so that
+        # lookups miss and the cache is pruned at a steady rate
+        cache = cache_fixture
+        for i in range(5000):
+            key = ("key", i % 1000)
+            if cache.get(key) is None:
+                cache[key] = i
+
+    @profiling.function_call_count(variance=0.10)
+    def test_hits_without_eviction(self, cache_fixture):
+        cache = cache_fixture
+        for i in range(5000):
+            cache.get(("warmup", i % 500))
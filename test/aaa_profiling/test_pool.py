@@ -1,4 +1,7 @@
+import threading
+
 from sqlalchemy import event
+from sqlalchemy.pool import AffinityQueuePool
 from sqlalchemy.pool import QueuePool
 from sqlalchemy.testing import AssertsExecutionResults
 from sqlalchemy.testing import fixtures
@@ -10,6 +13,8 @@ pool = None
 class QueuePoolTest(fixtures.TestBase, AssertsExecutionResults):
     __requires__ = ("cpython", "python_profiling_backend")
 
+    pool_cls = QueuePool
+
     class Connection:
         def rollback(self):
             pass
@@ -22,11 +27,15 @@ class QueuePoolTest(fixtures.TestBase, AssertsExecutionResults):
         # has the effect of initializing
         # class-level event listeners on Pool,
         # if not present already.
-        p1 = QueuePool(creator=self.Connection, pool_size=3, max_overflow=-1)
+        p1 = self.pool_cls(
+            creator=self.Connection, pool_size=3, max_overflow=-1
+        )
         p1.connect()
 
         global pool
-        pool = QueuePool(creator=self.Connection, pool_size=3, max_overflow=-1)
+        pool = self.pool_cls(
+            creator=self.Connection, pool_size=3, max_overflow=-1
+        )
 
         # make this a real world case where we have a "connect" handler
         @event.listens_for(pool, "connect")
@@ -47,3 +56,58 @@ class QueuePoolTest(fixtures.TestBase, AssertsExecutionResults):
             return conn2
 
         go()
+
+
+class AffinityQueuePoolTest(QueuePoolTest):
+    pool_cls = AffinityQueuePool
+
+
+class PoolContentionTest(fixtures.TestBase, AssertsExecutionResults):
+    """Profile checkouts made while other threads are continuously
+    checking out and returning connections from the same pool."""
+
+    __requires__ = ("cpython", "python_profiling_backend")
+
+    __backend__ = False
+
+    num_threads = 4
+
+    class Connection:
+        def rollback(self):
+            pass
+
+        def close(self):
+            pass
+
+    def setup_test(self):
+        global pool
+        pool = AffinityQueuePool(
+            creator=self.Connection,
+            pool_size=self.num_threads * 2,
+            max_overflow=-1,
+        )
+        self._stop = threading.Event()
+
+        def worker():
+            while not self._stop.is_set():
+                pool.connect().close()
+
+        self._threads = [
+            threading.Thread(target=worker) for i in range(self.num_threads)
+        ]
+        for t in self._threads:
+            t.start()
+
+        # acquire this thread's connection before profiling
+        pool.connect().close()
+
+    def teardown_test(self):
+        self._stop.set()
+        for t in self._threads:
+            t.join(10)
+        pool.dispose()
+
+    @profiling.function_call_count()
+    def test_affinity_checkout_contended(self):
+        for i in range(50):
+            pool.connect().close()
@@ -1,3 +1,5 @@
+import array
+
 from sqlalchemy import exc
 from sqlalchemy import testing
 from sqlalchemy.engine import result
@@ -904,6 +906,81 @@ class ResultTest(fixtures.TestBase):
         r2 = frozen().scalars(1).unique()
         eq_(r2.fetchall(), [1, 3])
 
+    def test_partitions_columnar(self):
+        r1 = self._fixture()
+
+        eq_(
+            [
+                [list(col) for col in partition]
+                for partition in r1.partitions_columnar(3)
+            ],
+            [[[1, 2, 1], [1, 1, 3], [1, 2, 2]], [[4], [1], [2]]],
+        )
+        eq_(r1.fetchall(), [])
+
+    def test_partitions_columnar_buffers(self):
+        r1 = self._fixture(
+            data=[(1, 1.5, "x", None), (2, 2.5, "y", 5)],
+        )
+        r1._metadata = result.SimpleResultMetaData(["a", "b", "c", "d"])
+
+        a, b, c, d = next(r1.partitions_columnar())
+        eq_(a, array.array("q", [1, 2]))
+        eq_(b, array.array("d", [1.5, 2.5]))
+        eq_(c, ["x", "y"])
+        eq_(d, [None, 5])
+
+    def test_partitions_columnar_overflow(self):
+        r1 = self._fixture(data=[(1, 1, 2**70)])
+
+        eq_(
+            next(r1.partitions_columnar()),
+            [array.array("q", [1]), array.array("q", [1]), [2**70]],
+        )
+
+    def test_columns_as_arrays(self):
+        r1 = self._fixture(
+            data=[(1, 1, 1), (2, 1.5, "x"), (3, 2.5, "y"), (4, 5, 6)]
+        )
+        r1.yield_per(2)
+
+        a, b, c = r1.columns_as_arrays()
+        eq_(a, array.array("q", [1, 2, 3, 4]))
+        eq_(b, [1, 1.5, 2.5, 5])
+        eq_(c, [1, "x", "y", 6])
+
+    def test_columns_as_arrays_no_rows(self):
+        r1 = self._fixture(num_rows=0)
+
+        eq_(r1.columns_as_arrays(), [[], [], []])
+
+    def test_columns_as_arrays_column_slices(self):
+        r1 = self._fixture().columns("c", "a")
+
+        eq_(
+            r1.columns_as_arrays(),
+            [array.array("q", [1, 2, 2, 2]), array.array("q", [1, 2, 1, 4])],
+        )
+
+    def test_columns_as_arrays_unique(self):
+        r1 = self._fixture().columns("b").unique()
+
+        eq_(r1.columns_as_arrays(), [array.array("q", [1, 3])])
+
+    @testing.requires.numpy
+    def test_columns_as_arrays_numpy(self):
+        r1 = self._fixture(
+            data=[(1, 1.5, (1, 2)), (2, 2.5, (3, 4))],
+        )
+
+        a, b, c = r1.columns_as_arrays(as_numpy=True)
+        eq_(a.dtype.name, "int64")
+        eq_(a.tolist(), [1, 2])
+        eq_(b.dtype.name, "float64")
+        eq_(b.tolist(), [1.5, 2.5])
+        eq_(c.dtype.name, "object")
+        eq_(c.tolist(), [(1, 2), (3, 4)])
+
 
 class MergeResultTest(fixtures.TestBase):
     @testing.fixture
@@ -4,6 +4,7 @@ import copy
 import inspect
 import pickle
 import sys
+import threading
 
 from sqlalchemy import exc
 from sqlalchemy import sql
@@ -1285,6 +1286,99 @@ class LRUTest(fixtures.TestBase):
         assert 25 in lru
         assert lru[25] is i2
 
+    def test_get_updates_recency(self):
+        lru = util.LRUCache(4, threshold=0.5)
+
+        for id_ in range(1, 7):
+            lru[id_] = id_
+
+        # at the threshold of 6; nothing removed yet
+        eq_(list(lru), [1, 2, 3, 4, 5, 6])
+
+        eq_(lru.get(1), 1)
+        eq_(lru.get(10, "default"), "default")
+        eq_(lru[2], 2)
+
+        lru[7] = 7
+
+        # least recently used are removed, down to the capacity
+        eq_(list(lru), [6, 1, 2, 7])
+
+    def test_replace_updates_recency(self):
+        lru = util.LRUCache(2, threshold=0.5)
+
+        lru[1] = 1
+        lru[2] = 2
+        lru[3] = 3
+        lru[1] = "one"
+        lru[4] = 4
+
+        eq_(list(lru), [1, 4])
+        eq_(lru[1], "one")
+
+    def test_items_does_not_reorder(self):
+        lru = util.LRUCache(10)
+        for id_ in range(5):
+            lru[id_] = str(id_)
+
+        eq_(list(lru.items()), [(i, str(i)) for i in range(5)])
+        eq_(list(lru.values()), [str(i) for i in range(5)])
+        eq_(list(lru), list(range(5)))
+
+    def test_items_concurrent_reads(self):
+        class Key:
+            # a Python-level __hash__ allows threads to switch while the
+            # OrderedDict is being copied
+            def __init__(self, id_):
+                self.id = id_
+
+            def __hash__(self):
+                return hash(self.id)
+
+            def __eq__(self, other):
+                return self.id == other.id
+
+        keys = [Key(id_) for id_ in range(100)]
+        lru = util.LRUCache(200)
+        for key in keys:
+            lru[key] = key.id
+
+        stop = threading.Event()
+
+        def reader():
+            while not stop.is_set():
+                for key in keys:
+                    lru.get(key)
+                    lru[key]
+
+        threads = [threading.Thread(target=reader) for i in range(4)]
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for t in threads:
+                t.start()
+            for i in range(300):
+                eq_(len(lru.items()), 100)
+                eq_(sorted(lru.values()), list(range(100)))
+        finally:
+            stop.set()
+            for t in threads:
+                t.join()
+            sys.setswitchinterval(switch_interval)
+
+    def test_size_alert(self):
+        canary = mock.Mock()
+        lru = util.LRUCache(10, threshold=0.5, size_alert=canary)
+
+        for id_ in range(15):
+            lru[id_] = id_
+        eq_(canary.mock_calls, [])
+
+        lru[15] = 15
+        eq_(canary.mock_calls, [mock.call(lru)])
+        eq_(len(lru), 10)
+        eq_(list(lru.values()), list(range(6, 16)))
+
 
 class ImmutableSubclass(str):
     pass
@@ -1,5 +1,6 @@
 # coding: utf-8
 import datetime
+import decimal
 import itertools
 import logging
 import logging.handlers
@@ -29,6 +30,7 @@ from sqlalchemy import Table
 from sqlalchemy import testing
 from sqlalchemy import text
 from sqlalchemy import TypeDecorator
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.dialects.postgresql import base as postgresql
 from sqlalchemy.dialects.postgresql import HSTORE
 from sqlalchemy.dialects.postgresql import insert as pg_insert
@@ -40,9 +42,12 @@ from sqlalchemy.dialects.postgresql.psycopg2 import EXECUTEMANY_PLAIN
 from sqlalchemy.dialects.postgresql.psycopg2 import EXECUTEMANY_VALUES
 from sqlalchemy.engine import cursor as _cursor
 from sqlalchemy.engine import url
+from sqlalchemy.orm import registry
+from sqlalchemy.orm import Session
 from sqlalchemy.sql.selectable import LABEL_STYLE_TABLENAME_PLUS_COL
 from sqlalchemy.testing import config
 from sqlalchemy.testing import engines
+from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_false
@@ -850,6 +855,422 @@ class ExecutemanyFlagOptionsTest(fixtures.TablesTest):
             )
 
 
+class BulkCopyTest(fixtures.TestBase):
+    """test Connection.bulk_copy() and the PostgreSQL dialect hooks using
+    fake DBAPI cursors which record the COPY stream."""
+
+    @testing.fixture
+    def table(self):
+        class Upper(TypeDecorator):
+            impl = String
+            cache_ok = True
+
+            def process_bind_param(self, value, dialect):
+                return value.upper() if value is not None else None
+
+        return Table(
+            "t",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("data", Upper(50)),
+            Column("status", String(10), default="new"),
+            Column("notes", String(50), server_default="none"),
+            schema="s1",
+        )
+
+    @testing.fixture
+    def copy_engine(self):
+        class FakeCopyCursor:
+            rowcount = -1
+
+            def __init__(self):
+                self.copies = []
+
+            def copy_expert(self, sql, file, size=16):
+                chunks = []
+                while True:
+                    chunk = file.read(size)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                data = "".join(chunks)
+                self.copies.append((sql, data))
+                self.rowcount = data.count("\n")
+
+            def close(self):
+                pass
+
+        cursor = FakeCopyCursor()
+
+        dbapi = mock.Mock(
+            paramstyle="pyformat", __version__="2.9.3 (dt dec pq3 ext lo64)"
+        )
+        dbapi.Error = type("Error", (Exception,), {})
+        dbapi.connect.return_value.cursor.return_value = cursor
+
+        with mock.patch.object(
+            psycopg2_dialect.dialect, "on_connect", lambda self: None
+        ):
+            engine = create_engine(
+                "postgresql+psycopg2://", module=dbapi, _initialize=False
+            )
+        return engine, cursor
+
+    def test_copy_statement(self, table):
+        dialect = postgresql.dialect()
+        eq_(
+            dialect._bulk_copy_statement(
+                table, "s1", [table.c.id, table.c.data], False
+            ),
+            "COPY s1.t (id, data) FROM STDIN",
+        )
+        eq_(
+            dialect._bulk_copy_statement(
+                table, "Other Schema", [table.c.id], True
+            ),
+            'COPY "Other Schema".t (id) FROM STDIN (FORMAT BINARY)',
+        )
+
+    def test_psycopg2_text_format(self):
+        copies = []
+
+        class FakeCursor:
+            rowcount = 2
+
+            def copy_expert(self, sql, file):
+                # read in small chunks to exercise buffering
+                chunks = []
+                while True:
+                    chunk = file.read(7)
+                    if not chunk:
+                        break
+                    assert len(chunk) <= 7
+                    chunks.append(chunk)
+                copies.append((sql, "".join(chunks)))
+
+        dialect = psycopg2_dialect.dialect()
+        rowcount = dialect.do_bulk_copy(
+            FakeCursor(),
+            "COPY t FROM STDIN",
+            None,
+            None,
+            [],
+            [
+                (
+                    1,
+                    "tab\there\nnewline\\backslash",
+                    None,
+                    True,
+                    b"\x00\xff",
+                ),
+                (
+                    [1, None, 'q"uote'],
+                    datetime.datetime(2020, 1, 2, 3, 4, 5),
+                    datetime.date(2020, 1, 2),
+                    datetime.timedelta(days=1, seconds=2),
+                    decimal.Decimal("1.50"),
+                ),
+            ],
+            False,
+        )
+        eq_(rowcount, 2)
+        eq_(
+            copies,
+            [
+                (
+                    "COPY t FROM STDIN",
+                    "1\ttab\\there\\nnewline\\\\backslash\t\\N\tt\t"
+                    "\\\\x00ff\n"
+                    '{"1",NULL,"q\\\\"uote"}\t2020-01-02T03:04:05\t'
+                    "2020-01-02\t1 days 2 seconds 0 microseconds\t1.50\n",
+                )
+            ],
+        )
+
+    def test_psycopg2_no_binary(self):
+        dialect = psycopg2_dialect.dialect()
+        with expect_raises_message(
+            exc.ArgumentError,
+            "The psycopg2 dialect supports only the text format",
+        ):
+            dialect.do_bulk_copy(
+                mock.Mock(), "COPY t FROM STDIN", None, None, [], [], True
+            )
+
+    @testing.combinations(True, False, argnames="binary")
+    def test_psycopg(self, binary):
+        class FakeCopy:
+            types = None
+
+            def __init__(self):
+                self.rows = []
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *arg):
+                pass
+
+            def set_types(self, types):
+                self.types = types
+
+            def write_row(self, row):
+                self.rows.append(row)
+
+        copy = FakeCopy()
+        cursor = mock.Mock(rowcount=2)
+        cursor.copy.return_value = copy
+
+        t = Table(
+            "t",
+            MetaData(),
+            Column("a", Integer),
+            Column("b", String(50)),
+            Column("c", Numeric(10, 2)),
+            Column("d", ARRAY(Integer)),
+        )
+
+        dialect = psycopg_dialect.dialect()
+        rowcount = dialect.do_bulk_copy(
+            cursor,
+            "COPY t FROM STDIN",
+            t,
+            None,
+            list(t.c),
+            iter([(1, "x", 1, [1]), (2, "y", 2, [2])]),
+            binary,
+        )
+        eq_(rowcount, 2)
+        eq_(cursor.copy.mock_calls, [mock.call("COPY t FROM STDIN")])
+        eq_(copy.rows, [(1, "x", 1, [1]), (2, "y", 2, [2])])
+        eq_(
+            copy.types,
+            ["integer", "varchar", "numeric", "integer[]"] if binary else None,
+        )
+
+    def test_asyncpg(self, table):
+        from sqlalchemy.dialects.postgresql import asyncpg
+
+        cursor = mock.Mock()
+        cursor.copy_records.return_value = "COPY 2"
+
+        rows = iter([(1, "x"), (2, "y")])
+        dialect = asyncpg.dialect()
+        rowcount = dialect.do_bulk_copy(
+            cursor,
+            "COPY s2.t (id, data) FROM STDIN",
+            table,
+            "s2",
+            [table.c.id, table.c.data],
+            rows,
+            False,
+        )
+        eq_(rowcount, 2)
+        eq_(
+            cursor.copy_records.mock_calls,
+            [mock.call("t", "s2", ["id", "data"], rows)],
+        )
+
+    def test_connection_bulk_copy(self, copy_engine, table):
+        engine, cursor = copy_engine
+
+        canary = mock.Mock()
+        event.listen(engine, "before_cursor_execute", canary.before)
+        event.listen(engine, "after_cursor_execute", canary.after)
+
+        with engine.begin() as conn:
+            rowcount = conn.bulk_copy(
+                table,
+                (
+                    {"id": i, "data": "d%d" % i}
+                    if i % 2
+                    else {"id": i, "data": None, "status": "old"}
+                    for i in range(1, 5)
+                ),
+            )
+            eq_(rowcount, 4)
+
+        eq_(
+            cursor.copies,
+            [
+                (
+                    "COPY s1.t (id, data, status) FROM STDIN",
+                    "1\tD1\tnew\n2\t\\N\told\n3\tD3\tnew\n4\t\\N\told\n",
+                )
+            ],
+        )
+        eq_(
+            [c[0] for c in canary.mock_calls],
+            ["before", "after"],
+        )
+        eq_(canary.before.mock_calls[0][1][2:4], cursor.copies[0][0:1] + ((),))
+
+    def test_connection_bulk_copy_tuples_schema_translate(
+        self, copy_engine, table
+    ):
+        engine, cursor = copy_engine
+
+        with engine.connect().execution_options(
+            schema_translate_map={"s1": "s2"}
+        ) as conn:
+            conn.bulk_copy(
+                table,
+                [(1, "a", "x"), (2, "b", "y")],
+                columns=["id", table.c.data, "status"],
+            )
+
+        eq_(
+            cursor.copies,
+            [
+                (
+                    "COPY s2.t (id, data, status) FROM STDIN",
+                    "1\tA\tx\n2\tB\ty\n",
+                )
+            ],
+        )
+
+    def test_connection_bulk_copy_no_rows(self, copy_engine, table):
+        engine, cursor = copy_engine
+
+        with engine.connect() as conn:
+            eq_(conn.bulk_copy(table, iter([])), 0)
+        eq_(cursor.copies, [])
+
+    def test_connection_bulk_copy_errors(self, copy_engine, table):
+        engine, cursor = copy_engine
+
+        with engine.connect() as conn:
+            with expect_raises_message(
+                exc.ArgumentError, "Unconsumed column names: foo"
+            ):
+                conn.bulk_copy(table, [{"id": 1, "foo": 2}])
+
+            with expect_raises_message(
+                exc.ArgumentError,
+                "The columns parameter is required when rows are not "
+                "dictionaries",
+            ):
+                conn.bulk_copy(table, [(1, "x")])
+
+            with expect_raises_message(
+                exc.InvalidRequestError,
+                "Column t.status has a client-side default, which can't be "
+                "applied by bulk_copy\\(\\) unless the column is loaded",
+            ):
+                conn.bulk_copy(table, [(1, "x")], columns=["id", "data"])
+
+        for row in [(2, "b"), (2, "b", "y", "z")]:
+            with engine.connect() as conn:
+                with expect_raises_message(
+                    exc.ArgumentError,
+                    r"Row \(2, 'b'.*\) has %d values; bulk_copy\(\) expects 3 "
+                    r"values per row, for columns id, data, status" % len(row),
+                ):
+                    conn.bulk_copy(
+                        table,
+                        [(1, "a", "x"), row],
+                        columns=["id", "data", "status"],
+                    )
+        eq_(cursor.copies, [])
+
+    def test_not_supported(self, table):
+        e = create_engine("sqlite://")
+        with e.connect() as conn:
+            with expect_raises_message(
+                exc.InvalidRequestError,
+                r"The sqlite\+pysqlite dialect does not support bulk_copy\(\)",
+            ):
+                conn.bulk_copy(table, [{"id": 1}])
+
+    def test_orm_bulk_insert_mappings(self, copy_engine, table):
+        engine, cursor = copy_engine
+
+        class A:
+            pass
+
+        registry().map_imperatively(A, table)
+
+        with Session(engine) as sess:
+            sess.bulk_insert_mappings(
+                A,
+                [
+                    {"id": 1, "data": "d1"},
+                    {"id": 2, "data": None},
+                    {"id": 3, "data": "d3", "status": "old"},
+                ],
+                use_copy=True,
+            )
+            sess.commit()
+
+        eq_(
+            cursor.copies,
+            [
+                (
+                    "COPY s1.t (id, data, status) FROM STDIN",
+                    "1\tD1\tnew\n2\t\\N\tnew\n3\tD3\told\n",
+                )
+            ],
+        )
+
+        with Session(engine) as sess:
+            with expect_raises_message(
+                exc.ArgumentError,
+                "The use_copy and return_defaults parameters of "
+                "bulk_insert_mappings\\(\\) can't be used together",
+            ):
+                sess.bulk_insert_mappings(
+                    A, [{"id": 1}], use_copy=True, return_defaults=True
+                )
+
+
+class BulkCopyBackendTest(fixtures.TablesTest):
+    __only_on__ = (
+        "postgresql+psycopg2",
+        "postgresql+psycopg",
+        "postgresql+asyncpg",
+    )
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "copy_data",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(50)),
+            Column("num", Numeric(10, 2)),
+            Column("ts", DateTime),
+            Column("ints", ARRAY(Integer)),
+        )
+
+    @testing.combinations(
+        (False,),
+        (True, testing.skip_if("postgresql+psycopg2")),
+        argnames="binary",
+    )
+    def test_roundtrip(self, connection, binary):
+        t = self.tables.copy_data
+
+        rows = [
+            {
+                "id": i,
+                "data": None if i % 3 == 0 else "data\t%d\\\n" % i,
+                "num": decimal.Decimal("%d.25" % i),
+                "ts": datetime.datetime(2020, 1, 1, 0, 0, i),
+                "ints": [i, None, i + 1],
+            }
+            for i in range(1, 50)
+        ]
+        eq_(connection.bulk_copy(t, iter(rows), binary=binary), 49)
+        eq_(
+            [
+                row._asdict()
+                for row in connection.execute(t.select().order_by(t.c.id))
+            ],
+            rows,
+        )
+
+
 class MiscBackendTest(
     fixtures.TestBase, AssertsExecutionResults, AssertsCompiledSQL
 ):
@@ -40,6 +40,7 @@ from sqlalchemy.pool import NullPool
 from sqlalchemy.pool import QueuePool
 from sqlalchemy.sql import column
 from sqlalchemy.sql import literal
+from sqlalchemy.sql.elements import ColumnClause
 from sqlalchemy.sql.elements import literal_column
 from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
@@ -1203,6 +1204,124 @@ class CompiledCacheTest(fixtures.TestBase):
         eq_(conn.scalar(stmt), 1)
 
 
+class CompiledCacheStatsTest(fixtures.TestBase):
+    @testing.fixture
+    def stats_engine(self):
+        def go(**kw):
+            return engines.testing_engine(
+                options=dict(query_cache_stats=True, **kw)
+            )
+
+        return go
+
+    def test_not_enabled(self):
+        eng = engines.testing_engine()
+        with expect_raises_message(
+            tsa.exc.InvalidRequestError,
+            "Compiled cache statistics are not enabled for this Engine",
+        ):
+            eng.compiled_cache_stats()
+
+    def test_hits_misses(self, stats_engine):
+        eng = stats_engine()
+
+        with eng.connect() as conn:
+            for i in range(3):
+                conn.scalar(select(literal(i)))
+                conn.scalar(select(literal(i), literal(i)))
+
+        stats = eng.compiled_cache_stats()
+        eq_(stats.hits, 4)
+        eq_(stats.misses, 2)
+        eq_(stats.no_cache_key, 0)
+        eq_(stats.evictions, 0)
+        eq_(stats.size, 2)
+        eq_(stats.capacity, 500)
+        is_true(stats.cache_key_time > 0)
+        is_true(stats.compile_time > 0)
+
+        eq_(
+            sorted(sql for sql, compile_time in stats.slowest_statements),
+            ["SELECT ? AS anon_1", "SELECT ? AS anon_1, ? AS anon_2"],
+        )
+        eq_(len(eng.compiled_cache_stats(top=1).slowest_statements), 1)
+
+    def test_caching_disabled(self, stats_engine):
+        eng = stats_engine()
+
+        with eng.connect() as conn:
+            conn = conn.execution_options(compiled_cache=None)
+            conn.scalar(select(literal(1)))
+            conn.scalar(select(literal(1)))
+
+        stats = eng.compiled_cache_stats()
+        eq_(stats.hits, 0)
+        eq_(stats.misses, 0)
+        eq_(stats.caching_disabled, 2)
+        eq_(stats.size, 0)
+
+    def test_uncacheable(self, stats_engine):
+        class NoCacheColumn(ColumnClause):
+            inherit_cache = False
+
+        eng = stats_engine()
+
+        stmt = select(literal(1)).where(
+            NoCacheColumn("1", is_literal=True) == 1
+        )
+
+        with eng.connect() as conn:
+            for i in range(3):
+                conn.scalar(stmt)
+
+        stats = eng.compiled_cache_stats()
+        eq_(stats.no_cache_key, 3)
+        eq_(stats.size, 0)
+        eq_(
+            stats.uncacheable_statements,
+            [("SELECT ? AS anon_1 \nWHERE 1 = ?", 3)],
+        )
+
+    def test_evictions(self, stats_engine):
+        eng = stats_engine(query_cache_size=2)
+
+        with eng.connect() as conn:
+            for i in range(1, 5):
+                conn.scalar(select(*[literal(j) for j in range(i)]))
+
+        stats = eng.compiled_cache_stats()
+        eq_(stats.misses, 4)
+        eq_(stats.evictions, 2)
+        eq_(stats.size, 2)
+
+    def test_reset(self, stats_engine):
+        eng = stats_engine()
+
+        with eng.connect() as conn:
+            conn.scalar(select(literal(1)))
+            conn.scalar(select(literal(1)))
+
+        stats = eng.compiled_cache_stats(reset=True)
+        eq_((stats.hits, stats.misses), (1, 1))
+
+        stats = eng.compiled_cache_stats()
+        eq_((stats.hits, stats.misses), (0, 0))
+        eq_(stats.cache_key_time, 0)
+
+        # the cache itself is not cleared
+        eq_(stats.size, 1)
+
+    def test_option_engine(self, stats_engine):
+        eng = stats_engine()
+        opt_eng = eng.execution_options(foo="bar")
+
+        with opt_eng.connect() as conn:
+            conn.scalar(select(literal(1)))
+
+        eq_(eng.compiled_cache_stats().misses, 1)
+        eq_(opt_eng.compiled_cache_stats().misses, 1)
+
+
 class MockStrategyTest(fixtures.TestBase):
     def _engine_fixture(self):
         buf = StringIO()
@@ -4048,3 +4167,215 @@ class DialectDoesntSupportCachingTest(fixtures.TestBase):
                 (2,),
             ],
         )
+
+
+class PipelineTest(fixtures.TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "pipeline_data",
+            metadata,
+            Column("id", Integer, primary_key=True, autoincrement=False),
+            Column("x", Integer),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(
+            cls.tables.pipeline_data.insert(),
+            [{"id": i, "x": i} for i in range(1, 5)],
+        )
+
+    @testing.fixture
+    def pipeline_connection(self, connection):
+        """a connection whose dialect makes use of a mock pipeline, which
+        records when it's entered, synchronized and exited.
+
+        """
+        canary = Mock()
+
+        class MockPipeline:
+            def __enter__(self):
+                canary.enter()
+                return self
+
+            def __exit__(self, type_, value, traceback):
+                canary.exit(type_)
+
+            def sync(self):
+                canary.sync()
+
+        with patch.object(
+            connection.dialect, "supports_pipeline", True
+        ), patch.object(
+            connection.dialect,
+            "do_pipeline",
+            lambda dbapi_connection: MockPipeline(),
+        ):
+            yield connection, canary
+
+    def test_no_pipeline_support(self, connection):
+        pipeline_data = self.tables.pipeline_data
+
+        with patch.object(connection.dialect, "supports_pipeline", False):
+            with connection.pipeline():
+                is_(connection._pipeline, None)
+                result = connection.execute(
+                    pipeline_data.update()
+                    .where(pipeline_data.c.id == 1)
+                    .values(x=10)
+                )
+                is_false(result.context._pipeline_pending)
+                eq_(result.rowcount, 1)
+
+    def test_dml_rowcount_delivered_on_exit(self, pipeline_connection):
+        conn, canary = pipeline_connection
+        pipeline_data = self.tables.pipeline_data
+
+        with conn.pipeline():
+            r1 = conn.execute(
+                pipeline_data.update()
+                .where(pipeline_data.c.id < 3)
+                .values(x=10)
+            )
+            r2 = conn.execute(
+                pipeline_data.delete().where(pipeline_data.c.id == 4)
+            )
+            r3 = conn.execute(
+                pipeline_data.update()
+                .where(pipeline_data.c.id == bindparam("pid"))
+                .values(x=bindparam("px")),
+                [{"pid": 1, "px": 11}, {"pid": 3, "px": 12}],
+            )
+
+            is_true(r1.context._pipeline_pending)
+            is_true(r2.context._pipeline_pending)
+            is_true(r3.context._pipeline_pending)
+            is_not(r1.cursor, None)
+            eq_(canary.mock_calls, [call.enter()])
+
+        eq_(canary.mock_calls, [call.enter(), call.exit(None)])
+        is_(conn._pipeline, None)
+
+        for r in (r1, r2, r3):
+            is_false(r.context._pipeline_pending)
+            is_(r.cursor, None)
+
+        eq_(r1.rowcount, 2)
+        eq_(r2.rowcount, 1)
+        if conn.dialect.supports_sane_multi_rowcount:
+            eq_(r3.rowcount, 2)
+
+        eq_(
+            conn.execute(
+                select(pipeline_data.c.x).order_by(pipeline_data.c.id)
+            ).all(),
+            [(11,), (10,), (12,)],
+        )
+
+    def test_rowcount_syncs_pipeline(self, pipeline_connection):
+        conn, canary = pipeline_connection
+        pipeline_data = self.tables.pipeline_data
+
+        with conn.pipeline():
+            r1 = conn.execute(
+                pipeline_data.update()
+                .where(pipeline_data.c.id == 1)
+                .values(x=10)
+            )
+            r2 = conn.execute(
+                pipeline_data.update()
+                .where(pipeline_data.c.id == 2)
+                .values(x=10)
+            )
+            eq_(r1.rowcount, 1)
+            is_false(r2.context._pipeline_pending)
+            eq_(canary.mock_calls, [call.enter(), call.sync()])
+
+            r3 = conn.execute(
+                pipeline_data.update()
+                .where(pipeline_data.c.id == 3)
+                .values(x=10)
+            )
+            is_true(r3.context._pipeline_pending)
+
+        eq_(r2.rowcount, 1)
+        eq_(r3.rowcount, 1)
+        eq_(
+            canary.mock_calls,
+            [call.enter(), call.sync(), call.exit(None)],
+        )
+
+    def test_rows_sync_pipeline(self, pipeline_connection):
+        conn, canary = pipeline_connection
+        pipeline_data = self.tables.pipeline_data
+
+        with conn.pipeline():
+            r1 = conn.execute(
+                pipeline_data.update()
+                .where(pipeline_data.c.id == 1)
+                .values(x=10)
+            )
+            eq_(
+                conn.scalar(
+                    select(pipeline_data.c.x).where(
+                        pipeline_data.c.id == 1
+                    )
+                ),
+                10,
+            )
+            is_false(r1.context._pipeline_pending)
+            eq_(canary.mock_calls, [call.enter(), call.sync()])
+
+        eq_(r1.rowcount, 1)
+
+    def test_nested(self, pipeline_connection):
+        conn, canary = pipeline_connection
+        pipeline_data = self.tables.pipeline_data
+
+        with conn.pipeline():
+            with conn.pipeline():
+                r1 = conn.execute(
+                    pipeline_data.delete().where(pipeline_data.c.id == 1)
+                )
+            is_true(r1.context._pipeline_pending)
+
+        eq_(r1.rowcount, 1)
+        eq_(canary.mock_calls, [call.enter(), call.exit(None)])
+
+    def test_error_on_exit(self, pipeline_connection):
+        conn, canary = pipeline_connection
+        pipeline_data = self.tables.pipeline_data
+        canary.exit.side_effect = conn.dialect.loaded_dbapi.OperationalError(
+            "pipeline aborted"
+        )
+
+        with expect_raises_message(
+            tsa.exc.OperationalError, "pipeline aborted"
+        ):
+            with conn.pipeline():
+                r1 = conn.execute(
+                    pipeline_data.delete().where(pipeline_data.c.id == 1)
+                )
+
+        is_(conn._pipeline, None)
+        is_false(r1.context._pipeline_pending)
+        is_(r1.cursor, None)
+
+    def test_error_in_block(self, pipeline_connection):
+        conn, canary = pipeline_connection
+        pipeline_data = self.tables.pipeline_data
+
+        with expect_raises_message(SomeException, "user error"):
+            with conn.pipeline():
+                r1 = conn.execute(
+                    pipeline_data.delete().where(pipeline_data.c.id == 1)
+                )
+                raise SomeException("user error")
+
+        eq_(canary.mock_calls, [call.enter(), call.exit(SomeException)])
+        is_(conn._pipeline, None)
+        is_false(r1.context._pipeline_pending)
+        is_(r1.cursor, None)
@@ -751,10 +751,27 @@ class CreateEngineTest(fixtures.TestBase):
             "postgresql+psycopg2://",
             max_overflow=8,
             pool_timeout=60,
+            pool_min_size=2,
+            pool_metrics=True,
             poolclass=tsa.pool.QueuePool,
             module=mock_dbapi,
             _initialize=False,
         )
+        eq_(e.pool._min_size, 2)
+        assert e.pool.get_metrics() is not None
+
+        e = create_engine(
+            "postgresql+psycopg2://",
+            pool_size=20,
+            pool_idle_timeout=120,
+            pool_wait_threshold=0.5,
+            poolclass=tsa.pool.AdaptiveQueuePool,
+            module=mock_dbapi,
+            _initialize=False,
+        )
+        eq_(e.pool.size(), 20)
+        eq_(e.pool._idle_timeout, 120)
+        eq_(e.pool._wait_threshold, 0.5)
 
         # but not SingletonThreadPool
 
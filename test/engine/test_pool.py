@@ -16,8 +16,10 @@ from sqlalchemy import testing
 from sqlalchemy.engine import default
 from sqlalchemy.pool.base import _AsyncConnDialect
 from sqlalchemy.pool.base import _ConnDialect
+from sqlalchemy.pool.base import _Histogram
 from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_context_ok
+from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import assert_warns_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_raises
@@ -281,6 +283,7 @@ class PoolTest(PoolTestBase):
         (pool.QueuePool, False),
         (pool.AsyncAdaptedQueuePool, True),
         (pool.FallbackAsyncAdaptedQueuePool, True),
+        (pool.AsyncQueuePool, True),
         (pool.NullPool, None),
         (pool.SingletonThreadPool, False),
         (pool.StaticPool, None),
@@ -302,6 +305,7 @@ class PoolTest(PoolTestBase):
         (pool.QueuePool, False),
         (pool.AsyncAdaptedQueuePool, True),
         (pool.FallbackAsyncAdaptedQueuePool, True),
+        (pool.AsyncQueuePool, True),
         (pool.NullPool, False),
         (pool.SingletonThreadPool, False),
         (pool.StaticPool, False),
@@ -463,14 +467,18 @@ class PoolEventsTest(PoolTestBase):
 
         return p, canary
 
-    def _reset_event_fixture(self):
-        p = self._queuepool_fixture()
+    def _reset_event_fixture(self, **kw):
+        p = self._queuepool_fixture(**kw)
         canary = []
 
         def reset(*arg, **kw):
             canary.append("reset")
 
+        def reset_skipped(*arg, **kw):
+            canary.append("reset_skipped")
+
         event.listen(p, "reset", reset)
+        event.listen(p, "reset_skipped", reset_skipped)
 
         return p, canary
 
@@ -671,6 +679,31 @@ class PoolEventsTest(PoolTestBase):
         c1.close()
         eq_(canary, ["reset"])
 
+    def test_reset_skipped_event(self):
+        p, canary = self._reset_event_fixture()
+
+        c1 = p.connect()
+        dbapi_con = c1.dbapi_connection
+        c1._close_no_reset()
+        eq_(canary, ["reset_skipped"])
+        eq_(dbapi_con.rollback.call_count, 0)
+
+        c1 = p.connect()
+        c1.close()
+        eq_(canary, ["reset_skipped", "reset"])
+        eq_(dbapi_con.rollback.call_count, 1)
+
+    def test_reset_skipped_event_no_reset_on_return(self):
+        p, canary = self._reset_event_fixture(reset_on_return=None)
+
+        c1 = p.connect()
+        dbapi_con = c1.dbapi_connection
+        c1._close_no_reset()
+
+        # no reset would have taken place, so none was skipped
+        eq_(canary, [])
+        eq_(dbapi_con.rollback.call_count, 0)
+
     def test_soft_invalidate_event_no_exception(self):
         p, canary = self._soft_invalidate_event_fixture()
 
@@ -1879,6 +1912,694 @@ class QueuePoolTest(PoolTestBase):
         pc3.close()
         pc1.close()
 
+    def _min_size_fixture(self, **kw):
+        dbapi, p = self._queuepool_dbapi_fixture(**kw)
+
+        # the filler runs upon first checkout, then not again
+        # for the duration of the test
+        p._filler_interval = 1000
+        return dbapi, p
+
+    def _wait_for(self, fn):
+        for i in range(100):
+            if fn():
+                return
+            time.sleep(0.05)
+        assert False, "condition not reached"
+
+    def test_min_size_fills_on_first_checkout(self):
+        dbapi, p = self._min_size_fixture(
+            pool_size=5, max_overflow=0, min_size=3
+        )
+
+        # no connections until the pool is used
+        eq_(dbapi.connect.call_count, 0)
+
+        c1 = p.connect()
+        self._wait_for(lambda: p.checkedin() == 2)
+        eq_(dbapi.connect.call_count, 3)
+        eq_(p.checkedout(), 1)
+
+        # checkouts use the pre-established connections
+        c2 = p.connect()
+        c3 = p.connect()
+        eq_(dbapi.connect.call_count, 3)
+
+        for c in (c1, c2, c3):
+            c.close()
+
+        p.dispose()
+        is_true(p._background_stop.is_set())
+
+    def test_min_size_refills(self):
+        dbapi, p = self._min_size_fixture(
+            pool_size=5, max_overflow=0, min_size=3
+        )
+        p.connect().close()
+        self._wait_for(lambda: p.checkedin() == 3)
+
+        # discarded connections are replaced
+        p._pool.get(False).close()
+        p._dec_overflow()
+        eq_(p.checkedin(), 2)
+
+        p._fill_to_min_size()
+        eq_(p.checkedin(), 3)
+        eq_(dbapi.connect.call_count, 4)
+
+        p.dispose()
+
+    def test_min_size_reconnects_invalidated(self):
+        dbapi, p = self._min_size_fixture(
+            pool_size=5, max_overflow=0, min_size=2
+        )
+
+        c1 = p.connect()
+        rec = c1._connection_record
+        c1.invalidate()
+        self._wait_for(lambda: p.checkedin() == 2)
+        is_none(rec.dbapi_connection)
+
+        p._fill_to_min_size()
+        is_not_none(rec.dbapi_connection)
+        eq_(dbapi.connect.call_count, 3)
+        eq_(p.checkedin(), 2)
+
+        # checkout doesn't need to connect
+        c1, c2 = p.connect(), p.connect()
+        eq_(dbapi.connect.call_count, 3)
+        c1.close()
+        c2.close()
+
+        p.dispose()
+
+    def test_min_size_recycle_shorter_than_interval(self):
+        dbapi, p = self._min_size_fixture(
+            pool_size=2, max_overflow=0, min_size=2, recycle=0.5
+        )
+
+        p.connect().close()
+        self._wait_for(lambda: p.checkedin() == 2)
+        eq_(dbapi.connect.call_count, 2)
+
+        # a reconnected connection would again be recycled before the
+        # next run; guard against reconnecting it over and over
+        connect = dbapi.connect.side_effect
+
+        def limited_connect(*arg, **kw):
+            if dbapi.connect.call_count > 10:
+                raise Exception("too many connections")
+            return connect(*arg, **kw)
+
+        dbapi.connect.side_effect = limited_connect
+
+        p._fill_to_min_size()
+
+        # each connection is reconnected once
+        eq_(dbapi.connect.call_count, 4)
+        eq_(p.checkedin(), 2)
+
+        p.dispose()
+
+    def test_min_size_reconnects_ahead_of_recycle(self):
+        dbapi, p = self._min_size_fixture(
+            pool_size=5, max_overflow=0, min_size=2, recycle=3600
+        )
+
+        p.connect().close()
+        self._wait_for(lambda: p.checkedin() == 2)
+
+        recs = list(p._pool.queue)
+        old_conns = [rec.dbapi_connection for rec in recs]
+
+        # one connection would be recycled before the next run
+        recs[0].starttime -= 3600 - p._filler_interval / 2
+        p._fill_to_min_size()
+
+        is_not(recs[0].dbapi_connection, old_conns[0])
+        is_(recs[1].dbapi_connection, old_conns[1])
+        eq_(old_conns[0].close.call_count, 1)
+        eq_(dbapi.connect.call_count, 3)
+
+        p.dispose()
+
+    def test_min_size_connect_error(self):
+        dbapi, p = self._min_size_fixture(
+            pool_size=5, max_overflow=0, min_size=3
+        )
+        p.connect().close()
+        self._wait_for(lambda: p.checkedin() == 3)
+
+        rec = p._pool.queue[0]
+        rec.invalidate()
+        p._pool.get(False).close()
+        p._dec_overflow()
+        dbapi.shutdown(True)
+
+        # errors are logged and the pool is left as is
+        p._fill_to_min_size()
+        eq_(p.checkedin(), 2)
+        eq_(p.overflow(), -3)
+
+        dbapi.shutdown(False)
+        p._fill_to_min_size()
+        eq_(p.checkedin(), 3)
+
+        p.dispose()
+
+    def test_min_size_exceeds_pool_size(self):
+        assert_raises_message(
+            tsa.exc.ArgumentError,
+            "min_size of 6 may not exceed pool_size of 5",
+            pool.QueuePool,
+            creator=Mock(),
+            pool_size=5,
+            min_size=6,
+        )
+
+    def test_min_size_not_for_asyncio(self):
+        assert_raises_message(
+            tsa.exc.ArgumentError,
+            "The min_size parameter is not supported",
+            pool.AsyncAdaptedQueuePool,
+            creator=Mock(),
+            min_size=2,
+        )
+
+    def test_min_size_recreate(self):
+        p = pool.QueuePool(creator=Mock(), pool_size=5, min_size=2)
+        eq_(p.recreate()._min_size, 2)
+
+    def test_min_size_async_queue_pool(self):
+        p = pool.AsyncQueuePool(creator=Mock(), pool_size=5, min_size=2)
+        eq_(p._min_size, 2)
+        eq_(p.recreate()._min_size, 2)
+
+        assert_raises_message(
+            tsa.exc.ArgumentError,
+            "min_size of 6 may not exceed pool_size of 5",
+            pool.AsyncQueuePool,
+            creator=Mock(),
+            pool_size=5,
+            min_size=6,
+        )
+
+
+class AffinityQueuePoolTest(PoolTestBase):
+    def _fixture(self, **kw):
+        dbapi = MockDBAPI()
+        p = pool.AffinityQueuePool(
+            creator=lambda: dbapi.connect("foo.db"), **kw
+        )
+        return dbapi, p
+
+    def _run_in_thread(self, fn):
+        result = []
+        t = threading.Thread(target=lambda: result.append(fn()))
+        t.start()
+        t.join(10)
+        return result[0]
+
+    def test_reacquire_parked(self):
+        dbapi, p = self._fixture(pool_size=3, max_overflow=0)
+
+        c1 = p.connect()
+        rec = c1._connection_record
+        c1.close()
+
+        eq_(p._pool.qsize(), 0)
+        eq_(p.checkedin(), 1)
+        eq_(p.checkedout(), 0)
+
+        with patch.object(p._pool, "get") as get:
+            c1 = p.connect()
+            eq_(get.mock_calls, [])
+        is_(c1._connection_record, rec)
+        eq_(p.checkedout(), 1)
+        c1.close()
+        eq_(dbapi.connect.call_count, 1)
+
+    def test_slot_taken_uses_queue(self):
+        dbapi, p = self._fixture(pool_size=3, max_overflow=0)
+
+        c1, c2 = p.connect(), p.connect()
+        rec1, rec2 = c1._connection_record, c2._connection_record
+        c1.close()
+        c2.close()
+
+        eq_(list(p._parked.values()), [rec1])
+        eq_(list(p._pool.queue), [rec2])
+        eq_(p.checkedin(), 2)
+
+        # parked connection is used first, then the shared queue
+        c1, c2 = p.connect(), p.connect()
+        is_(c1._connection_record, rec1)
+        is_(c2._connection_record, rec2)
+        c1.close()
+        c2.close()
+
+    def test_take_from_other_thread(self):
+        dbapi, p = self._fixture(pool_size=3, max_overflow=0)
+
+        rec = self._run_in_thread(
+            lambda: self._with_teardown(p.connect())._connection_record
+        )
+        lazy_gc()
+        eq_(list(p._parked.values()), [rec])
+
+        c1 = p.connect()
+        is_(c1._connection_record, rec)
+        eq_(dbapi.connect.call_count, 1)
+        c1.close()
+
+    def test_overflow_not_parked(self):
+        dbapi, p = self._fixture(pool_size=1, max_overflow=2)
+
+        c1 = p.connect()
+        c2 = self._run_in_thread(p.connect)
+        dbapi_conn = c2.dbapi_connection
+        eq_(p.overflow(), 1)
+
+        c1.close()
+        eq_(len(p._parked), 0)
+        eq_(p.checkedin(), 1)
+
+        # overflow connection goes to the shared queue, which closes it
+        # as it's full
+        c2.close()
+        eq_(len(p._parked), 0)
+        eq_(p.checkedin(), 1)
+        eq_(p.overflow(), 0)
+        eq_(dbapi_conn.close.call_count, 1)
+
+    def test_waiter_receives_connection(self):
+        dbapi, p = self._fixture(pool_size=1, max_overflow=0, timeout=5)
+
+        c1 = p.connect()
+        rec = c1._connection_record
+
+        def go():
+            c2 = p.connect()
+            return c2._connection_record
+
+        t = threading.Thread(target=lambda: result.append(go()))
+        result = []
+        t.start()
+        time.sleep(0.1)
+
+        # pool is at its limit, so the connection isn't parked
+        c1.close()
+        t.join(5)
+        is_(result[0], rec)
+        eq_(dbapi.connect.call_count, 1)
+
+    def test_waiter_takes_parked(self):
+        dbapi, p = self._fixture(pool_size=1, max_overflow=0, timeout=5)
+
+        c1 = p.connect()
+        rec = c1._connection_record
+        c1.close()
+
+        # simulate the connection being parked by another thread after
+        # the checkout has started waiting
+        is_(p._pool.get(False), rec)
+        with patch.object(p, "_take_parked", side_effect=[None, rec]):
+            is_(self._run_in_thread(p._do_get), rec)
+
+    def test_timeout(self):
+        dbapi, p = self._fixture(pool_size=1, max_overflow=0, timeout=0.2)
+
+        c1 = p.connect()
+        now = time.time()
+        assert_raises(tsa.exc.TimeoutError, p.connect)
+        assert time.time() - now >= 0.2
+        c1.close()
+
+    def test_dispose(self):
+        dbapi, p = self._fixture(pool_size=3, max_overflow=0)
+
+        c1, c2 = p.connect(), p.connect()
+        dbapi_conns = [c1.dbapi_connection, c2.dbapi_connection]
+        c1.close()
+        c2.close()
+
+        p.dispose()
+        eq_(p.checkedin(), 0)
+        eq_([conn.close.call_count for conn in dbapi_conns], [1, 1])
+
+    def test_idle_ping_parked(self):
+        dbapi, p = self._fixture(
+            pool_size=3, max_overflow=0, idle_ping_interval=30
+        )
+        p._dialect = default.DefaultDialect()
+
+        c1, c2 = p.connect(), p.connect()
+        rec1, rec2 = c1._connection_record, c2._connection_record
+        dbapi_c1, dbapi_c2 = c1.dbapi_connection, c2.dbapi_connection
+        c1.close()
+        c2.close()
+        eq_(list(p._parked.values()), [rec1])
+        eq_(list(p._pool.queue), [rec2])
+
+        rec1.last_used -= 60
+        rec2.last_used -= 60
+        p._ping_idle_connections()
+
+        # both the parked connection and the one in the shared queue
+        # are pinged, and returned to where they were
+        for dbapi_conn in (dbapi_c1, dbapi_c2):
+            is_true(dbapi_conn.cursor.called)
+            is_true(not dbapi_conn.close.called)
+        eq_(list(p._parked.values()), [rec1])
+        eq_(list(p._pool.queue), [rec2])
+
+        p.dispose()
+
+    def test_fill_reconnects_parked(self):
+        dbapi, p = self._fixture(pool_size=3, max_overflow=0)
+
+        c1 = p.connect()
+        rec = c1._connection_record
+        c1.invalidate()
+        eq_(list(p._parked.values()), [rec])
+        is_none(rec.dbapi_connection)
+
+        p._fill_to_min_size()
+        is_not_none(rec.dbapi_connection)
+        eq_(dbapi.connect.call_count, 2)
+        eq_(list(p._parked.values()), [rec])
+
+        # checkout doesn't need to connect
+        c1 = p.connect()
+        is_(c1._connection_record, rec)
+        eq_(dbapi.connect.call_count, 2)
+        c1.close()
+
+    def test_repark_slot_taken(self):
+        dbapi, p = self._fixture(pool_size=5, max_overflow=0)
+
+        c1 = p.connect()
+        rec = c1._connection_record
+        c1.close()
+
+        ident, taken = p._take_parked_where(lambda rec: True)
+        is_(taken, rec)
+        eq_(len(p._parked), 0)
+
+        # the thread parks another connection while the first is out
+        c1, c2 = p.connect(), p.connect()
+        other = c1._connection_record
+        c1.close()
+        eq_(list(p._parked.values()), [other])
+
+        p._repark(ident, rec)
+        eq_(list(p._parked.values()), [other])
+        eq_(list(p._pool.queue), [rec])
+        c2.close()
+
+    def test_recreate(self):
+        dbapi, p = self._fixture(pool_size=3, max_overflow=2)
+        p2 = p.recreate()
+        assert isinstance(p2, pool.AffinityQueuePool)
+        eq_(p2.size(), 3)
+        is_true(p2._pool.use_lifo)
+
+
+class AdaptiveQueuePoolTest(PoolTestBase):
+    def _fixture(self, **kw):
+        dbapi = MockDBAPI()
+        p = pool.AdaptiveQueuePool(
+            creator=lambda: dbapi.connect("foo.db"), **kw
+        )
+
+        # size adjustments are run explicitly by the tests
+        p._filler_started = True
+        return dbapi, p
+
+    def _open(self, p):
+        return p.checkedin() + p.checkedout()
+
+    def test_counts_slow_checkouts(self):
+        dbapi, p = self._fixture(wait_threshold=0)
+        c1, c2 = p.connect(), p.connect()
+        eq_(p._slow_checkouts, 2)
+        c1.close()
+        c2.close()
+
+        dbapi, p = self._fixture(wait_threshold=1000)
+        p.connect().close()
+        eq_(p._slow_checkouts, 0)
+
+    def test_grows_on_slow_checkouts(self):
+        dbapi, p = self._fixture(pool_size=5, max_overflow=0)
+
+        c1 = p.connect()
+        p._slow_checkouts = 2
+        p._adjust_size()
+
+        eq_(p._slow_checkouts, 0)
+        eq_(p.checkedin(), 2)
+        eq_(self._open(p), 3)
+        eq_(dbapi.connect.call_count, 3)
+
+        # new connections aren't idle
+        p._adjust_size()
+        eq_(self._open(p), 3)
+
+        # limited to pool_size
+        p._slow_checkouts = 10
+        p._adjust_size()
+        eq_(self._open(p), 5)
+        eq_(p.overflow(), 0)
+        c1.close()
+
+    def test_shrinks_gradually(self):
+        dbapi, p = self._fixture(pool_size=5, max_overflow=0, idle_timeout=60)
+
+        conns = [p.connect() for i in range(3)]
+        recs = [c._connection_record for c in conns]
+        dbapi_conns = [c.dbapi_connection for c in conns]
+        for c in conns:
+            c.close()
+
+        p._adjust_size()
+        eq_(self._open(p), 3)
+
+        for rec in recs[0:2]:
+            rec.last_used -= 100
+
+        p._adjust_size()
+        eq_(self._open(p), 2)
+        eq_(p.overflow(), -3)
+        eq_([c.close.call_count for c in dbapi_conns], [1, 0, 0])
+
+        p._adjust_size()
+        eq_(self._open(p), 1)
+        eq_([c.close.call_count for c in dbapi_conns], [1, 1, 0])
+
+        p._adjust_size()
+        eq_(self._open(p), 1)
+
+        # the pool opens connections as needed again
+        c1, c2 = p.connect(), p.connect()
+        eq_(dbapi.connect.call_count, 4)
+        c1.close()
+        c2.close()
+
+    def test_shrink_stops_at_min_size(self):
+        dbapi, p = self._fixture(
+            pool_size=5, max_overflow=0, min_size=2, idle_timeout=0
+        )
+        conns = [p.connect() for i in range(4)]
+        for c in conns:
+            c.close()
+
+        for i in range(5):
+            p._adjust_size()
+        eq_(self._open(p), 2)
+
+    def test_no_shrink_while_waiting(self):
+        dbapi, p = self._fixture(pool_size=5, max_overflow=0, idle_timeout=0)
+        p.connect().close()
+
+        p._slow_checkouts = 1
+        p._adjust_size()
+        eq_(self._open(p), 2)
+
+        p._adjust_size()
+        eq_(self._open(p), 1)
+
+    def test_background_thread(self):
+        dbapi = MockDBAPI()
+        p = pool.AdaptiveQueuePool(
+            creator=lambda: dbapi.connect("foo.db"),
+            pool_size=5,
+            max_overflow=0,
+            idle_timeout=0,
+        )
+        p._filler_interval = 0.05
+
+        conns = [p.connect() for i in range(3)]
+        for c in conns:
+            c.close()
+
+        for i in range(100):
+            if self._open(p) == 0:
+                break
+            time.sleep(0.05)
+        eq_(self._open(p), 0)
+
+        p.dispose()
+        assert p._background_stop.is_set()
+
+    def test_recreate(self):
+        dbapi, p = self._fixture(
+            pool_size=8, min_size=2, idle_timeout=30, wait_threshold=0.5
+        )
+        p2 = p.recreate()
+        assert isinstance(p2, pool.AdaptiveQueuePool)
+        eq_(p2.size(), 8)
+        eq_(p2._min_size, 2)
+        eq_(p2._idle_timeout, 30)
+        eq_(p2._wait_threshold, 0.5)
+        is_true(p2._pool.use_lifo)
+
+
+class PoolMetricsTest(PoolTestBase):
+    def test_not_enabled(self):
+        p = self._queuepool_fixture()
+        p.connect().close()
+        is_none(p.get_metrics())
+
+    def test_checkout_checkin(self):
+        p = self._queuepool_fixture(pool_size=2, max_overflow=1, metrics=True)
+
+        c1, c2, c3 = p.connect(), p.connect(), p.connect()
+
+        metrics = p.get_metrics()
+        eq_(metrics["checkouts"], 3)
+        eq_(metrics["connects"], 3)
+        eq_(metrics["connect_time"]["count"], 3)
+        eq_(metrics["overflow_created"], 1)
+        eq_(metrics["hold_time"]["count"], 0)
+        eq_(metrics["checkedout"], 3)
+        eq_(metrics["saturation"], 1.0)
+
+        c1.close()
+        c2.close()
+
+        metrics = p.get_metrics()
+        eq_(metrics["hold_time"]["count"], 2)
+        eq_(metrics["checkedout"], 1)
+        eq_(metrics["checkedin"], 2)
+        eq_(metrics["saturation"], 1 / 3)
+
+        c1 = p.connect()
+        c1.close()
+        c3.close()
+
+        metrics = p.get_metrics()
+        eq_(metrics["checkouts"], 4)
+        eq_(metrics["connects"], 3)
+        eq_(metrics["hold_time"]["count"], 4)
+        eq_(metrics["checkout_wait"]["count"], 4)
+        is_true(metrics["checkout_wait"]["total"] >= 0)
+        eq_(sum(count for bound, count in metrics["hold_time"]["buckets"]), 4)
+
+    def test_no_limit_saturation(self):
+        p = self._queuepool_fixture(pool_size=2, max_overflow=-1, metrics=True)
+        c1 = p.connect()
+        is_none(p.get_metrics()["saturation"])
+        c1.close()
+
+    def test_timeout(self):
+        p = self._queuepool_fixture(
+            pool_size=1, max_overflow=0, timeout=0, metrics=True
+        )
+        c1 = p.connect()
+        assert_raises(tsa.exc.TimeoutError, p.connect)
+        eq_(p.get_metrics()["timeouts"], 1)
+        c1.close()
+
+    def test_invalidate_and_connect_error(self):
+        dbapi, p = self._queuepool_dbapi_fixture(
+            pool_size=1, max_overflow=0, metrics=True
+        )
+        c1 = p.connect()
+        c1.invalidate()
+
+        dbapi.shutdown(True)
+        assert_raises_context_ok(Exception, p.connect)
+
+        metrics = p.get_metrics()
+        eq_(metrics["invalidations"], 1)
+        eq_(metrics["connect_errors"], 1)
+        eq_(metrics["connects"], 1)
+
+    def test_resets(self):
+        p = self._queuepool_fixture(metrics=True)
+        p.connect().close()
+        p.connect()._close_no_reset()
+        p.connect()._close_no_reset()
+
+        metrics = p.get_metrics()
+        eq_(metrics["resets"], 1)
+        eq_(metrics["resets_skipped"], 2)
+
+    def test_no_reset_on_return(self):
+        p = self._queuepool_fixture(metrics=True, reset_on_return=None)
+        p.connect().close()
+        p.connect()._close_no_reset()
+
+        metrics = p.get_metrics()
+        eq_(metrics["resets"], 0)
+        eq_(metrics["resets_skipped"], 0)
+
+    def test_reset(self):
+        p = self._queuepool_fixture(metrics=True)
+        p.connect().close()
+
+        eq_(p.get_metrics(reset=True)["checkouts"], 1)
+        eq_(p.get_metrics()["checkouts"], 0)
+
+    def test_histogram(self):
+        hist = _Histogram()
+        for value in (0.00005, 0.002, 0.002, 0.3, 100):
+            hist.observe(value)
+
+        d = hist.as_dict()
+        eq_(d["count"], 5)
+        eq_(d["max"], 100)
+        eq_(
+            [(bound, count) for bound, count in d["buckets"] if count],
+            [(0.0001, 1), (0.005, 2), (0.5, 1), (float("inf"), 1)],
+        )
+
+    @testing.combinations(
+        pool.QueuePool,
+        pool.NullPool,
+        pool.SingletonThreadPool,
+        pool.StaticPool,
+        pool.AssertionPool,
+    )
+    def test_recreate(self, pool_cls):
+        p = pool_cls(creator=Mock(), metrics=True)
+        is_not_none(p.recreate().get_metrics())
+
+        p = pool_cls(creator=Mock())
+        is_none(p.recreate().get_metrics())
+
+    def test_null_pool(self):
+        p = pool.NullPool(creator=Mock(), metrics=True)
+        p.connect().close()
+        p.connect().close()
+
+        metrics = p.get_metrics()
+        eq_(metrics["checkouts"], 2)
+        eq_(metrics["connects"], 2)
+        eq_(metrics["hold_time"]["count"], 2)
+        assert "saturation" not in metrics
+
 
 class ResetOnReturnTest(PoolTestBase):
     def _fixture(self, **kw):
@@ -377,6 +377,197 @@ class PrePingMockTest(fixtures.TestBase):
             ],
         )
 
+    def test_ping_interval_skips_recently_used(self):
+        pool = self._pool_fixture(
+            pre_ping=True,
+            pool_kw=dict(pool_size=1, max_overflow=0, pre_ping_interval=30),
+        )
+
+        conn = pool.connect()
+        dbapi_conn = conn.dbapi_connection
+        rec = conn._connection_record
+        conn.close()
+
+        # connection was used recently, no ping
+        conn = pool.connect()
+        is_(conn.dbapi_connection, dbapi_conn)
+        eq_(dbapi_conn.mock_calls, [call.rollback()])
+        conn.close()
+
+        rec.last_used -= 60
+
+        # connection has been idle past the interval, ping
+        conn = pool.connect()
+        is_(conn.dbapi_connection, dbapi_conn)
+        eq_(
+            dbapi_conn.mock_calls,
+            [call.rollback(), call.rollback(), call.cursor()],
+        )
+        conn.close()
+
+    def test_ping_interval_reconnects_idle(self):
+        pool = self._pool_fixture(
+            pre_ping=True,
+            pool_kw=dict(pool_size=1, max_overflow=0, pre_ping_interval=30),
+        )
+
+        conn = pool.connect()
+        stale_connection = conn.dbapi_connection
+        rec = conn._connection_record
+        conn.close()
+        rec.last_used -= 60
+
+        self.dbapi.shutdown("execute")
+        self.dbapi.restart()
+
+        conn = pool.connect()
+        ne_(conn.dbapi_connection, stale_connection)
+        conn.cursor().execute("hi")
+        conn.close()
+
+    def test_idle_ping(self):
+        pool = self._pool_fixture(
+            pre_ping=True,
+            pool_kw=dict(
+                pool_size=2,
+                max_overflow=0,
+                pre_ping_interval=30,
+                idle_ping_interval=30,
+            ),
+        )
+
+        c1, c2 = pool.connect(), pool.connect()
+        rec1, rec2 = c1._connection_record, c2._connection_record
+        dbapi_c1, dbapi_c2 = c1.dbapi_connection, c2.dbapi_connection
+        c1.close()
+        c2.close()
+
+        rec1.last_used -= 60
+        pool._ping_idle_connections()
+
+        # only the connection idle past the interval was pinged, and
+        # is now considered to have been used recently
+        eq_(dbapi_c1.mock_calls, [call.rollback(), call.cursor()])
+        eq_(dbapi_c2.mock_calls, [call.rollback()])
+        is_true(time.time() - rec1.last_used < 30)
+        eq_(pool.checkedin(), 2)
+
+        # so neither connection is pinged upon checkout
+        c1, c2 = pool.connect(), pool.connect()
+        eq_(dbapi_c1.mock_calls, [call.rollback(), call.cursor()])
+        eq_(dbapi_c2.mock_calls, [call.rollback()])
+        c1.close()
+        c2.close()
+
+        pool.dispose()
+
+    def test_idle_ping_reconnects(self):
+        pool = self._pool_fixture(
+            pre_ping=True,
+            pool_kw=dict(
+                pool_size=2,
+                max_overflow=0,
+                pre_ping_interval=30,
+                idle_ping_interval=30,
+            ),
+        )
+
+        c1, c2 = pool.connect(), pool.connect()
+        rec1, rec2 = c1._connection_record, c2._connection_record
+        stale_c1, stale_c2 = c1.dbapi_connection, c2.dbapi_connection
+        c1.close()
+        c2.close()
+
+        self.dbapi.shutdown("execute")
+        self.dbapi.restart()
+
+        rec1.last_used -= 60
+        rec2.last_used -= 60
+        pool._ping_idle_connections()
+
+        is_true(stale_c1.close.called)
+        is_true(stale_c2.close.called)
+        ne_(rec1.dbapi_connection, stale_c1)
+        ne_(rec2.dbapi_connection, stale_c2)
+        eq_(pool.checkedin(), 2)
+
+        for conn in (pool.connect(), pool.connect()):
+            conn.cursor().execute("hi")
+            conn.close()
+
+        pool.dispose()
+
+    def test_idle_ping_db_is_stopped(self):
+        pool = self._pool_fixture(
+            pre_ping=True,
+            pool_kw=dict(pool_size=1, max_overflow=0, idle_ping_interval=30),
+        )
+
+        conn = pool.connect()
+        rec = conn._connection_record
+        conn.close()
+
+        self.dbapi.shutdown("execute", stop=True)
+
+        rec.last_used -= 60
+        pool._ping_idle_connections()
+
+        # connection is invalidated and returned to the pool, to be
+        # reconnected upon next checkout
+        is_(rec.dbapi_connection, None)
+        eq_(pool.checkedin(), 1)
+
+        pool.dispose()
+
+    def test_idle_pinger_thread(self):
+        pool = self._pool_fixture(
+            pre_ping=True,
+            pool_kw=dict(pool_size=1, max_overflow=0, idle_ping_interval=0.05),
+        )
+
+        conn = pool.connect()
+        dbapi_conn = conn.dbapi_connection
+        conn.close()
+
+        for i in range(100):
+            if call.cursor() in dbapi_conn.mock_calls:
+                break
+            time.sleep(0.05)
+        else:
+            assert False, "idle pinger did not ping connection"
+
+        pool.dispose()
+        is_true(pool._background_stop.is_set())
+
+    def test_idle_ping_interval_not_for_asyncio(self):
+        with expect_raises_message(
+            exc.ArgumentError,
+            "The idle_ping_interval parameter is not supported",
+        ):
+            pool.AsyncAdaptedQueuePool(
+                creator=lambda: self.dbapi.connect("foo.db"),
+                idle_ping_interval=30,
+            )
+
+    def test_create_engine_args(self):
+        e = create_engine(
+            "postgresql+psycopg2://",
+            module=self.dbapi,
+            _initialize=False,
+            pool_pre_ping=True,
+            pool_pre_ping_interval=20,
+            pool_idle_ping_interval=30,
+        )
+        eq_(e.pool._pre_ping_interval, 20)
+        eq_(e.pool._idle_ping_interval, 30)
+
+        p2 = e.pool.recreate()
+        eq_(p2._pre_ping_interval, 20)
+        eq_(p2._idle_ping_interval, 30)
+
+        e.dispose()
+        p2.dispose()
+
 
 class MockReconnectTest(fixtures.TestBase):
     def setup_test(self):
@@ -1637,11 +1637,9 @@ class ResetFixture:
 
 
 class ResetAgentTest(ResetFixture, fixtures.TestBase):
-    # many of these tests illustate rollback-on-return being redundant
-    # vs. what the transaction just did, however this is to ensure
-    # even if statements were invoked on the DBAPI connection directly,
-    # the state is cleared.    options to optimize this with clear
-    # docs etc. should be added.
+    # rollback-on-return is skipped when the transaction was just
+    # committed or rolled back by the Connection.  if the DBAPI connection
+    # may have been used directly since then, the state is cleared.
 
     __backend__ = True
 
@@ -1665,7 +1663,6 @@ class ResetAgentTest(ResetFixture, fixtures.TestBase):
             [
                 mock.call.rollback(connection),
                 mock.call.do_rollback(mock.ANY),
-                mock.call.do_rollback(mock.ANY),
             ],
         )
 
@@ -1679,6 +1676,54 @@ class ResetAgentTest(ResetFixture, fixtures.TestBase):
             [
                 mock.call.commit(connection),
                 mock.call.do_commit(mock.ANY),
+            ],
+        )
+
+    def test_begin_commit_dbapi_connection_used(self, reset_agent):
+        with reset_agent.engine.connect() as connection:
+            trans = connection.begin()
+            trans.commit()
+            connection.connection.cursor().close()
+        eq_(
+            reset_agent.mock_calls,
+            [
+                mock.call.commit(connection),
+                mock.call.do_commit(mock.ANY),
+                mock.call.do_rollback(mock.ANY),
+            ],
+        )
+
+    def test_begin_commit_reset_listener(self, reset_agent):
+        engine = reset_agent.engine
+        event.listen(engine, "reset", reset_agent.reset)
+        event.listen(engine, "reset_skipped", reset_agent.reset_skipped)
+        try:
+            with engine.begin() as connection:
+                connection.execute(select(1))
+        finally:
+            event.remove(engine, "reset", reset_agent.reset)
+            event.remove(engine, "reset_skipped", reset_agent.reset_skipped)
+        eq_(
+            reset_agent.mock_calls,
+            [
+                mock.call.commit(connection),
+                mock.call.do_commit(mock.ANY),
+                mock.call.reset(mock.ANY, mock.ANY),
+                mock.call.do_rollback(mock.ANY),
+            ],
+        )
+
+    def test_commit_execute_close(self, reset_agent):
+        with reset_agent.engine.connect() as connection:
+            connection.execute(select(1))
+            connection.commit()
+            connection.execute(select(1))
+        eq_(
+            reset_agent.mock_calls,
+            [
+                mock.call.commit(connection),
+                mock.call.do_commit(mock.ANY),
+                mock.call.rollback(connection),
                 mock.call.do_rollback(mock.ANY),
             ],
         )
@@ -1692,7 +1737,6 @@ class ResetAgentTest(ResetFixture, fixtures.TestBase):
             [
                 mock.call.rollback(connection),
                 mock.call.do_rollback(mock.ANY),
-                mock.call.do_rollback(mock.ANY),
             ],
         )
 
@@ -1714,7 +1758,6 @@ class ResetAgentTest(ResetFixture, fixtures.TestBase):
                 mock.call.rollback_savepoint(connection, mock.ANY, mock.ANY),
                 mock.call.rollback(connection),
                 mock.call.do_rollback(mock.ANY),
-                mock.call.do_rollback(mock.ANY),
             ],
         )
 
@@ -1737,7 +1780,6 @@ class ResetAgentTest(ResetFixture, fixtures.TestBase):
             [
                 mock.call.rollback(connection),
                 mock.call.do_rollback(mock.ANY),
-                mock.call.do_rollback(mock.ANY),
             ],
         )
 
@@ -1761,7 +1803,6 @@ class ResetAgentTest(ResetFixture, fixtures.TestBase):
                 mock.call.rollback_savepoint(connection, mock.ANY, mock.ANY),
                 mock.call.rollback(connection),
                 mock.call.do_rollback(mock.ANY),
-                mock.call.do_rollback(mock.ANY),
             ],
         )
 
@@ -1801,7 +1842,6 @@ class ResetAgentTest(ResetFixture, fixtures.TestBase):
                 mock.call.rollback_savepoint(connection, mock.ANY, None),
                 mock.call.commit(connection),
                 mock.call.do_commit(mock.ANY),
-                mock.call.do_rollback(mock.ANY),
             ],
         )
 
@@ -1818,7 +1858,6 @@ class ResetAgentTest(ResetFixture, fixtures.TestBase):
                 mock.call.rollback_savepoint(connection, mock.ANY, mock.ANY),
                 mock.call.rollback(connection),
                 mock.call.do_rollback(mock.ANY),
-                mock.call.do_rollback(mock.ANY),  # this is the reset on return
             ],
         )
 
@@ -24,6 +24,8 @@ from sqlalchemy.ext.asyncio.base import ReversibleProxy
 from sqlalchemy.ext.asyncio.engine import AsyncConnection
 from sqlalchemy.ext.asyncio.engine import AsyncEngine
 from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.pool import AsyncQueuePool
+from sqlalchemy.pool import impl as pool_impl
 from sqlalchemy.testing import assertions
 from sqlalchemy.testing import async_test
 from sqlalchemy.testing import combinations
@@ -621,6 +623,76 @@ class AsyncEngineTest(EngineFixture):
             with expect_raises(exc.TimeoutError):
                 await engine.connect()
 
+    @testing.requires.queue_pool
+    @async_test
+    async def test_async_queue_pool_exhausted(self, async_engine):
+        engine = create_async_engine(
+            testing.db.url,
+            poolclass=AsyncQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.1,
+        )
+        async with engine.connect():
+            with expect_raises(exc.TimeoutError):
+                await engine.connect()
+        await engine.dispose()
+
+    @testing.requires.queue_pool
+    @async_test
+    async def test_async_queue_pool_checkout_no_greenlet(self, async_engine):
+        engine = create_async_engine(
+            testing.db.url, poolclass=AsyncQueuePool, pool_size=2
+        )
+        async with engine.connect() as conn:
+            eq_(await conn.scalar(select(1)), 1)
+
+        with mock.patch.object(
+            pool_impl, "greenlet_spawn", side_effect=greenlet_spawn
+        ) as pool_spawn, mock.patch.object(
+            _async_engine, "greenlet_spawn", side_effect=greenlet_spawn
+        ) as engine_spawn:
+            conn = await engine.connect().start()
+            raw = await engine.raw_connection()
+
+        eq_(pool_spawn.mock_calls, [])
+        eq_(engine_spawn.mock_calls, [])
+        eq_(engine.pool.checkedout(), 2)
+
+        eq_(await conn.scalar(select(1)), 1)
+        await conn.close()
+        await greenlet_spawn(raw.close)
+        eq_(engine.pool.checkedout(), 0)
+        await engine.dispose()
+
+    @testing.requires.queue_pool
+    @async_test
+    async def test_async_queue_pool_warm_up(self, async_engine):
+        engine = create_async_engine(
+            testing.db.url, poolclass=AsyncQueuePool, pool_size=5
+        )
+        async with engine.connect():
+            pass
+
+        await engine.sync_engine.pool.warm_up(3)
+        eq_(engine.pool.checkedin(), 3)
+        await engine.dispose()
+
+    @testing.requires.queue_pool
+    @async_test
+    async def test_async_queue_pool_min_size(self, async_engine):
+        engine = create_async_engine(
+            testing.db.url,
+            poolclass=AsyncQueuePool,
+            pool_size=5,
+            pool_min_size=3,
+        )
+        async with engine.connect():
+            await engine.sync_engine.pool._warm_up_task
+            eq_(engine.pool.checkedin(), 2)
+        eq_(engine.pool.checkedin(), 3)
+        await engine.dispose()
+
     @async_test
     async def test_create_async_engine_server_side_cursor(self, async_engine):
         testing.assert_raises_message(
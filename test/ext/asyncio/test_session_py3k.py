@@ -15,6 +15,7 @@ from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.asyncio import exc as async_exc
 from sqlalchemy.ext.asyncio.base import ReversibleProxy
+from sqlalchemy.orm import LazyLoadTracker
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import selectinload
 from sqlalchemy.orm import Session
@@ -70,6 +71,16 @@ class AsyncSessionTest(AsyncFixture):
         ss = AsyncSession(binds=binds)
         is_(ss.binds, binds)
 
+    def test_lazy_load_tracker(self, async_engine):
+        tracker = LazyLoadTracker()
+
+        ss = async_sessionmaker(async_engine, lazy_load_tracker=tracker)()
+        is_(ss.lazy_load_tracker, tracker)
+        is_(ss.sync_session.lazy_load_tracker, tracker)
+
+        ss.lazy_load_tracker = None
+        is_(ss.sync_session.lazy_load_tracker, None)
+
     @async_test
     @testing.combinations((True,), (False,), argnames="use_scalar")
     @testing.requires.sequences
@@ -159,6 +170,16 @@ class AsyncSessionQueryTest(AsyncFixture):
         u3 = await async_session.get(User, 12)
         is_(u3, None)
 
+    @async_test
+    async def test_get_many(self, async_session):
+        User = self.classes.User
+
+        u7 = await async_session.get(User, 7)
+
+        result = await async_session.get_many(User, [8, 7, 12])
+        eq_([u and u.name for u in result], ["ed", "jack", None])
+        is_(result[1], u7)
+
     @async_test
     async def test_get_loader_options(self, async_session):
         User = self.classes.User
@@ -489,6 +510,24 @@ class AsyncSessionTransactionTest(AsyncFixture):
             eq_(new_u_merged.name, "new u1")
             eq_(len(new_u_merged.__dict__["addresses"]), 1)
 
+    @async_test
+    async def test_merge_all(self, async_session):
+        User = self.classes.User
+
+        async with async_session.begin():
+            u1 = User(id=1, name="u1")
+
+            async_session.add(u1)
+
+        async with async_session.begin():
+            merged = await async_session.merge_all(
+                [User(id=2, name="u2"), User(id=1, name="new u1")]
+            )
+
+            is_(merged[1], u1)
+            eq_(u1.name, "new u1")
+            eq_(merged[0].name, "u2")
+
     @async_test
     async def test_join_to_external_transaction(self, async_engine):
         User = self.classes.User
@@ -1,14 +1,19 @@
 import datetime
 import os
+import threading
+import time
 
 from sqlalchemy import Column
 from sqlalchemy import DateTime
 from sqlalchemy import delete
 from sqlalchemy import event
+from sqlalchemy import exc
 from sqlalchemy import Float
+from sqlalchemy import func
 from sqlalchemy import ForeignKey
 from sqlalchemy import inspect
 from sqlalchemy import Integer
+from sqlalchemy import literal_column
 from sqlalchemy import select
 from sqlalchemy import sql
 from sqlalchemy import String
@@ -28,6 +33,7 @@ from sqlalchemy.pool import SingletonThreadPool
 from sqlalchemy.sql import operators
 from sqlalchemy.sql import Select
 from sqlalchemy.testing import eq_
+from sqlalchemy.testing import expect_raises_message
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import provision
@@ -214,6 +220,15 @@ class ShardTest:
         t2 = sess.get(WeatherLocation, 1)
         is_(t2, tokyo)
 
+    def test_get_many_identity_token(self):
+        sess = self._fixture_data()
+        tokyo, newyork = sess.get_many(
+            WeatherLocation, [1, 2], identity_token="north_america"
+        )
+        is_(tokyo, None)
+        eq_(newyork.city, "New York")
+        eq_(inspect(newyork).identity_token, "north_america")
+
     def test_get_explicit_shard(self):
         sess = self._fixture_data()
         tokyo = (
@@ -294,6 +309,239 @@ class ShardTest:
             {"Tokyo", "London", "Dublin"},
         )
 
+    @testing.combinations((None,), (2,), (4,), argnames="max_concurrent")
+    def test_roundtrip_concurrent_shards(self, max_concurrent):
+        self._fixture_data()
+        sess = sharded_session(max_concurrent_shards=max_concurrent)
+
+        eq_(
+            [
+                (inspect(loc).identity_token, loc.city)
+                for loc in sess.scalars(
+                    select(WeatherLocation).order_by(WeatherLocation.id)
+                )
+            ],
+            [
+                ("north_america", "New York"),
+                ("north_america", "Toronto"),
+                ("asia", "Tokyo"),
+                ("europe", "London"),
+                ("europe", "Dublin"),
+                ("south_america", "Brasila"),
+                ("south_america", "Quito"),
+            ],
+        )
+
+        asia_and_europe = sess.scalars(
+            select(WeatherLocation).filter(
+                WeatherLocation.continent.in_(["Europe", "Asia"])
+            )
+        ).all()
+        eq_(
+            {c.city for c in asia_and_europe},
+            {"Tokyo", "London", "Dublin"},
+        )
+        # Asia is the second shard per execute_chooser
+        eq_(asia_and_europe[-1].city, "Tokyo")
+        tokyo = sess.scalars(
+            select(WeatherLocation).filter_by(city="Tokyo")
+        ).one()
+        is_(tokyo, asia_and_europe[-1])
+
+    @testing.combinations(
+        (
+            lambda: WeatherLocation.city,
+            {},
+            [
+                "Brasila",
+                "Dublin",
+                "London",
+                "New York",
+                "Quito",
+                "Tokyo",
+                "Toronto",
+            ],
+        ),
+        (
+            lambda: weather_locations.c.city,
+            {"limit": 2},
+            ["Brasila", "Dublin"],
+        ),
+        (
+            lambda: WeatherLocation.city.asc().nulls_last(),
+            {"limit": 2},
+            ["Brasila", "Dublin"],
+        ),
+        (
+            lambda: WeatherLocation.city.desc(),
+            {"limit": 3},
+            ["Toronto", "Tokyo", "Quito"],
+        ),
+        (
+            lambda: (WeatherLocation.continent, WeatherLocation.city.desc()),
+            {"limit": 3},
+            ["Tokyo", "London", "Dublin"],
+        ),
+        (
+            lambda: WeatherLocation.city,
+            {"limit": 3, "offset": 2},
+            ["London", "New York", "Quito"],
+        ),
+        (lambda: WeatherLocation.city, {"offset": 5}, ["Tokyo", "Toronto"]),
+        argnames="order_by, limit_offset, expected",
+    )
+    def test_merge_ordered_entities(self, order_by, limit_offset, expected):
+        self._fixture_data()
+        sess = sharded_session(merge_ordered_results=True)
+
+        order_by = order_by()
+        if not isinstance(order_by, tuple):
+            order_by = (order_by,)
+        stmt = select(WeatherLocation).order_by(*order_by)
+        if "limit" in limit_offset:
+            stmt = stmt.limit(limit_offset["limit"])
+        if "offset" in limit_offset:
+            stmt = stmt.offset(limit_offset["offset"])
+
+        eq_([loc.city for loc in sess.scalars(stmt)], expected)
+
+    @testing.combinations(
+        (lambda: select(WeatherLocation.city).order_by(WeatherLocation.city),),
+        (
+            lambda: select(
+                WeatherLocation.continent, WeatherLocation.city
+            ).order_by(WeatherLocation.city),
+        ),
+        (
+            lambda: select(
+                WeatherLocation.continent, WeatherLocation.city.label("c")
+            ).order_by("c"),
+        ),
+        (
+            lambda: select(
+                WeatherLocation.continent,
+                WeatherLocation.city.label("c"),
+            ).order_by(WeatherLocation.city.label("c")),
+        ),
+        argnames="stmt",
+    )
+    def test_merge_ordered_columns(self, stmt):
+        self._fixture_data()
+        sess = sharded_session(merge_ordered_results=True)
+
+        result = sess.execute(stmt().limit(4))
+        eq_(
+            [row[-1] for row in result],
+            ["Brasila", "Dublin", "London", "New York"],
+        )
+
+    @testing.combinations(
+        (lambda stmt: stmt.fetch(1), testing.requires.fetch_first),
+        (lambda stmt: stmt.limit(literal_column("1")),),
+        (lambda stmt: stmt.limit(1).offset(literal_column("0")),),
+        argnames="limit",
+    )
+    def test_merge_ordered_non_int_limit(self, limit):
+        """LIMIT / OFFSET that can't be applied to the merged rows are
+        applied per shard, and the results concatenated"""
+
+        self._fixture_data()
+        sess = sharded_session(merge_ordered_results=True)
+
+        stmt = limit(select(WeatherLocation).order_by(WeatherLocation.city))
+        eq_(
+            sorted(loc.city for loc in sess.scalars(stmt)),
+            ["Brasila", "Dublin", "New York", "Tokyo"],
+        )
+
+    def test_merge_ordered_legacy_query(self):
+        self._fixture_data()
+        sess = sharded_session(merge_ordered_results=True)
+
+        eq_(
+            [
+                loc.city
+                for loc in sess.query(WeatherLocation)
+                .order_by(WeatherLocation.city.desc())
+                .limit(2)
+            ],
+            ["Toronto", "Tokyo"],
+        )
+
+    def test_merge_ordered_nulls(self):
+        self._fixture_data()
+        sess = sharded_session(merge_ordered_results=True)
+
+        brasilia = sess.scalars(
+            select(WeatherLocation).filter_by(city="Brasila")
+        ).one()
+        brasilia.reports.append(Report(None))
+        sess.commit()
+
+        for nulls, expected in [
+            (
+                lambda col: col.nulls_first(),
+                [None, 75.0, 80.0, 85.0],
+            ),
+            (
+                lambda col: col.nulls_last(),
+                [75.0, 80.0, 85.0, None],
+            ),
+            (
+                lambda col: col.desc().nulls_first(),
+                [None, 85.0, 80.0, 75.0],
+            ),
+            (
+                lambda col: col.desc().nulls_last(),
+                [85.0, 80.0, 75.0, None],
+            ),
+        ]:
+            eq_(
+                sess.scalars(
+                    select(Report.temperature).order_by(
+                        nulls(Report.temperature)
+                    )
+                ).all(),
+                expected,
+            )
+
+    def test_merge_ordered_unsupported_order_by(self):
+        self._fixture_data()
+        sess = sharded_session(merge_ordered_results=True)
+
+        with expect_raises_message(
+            exc.InvalidRequestError,
+            "Can't merge the results of multiple shards in terms of ORDER BY "
+            "expression lower",
+        ):
+            sess.scalars(
+                select(WeatherLocation).order_by(
+                    func.lower(WeatherLocation.city)
+                )
+            ).all()
+
+    def test_merge_ordered_yield_per(self):
+        self._fixture_data()
+        sess = sharded_session(merge_ordered_results=True)
+
+        result = sess.scalars(
+            select(WeatherLocation)
+            .order_by(WeatherLocation.city)
+            .execution_options(yield_per=1)
+        )
+        eq_(
+            [[loc.city for loc in part] for part in result.partitions()],
+            [
+                ["Brasila"],
+                ["Dublin"],
+                ["London"],
+                ["New York"],
+                ["Quito"],
+                ["Tokyo"],
+                ["Toronto"],
+            ],
+        )
+
     def test_roundtrip(self):
         sess = self._fixture_data()
         tokyo = sess.query(WeatherLocation).filter_by(city="Tokyo").one()
@@ -695,6 +943,91 @@ class DistinctEngineShardTest(ShardTest, fixtures.MappedTest):
         for i in range(1, 5):
             os.remove("shard%d_%s.db" % (i, provision.FOLLOWER_IDENT))
 
+    def _slow_shard_fixture(self, delay):
+        @event.listens_for(self.dbs[2], "before_cursor_execute")
+        def slow(conn, cursor, statement, parameters, context, executemany):
+            time.sleep(delay)
+
+    def test_concurrent_shards_run_concurrently(self):
+        self._fixture_data()
+        sess = sharded_session(max_concurrent_shards=4)
+
+        # each shard's statement waits for all four to be in progress
+        barrier = threading.Barrier(4, timeout=5)
+        threads = set()
+
+        def wait_for_shards(*arg):
+            threads.add(threading.get_ident())
+            barrier.wait()
+
+        for db in self.dbs:
+            event.listen(db, "before_cursor_execute", wait_for_shards)
+
+        eq_(len(sess.scalars(select(WeatherLocation)).all()), 7)
+        eq_(len(threads), 4)
+        assert threading.get_ident() not in threads
+
+    def test_concurrent_shard_timeout(self):
+        self._fixture_data()
+        sess = sharded_session(max_concurrent_shards=4, shard_timeout=0.1)
+
+        self._slow_shard_fixture(0.5)
+
+        with expect_raises_message(
+            exc.TimeoutError,
+            "Statement for shard 'europe' did not complete within 0.1 seconds",
+        ):
+            sess.scalars(select(WeatherLocation)).all()
+
+        sess.rollback()
+
+        # the Session remains usable
+        eq_(
+            sess.scalars(
+                select(WeatherLocation.city).filter_by(continent="Asia")
+            ).all(),
+            ["Tokyo"],
+        )
+
+    def test_concurrent_shard_within_timeout(self):
+        self._fixture_data()
+        sess = sharded_session(max_concurrent_shards=2, shard_timeout=5)
+
+        self._slow_shard_fixture(0.1)
+
+        eq_(len(sess.scalars(select(WeatherLocation)).all()), 7)
+
+    def test_merge_ordered_limit_per_shard(self):
+        self._fixture_data()
+        sess = sharded_session(
+            merge_ordered_results=True, max_concurrent_shards=4
+        )
+
+        params = []
+
+        def record(conn, cursor, statement, parameters, *arg):
+            if "LIMIT" in statement:
+                params.append(parameters)
+
+        for db in self.dbs:
+            event.listen(db, "before_cursor_execute", record)
+
+        eq_(
+            [
+                loc.city
+                for loc in sess.scalars(
+                    select(WeatherLocation)
+                    .order_by(WeatherLocation.city)
+                    .limit(2)
+                    .offset(1)
+                )
+            ],
+            ["Dublin", "London"],
+        )
+
+        # each shard is given LIMIT 3 and no OFFSET
+        eq_(params, [(3, 0)] * 4)
+
     def test_plain_core_textual_lookup_w_shard(self):
         sess = self._fixture_data()
 
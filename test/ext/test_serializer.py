@@ -2,9 +2,12 @@
 
 from sqlalchemy import desc
 from sqlalchemy import ForeignKey
+from io import BytesIO
+
 from sqlalchemy import func
 from sqlalchemy import Integer
 from sqlalchemy import join
+from sqlalchemy import lambda_stmt
 from sqlalchemy import literal_column
 from sqlalchemy import MetaData
 from sqlalchemy import select
@@ -20,7 +23,9 @@ from sqlalchemy.orm import relationship
 from sqlalchemy.orm import scoped_session
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.testing import AssertsCompiledSQL
+from sqlalchemy.testing import engines
 from sqlalchemy.testing import eq_
+from sqlalchemy.testing import is_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
@@ -281,6 +286,69 @@ class SerializeTest(AssertsCompiledSQL, fixtures.MappedTest):
             dialect="default",
         )
 
+    def _engine(self):
+        # new Engine with an empty compiled cache, sharing the
+        # connection pool (and therefore the database) of testing.db
+        return engines.testing_engine(
+            options={"use_reaper": False}, share_pool=True
+        )
+
+    def _warm_compiled_cache(self, stmts):
+        eng = self._engine()
+        with eng.connect() as conn:
+            for stmt in stmts:
+                conn.execute(stmt).all()
+
+        buf = BytesIO()
+        serializer.dump_compiled_cache(eng, buf)
+        buf.seek(0)
+        return buf
+
+    def test_compiled_cache_core(self):
+        stmt = select(users).where(users.c.name == "ed")
+        buf = self._warm_compiled_cache([stmt])
+
+        eng = self._engine()
+        eq_(serializer.load_compiled_cache(eng, buf, users.metadata), 1)
+
+        with eng.connect() as conn:
+            result = conn.execute(
+                select(users).where(users.c.name == "fred")
+            )
+            is_(result.context.cache_hit, eng.dialect.CACHE_HIT)
+            eq_(
+                [row._mapping[users.c.name] for row in result],
+                ["fred"],
+            )
+
+    def test_compiled_cache_version_mismatch(self):
+        buf = self._warm_compiled_cache([select(users)])
+
+        eng = self._engine()
+        with eng.connect():
+            pass
+        eng.dialect.server_version_info = (0, 0, 1)
+
+        eq_(serializer.load_compiled_cache(eng, buf, users.metadata), 0)
+        eq_(len(eng._compiled_cache), 0)
+
+    def test_compiled_cache_skips_unknown_tables(self):
+        buf = self._warm_compiled_cache([select(users), select(addresses)])
+
+        metadata = MetaData()
+        users.to_metadata(metadata)
+
+        eng = self._engine()
+        eq_(serializer.load_compiled_cache(eng, buf, metadata), 1)
+
+    def test_compiled_cache_skips_lambdas(self):
+        buf = self._warm_compiled_cache(
+            [select(users), lambda_stmt(lambda: select(addresses))]
+        )
+
+        eng = self._engine()
+        eq_(serializer.load_compiled_cache(eng, buf, users.metadata), 1)
+
 
 class ColumnPropertyWParamTest(
     AssertsCompiledSQL, fixtures.DeclarativeMappedTest
@@ -1,6 +1,7 @@
 """basic tests of lazy loaded attributes"""
 
 import datetime
+import weakref
 
 import sqlalchemy as sa
 from sqlalchemy import and_
@@ -27,6 +28,8 @@ from sqlalchemy.orm import with_parent
 from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_warns
 from sqlalchemy.testing import eq_
+from sqlalchemy.testing import expect_raises_message
+from sqlalchemy.testing import expect_warnings
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
 from sqlalchemy.testing import is_false
@@ -35,6 +38,7 @@ from sqlalchemy.testing.assertsql import CompiledSQL
 from sqlalchemy.testing.fixtures import fixture_session
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
+from sqlalchemy.testing.util import gc_collect
 from sqlalchemy.types import TypeDecorator
 from test.orm import _fixtures
 
@@ -994,6 +998,407 @@ class LazyTest(_fixtures.FixtureTest):
         self.assert_sql_count(testing.db, go, 1)
 
 
+class BatchLazyTest(_fixtures.FixtureTest):
+    run_inserts = "once"
+    run_deletes = None
+
+    def _o2m_fixture(self, lazy="batch"):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+
+        self.mapper_registry.map_imperatively(
+            User,
+            users,
+            properties={
+                "addresses": relationship(
+                    self.mapper_registry.map_imperatively(Address, addresses),
+                    lazy=lazy,
+                    order_by=addresses.c.id,
+                )
+            },
+        )
+        return User, Address
+
+    def test_o2m(self):
+        User, Address = self._o2m_fixture()
+
+        sess = fixture_session()
+        users = sess.scalars(select(User).order_by(User.id)).all()
+
+        def go():
+            eq_(
+                [[a.id for a in u.addresses] for u in users],
+                [[1], [2, 3, 4], [5], []],
+            )
+
+        self.assert_sql_execution(
+            testing.db,
+            go,
+            CompiledSQL(
+                "SELECT addresses.user_id AS addresses_user_id, "
+                "addresses.id AS addresses_id, "
+                "addresses.email_address AS addresses_email_address "
+                "FROM addresses WHERE addresses.user_id "
+                "IN (__[POSTCOMPILE_primary_keys]) ORDER BY addresses.id",
+                [{"primary_keys": [7, 8, 9, 10]}],
+            ),
+        )
+
+    def test_option(self):
+        User, Address = self._o2m_fixture(lazy="select")
+
+        sess = fixture_session()
+        users = sess.scalars(
+            select(User)
+            .options(
+                orm.batchload(
+                    User.addresses.and_(Address.email_address != "ed@wood.com")
+                )
+            )
+            .order_by(User.id)
+        ).all()
+
+        def go():
+            eq_(
+                [[a.id for a in u.addresses] for u in users],
+                [[1], [3, 4], [5], []],
+            )
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_m2o_identity_map(self):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+
+        self.mapper_registry.map_imperatively(
+            Address,
+            addresses,
+            properties={
+                "user": relationship(
+                    self.mapper_registry.map_imperatively(User, users),
+                    lazy="batch",
+                )
+            },
+        )
+
+        sess = fixture_session()
+        addresses = sess.scalars(select(Address).order_by(Address.id)).all()
+
+        def go():
+            eq_([a.user.id for a in addresses], [7, 8, 8, 8, 9])
+
+        self.assert_sql_count(testing.db, go, 1)
+
+        sess.expunge_all()
+        users = sess.scalars(select(User)).all()
+        eq_(len(users), 4)
+        addresses = sess.scalars(select(Address).order_by(Address.id)).all()
+
+        # related objects are present in the identity map
+        def go():
+            eq_([a.user.id for a in addresses], [7, 8, 8, 8, 9])
+
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_m2m(self):
+        items, keywords, item_keywords, Keyword, Item = (
+            self.tables.items,
+            self.tables.keywords,
+            self.tables.item_keywords,
+            self.classes.Keyword,
+            self.classes.Item,
+        )
+
+        self.mapper_registry.map_imperatively(
+            Item,
+            items,
+            properties={
+                "keywords": relationship(
+                    self.mapper_registry.map_imperatively(Keyword, keywords),
+                    secondary=item_keywords,
+                    lazy="batch",
+                    order_by=keywords.c.id,
+                )
+            },
+        )
+
+        sess = fixture_session()
+        items = sess.scalars(select(Item).order_by(Item.id)).all()
+
+        def go():
+            eq_(
+                [[k.id for k in item.keywords] for item in items],
+                [[2, 4, 6], [2, 5, 7], [3, 4, 6], [], []],
+            )
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_batch_per_statement(self):
+        User, Address = self._o2m_fixture()
+
+        sess = fixture_session()
+        u7 = sess.scalars(select(User).where(User.id == 7)).one()
+        others = sess.scalars(select(User).where(User.id != 7)).all()
+
+        def go():
+            eq_([a.id for a in u7.addresses], [1])
+
+        self.assert_sql_count(testing.db, go, 1)
+
+        def go():
+            eq_(sum(len(u.addresses) for u in others), 4)
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_batch_used_once(self):
+        User, Address = self._o2m_fixture()
+
+        sess = fixture_session()
+        users = sess.scalars(select(User).order_by(User.id)).all()
+
+        def go():
+            eq_(users[0].addresses[0].id, 1)
+
+        self.assert_sql_count(testing.db, go, 1)
+
+        sess.expire(users[1], ["addresses"])
+        sess.expire(users[2], ["addresses"])
+
+        # expired attributes are loaded individually
+        def go():
+            eq_([a.id for a in users[1].addresses], [2, 3, 4])
+            eq_([a.id for a in users[2].addresses], [5])
+
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_pending_changes_autoflushed(self):
+        User, Address = self._o2m_fixture()
+
+        sess = fixture_session()
+        users = sess.scalars(select(User).order_by(User.id)).all()
+        sess.add(Address(id=6, user_id=10, email_address="c@c.com"))
+
+        eq_([a.id for a in users[3].addresses], [6])
+        eq_([a.id for a in users[0].addresses], [1])
+
+    def test_siblings_not_retained(self):
+        User, Address = self._o2m_fixture()
+
+        sess = fixture_session()
+        users = sess.scalars(select(User).order_by(User.id)).all()
+        u8 = users[1]
+        state_refs = [
+            weakref.ref(attributes.instance_state(u)) for u in users
+        ]
+        del users
+        gc_collect()
+
+        # the remaining object doesn't keep its siblings alive
+        eq_(
+            [ref() is not None for ref in state_refs],
+            [False, True, False, False],
+        )
+
+        def go():
+            eq_([a.id for a in u8.addresses], [2, 3, 4])
+
+        self.assert_sql_execution(
+            testing.db,
+            go,
+            CompiledSQL(
+                "SELECT addresses.user_id AS addresses_user_id, "
+                "addresses.id AS addresses_id, "
+                "addresses.email_address AS addresses_email_address "
+                "FROM addresses WHERE addresses.user_id "
+                "IN (__[POSTCOMPILE_primary_keys]) ORDER BY addresses.id",
+                [{"primary_keys": [8]}],
+            ),
+        )
+
+
+class LazyLoadTrackerTest(_fixtures.FixtureTest):
+    run_inserts = "once"
+    run_deletes = None
+
+    def _fixture(self, lazy="select"):
+        users, Address, addresses, User = (
+            self.tables.users,
+            self.classes.Address,
+            self.tables.addresses,
+            self.classes.User,
+        )
+
+        self.mapper_registry.map_imperatively(
+            User,
+            users,
+            properties={
+                "addresses": relationship(
+                    Address,
+                    lazy=lazy,
+                    order_by=addresses.c.id,
+                    back_populates="user",
+                ),
+                "name": orm.deferred(users.c.name),
+            },
+        )
+        self.mapper_registry.map_imperatively(
+            Address,
+            addresses,
+            properties={
+                "user": relationship(User, back_populates="addresses")
+            },
+        )
+        return User, Address
+
+    def test_o2m(self):
+        User, Address = self._fixture()
+
+        tracker = orm.LazyLoadTracker()
+        sess = fixture_session(lazy_load_tracker=tracker)
+        for u in sess.scalars(select(User)):
+            u.addresses
+
+        eq_(len(tracker.report()), 1)
+        mapper, key, origin, count = tracker.report()[0]
+        is_(mapper, User.__mapper__)
+        eq_(key, "addresses")
+        eq_(count, 4)
+        is_true(origin.startswith(__file__.rstrip("c")))
+        eq_(tracker.totals(), {(User.__mapper__, "addresses"): 4})
+
+    def test_m2o_identity_map_not_counted(self):
+        User, Address = self._fixture()
+
+        tracker = orm.LazyLoadTracker()
+        sess = fixture_session(lazy_load_tracker=tracker)
+        addresses = sess.scalars(select(Address)).all()
+        for a in addresses:
+            a.user
+
+        # users 7, 8, 9 are each loaded once; the remaining addresses
+        # of user 8 locate it in the identity map
+        eq_(tracker.totals(), {(Address.__mapper__, "user"): 3})
+
+    def test_batch_counted_once(self):
+        User, Address = self._fixture(lazy="batch")
+
+        tracker = orm.LazyLoadTracker()
+        sess = fixture_session(lazy_load_tracker=tracker)
+        for u in sess.scalars(select(User)):
+            u.addresses
+
+        eq_(tracker.totals(), {(User.__mapper__, "addresses"): 1})
+
+    def test_deferred(self):
+        User, Address = self._fixture()
+
+        tracker = orm.LazyLoadTracker()
+        sess = fixture_session(lazy_load_tracker=tracker)
+        for u in sess.scalars(select(User)):
+            u.name
+
+        eq_(tracker.totals(), {(User.__mapper__, "name"): 4})
+
+    def test_origin_per_call_site(self):
+        User, Address = self._fixture()
+
+        tracker = orm.LazyLoadTracker()
+        sess = fixture_session(lazy_load_tracker=tracker)
+        users = sess.scalars(select(User)).all()
+        users[0].addresses
+        for u in users[1:]:
+            u.addresses
+
+        eq_([rec[3] for rec in tracker.report()], [3, 1])
+        eq_(len({rec[2] for rec in tracker.report()}), 2)
+
+    def test_no_origin(self):
+        User, Address = self._fixture()
+
+        tracker = orm.LazyLoadTracker(track_origin=False)
+        sess = fixture_session(lazy_load_tracker=tracker)
+        for u in sess.scalars(select(User)):
+            u.addresses
+
+        eq_(tracker.report(), [(User.__mapper__, "addresses", None, 4)])
+
+        tracker.reset()
+        eq_(tracker.report(), [])
+
+    def test_threshold_warns_once(self):
+        User, Address = self._fixture()
+
+        tracker = orm.LazyLoadTracker(threshold=2)
+        sess = fixture_session(lazy_load_tracker=tracker)
+        users = sess.scalars(select(User)).all()
+
+        users[0].addresses
+        users[1].addresses
+        with expect_warnings(
+            "Attribute User.addresses has been lazy loaded 3 times, "
+            "exceeding the threshold of 2"
+        ):
+            users[2].addresses
+
+        # already warned
+        users[3].addresses
+        eq_(tracker.totals(), {(User.__mapper__, "addresses"): 4})
+
+    def test_threshold_raise(self):
+        User, Address = self._fixture()
+
+        tracker = orm.LazyLoadTracker(threshold=1, raise_on_threshold=True)
+        sess = fixture_session(lazy_load_tracker=tracker)
+        users = sess.scalars(select(User)).all()
+
+        users[0].addresses
+        with expect_raises_message(
+            sa.exc.InvalidRequestError,
+            "Attribute User.addresses has been lazy loaded 2 times",
+        ):
+            users[1].addresses
+
+    def test_assign_to_session(self):
+        User, Address = self._fixture()
+
+        sess = fixture_session()
+        is_(sess.lazy_load_tracker, None)
+        users = sess.scalars(select(User)).all()
+        users[0].addresses
+
+        sess.lazy_load_tracker = tracker = orm.LazyLoadTracker()
+        users[1].addresses
+        eq_(tracker.totals(), {(User.__mapper__, "addresses"): 1})
+
+    def test_scoped_session(self):
+        User, Address = self._fixture()
+
+        tracker = orm.LazyLoadTracker()
+        Session = orm.scoped_session(
+            orm.sessionmaker(testing.db, lazy_load_tracker=tracker)
+        )
+        try:
+            is_(Session.lazy_load_tracker, tracker)
+            is_(Session().lazy_load_tracker, tracker)
+
+            users = Session.scalars(select(User)).all()
+            users[0].addresses
+            eq_(tracker.totals(), {(User.__mapper__, "addresses"): 1})
+
+            Session.lazy_load_tracker = None
+            is_(Session().lazy_load_tracker, None)
+        finally:
+            Session.remove()
+
+
 class GetterStateTest(_fixtures.FixtureTest):
 
     """test lazyloader on non-existent attribute returns
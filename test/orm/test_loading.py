@@ -1,8 +1,20 @@
+from sqlalchemy import Column
+from sqlalchemy import event
 from sqlalchemy import exc
+from sqlalchemy import ForeignKey
+from sqlalchemy import inspect
+from sqlalchemy import Integer
 from sqlalchemy import select
+from sqlalchemy import String
 from sqlalchemy import testing
+from sqlalchemy.orm import exc as orm_exc
+from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import loading
 from sqlalchemy.orm import relationship
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import with_polymorphic
+from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import mock
 from sqlalchemy.testing.assertions import assert_raises
 from sqlalchemy.testing.assertions import assert_raises_message
@@ -92,6 +104,209 @@ class InstancesTest(_fixtures.FixtureTest):
         )
 
 
+class ReadOnlyEntitiesTest(_fixtures.FixtureTest):
+    run_setup_mappers = "once"
+    run_inserts = "once"
+    run_deletes = None
+
+    @classmethod
+    def setup_mappers(cls):
+        cls._setup_stock_mapping()
+
+    def test_columns(self):
+        User = self.classes.User
+
+        s = fixture_session()
+        users = s.scalars(
+            select(User)
+            .order_by(User.id)
+            .execution_options(readonly_entities=True)
+        ).all()
+
+        eq_(
+            [(u.id, u.name) for u in users],
+            [(7, "jack"), (8, "ed"), (9, "fred"), (10, "chuck")],
+        )
+        assert not isinstance(users[0], User)
+        assert isinstance(users[0], loading.ReadOnlyEntity)
+        eq_(type(users[0]).__name__, "User")
+        eq_(len(s.identity_map), 0)
+
+    def test_read_only(self):
+        User = self.classes.User
+
+        s = fixture_session()
+        u1 = s.scalars(
+            select(User)
+            .where(User.id == 7)
+            .execution_options(readonly_entities=True)
+        ).one()
+
+        assert_raises_message(
+            AttributeError,
+            "Can't set attribute 'name' on read-only User object",
+            setattr,
+            u1,
+            "name",
+            "newname",
+        )
+        assert_raises_message(
+            AttributeError,
+            "Can't delete attribute 'name' on read-only User object",
+            delattr,
+            u1,
+            "name",
+        )
+
+        # lazy loaders don't apply
+        assert_raises(AttributeError, getattr, u1, "addresses")
+
+        assert_raises(orm_exc.UnmappedInstanceError, s.add, u1)
+
+    @testing.combinations(joinedload, selectinload, argnames="loader")
+    def test_collection(self, loader):
+        User, Address = self.classes("User", "Address")
+
+        s = fixture_session()
+
+        def go():
+            users = s.scalars(
+                select(User)
+                .options(loader(User.addresses))
+                .order_by(User.id)
+                .execution_options(readonly_entities=True)
+            )
+            eq_(
+                [
+                    (u.id, sorted(a.id for a in u.addresses))
+                    for u in users.unique()
+                ],
+                [(7, [1]), (8, [2, 3, 4]), (9, [5]), (10, [])],
+            )
+
+        self.assert_sql_count(testing.db, go, 1 if loader is joinedload else 2)
+
+    @testing.combinations(joinedload, selectinload, argnames="loader")
+    def test_many_to_one_uniqued(self, loader):
+        User, Address = self.classes("User", "Address")
+
+        s = fixture_session()
+        addresses = s.scalars(
+            select(Address)
+            .options(loader(Address.user))
+            .where(Address.id.in_([2, 3, 4, 5]))
+            .order_by(Address.id)
+            .execution_options(readonly_entities=True)
+        ).all()
+
+        eq_([a.user.id for a in addresses], [8, 8, 8, 9])
+        assert addresses[0].user is addresses[1].user
+        assert addresses[0].user is addresses[2].user
+
+    def test_nested_selectin_shares_identity(self):
+        User, Address = self.classes("User", "Address")
+
+        s = fixture_session()
+        users = s.scalars(
+            select(User)
+            .options(selectinload(User.addresses).selectinload(Address.user))
+            .order_by(User.id)
+            .execution_options(readonly_entities=True)
+        ).all()
+
+        for u in users:
+            for a in u.addresses:
+                assert a.user is u
+
+    def test_no_load_events(self):
+        User = self.classes.User
+
+        canary = mock.Mock()
+        event.listen(User, "load", canary)
+        try:
+            s = fixture_session()
+            s.scalars(
+                select(User).execution_options(readonly_entities=True)
+            ).all()
+            eq_(canary.mock_calls, [])
+
+            s.scalars(select(User)).all()
+            eq_(len(canary.mock_calls), 4)
+        finally:
+            event.remove(User, "load", canary)
+
+    def test_yield_per(self):
+        User = self.classes.User
+
+        s = fixture_session()
+        result = s.execute(
+            select(User)
+            .order_by(User.id)
+            .execution_options(readonly_entities=True, yield_per=2)
+        )
+        eq_(
+            [[u.id for u, in partition] for partition in result.partitions()],
+            [[7, 8], [9, 10]],
+        )
+
+
+class ReadOnlyEntitiesPolymorphicTest(fixtures.DeclarativeMappedTest):
+    @classmethod
+    def setup_classes(cls):
+        Base = cls.DeclarativeBasic
+
+        class Employee(Base):
+            __tablename__ = "employee"
+            id = Column(Integer, primary_key=True)
+            type = Column(String(20))
+            name = Column(String(50))
+
+            __mapper_args__ = {
+                "polymorphic_on": type,
+                "polymorphic_identity": "employee",
+            }
+
+        class Manager(Employee):
+            __tablename__ = "manager"
+            id = Column(ForeignKey("employee.id"), primary_key=True)
+            golf_swing = Column(String(50))
+
+            __mapper_args__ = {"polymorphic_identity": "manager"}
+
+    @classmethod
+    def insert_data(cls, connection):
+        Employee, Manager = cls.classes("Employee", "Manager")
+
+        with Session(connection) as s:
+            s.add_all(
+                [
+                    Employee(id=1, name="e1"),
+                    Manager(id=2, name="m1", golf_swing="fore"),
+                ]
+            )
+            s.commit()
+
+    def test_polymorphic(self):
+        Employee, Manager = self.classes("Employee", "Manager")
+
+        s = fixture_session()
+        e1, m1 = s.scalars(
+            select(with_polymorphic(Employee, "*"))
+            .order_by(Employee.id)
+            .execution_options(readonly_entities=True)
+        ).all()
+
+        employee_cls = inspect(Employee)._readonly_entity_class
+        manager_cls = inspect(Manager)._readonly_entity_class
+
+        assert type(e1) is employee_cls
+        assert type(m1) is manager_cls
+        assert isinstance(m1, employee_cls)
+
+        eq_((e1.id, e1.name), (1, "e1"))
+        eq_((m1.id, m1.name, m1.golf_swing), (2, "m1", "fore"))
+
+
 class MergeResultTest(_fixtures.FixtureTest):
     run_setup_mappers = "once"
     run_inserts = "once"
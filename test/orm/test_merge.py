@@ -27,6 +27,7 @@ from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_warnings
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import in_
+from sqlalchemy.testing import is_
 from sqlalchemy.testing import not_in
 from sqlalchemy.testing.fixtures import fixture_session
 from sqlalchemy.testing.schema import Column
@@ -1688,6 +1689,216 @@ class MergeTest(_fixtures.FixtureTest):
         eq_(sess.query(Address).one(), Address(id=1, email_address="c"))
 
 
+class MergeAllTest(_fixtures.FixtureTest):
+    """Session.merge_all() functionality"""
+
+    run_inserts = "each"
+
+    @classmethod
+    def setup_mappers(cls):
+        User, Address, addresses, users = (
+            cls.classes.User,
+            cls.classes.Address,
+            cls.tables.addresses,
+            cls.tables.users,
+        )
+
+        cls.mapper_registry.map_imperatively(
+            User,
+            users,
+            properties={
+                "addresses": relationship(
+                    Address, backref="user", order_by=addresses.c.id
+                )
+            },
+        )
+        cls.mapper_registry.map_imperatively(Address, addresses)
+
+    def test_batched(self):
+        User = self.classes.User
+
+        sess = fixture_session()
+        users = [
+            User(id=9, name="fred modified"),
+            User(id=7, name="jack modified"),
+            User(id=20, name="new user"),
+        ]
+
+        def go():
+            merged = sess.merge_all(users)
+            eq_(
+                [(u.id, u.name) for u in merged],
+                [(9, "fred modified"), (7, "jack modified"), (20, "new user")],
+            )
+            in_(merged[2], sess.new)
+            in_(merged[0], sess.dirty)
+
+        self.assert_sql_count(testing.db, go, 1)
+
+        sess.commit()
+        eq_(
+            sess.query(User.id, User.name).order_by(User.id).all(),
+            [
+                (7, "jack modified"),
+                (8, "ed"),
+                (9, "fred modified"),
+                (10, "chuck"),
+                (20, "new user"),
+            ],
+        )
+
+    def test_identity_map(self):
+        User = self.classes.User
+
+        sess = fixture_session()
+        u7 = sess.get(User, 7)
+
+        def go():
+            merged = sess.merge_all([User(id=7, name="jack modified")])
+            is_(merged[0], u7)
+
+        self.assert_sql_count(testing.db, go, 0)
+        eq_(u7.name, "jack modified")
+
+    def test_string_identity(self):
+        User = self.classes.User
+
+        sess = fixture_session()
+
+        def go():
+            merged = sess.merge_all(
+                [
+                    User(id="7", name="jack modified"),
+                    User(id="20", name="new user"),
+                ]
+            )
+            in_(merged[1], sess.new)
+            not_in(merged[0], sess.new)
+
+        # the existing user is loaded along with the other identities;
+        # as "20" isn't found, the merge looks for it again
+        self.assert_sql_count(testing.db, go, 2)
+
+        sess.commit()
+        eq_(
+            sess.query(User.id, User.name).order_by(User.id).all(),
+            [
+                (7, "jack modified"),
+                (8, "ed"),
+                (9, "fred"),
+                (10, "chuck"),
+                (20, "new user"),
+            ],
+        )
+
+    def test_same_identity(self):
+        User = self.classes.User
+
+        sess = fixture_session()
+        merged = sess.merge_all(
+            [User(id=7, name="jack 1"), User(id=7, name="jack 2")]
+        )
+        is_(merged[0], merged[1])
+        eq_(merged[0].name, "jack 2")
+
+    def test_cascade_collection(self):
+        User, Address = self.classes.User, self.classes.Address
+
+        sess = fixture_session()
+        users = [
+            User(
+                id=8,
+                name="ed",
+                addresses=[
+                    Address(id=2, email_address="ed modified"),
+                    Address(id=20, email_address="ed new"),
+                ],
+            ),
+            User(
+                id=9,
+                name="fred",
+                addresses=[Address(id=5, email_address="fred modified")],
+            ),
+        ]
+
+        def go():
+            sess.merge_all(users)
+
+        # users, their existing addresses, then address 20
+        self.assert_sql_count(testing.db, go, 3)
+
+        sess.commit()
+        eq_(
+            sess.query(Address.id, Address.user_id, Address.email_address)
+            .order_by(Address.id)
+            .all(),
+            [
+                (1, 7, "jack@bean.com"),
+                (2, 8, "ed modified"),
+                (3, None, "ed@bettyboop.com"),
+                (4, None, "ed@lala.com"),
+                (5, 9, "fred modified"),
+                (20, 8, "ed new"),
+            ],
+        )
+
+    def test_cascade_many_to_one(self):
+        User, Address = self.classes.User, self.classes.Address
+
+        sess = fixture_session()
+        addresses = [
+            Address(
+                id=1,
+                email_address="jack modified",
+                user=User(id=7, name="jack modified"),
+            ),
+            Address(
+                id=5,
+                email_address="fred modified",
+                user=User(id=9, name="fred modified"),
+            ),
+        ]
+
+        def go():
+            merged = sess.merge_all(addresses)
+            eq_(
+                [(a.email_address, a.user.name) for a in merged],
+                [
+                    ("jack modified", "jack modified"),
+                    ("fred modified", "fred modified"),
+                ],
+            )
+
+        # addresses, then users along with User.addresses, which the
+        # backref has populated on the incoming users
+        self.assert_sql_count(testing.db, go, 3)
+
+    def test_loader_options(self):
+        User = self.classes.User
+
+        sess = fixture_session()
+        merged = sess.merge_all(
+            [User(id=8, name="ed")],
+            options=[selectinload(User.addresses)],
+        )
+        eq_(len(merged[0].__dict__["addresses"]), 3)
+
+    def test_no_load(self):
+        User = self.classes.User
+
+        sess = fixture_session()
+        users = sess.query(User).order_by(User.id).all()
+        sess.close()
+
+        sess = fixture_session()
+
+        def go():
+            merged = sess.merge_all(users, load=False)
+            eq_([u.name for u in merged], ["jack", "ed", "fred", "chuck"])
+
+        self.assert_sql_count(testing.db, go, 0)
+
+
 class M2ONoUseGetLoadingTest(fixtures.MappedTest):
     """Merge a one-to-many.  The many-to-one on the other side is set up
     so that use_get is False.   See if skipping the "m2o" merge
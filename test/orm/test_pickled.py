@@ -5,23 +5,29 @@ import sqlalchemy as sa
 from sqlalchemy import ForeignKey
 from sqlalchemy import Integer
 from sqlalchemy import MetaData
+from sqlalchemy import select
 from sqlalchemy import String
 from sqlalchemy import testing
 from sqlalchemy.orm import aliased
 from sqlalchemy.orm import attributes
 from sqlalchemy.orm import clear_mappers
 from sqlalchemy.orm import exc as orm_exc
+from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import lazyload
+from sqlalchemy.orm import loading
 from sqlalchemy.orm import relationship
+from sqlalchemy.orm import selectinload
 from sqlalchemy.orm import state as sa_state
 from sqlalchemy.orm import subqueryload
 from sqlalchemy.orm import with_loader_criteria
 from sqlalchemy.orm import with_polymorphic
 from sqlalchemy.orm.collections import attribute_mapped_collection
 from sqlalchemy.orm.collections import column_mapped_collection
+from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
 from sqlalchemy.testing.fixtures import fixture_session
 from sqlalchemy.testing.pickleable import Address
 from sqlalchemy.testing.pickleable import AddressWMixin
@@ -825,6 +831,58 @@ class TupleLabelTest(_fixtures.FixtureTest):
                 pickle.loads(pickle.dumps(ret, pickled))
 
 
+class ReadOnlyEntitiesTest(_fixtures.FixtureTest):
+    run_setup_mappers = "once"
+    run_inserts = "once"
+    run_deletes = None
+
+    @classmethod
+    def setup_classes(cls):
+        pass
+
+    @classmethod
+    def setup_mappers(cls):
+        users, addresses = cls.tables.users, cls.tables.addresses
+        cls.mapper_registry.map_imperatively(
+            User,
+            users,
+            properties={
+                "addresses": relationship(
+                    Address, backref="user", order_by=addresses.c.id
+                )
+            },
+        )
+        cls.mapper_registry.map_imperatively(Address, addresses)
+
+    def test_pickle(self):
+        sess = fixture_session()
+        u1 = sess.scalars(
+            select(User)
+            .where(User.id == 8)
+            .options(selectinload(User.addresses).joinedload(Address.user))
+            .execution_options(readonly_entities=True)
+        ).one()
+        assert u1.addresses[0].user is u1
+
+        for loads, dumps in picklers():
+            u2 = loads(dumps(u1))
+            is_(type(u2), type(u1))
+            eq_(u2._sa_identity_key, u1._sa_identity_key)
+            eq_((u2.id, u2.name), (8, "ed"))
+            eq_([a.id for a in u2.addresses], [2, 3, 4])
+            assert u2.addresses[0].user is u2
+            assert_raises(AttributeError, setattr, u2, "name", "newname")
+
+    def test_session_get(self):
+        sess = fixture_session()
+        u1 = sess.get(User, 7, execution_options={"readonly_entities": True})
+        assert isinstance(u1, loading.ReadOnlyEntity)
+        eq_(len(sess.identity_map), 0)
+
+        u2 = pickle.loads(pickle.dumps(u1))
+        eq_((u2.id, u2.name), (7, "jack"))
+
+
 class CustomSetupTeardownTest(fixtures.MappedTest):
     @classmethod
     def define_tables(cls, metadata):
@@ -1409,6 +1409,214 @@ class GetTest(QueryTest):
             )
 
 
+class GetManyTest(QueryTest):
+    def test_get_many(self):
+        User = self.classes.User
+
+        s = fixture_session()
+
+        def go():
+            eq_(
+                [u and u.name for u in s.get_many(User, [9, 7, 12, 9])],
+                ["fred", "jack", None, "fred"],
+            )
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_identity_map(self):
+        User = self.classes.User
+
+        s = fixture_session()
+        u7, u8 = s.get(User, 7), s.get(User, 8)
+
+        def go():
+            eq_(s.get_many(User, [8, 7]), [u8, u7])
+
+        self.assert_sql_count(testing.db, go, 0)
+
+        def go():
+            eq_(s.get_many(User, [8, 10, 7]), [u8, s.get(User, 10), u7])
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_expired(self):
+        User = self.classes.User
+
+        s = fixture_session()
+        u7, u8 = s.get(User, 7), s.get(User, 8)
+        s.expire(u7)
+        s.expire(u8)
+
+        def go():
+            eq_(s.get_many(User, [7, 8]), [u7, u8])
+            eq_(u7.name, "jack")
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_populate_existing(self):
+        User = self.classes.User
+
+        s = fixture_session()
+        u7 = s.get(User, 7)
+        u7.name = "modified"
+
+        def go():
+            eq_(s.get_many(User, [7], populate_existing=True), [u7])
+
+        # autoflush, then refresh
+        self.assert_sql_count(testing.db, go, 2)
+        eq_(u7.name, "modified")
+
+    def test_chunksize(self):
+        User = self.classes.User
+
+        s = fixture_session()
+
+        def go():
+            eq_(
+                [u.id for u in s.get_many(User, [10, 9, 8, 7], chunksize=3)],
+                [10, 9, 8, 7],
+            )
+
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_loader_options(self):
+        User = self.classes.User
+
+        s = fixture_session()
+
+        u7, u8 = s.get_many(
+            User, [7, 8], options=[selectinload(User.addresses)]
+        )
+        eq_(len(u7.__dict__["addresses"]), 1)
+        eq_(len(u8.__dict__["addresses"]), 3)
+
+    def test_composite_pk(self):
+        CompositePk = self.classes.CompositePk
+
+        s = fixture_session()
+
+        def go():
+            eq_(
+                [
+                    obj and obj.k
+                    for obj in s.get_many(
+                        CompositePk,
+                        [(2, 1), {"i": 1, "j": 2}, (100, 100)],
+                    )
+                ],
+                [4, 3, None],
+            )
+
+        self.assert_sql_count(testing.db, go, 1)
+
+    def test_string_identities(self):
+        User = self.classes.User
+
+        s = fixture_session()
+
+        def go():
+            eq_(
+                [u and u.name for u in s.get_many(User, ["9", 7, "12", 9])],
+                ["fred", "jack", None, "fred"],
+            )
+
+        self.assert_sql_count(testing.db, go, 1)
+
+        u7 = s.get(User, 7)
+
+        def go():
+            eq_(s.get_many(User, ["7"]), [u7])
+
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_composite_string_identities(self):
+        CompositePk = self.classes.CompositePk
+
+        s = fixture_session()
+        eq_(
+            [obj and obj.k for obj in s.get_many(CompositePk, [("2", 1)])],
+            [4],
+        )
+
+    def test_invalid_string_identity(self):
+        User = self.classes.User
+
+        s = fixture_session()
+        assert_raises(ValueError, s.get_many, User, [7, "seven"])
+
+    def test_identity_token(self):
+        User = self.classes.User
+
+        s = fixture_session()
+
+        def go():
+            u7, u8 = s.get_many(User, [7, 8], identity_token="some_token")
+            eq_(inspect(u7).key, (User, (7,), "some_token"))
+            eq_(inspect(u8).key, (User, (8,), "some_token"))
+            return u7, u8
+
+        u7, u8 = self.assert_sql_count(testing.db, go, 1)
+
+        def go():
+            eq_(
+                s.get_many(User, [8, 7], identity_token="some_token"),
+                [u8, u7],
+            )
+
+        self.assert_sql_count(testing.db, go, 0)
+
+    def test_unmatched_rows(self, metadata, connection):
+        class LowerCase(TypeDecorator):
+            impl = String(10)
+            cache_ok = True
+
+            def process_bind_param(self, value, dialect):
+                return value.lower() if value is not None else None
+
+        table = Table(
+            "lower_case",
+            metadata,
+            Column("id", LowerCase, primary_key=True),
+            Column("data", String(10)),
+        )
+        metadata.create_all(connection)
+        connection.execute(
+            table.insert(),
+            [dict(id="abc", data="d1"), dict(id="def", data="d2")],
+        )
+
+        class Thing(self.classes.Base):
+            pass
+
+        self.mapper_registry.map_imperatively(Thing, table)
+        with Session(connection) as sess:
+
+            def go():
+                eq_(
+                    [
+                        obj and obj.id
+                        for obj in sess.get_many(Thing, ["ABC", "def", "x"])
+                    ],
+                    ["abc", "def", None],
+                )
+
+            # the row for "ABC" isn't matched to it in Python, so "ABC"
+            # and "x" are loaded individually
+            self.assert_sql_count(connection, go, 3)
+
+    def test_composite_pk_wrong_keys(self):
+        CompositePk = self.classes.CompositePk
+
+        s = fixture_session()
+        assert_raises(
+            sa_exc.InvalidRequestError,
+            s.get_many,
+            CompositePk,
+            [(1, 2), {"i": 1, "k": 2}],
+        )
+
+
 class InvalidGenerationsTest(QueryTest, AssertsCompiledSQL):
     @testing.combinations(
         lambda s, User: s.query(User).limit(2),
@@ -2499,6 +2499,105 @@ class ChunkingTest(fixtures.DeclarativeMappedTest):
             ),
         )
 
+    @testing.requires.array_parameters
+    def test_array_keys(self):
+        A, B = self.classes("A", "B")
+
+        session = fixture_session()
+
+        def go():
+            with mock.patch(
+                "sqlalchemy.orm.strategies.SelectInLoader._array_chunksize",
+                60,
+            ):
+                stmt = (
+                    select(A)
+                    .options(selectinload(A.bs))
+                    .order_by(A.id)
+                    .execution_options(selectinload_array_keys=True)
+                )
+
+                for a in session.scalars(stmt):
+                    eq_(a.bs, [B(id=(a.id * 6) + j) for j in range(1, 6)])
+
+        self.assert_sql_execution(
+            testing.db,
+            go,
+            CompiledSQL("SELECT a.id FROM a ORDER BY a.id", {}),
+            CompiledSQL(
+                "SELECT b.a_id AS b_a_id, b.id AS b_id "
+                "FROM b WHERE b.a_id = ANY (:primary_keys) ORDER BY b.id",
+                {"primary_keys": list(range(1, 61))},
+            ),
+            CompiledSQL(
+                "SELECT b.a_id AS b_a_id, b.id AS b_id "
+                "FROM b WHERE b.a_id = ANY (:primary_keys) ORDER BY b.id",
+                {"primary_keys": list(range(61, 101))},
+            ),
+        )
+
+    @testing.requires.array_parameters
+    def test_array_keys_m2o(self):
+        A, B = self.classes("A", "B")
+
+        session = fixture_session()
+
+        def go():
+            stmt = (
+                select(B)
+                .options(selectinload(B.a))
+                .order_by(B.id)
+                .execution_options(selectinload_array_keys=True)
+            )
+
+            for b in session.scalars(stmt):
+                eq_(b.a, A(id=b.a_id))
+
+        self.assert_sql_execution(
+            testing.db,
+            go,
+            CompiledSQL("SELECT b.id, b.a_id FROM b ORDER BY b.id", {}),
+            CompiledSQL(
+                "SELECT a.id AS a_id FROM a WHERE a.id = ANY (:primary_keys)",
+                {"primary_keys": list(range(1, 101))},
+            ),
+        )
+
+    def test_array_keys_not_supported(self):
+        A, B = self.classes("A", "B")
+
+        session = fixture_session()
+
+        def go():
+            with mock.patch.object(
+                testing.db.dialect, "supports_array_parameters", False
+            ):
+                stmt = (
+                    select(A)
+                    .options(selectinload(A.bs))
+                    .where(A.id < 5)
+                    .order_by(A.id)
+                    .execution_options(selectinload_array_keys=True)
+                )
+
+                for a in session.scalars(stmt):
+                    a.bs
+
+        self.assert_sql_execution(
+            testing.db,
+            go,
+            CompiledSQL(
+                "SELECT a.id FROM a WHERE a.id < :id_1 ORDER BY a.id",
+                {"id_1": 5},
+            ),
+            CompiledSQL(
+                "SELECT b.a_id AS b_a_id, b.id AS b_id "
+                "FROM b WHERE b.a_id IN "
+                "(__[POSTCOMPILE_primary_keys]) ORDER BY b.id",
+                {"primary_keys": [1, 2, 3, 4]},
+            ),
+        )
+
 
 class SubRelationFromJoinedSubclassMultiLevelTest(_Polymorphic):
     @classmethod
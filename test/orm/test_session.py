@@ -1991,7 +1991,14 @@ class SessionInterface(fixtures.MappedTest):
     def _public_session_methods(self):
         Session = sa.orm.session.Session
 
-        blocklist = {"begin", "query", "bind_mapper", "get", "bind_table"}
+        blocklist = {
+            "begin",
+            "query",
+            "bind_mapper",
+            "get",
+            "get_many",
+            "bind_table",
+        }
         specials = {"__iter__", "__contains__"}
         ok = set()
         for name in dir(Session):
@@ -2053,6 +2060,7 @@ class SessionInterface(fixtures.MappedTest):
             raises_(name, user_arg)
 
         raises_("add_all", (user_arg,))
+        raises_("merge_all", (user_arg,))
 
         # flush will no-op without something in the unit of work
         def _():
@@ -1,5 +1,7 @@
 import contextlib
 import datetime
+from unittest.mock import call
+from unittest.mock import Mock
 from unittest.mock import patch
 import uuid
 
@@ -500,6 +502,73 @@ class VersioningTest(fixtures.MappedTest):
             ):
                 s1.flush()
 
+    @testing.requires.sane_rowcount
+    def test_update_delete_pipelined(self):
+        canary = Mock()
+
+        class MockPipeline:
+            def __enter__(self):
+                canary.enter()
+                return self
+
+            def __exit__(self, type_, value, traceback):
+                canary.exit(type_)
+
+            def sync(self):
+                canary.sync()
+
+        dialect = config.db.dialect
+        with patch.object(dialect, "supports_pipeline", True), patch.object(
+            dialect, "use_pipeline_for_flush", True
+        ), patch.object(
+            dialect, "do_pipeline", lambda dbapi_connection: MockPipeline()
+        ), patch.object(
+            dialect, "supports_sane_rowcount_returning", True
+        ), patch.object(
+            dialect, "supports_sane_multi_rowcount", False
+        ):
+            Foo = self.classes.Foo
+            s1 = self._fixture()
+            f1 = Foo(value="f1")
+            f2 = Foo(value="f2")
+            s1.add_all((f1, f2))
+            s1.commit()
+            eq_(canary.mock_calls, [])
+
+            f1.value = "f1rev2"
+            f2.value = "f2rev2"
+            s1.commit()
+            eq_(canary.mock_calls, [call.enter(), call.exit(None)])
+            eq_((f1.version_id, f2.version_id), (2, 2))
+
+            s2 = fixture_session()
+            s2.get(Foo, f1.id).value = "f1rev3"
+            s2.commit()
+
+            f1.value = "f1rev3mine"
+            f2.value = "f2rev3"
+            assert_raises_message(
+                sa.orm.exc.StaleDataError,
+                r"UPDATE statement on table 'version_table' expected "
+                r"to update 2 row\(s\); 1 were matched.",
+                s1.commit,
+            )
+            s1.rollback()
+
+            f2_id = f2.id
+            s1.delete(f2)
+            s2.get(Foo, f2_id).value = "f2rev4"
+            s2.commit()
+
+            canary.reset_mock()
+            assert_raises_message(
+                sa.orm.exc.StaleDataError,
+                r"DELETE statement on table 'version_table' expected "
+                r"to delete 1 row\(s\); 0 were matched.",
+                s1.commit,
+            )
+            eq_(canary.mock_calls, [call.enter(), call.exit(None)])
+
     @engines.close_open_connections
     def test_noversioncheck(self):
         """test query.with_lockmode works when the mapper has no version id
@@ -324,6 +324,16 @@ class DefaultRequirements(SuiteRequirements):
             ["mysql", "mariadb", "postgresql", _sqlite_tuple_in, "oracle"]
         )
 
+    @property
+    def array_parameters(self):
+        """target dialect accepts a Python list as the value of a single
+        ARRAY bound parameter, e.g. for ``column = ANY (:param)``."""
+
+        return only_if(
+            lambda config: config.db.dialect.supports_array_parameters,
+            "dialect does not support array parameters",
+        )
+
     @property
     def tuple_in_w_empty(self):
         return self.tuple_in + skip_if(["oracle"])
@@ -4770,6 +4770,270 @@ class BindParameterTest(AssertsCompiledSQL, fixtures.TestBase):
             checkparams={"foo_1": 1, "foo_2": 2, "foo_3": 3},
         )
 
+    @testing.combinations(
+        ([1], [1]),
+        ([1, 2], [1, 2]),
+        ([1, 2, 3], [1, 2, 3, 3]),
+        ([1, 2, 3, 4], [1, 2, 3, 4]),
+        ([1, 2, 3, 4, 5], [1, 2, 3, 4, 5, 5, 5, 5]),
+        ((1, 2, 3), [1, 2, 3, 3]),
+        argnames="values, expected",
+    )
+    def test_pad_expanding_parameter(self, values, expected):
+        compiled = table1.c.myid.in_(
+            bindparam("foo", expanding=True)
+        ).compile()
+
+        state = compiled._process_parameters_for_postcompile(
+            {"foo": values}, _pad_expanding=True
+        )
+
+        keys = ["foo_%d" % i for i in range(1, len(expected) + 1)]
+        eq_(
+            state.statement,
+            "mytable.myid IN (%s)"
+            % ", ".join(":%s" % key for key in keys),
+        )
+        eq_(state.additional_parameters, dict(zip(keys, expected)))
+        eq_(state.parameter_expansion, {"foo": keys})
+
+    def test_pad_expanding_parameter_empty(self):
+        compiled = table1.c.myid.in_(
+            bindparam("foo", expanding=True)
+        ).compile()
+
+        for i in range(2):
+            state = compiled._process_parameters_for_postcompile(
+                {"foo": []}, _pad_expanding=True
+            )
+            eq_(
+                state.statement,
+                "mytable.myid IN (NULL) AND (1 != 1)",
+            )
+            eq_(state.additional_parameters, {})
+        eq_(list(compiled._post_compile_cache), [(0,)])
+
+    def test_pad_expanding_parameter_cached(self):
+        compiled = and_(
+            table1.c.myid.in_(bindparam("foo", expanding=True)),
+            table1.c.name.in_(bindparam("bar", expanding=True)),
+            table1.c.description == bindparam("bat"),
+        ).compile()
+
+        first = compiled._process_parameters_for_postcompile(
+            {"foo": [1, 2, 3], "bar": ["a"], "bat": "x"}, _pad_expanding=True
+        )
+        second = compiled._process_parameters_for_postcompile(
+            {"foo": [4, 5, 6, 7], "bar": ["b"], "bat": "y"},
+            _pad_expanding=True,
+        )
+        third = compiled._process_parameters_for_postcompile(
+            {"foo": [8, 9], "bar": ["c"], "bat": "z"}, _pad_expanding=True
+        )
+
+        is_(second.statement, first.statement)
+        eq_(
+            second.additional_parameters,
+            {
+                "foo_1": 4,
+                "foo_2": 5,
+                "foo_3": 6,
+                "foo_4": 7,
+                "bar_1": "b",
+                "bat": "y",
+            },
+        )
+        eq_(
+            third.statement,
+            "mytable.myid IN (:foo_1, :foo_2) AND mytable.name IN (:bar_1) "
+            "AND mytable.description = :bat",
+        )
+        eq_(len(compiled._post_compile_cache), 2)
+
+    def test_pad_expanding_parameter_tuple(self):
+        compiled = tuple_(table1.c.myid, table1.c.name).in_(
+            bindparam("foo", expanding=True)
+        ).compile()
+
+        for values in [(1, "a"), (2, "b"), (3, "c")], [(4, "d"), (5, "e")]:
+            state = compiled._process_parameters_for_postcompile(
+                {"foo": values}, _pad_expanding=True
+            )
+
+        eq_(
+            state.statement,
+            "(mytable.myid, mytable.name) IN "
+            "((:foo_1_1, :foo_1_2), (:foo_2_1, :foo_2_2))",
+        )
+        eq_(
+            state.additional_parameters,
+            {"foo_1_1": 4, "foo_1_2": "d", "foo_2_1": 5, "foo_2_2": "e"},
+        )
+
+        state = compiled._process_parameters_for_postcompile(
+            {"foo": [(6, "f"), (7, "g"), (8, "h")]}, _pad_expanding=True
+        )
+        eq_(
+            state.additional_parameters,
+            {
+                "foo_1_1": 6,
+                "foo_1_2": "f",
+                "foo_2_1": 7,
+                "foo_2_2": "g",
+                "foo_3_1": 8,
+                "foo_3_2": "h",
+                "foo_4_1": 8,
+                "foo_4_2": "h",
+            },
+        )
+        eq_(len(compiled._post_compile_cache), 2)
+
+    def test_pad_expanding_parameter_literal_execute(self):
+        compiled = and_(
+            table1.c.myid.in_(bindparam("foo", expanding=True)),
+            table1.c.myid != bindparam("bar", literal_execute=True),
+        ).compile()
+
+        state = compiled._process_parameters_for_postcompile(
+            {"foo": [1, 2, 3], "bar": 5}, _pad_expanding=True
+        )
+        eq_(
+            state.statement,
+            "mytable.myid IN (:foo_1, :foo_2, :foo_3, :foo_4) "
+            "AND mytable.myid != 5",
+        )
+        eq_(list(compiled._post_compile_cache), [(4, "5")])
+        is_(
+            compiled._process_parameters_for_postcompile(
+                {"foo": [4, 5, 6, 7], "bar": 5}, _pad_expanding=True
+            ).statement,
+            state.statement,
+        )
+
+    def test_post_compile_cached(self):
+        compiled = and_(
+            table1.c.myid.in_(bindparam("foo", expanding=True)),
+            table1.c.name == bindparam("bar"),
+        ).compile(dialect=default.DefaultDialect(paramstyle="qmark"))
+
+        first = compiled._process_parameters_for_postcompile(
+            {"foo": [1, 2, 3], "bar": "a"}
+        )
+        second = compiled._process_parameters_for_postcompile(
+            {"foo": [4, 5, 6], "bar": "b"}
+        )
+        third = compiled._process_parameters_for_postcompile(
+            {"foo": [7, 8], "bar": "c"}
+        )
+
+        eq_(first.statement, "mytable.myid IN (?, ?, ?) AND mytable.name = ?")
+        is_(second.statement, first.statement)
+        is_(second.positiontup, first.positiontup)
+        eq_(second.positiontup, ["foo_1", "foo_2", "foo_3", "bar"])
+        eq_(
+            second.additional_parameters,
+            {"foo_1": 4, "foo_2": 5, "foo_3": 6, "bar": "b"},
+        )
+        eq_(second.parameter_expansion, {"foo": ["foo_1", "foo_2", "foo_3"]})
+        eq_(third.statement, "mytable.myid IN (?, ?) AND mytable.name = ?")
+        eq_(third.positiontup, ["foo_1", "foo_2", "bar"])
+        eq_(len(compiled._post_compile_cache), 2)
+
+    def test_post_compile_cached_literal_execute(self):
+        compiled = and_(
+            table1.c.myid.in_(bindparam("foo", literal_execute=True)),
+            table1.c.myid != bindparam("bar", literal_execute=True),
+        ).compile()
+
+        for foo, bar, expected in [
+            ([1, 2], 5, "mytable.myid IN (1, 2) AND mytable.myid != 5"),
+            ([1, 2], 5, "mytable.myid IN (1, 2) AND mytable.myid != 5"),
+            ([1, 3], 5, "mytable.myid IN (1, 3) AND mytable.myid != 5"),
+            ([1, 2], 6, "mytable.myid IN (1, 2) AND mytable.myid != 6"),
+        ]:
+            state = compiled._process_parameters_for_postcompile(
+                {"foo": foo, "bar": bar}
+            )
+            eq_(state.statement, expected)
+            eq_(state.additional_parameters, {})
+        eq_(len(compiled._post_compile_cache), 3)
+
+    def test_post_compile_cached_literal_execute_rendered(self):
+        """literal_execute values that compare as equal but render
+        differently don't share a cached statement"""
+
+        compiled = (
+            column("q", Numeric(10, 2))
+            == bindparam("foo", literal_execute=True, type_=Numeric(10, 2))
+        ).compile()
+
+        for foo, expected in [
+            (decimal.Decimal("1.0"), "q = 1.0"),
+            (decimal.Decimal("1.00"), "q = 1.00"),
+            (decimal.Decimal("1.0"), "q = 1.0"),
+            (1, "q = 1"),
+            (True, "q = True"),
+        ]:
+            state = compiled._process_parameters_for_postcompile(
+                {"foo": foo}
+            )
+            eq_(state.statement, expected)
+        eq_(len(compiled._post_compile_cache), 4)
+
+    def test_post_compile_cached_literal_execute_tuple(self):
+        compiled = tuple_(table1.c.myid, table1.c.name).in_(
+            bindparam("foo", literal_execute=True)
+        ).compile()
+
+        state = compiled._process_parameters_for_postcompile(
+            {"foo": [(1, "a"), (2, "b")]}
+        )
+        eq_(
+            state.statement,
+            "(mytable.myid, mytable.name) IN ((1, 'a'), (2, 'b'))",
+        )
+        eq_(
+            list(compiled._post_compile_cache),
+            [("(1, 'a'), (2, 'b')",)],
+        )
+
+    def test_post_compile_cache_size(self):
+        compiled = table1.c.myid.in_(
+            bindparam("foo", expanding=True)
+        ).compile()
+        compiled._post_compile_cache_size = 3
+
+        for size in range(1, 6):
+            state = compiled._process_parameters_for_postcompile(
+                {"foo": list(range(size))}
+            )
+            eq_(
+                state.parameter_expansion["foo"],
+                ["foo_%d" % i for i in range(1, size + 1)],
+            )
+        eq_(list(compiled._post_compile_cache), [(3,), (4,), (5,)])
+
+        # the least recently used shape is pruned
+        compiled._process_parameters_for_postcompile({"foo": [1, 2, 3]})
+        for size in range(6, 8):
+            compiled._process_parameters_for_postcompile(
+                {"foo": list(range(size))}
+            )
+        eq_(list(compiled._post_compile_cache), [(3,), (6,), (7,)])
+
+    def test_post_compile_cache_max_length(self):
+        compiled = table1.c.myid.in_(
+            bindparam("foo", expanding=True)
+        ).compile()
+        compiled._post_compile_cache_max_length = 50
+
+        for size in (2, 10, 2, 10):
+            state = compiled._process_parameters_for_postcompile(
+                {"foo": list(range(size))}
+            )
+            eq_(len(state.parameter_expansion["foo"]), size)
+        eq_(list(compiled._post_compile_cache), [(2,)])
+
     @testing.combinations(
         (
             select(table1.c.myid).where(
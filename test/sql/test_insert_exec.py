@@ -1,10 +1,12 @@
 from sqlalchemy import and_
+from sqlalchemy import event
 from sqlalchemy import exc
 from sqlalchemy import ForeignKey
 from sqlalchemy import func
 from sqlalchemy import INT
 from sqlalchemy import Integer
 from sqlalchemy import literal
+from sqlalchemy import select
 from sqlalchemy import Sequence
 from sqlalchemy import sql
 from sqlalchemy import String
@@ -14,6 +16,7 @@ from sqlalchemy.testing import assert_raises_message
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_not
 from sqlalchemy.testing import mock
 from sqlalchemy.testing.schema import Column
 from sqlalchemy.testing.schema import Table
@@ -690,3 +693,253 @@ class TableInsertTest(fixtures.TablesTest):
             table=t,
             parameters=dict(id=None, data="data", x=5),
         )
+
+
+class InsertManyValuesTest(fixtures.RemovesEvents, fixtures.TablesTest):
+    __backend__ = True
+    __requires__ = ("insert_executemany_returning",)
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "data",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("x", String(50)),
+            Column("y", String(50)),
+            Column("z", Integer, server_default="5"),
+        )
+
+    def _capture_statements(self, connection):
+        statements = []
+
+        @event.listens_for(connection, "before_cursor_execute")
+        def before_cursor_execute(
+            conn, cursor, statement, parameters, context, executemany
+        ):
+            statements.append((statement, parameters))
+
+        return statements
+
+    @testing.combinations(True, False, argnames="use_returning")
+    def test_paging(self, connection, use_returning):
+        t = self.tables.data
+        statements = self._capture_statements(connection)
+
+        stmt = t.insert()
+        if use_returning:
+            stmt = stmt.returning(t.c.x, t.c.z)
+        else:
+            stmt = stmt.return_defaults()
+
+        result = connection.execution_options(
+            insertmanyvalues_page_size=4
+        ).execute(stmt, [{"x": "d%d" % i, "y": "y%d" % i} for i in range(10)])
+
+        eq_(len(statements), 3)
+        eq_(result.rowcount, 10)
+
+        if use_returning:
+            eq_(result.all(), [("d%d" % i, 5) for i in range(10)])
+        else:
+            eq_(
+                result.inserted_primary_key_rows,
+                [(i,) for i in range(1, 11)],
+            )
+            eq_(
+                [row._mapping for row in result.returned_defaults_rows],
+                [{"id": i, "z": 5} for i in range(1, 11)],
+            )
+
+        eq_(
+            connection.execute(select(t.c.x).order_by(t.c.id)).all(),
+            [("d%d" % i,) for i in range(10)],
+        )
+
+    def test_page_size_from_dialect(self, connection):
+        t = self.tables.data
+        statements = self._capture_statements(connection)
+
+        with mock.patch.object(
+            connection.dialect, "insertmanyvalues_page_size", 3
+        ):
+            result = connection.execute(
+                t.insert().returning(t.c.id),
+                [{"x": "d%d" % i} for i in range(7)],
+            )
+        eq_(result.all(), [(i,) for i in range(1, 8)])
+        eq_(len(statements), 3)
+
+    def test_page_size_limited_by_max_parameters(self, connection):
+        t = self.tables.data
+        statements = self._capture_statements(connection)
+
+        with mock.patch.object(
+            connection.dialect, "insertmanyvalues_max_parameters", 5
+        ):
+            result = connection.execute(
+                t.insert().returning(t.c.id),
+                [{"x": "d%d" % i, "y": "y%d" % i} for i in range(5)],
+            )
+        eq_(result.all(), [(i,) for i in range(1, 6)])
+
+        # two parameters per row, five parameters total per statement
+        eq_(len(statements), 3)
+
+    def test_not_used_without_returning(self, connection):
+        t = self.tables.data
+        statements = self._capture_statements(connection)
+
+        connection.execute(t.insert(), [{"x": "d%d" % i} for i in range(5)])
+
+        if connection.dialect.use_insertmanyvalues_wo_returning:
+            eq_(len(statements), 1)
+            assert "VALUES (" in statements[0][0]
+        else:
+            eq_(statements, [(mock.ANY, mock.ANY)])
+            eq_(len(statements[0][1]), 5)
+
+
+class InsertManyValuesCompileTest(fixtures.TestBase):
+    def _dialect(self, paramstyle):
+        from sqlalchemy.engine import default
+
+        dialect = default.DefaultDialect(paramstyle=paramstyle)
+        dialect.insert_returning = True
+        dialect.supports_multivalues_insert = True
+        dialect.use_insertmanyvalues = True
+        return dialect
+
+    def _table(self):
+        return sql.table(
+            "t", sql.column("id", Integer), sql.column("x", String)
+        )
+
+    @testing.combinations(
+        (
+            "qmark",
+            "INSERT INTO t (id, x) VALUES (?, ?), (?, ?), (?, ?) "
+            "RETURNING t.id",
+            (1, "a", 2, "b", 3, "c"),
+        ),
+        (
+            "format",
+            "INSERT INTO t (id, x) VALUES (%s, %s), (%s, %s), (%s, %s) "
+            "RETURNING t.id",
+            (1, "a", 2, "b", 3, "c"),
+        ),
+        (
+            "named",
+            "INSERT INTO t (id, x) VALUES (:id__0, :x__0), "
+            "(:id__1, :x__1), (:id__2, :x__2) RETURNING t.id",
+            {
+                "id__0": 1,
+                "x__0": "a",
+                "id__1": 2,
+                "x__1": "b",
+                "id__2": 3,
+                "x__2": "c",
+            },
+        ),
+        (
+            "pyformat",
+            "INSERT INTO t (id, x) VALUES (%(id__0)s, %(x__0)s), "
+            "(%(id__1)s, %(x__1)s), (%(id__2)s, %(x__2)s) RETURNING t.id",
+            {
+                "id__0": 1,
+                "x__0": "a",
+                "id__1": 2,
+                "x__1": "b",
+                "id__2": 3,
+                "x__2": "c",
+            },
+        ),
+        argnames="paramstyle, expected_stmt, expected_params",
+    )
+    def test_batches(self, paramstyle, expected_stmt, expected_params):
+        dialect = self._dialect(paramstyle)
+        t = self._table()
+
+        compiled = t.insert().returning(t.c.id).compile(
+            dialect=dialect, column_keys=["id", "x"], for_executemany=True
+        )
+        is_not(compiled._insertmanyvalues, None)
+
+        if dialect.positional:
+            parameters = [(1, "a"), (2, "b"), (3, "c"), (4, "d")]
+        else:
+            parameters = [
+                {"id": 1, "x": "a"},
+                {"id": 2, "x": "b"},
+                {"id": 3, "x": "c"},
+                {"id": 4, "x": "d"},
+            ]
+
+        batches = list(
+            compiled._deliver_insertmanyvalues_batches(
+                compiled.string, parameters, 3
+            )
+        )
+        eq_(len(batches), 2)
+        eq_(batches[0].replaced_statement, expected_stmt)
+        eq_(batches[0].replaced_parameters, expected_params)
+        eq_(
+            [(b.batch_size, b.batchnum, b.total_batches) for b in batches],
+            [(3, 1, 2), (1, 2, 2)],
+        )
+
+    def test_not_for_single_execute(self):
+        dialect = self._dialect("qmark")
+        t = self._table()
+
+        compiled = t.insert().returning(t.c.id).compile(
+            dialect=dialect, column_keys=["id", "x"]
+        )
+        is_(compiled._insertmanyvalues, None)
+
+    def test_not_without_returning(self):
+        dialect = self._dialect("qmark")
+        t = self._table()
+
+        compiled = t.insert().compile(
+            dialect=dialect, column_keys=["id", "x"], for_executemany=True
+        )
+        is_(compiled._insertmanyvalues, None)
+
+        dialect.use_insertmanyvalues_wo_returning = True
+        compiled = t.insert().compile(
+            dialect=dialect, column_keys=["id", "x"], for_executemany=True
+        )
+        is_not(compiled._insertmanyvalues, None)
+
+    def test_single_row_with_params_outside_values(self):
+        dialect = self._dialect("qmark")
+        t = self._table()
+
+        compiled = (
+            t.insert()
+            .returning(t.c.id, literal("q"))
+            .compile(
+                dialect=dialect,
+                column_keys=["id", "x"],
+                for_executemany=True,
+            )
+        )
+        is_(compiled._insertmanyvalues.single_row_only, True)
+
+        parameters = [(1, "a", "q"), (2, "b", "q")]
+        batches = list(
+            compiled._deliver_insertmanyvalues_batches(
+                compiled.string, parameters, 1000
+            )
+        )
+        eq_(
+            [
+                (b.replaced_statement, b.replaced_parameters, b.batchnum)
+                for b in batches
+            ],
+            [
+                (compiled.string, (1, "a", "q"), 1),
+                (compiled.string, (2, "b", "q"), 2),
+            ],
+        )
@@ -822,6 +822,81 @@ class QueryTest(fixtures.TablesTest):
 
         eq_(len(compiled._bind_processors), 1)
 
+    def test_expanding_in_padded(self, connection):
+        users = self.tables.users
+        connection.execute(
+            users.insert(),
+            [
+                dict(user_id=7, user_name="jack"),
+                dict(user_id=8, user_name="fred"),
+                dict(user_id=9, user_name="ed"),
+            ],
+        )
+
+        stmt = (
+            select(users)
+            .where(users.c.user_name.in_(bindparam("uname", expanding=True)))
+            .order_by(users.c.user_id)
+            .execution_options(pad_expanding_parameters=True)
+        )
+
+        for names, expected in [
+            (["jack", "fred", "ed"], [(7, "jack"), (8, "fred"), (9, "ed")]),
+            (["fred", "ed", "jack"], [(7, "jack"), (8, "fred"), (9, "ed")]),
+            (["ed", "jack"], [(7, "jack"), (9, "ed")]),
+            (["fred"], [(8, "fred")]),
+            ([], []),
+        ]:
+            eq_(
+                connection.execute(stmt, {"uname": names}).fetchall(),
+                expected,
+            )
+
+        stmt = (
+            select(users)
+            .where(
+                users.c.user_name.not_in(bindparam("uname", expanding=True))
+            )
+            .order_by(users.c.user_id)
+            .execution_options(pad_expanding_parameters=True)
+        )
+        eq_(
+            connection.execute(
+                stmt, {"uname": ["jack", "fred", "bob"]}
+            ).fetchall(),
+            [(9, "ed")],
+        )
+
+    @testing.requires.tuple_in
+    def test_expanding_in_composite_padded(self, connection):
+        users = self.tables.users
+        connection.execute(
+            users.insert(),
+            [
+                dict(user_id=7, user_name="jack"),
+                dict(user_id=8, user_name="fred"),
+                dict(user_id=9, user_name="ed"),
+            ],
+        )
+
+        stmt = (
+            select(users)
+            .where(
+                tuple_(users.c.user_id, users.c.user_name).in_(
+                    bindparam("uname", expanding=True)
+                )
+            )
+            .order_by(users.c.user_id)
+            .execution_options(pad_expanding_parameters=True)
+        )
+
+        eq_(
+            connection.execute(
+                stmt, {"uname": [(7, "jack"), (8, "ed"), (9, "ed")]}
+            ).fetchall(),
+            [(7, "jack"), (9, "ed")],
+        )
+
     @testing.skip_if(["mssql"])
     def test_bind_in(self, connection):
         """test calling IN against a bind parameter.
@@ -1,3 +1,4 @@
+import array
 import collections
 import collections.abc as collections_abc
 from contextlib import contextmanager
@@ -11,7 +12,9 @@ from unittest.mock import patch
 from sqlalchemy import CHAR
 from sqlalchemy import column
 from sqlalchemy import exc
+from sqlalchemy import event
 from sqlalchemy import exc as sa_exc
+from sqlalchemy import false
 from sqlalchemy import ForeignKey
 from sqlalchemy import func
 from sqlalchemy import INT
@@ -50,9 +53,11 @@ from sqlalchemy.testing import engines
 from sqlalchemy.testing import eq_
 from sqlalchemy.testing import expect_raises
 from sqlalchemy.testing import expect_raises_message
+from sqlalchemy.testing import expect_warnings
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import in_
 from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_false
 from sqlalchemy.testing import is_true
 from sqlalchemy.testing import le_
 from sqlalchemy.testing import mock
@@ -3055,6 +3060,310 @@ class AlternateCursorResultTest(fixtures.TablesTest):
                 r.close()
 
 
+class PrefetchCursorResultTest(fixtures.TablesTest):
+    __requires__ = ("sqlite",)
+
+    @classmethod
+    def setup_bind(cls):
+        cls.engine = engine = engines.testing_engine(
+            "sqlite://",
+            options={
+                "scope": "class",
+                "connect_args": {"check_same_thread": False},
+            },
+        )
+
+        # pysqlite connections may be used from other threads given
+        # check_same_thread=False
+        engine.dialect.supports_threaded_fetch = True
+
+        @event.listens_for(engine, "connect")
+        def connect(dbapi_connection, connection_record):
+            def fail_at(x, y):
+                if x == y:
+                    raise ValueError("failed at %d" % y)
+                return x
+
+            dbapi_connection.create_function("fail_at", 2, fail_at)
+
+        return engine
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "test",
+            metadata,
+            Column("x", Integer, primary_key=True),
+            Column("y", String(50)),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(
+            cls.tables.test.insert(),
+            [{"x": i, "y": "t_%d" % i} for i in range(1, 101)],
+        )
+
+    @testing.fixture
+    def prefetch_connection(self):
+        with self.engine.connect() as conn:
+            yield conn.execution_options(prefetch_batches=2, max_row_buffer=10)
+
+    def test_strategy_selected(self, prefetch_connection):
+        table = self.tables.test
+
+        result = prefetch_connection.execute(select(table))
+        assert isinstance(
+            result.cursor_strategy, _cursor.PrefetchingCursorFetchStrategy
+        )
+        eq_(len(result.cursor_strategy._rowbuffer), 10)
+        eq_(result.cursor_strategy._prefetcher.queue.maxsize, 2)
+        result.close()
+
+        result = prefetch_connection.execute(
+            text("select x, y from test order by x")
+        )
+        assert isinstance(
+            result.cursor_strategy, _cursor.PrefetchingCursorFetchStrategy
+        )
+        eq_(result.all(), [(i, "t_%d" % i) for i in range(1, 101)])
+
+        result = prefetch_connection.execution_options(
+            prefetch_batches=None
+        ).execute(select(table))
+        is_(result.cursor_strategy, _cursor._DEFAULT_FETCH)
+        result.close()
+
+    def test_no_rows_returned(self, prefetch_connection):
+        table = self.tables.test
+
+        result = prefetch_connection.execute(
+            table.update().where(table.c.x == 1).values(y="x")
+        )
+        eq_(result.rowcount, 1)
+
+        result = prefetch_connection.execute(select(table).where(false()))
+        is_(result.cursor_strategy._prefetcher, None)
+        eq_(result.all(), [])
+
+    @testing.combinations(
+        "fetchone", "fetchmany", "fetchall", "iterate", argnames="fetch_style"
+    )
+    def test_fetch(self, prefetch_connection, fetch_style):
+        table = self.tables.test
+
+        result = prefetch_connection.execute(select(table).order_by(table.c.x))
+
+        if fetch_style == "fetchone":
+            rows = []
+            while True:
+                row = result.fetchone()
+                if row is None:
+                    break
+                rows.append(row)
+        elif fetch_style == "fetchmany":
+            rows = []
+            while True:
+                chunk = result.fetchmany(7)
+                if not chunk:
+                    break
+                le_(len(chunk), 7)
+                rows.extend(chunk)
+        elif fetch_style == "fetchall":
+            result.fetchone()
+            rows = [(1, "t_1")] + result.fetchall()
+        elif fetch_style == "iterate":
+            rows = list(result)
+        else:
+            assert False
+
+        eq_(rows, [(i, "t_%d" % i) for i in range(1, 101)])
+        is_(result.cursor_strategy, _cursor._NO_CURSOR_DQL)
+
+    def test_partitions(self, prefetch_connection):
+        table = self.tables.test
+
+        result = prefetch_connection.execute(select(table).order_by(table.c.x))
+        eq_(
+            [len(partition) for partition in result.partitions(15)],
+            [15] * 6 + [10],
+        )
+
+    def test_yield_per(self, prefetch_connection):
+        table = self.tables.test
+
+        result = prefetch_connection.execute(
+            select(table).order_by(table.c.x)
+        ).yield_per(25)
+        eq_(result.cursor_strategy._prefetcher.batch_size, 25)
+        eq_(
+            [len(partition) for partition in result.partitions()],
+            [25] * 4,
+        )
+
+    def test_close_stops_thread(self, prefetch_connection):
+        table = self.tables.test
+
+        result = prefetch_connection.execute(select(table))
+        result.fetchone()
+        prefetcher = result.cursor_strategy._prefetcher
+        is_true(prefetcher.thread.is_alive())
+
+        result.close()
+        is_false(prefetcher.thread.is_alive())
+        self._assert_result_closed(result)
+
+    def test_threaded_fetch_not_supported(self, prefetch_connection):
+        table = self.tables.test
+
+        with mock.patch.object(
+            prefetch_connection.dialect, "supports_threaded_fetch", False
+        ), expect_warnings(
+            "The sqlite dialect does not support fetching rows in a "
+            "background thread"
+        ):
+            result = prefetch_connection.execute(
+                select(table).order_by(table.c.x)
+            )
+        assert isinstance(
+            result.cursor_strategy, _cursor.BufferedRowCursorFetchStrategy
+        )
+        eq_(result.all(), [(i, "t_%d" % i) for i in range(1, 101)])
+
+    def test_error_in_thread(self, prefetch_connection):
+        table = self.tables.test
+
+        result = prefetch_connection.execute(
+            select(table.c.x, func.fail_at(table.c.x, 35)).order_by(
+                table.c.x
+            )
+        )
+        eq_(len(result.fetchmany(30)), 30)
+        with expect_raises_message(
+            exc.OperationalError, "user-defined function raised exception"
+        ):
+            result.fetchmany(10)
+
+    def _assert_result_closed(self, r):
+        assert_raises_message(
+            sa_exc.ResourceClosedError, "object is closed", r.fetchone
+        )
+
+
+class ColumnarCursorResultTest(fixtures.TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        class Prefixed(TypeDecorator):
+            impl = String(50)
+            cache_ok = True
+
+            def process_result_value(self, value, dialect):
+                return "p_" + value if value is not None else None
+
+        Table(
+            "test",
+            metadata,
+            Column("x", Integer, primary_key=True, autoincrement=False),
+            Column("y", Prefixed),
+            Column("z", Integer),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(
+            cls.tables.test.insert(),
+            [
+                {"x": i, "y": "t_%d" % i, "z": i * 10 if i % 5 else None}
+                for i in range(1, 13)
+            ],
+        )
+
+    def test_partitions_columnar(self, connection):
+        table = self.tables.test
+
+        result = connection.execute(select(table).order_by(table.c.x))
+
+        partitions = list(result.partitions_columnar(5))
+        eq_(
+            [[list(col) for col in partition] for partition in partitions],
+            [
+                [
+                    [1, 2, 3, 4, 5],
+                    ["p_t_%d" % i for i in range(1, 6)],
+                    [10, 20, 30, 40, None],
+                ],
+                [
+                    [6, 7, 8, 9, 10],
+                    ["p_t_%d" % i for i in range(6, 11)],
+                    [60, 70, 80, 90, None],
+                ],
+                [[11, 12], ["p_t_11", "p_t_12"], [110, 120]],
+            ],
+        )
+        eq_(partitions[0][0].typecode, "q")
+        eq_(partitions[2][2].typecode, "q")
+        assert result._soft_closed
+
+    def test_columns_as_arrays(self, connection):
+        table = self.tables.test
+
+        result = connection.execute(
+            select(table).where(table.c.x < 7).order_by(table.c.x)
+        )
+        x, y, z = result.columns_as_arrays()
+        eq_(x, array.array("q", [1, 2, 3, 4, 5, 6]))
+        eq_(y, ["p_t_%d" % i for i in range(1, 7)])
+        eq_(z, [10, 20, 30, 40, None, 60])
+
+    @testing.combinations(True, False, argnames="stream")
+    def test_columns_as_arrays_yield_per(self, connection, stream):
+        table = self.tables.test
+
+        stmt = select(table.c.y, table.c.x).order_by(table.c.x)
+        if stream:
+            stmt = stmt.execution_options(yield_per=5)
+
+        y, x = connection.execute(stmt).columns_as_arrays()
+        eq_(x, array.array("q", range(1, 13)))
+        eq_(y, ["p_t_%d" % i for i in range(1, 13)])
+
+    @testing.combinations(
+        (None, None, 1000), (5, None, 5), (None, 3, 3), argnames="yp,size,exp"
+    )
+    def test_columns_as_arrays_batch_size(self, connection, yp, size, exp):
+        table = self.tables.test
+
+        result = connection.execute(select(table.c.x).order_by(table.c.x))
+        if yp:
+            result = result.yield_per(yp)
+
+        with patch.object(
+            result, "partitions_columnar", wraps=result.partitions_columnar
+        ) as partitions_columnar:
+            (x,) = result.columns_as_arrays(size=size)
+        eq_(x, array.array("q", range(1, 13)))
+        eq_(partitions_columnar.call_args[0], (exp,))
+
+    def test_columns_as_arrays_column_slices(self, connection):
+        table = self.tables.test
+
+        result = connection.execute(
+            select(table).where(table.c.x < 4).order_by(table.c.x)
+        )
+        eq_(
+            result.columns("y", "x").columns_as_arrays(),
+            [["p_t_1", "p_t_2", "p_t_3"], array.array("q", [1, 2, 3])],
+        )
+
+    def test_columns_as_arrays_no_rows(self, connection):
+        table = self.tables.test
+
+        result = connection.execute(select(table).where(table.c.x > 20))
+        eq_(result.columns_as_arrays(), [[], [], []])
+
+
 class MergeCursorResultTest(fixtures.TablesTest):
     __backend__ = True
 